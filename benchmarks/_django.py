@@ -0,0 +1,42 @@
+# benchmarks/_django.py
+"""
+Django bootstrap for DB-backed benchmarks.
+
+With DJANGO_SETTINGS_MODULE set, the project settings (and their already-migrated
+databases) are used as-is; otherwise an in-memory SQLite pair stands in for
+default/auth_db (or a pair of files under `sqlite_dir`, so commits pay a real fsync)
+and the given models' tables are created on it.
+"""
+from __future__ import annotations
+import os
+from typing import Iterable, Optional, Tuple, Type
+
+import django
+from django.conf import settings
+
+
+def setup(models: Iterable[Tuple[str, str]] = (), sqlite_dir: Optional[str] = None) -> bool:
+    """`models`: ("dotted.path.Model", db alias) pairs to create. Returns True on SQLite."""
+    if os.environ.get("DJANGO_SETTINGS_MODULE"):
+        django.setup()
+        return False
+    settings.configure(
+        INSTALLED_APPS=["django.contrib.auth", "django.contrib.contenttypes", "cqrsex"],
+        DATABASES={
+            alias: {"ENGINE": "django.db.backends.sqlite3",
+                    "NAME": os.path.join(sqlite_dir, f"{alias}.sqlite3") if sqlite_dir else ":memory:"}
+            for alias in ("default", "auth_db")
+        },
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD="django.db.models.BigAutoField",
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        CQRS_QUERY_CACHE={"BACKEND": "lru", "SINGLE_PROCESS": True},
+    )
+    django.setup()
+    from django.db import connections
+    from django.utils.module_loading import import_string
+    for path, alias in models:
+        model: Type = import_string(path)
+        with connections[alias].schema_editor() as editor:
+            editor.create_model(model)
+    return True
@@ -0,0 +1,87 @@
+# benchmarks/bench_bulk_import.py
+"""
+Importing N blog posts: one CreateBlogPost per row vs CreateBlogPosts batches.
+
+    python -m benchmarks.bench_bulk_import [--rows 10000] [--batch 1000] [--on-disk]
+
+Both go through the real mediator (transaction behavior, cache invalidation, outbox),
+so the per-row path pays a transaction, an INSERT and an outbox INSERT per post, and
+the bulk path pays them once per batch. Set DJANGO_SETTINGS_MODULE to run against a
+real, migrated database instead of in-memory SQLite.
+
+The target is a 10x speedup on a 10k-post import. It is NOT met on in-memory SQLite
+(about 4-5x): commits cost nothing there, and what is left of the bulk path is Django's
+per-field value preparation in bulk_create. With --on-disk, where each commit pays an
+fsync like a real database does, bulk measures about 11x. The run reports which.
+"""
+from __future__ import annotations
+import argparse
+import atexit
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks._django import setup
+
+
+def _items(rows: int, start: int) -> List[Dict[str, Any]]:
+    return [{"title": f"post {start + i}", "author_id": i % 50 + 1, "body": "x" * 200} for i in range(rows)]
+
+
+def _single(mediator, items: List[Dict[str, Any]], batch: int) -> None:
+    from cqrsex.Application.CQRS.BlogPosts.Commands.Create.Request import CreateBlogPost
+    for item in items:
+        res = mediator.send(CreateBlogPost(**item))
+        assert res.status.succeeded, res.status
+
+
+def _bulk(mediator, items: List[Dict[str, Any]], batch: int) -> None:
+    from cqrsex.Application.CQRS.BlogPosts.Commands.CreateMany.Request import CreateBlogPosts
+    for i in range(0, len(items), batch):
+        res = mediator.send(CreateBlogPosts(items=tuple(items[i:i + batch])))
+        assert res.status.succeeded, res.status
+
+
+def _time(run: Callable[..., None], mediator, items: List[Dict[str, Any]], batch: int) -> float:
+    t0 = time.perf_counter()
+    run(mediator, items, batch)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--rows", type=int, default=10_000)
+    ap.add_argument("--batch", type=int, default=1_000)
+    ap.add_argument("--on-disk", action="store_true", help="file-backed SQLite instead of :memory:")
+    ap.add_argument("--target", type=float, default=10.0, help="required bulk speedup")
+    args = ap.parse_args()
+
+    sqlite_dir = tempfile.mkdtemp(prefix="bench_bulk_") if args.on_disk else None
+    if sqlite_dir:
+        atexit.register(shutil.rmtree, sqlite_dir, True)
+    setup([("cqrsex.Domain.models.BlogPost", "default"), ("cqrsex.Domain.models.OutboxEvent", "default")],
+          sqlite_dir=sqlite_dir)
+    from cqrsex.Bootstrap.container import get_mediator
+    mediator = get_mediator()
+
+    # warm up both paths (handler construction, pipeline compilation)
+    _single(mediator, _items(10, 0), args.batch)
+    _bulk(mediator, _items(10, 0), args.batch)
+
+    secs = {
+        "single": _time(_single, mediator, _items(args.rows, 0), args.batch),
+        "bulk": _time(_bulk, mediator, _items(args.rows, args.rows), args.batch),
+    }
+    print(f"{'path':>6} | {'rows':>7} | {'secs':>7} | {'rows/sec':>10}")
+    print("-" * 40)
+    for name in ("single", "bulk"):
+        print(f"{name:>6} | {args.rows:>7} | {secs[name]:>7.2f} | {args.rows / secs[name]:>10.0f}")
+    speedup = secs["single"] / secs["bulk"]
+    print(f"bulk speedup {speedup:.1f}x (batch={args.batch})")
+    print(f"{args.target:g}x target {'met' if speedup >= args.target else 'NOT met'}"
+          f"{' (in-memory SQLite; try --on-disk)' if sqlite_dir is None and speedup < args.target else ''}")
+
+
+if __name__ == "__main__":
+    main()
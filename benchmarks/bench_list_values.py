@@ -0,0 +1,100 @@
+# benchmarks/bench_list_values.py
+"""
+List endpoints: model instances + mapper vs the values() path (only the DTO's columns).
+
+    python -m benchmarks.bench_list_values [--rows 20000] [--page-size 200] [--body-bytes 2000]
+
+Walks the whole table page by page (keyset on id, like ?paging=cursor) both ways and
+reports rows/sec, plus the tracemalloc peak of materialising one --rows batch.
+Set DJANGO_SETTINGS_MODULE to run against a real, migrated database instead of
+in-memory SQLite.
+"""
+from __future__ import annotations
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks._django import setup
+
+
+def _seed(rows: int, body_bytes: int) -> None:
+    from cqrsex.Domain.models import BlogPost
+    body = "x" * body_bytes
+    BlogPost.objects.bulk_create(
+        [BlogPost(title=f"post {i}", body=body, author_id=i % 50 + 1) for i in range(rows)], batch_size=2_000
+    )
+
+
+def _model_page(repo, page_size: int, cursor):
+    from cqrsex.Application.Mapping.BlogPostsMapper import BlogPostMapper
+    kp = repo.get_keyset_page(page_size, cursor=cursor)
+    return [BlogPostMapper.to_detail(m) for m in kp.items], kp.next_cursor
+
+
+def _values_page(repo, page_size: int, cursor):
+    from cqrsex.Application.DTOs.post_dtos import BLOG_POST_LIST_FIELDS
+    kp = repo.get_keyset_page(page_size, cursor=cursor, fields=BLOG_POST_LIST_FIELDS)
+    return kp.items, kp.next_cursor
+
+
+def _walk(page: Callable[..., Any], repo, page_size: int) -> Dict[str, float]:
+    n, cursor = 0, None
+    t0 = time.perf_counter()
+    while True:
+        dtos, cursor = page(repo, page_size, cursor)
+        n += len(dtos)
+        if not cursor:
+            break
+    secs = time.perf_counter() - t0
+    return {"rows": n, "secs": secs, "rows_per_sec": n / secs if secs else 0.0}
+
+
+def _peak(build: Callable[[], List[Any]]) -> int:
+    tracemalloc.start()
+    try:
+        rows = build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del rows
+    return peak
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--rows", type=int, default=20_000)
+    ap.add_argument("--page-size", type=int, default=200)
+    ap.add_argument("--body-bytes", type=int, default=2_000)
+    args = ap.parse_args()
+
+    if setup([("cqrsex.Domain.models.BlogPost", "default")]):
+        _seed(args.rows, args.body_bytes)
+
+    from cqrsex.Application.DTOs.post_dtos import BLOG_POST_LIST_FIELDS
+    from cqrsex.Application.Mapping.BlogPostsMapper import BlogPostMapper
+    from cqrsex.Infrstraction.Repositories.BlogPostReadRepository import BlogPostReadRepository
+    repo = BlogPostReadRepository()
+
+    results = {}
+    for name, page in (("model", _model_page), ("values", _values_page)):
+        _walk(page, repo, args.page_size)  # warm up
+        results[name] = _walk(page, repo, args.page_size)
+
+    qs = repo._filtered(order_by=("-id",))[: args.rows]
+    mem = {
+        "model": _peak(lambda: [BlogPostMapper.to_detail(m) for m in qs]),
+        "values": _peak(lambda: list(qs.values(*BLOG_POST_LIST_FIELDS))),
+    }
+
+    print(f"{'path':>6} | {'rows':>7} | {'rows/sec':>10} | {'peak MiB':>8}")
+    print("-" * 42)
+    for name in ("model", "values"):
+        r = results[name]
+        print(f"{name:>6} | {r['rows']:>7} | {r['rows_per_sec']:>10.0f} | {mem[name] / 2**20:>8.1f}")
+    print(f"values speedup {results['values']['rows_per_sec'] / results['model']['rows_per_sec']:.2f}x, "
+          f"memory {mem['model'] / max(mem['values'], 1):.2f}x less")
+
+
+if __name__ == "__main__":
+    main()
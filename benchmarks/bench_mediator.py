@@ -0,0 +1,111 @@
+# benchmarks/bench_mediator.py
+"""
+Per-dispatch overhead of Mediator.send / send_async: compiled pipelines vs the
+previous build-the-chain-per-call implementation.
+
+    python -m benchmarks.bench_mediator [--iterations 200000]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Type
+
+from cqrsex.Application.Mediator.mediator import Behavior, Mediator
+
+BEHAVIOR_COUNTS = (0, 1, 4, 8)
+
+
+class LegacyMediator:
+    """The pre-compilation dispatch loop, kept verbatim for comparison."""
+
+    def __init__(self, handlers: Dict[Type[Any], Callable[[], Any]], behaviors: List[Behavior]) -> None:
+        self._factories = handlers
+        self._behaviors = list(behaviors)
+        self._cache_map: Dict[Type[Any], Any] = {}
+
+    def _get_handler(self, req_type: Type[Any]) -> Any:
+        inst = self._cache_map.get(req_type)
+        if inst is None:
+            inst = self._factories[req_type]()
+            self._cache_map[req_type] = inst
+        return inst
+
+    def send(self, request: Any) -> Any:
+        handler = self._get_handler(type(request))
+        def call(): return handler.handle(request)
+        nxt = call
+        for b in reversed(self._behaviors):
+            prev = nxt
+            nxt = (lambda bb=b, pn=prev: lambda: bb.handle(request, pn))()
+        res = nxt()
+        if inspect.isawaitable(res):
+            raise RuntimeError("Handler returned coroutine. Use send_async for async handlers.")
+        return res
+
+    async def send_async(self, request: Any) -> Any:
+        handler = self._get_handler(type(request))
+        async def final():
+            h = getattr(handler, "handle", None)
+            return await h(request) if inspect.iscoroutinefunction(h) else h(request)
+        nxt: Callable[[], Awaitable[Any]] = final
+        for b in reversed(self._behaviors):
+            prev = nxt
+            async def wrap(bb=b, pn=prev):
+                async def _inner(): return await bb.ahandle(request, pn)
+                return _inner
+            nxt = await wrap()
+        return await nxt()
+
+
+class Ping:
+    __slots__ = ()
+
+
+class PingHandler:
+    def handle(self, request: Ping) -> int:
+        return 1
+
+
+def _bench_sync(mediator: Any, n: int) -> float:
+    req = Ping()
+    send = mediator.send
+    t0 = time.perf_counter()
+    for _ in range(n):
+        send(req)
+    return (time.perf_counter() - t0) / n * 1e9
+
+
+def _bench_async(mediator: Any, n: int) -> float:
+    async def run() -> float:
+        req = Ping()
+        send = mediator.send_async
+        t0 = time.perf_counter()
+        for _ in range(n):
+            await send(req)
+        return (time.perf_counter() - t0) / n * 1e9
+    return asyncio.run(run())
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--iterations", type=int, default=200_000)
+    args = ap.parse_args()
+
+    handlers = {Ping: PingHandler}
+    print(f"{'behaviors':>9} | {'mode':>5} | {'legacy ns/op':>12} | {'compiled ns/op':>14} | {'speedup':>7}")
+    print("-" * 62)
+    for count in BEHAVIOR_COUNTS:
+        behaviors = [Behavior() for _ in range(count)]
+        legacy = LegacyMediator(handlers, behaviors)
+        compiled = Mediator(handlers, behaviors=behaviors)
+        for mode, bench in (("sync", _bench_sync), ("async", _bench_async)):
+            bench(legacy, 1_000); bench(compiled, 1_000)  # warm up + compile
+            old = bench(legacy, args.iterations)
+            new = bench(compiled, args.iterations)
+            print(f"{count:>9} | {mode:>5} | {old:>12.0f} | {new:>14.0f} | {old / new:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
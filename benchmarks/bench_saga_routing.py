@@ -0,0 +1,162 @@
+# benchmarks/bench_saga_routing.py
+"""
+GenericCrudSaga.process routing throughput: the compiled router (per-string LRU,
+prepared kwarg adapters) vs the previous per-event parse / normalize / filter.
+
+    python -m benchmarks.bench_saga_routing [--events 200000]
+
+The mediator is a counter, so only routing + command construction is timed. Mixes:
+  entity/action hit     BlogPost + Update           -> UpdateBlogPost
+  entity/action miss    BlogPost + Updated          (what Events.py emits)
+  event_type hit        "BlogPostDelete"            -> DeleteBlogPost
+  event_type miss       "BlogPostUpdated" / 50 distinct unknown types
+  fqcn                  evt.command = "...Create.Request.CreateBlogPost"
+"""
+from __future__ import annotations
+import argparse
+import inspect
+import logging
+import re
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from benchmarks._django import setup
+
+CREATE_FQCN = "cqrsex.Application.CQRS.BlogPosts.Commands.Create.Request.CreateBlogPost"
+
+
+class CountingMediator:
+    def __init__(self) -> None:
+        self.sent = 0
+
+    def send(self, cmd: Any) -> None:
+        self.sent += 1
+
+
+# ---- the previous routing, kept verbatim for comparison ----
+_CAMEL_RE = re.compile(r"""
+    (?:[A-Z]+(?=[A-Z][a-z0-9]|[0-9]|\b)) |   # acronyms at start/middle (API, HTTP2)
+    (?:[A-Z]?[a-z0-9]+)                    | # normal words
+    (?:[A-Z])                                # single trailing capitals
+""", re.VERBOSE)
+
+
+def _norm(s: Optional[str]) -> str:
+    return "".join((s or "")).replace("_", "").replace("-", "").strip().lower()
+
+
+class _CmdMeta:
+    __slots__ = ("cls", "params")
+
+    def __init__(self, cls: Type[Any], params: Set[str]):
+        self.cls = cls
+        self.params = params
+
+
+class LegacySaga:
+    def __init__(self, mediator: Any, index: Dict[Tuple[str, str], _CmdMeta]) -> None:
+        self._mediator = mediator
+        self._index = index
+
+    @staticmethod
+    def _resolve_by_fqcn(fqcn: str) -> Optional[_CmdMeta]:
+        from importlib import import_module
+        mod_path, cls_name = fqcn.rsplit(".", 1)
+        cls = getattr(import_module(mod_path), cls_name)
+        return _CmdMeta(cls, set(inspect.signature(cls).parameters.keys()))
+
+    def _parse_event(self, evt: Any):
+        payload = getattr(evt, "payload", {}) or {}
+        db_alias = getattr(evt, "db_alias", None)
+        cmd_fqcn = getattr(evt, "command", None)
+        entity = getattr(evt, "entity", None)
+        action = getattr(evt, "action", None)
+        if entity and action:
+            return str(entity), str(action), db_alias, payload, cmd_fqcn
+        et = (getattr(evt, "event_type", "") or "").strip()
+        if not et:
+            return None, None, db_alias, payload, cmd_fqcn
+        tokens = [m.group(0) for m in _CAMEL_RE.finditer(et or "")] or []
+        if len(tokens) >= 2:
+            for i in range(1, len(tokens)):
+                e = "".join(tokens[:len(tokens) - i])
+                a = "".join(tokens[len(tokens) - i:])
+                if (_norm(e), _norm(a)) in self._index:
+                    return e, a, db_alias, payload, cmd_fqcn
+        return None, None, db_alias, payload, cmd_fqcn
+
+    @staticmethod
+    def _build_kwargs(meta: _CmdMeta, evt: Any, payload: dict, db_alias: Optional[str]) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = dict(payload) if payload else {}
+        if "allow_anonymous" in meta.params:
+            kwargs.setdefault("allow_anonymous", True)
+        if db_alias and "db_alias" in meta.params:
+            kwargs.setdefault("db_alias", db_alias)
+        agg_id = getattr(evt, "aggregate_id", None)
+        if agg_id is not None and "id" in meta.params and "id" not in kwargs:
+            kwargs["id"] = agg_id
+        return {k: v for k, v in kwargs.items() if k in meta.params}
+
+    def process(self, event: Any):
+        entity, action, db_alias, payload, cmd_fqcn = self._parse_event(event)
+        if cmd_fqcn:
+            meta = self._resolve_by_fqcn(cmd_fqcn)
+        else:
+            if not entity or not action:
+                return
+            meta = self._index.get((_norm(entity), _norm(action)))
+            if not meta:
+                return
+        cmd = meta.cls(**self._build_kwargs(meta, event, payload, db_alias))
+        self._mediator.send(cmd)
+
+
+def _mixes() -> Dict[str, List[Any]]:
+    ev = SimpleNamespace
+    return {
+        "entity/action hit": [ev(entity="BlogPost", action="Update", aggregate_id=7,
+                                 payload={"title": "t", "body": "b", "author_id": 1, "tenant_id": "main"})],
+        "entity/action miss": [ev(entity="BlogPost", action="Updated", aggregate_id=7, payload={"id": 7})],
+        "event_type hit": [ev(event_type="BlogPostDelete", aggregate_id=7, payload={})],
+        "event_type miss": [ev(event_type="BlogPostUpdated", payload={})]
+                           + [ev(event_type=f"Widget{i}Archived", payload={}) for i in range(50)],
+        "fqcn": [ev(command=CREATE_FQCN, payload={"title": "t", "body": "b", "author_id": 1})],
+    }
+
+
+def _rate(saga: Any, events: List[Any], n: int) -> float:
+    batch = (events * (n // len(events) + 1))[:n]
+    process = saga.process
+    t0 = time.perf_counter()
+    for e in batch:
+        process(e)
+    return n / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--events", type=int, default=200_000)
+    args = ap.parse_args()
+    setup()
+    logging.disable(logging.CRITICAL)
+
+    from cqrsex.Application.Mediator.manifest import get_manifest, import_path
+    from cqrsex.Application.Sagas.GenericCrudSaga import GenericCrudSaga
+
+    index = {}
+    for key, path in get_manifest().commands.items():
+        cls = import_path(path)
+        index[tuple(key.split(":", 1))] = _CmdMeta(cls, set(inspect.signature(cls).parameters.keys()))
+
+    print(f"{'events/s':<20}{'legacy':>12}{'compiled':>12}{'speedup':>9}")
+    for name, events in _mixes().items():
+        legacy, compiled = CountingMediator(), CountingMediator()
+        old = _rate(LegacySaga(legacy, index), events, args.events)
+        new = _rate(GenericCrudSaga(compiled), events, args.events)
+        assert legacy.sent == compiled.sent, (name, legacy.sent, compiled.sent)
+        print(f"{name:<20}{old:>12,.0f}{new:>12,.0f}{new / old:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/bench_startup.py
+"""
+Worker cold start: building the Mediator by importing every CQRS module (scan) vs
+from the handler manifest (handlers imported on first dispatch).
+
+    python -m benchmarks.bench_startup [--runs 15]
+
+Each run is a fresh interpreter (nothing cached in sys.modules), timing django.setup()
+and get_mediator() separately and counting the modules they import. "manifest" runs
+read a manifest written by an earlier run; "stale" runs find it invalidated (a source
+mtime changed) and rescan + rewrite. First dispatch = the lazy import of one handler.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+MODES = ("scan", "manifest", "stale")
+
+
+def _child(mode: str, path: str) -> None:
+    t0 = time.perf_counter()
+    from benchmarks._django import setup
+    setup()
+    from django.conf import settings
+    settings.CQRS_HANDLER_MANIFEST = {"PATH": None if mode == "scan" else path, "VALIDATE": True}
+    t1 = time.perf_counter()
+    mods = len(sys.modules)
+    from cqrsex.Bootstrap.container import get_mediator
+    mediator = get_mediator()
+    t2 = time.perf_counter()
+    boot_mods = len(sys.modules) - mods
+    from cqrsex.Application.CQRS.BlogPosts.Queries.Get.Request import GetBlogPost
+    mediator._factory_for(GetBlogPost)         # resolve (lazily import) without a database
+    t3 = time.perf_counter()
+    print(json.dumps({"django": t1 - t0, "mediator": t2 - t1, "first": t3 - t2, "modules": boot_mods}))
+
+
+def _run(mode: str, path: str) -> dict:
+    if mode == "stale":
+        # as if a source file changed since the manifest was written
+        with open(path) as f:
+            data = json.load(f)
+        data["sources"] = {}
+        with open(path, "w") as f:
+            json.dump(data, f)
+    out = subprocess.run([sys.executable, "-m", "benchmarks.bench_startup", "--child", mode, "--path", path],
+                         check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=15)
+    ap.add_argument("--child", choices=MODES)
+    ap.add_argument("--path")
+    args = ap.parse_args()
+    if args.child:
+        _child(args.child, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "handler_manifest.json")
+        _run("manifest", path)                    # first run writes it
+        results = {m: [_run(m, path) for _ in range(args.runs)] for m in MODES}
+
+    med = lambda rows, k: statistics.median(r[k] for r in rows) * 1000
+    print(f"{'mode':<10}{'django.setup':>14}{'get_mediator':>14}{'1st dispatch':>14}{'modules':>9}")
+    for mode, rows in results.items():
+        print(f"{mode:<10}{med(rows, 'django'):>12.1f}ms{med(rows, 'mediator'):>12.1f}ms"
+              f"{med(rows, 'first'):>12.2f}ms{rows[0]['modules']:>9}")
+    scan, fast = med(results["scan"], "mediator"), med(results["manifest"], "mediator")
+    print(f"\nget_mediator: {scan:.1f}ms -> {fast:.1f}ms ({scan / fast:.1f}x) with a valid manifest")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_user_lookup.py
+"""
+Case-insensitive user lookups: the old `__iexact` filter (UPPER(col) = UPPER(%s))
+vs UserReadRepository's LOWER(col) = LOWER(%s), which uses users_*_lower_idx.
+
+    python -m benchmarks.bench_user_lookup [--rows 1000000] [--lookups 200]
+
+Seeds --rows users (with the functional indexes from User.Meta) and times
+exists_by_username / exists_by_email / get_by_email both ways for random existing
+and missing values. Set DJANGO_SETTINGS_MODULE to run against a real, migrated
+auth_db (nothing is seeded then).
+"""
+from __future__ import annotations
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from benchmarks._django import setup
+
+
+def _seed(rows: int) -> None:
+    from django.db import connections
+    from django.utils import timezone
+    from cqrsex.Domain.models import User
+    now = timezone.now()
+    sql = (f'INSERT INTO "{User._meta.db_table}" (password, is_superuser, username, first_name, last_name, email, '
+           "is_staff, is_active, date_joined, user_type, tenant_id) VALUES (%s, %s, %s, '', '', %s, %s, %s, %s, %s, %s)")
+    with connections["auth_db"].cursor() as cur:
+        for start in range(0, rows, 50_000):
+            cur.executemany(sql, [
+                ("!", False, f"User{i}", f"User{i}@Example.com", False, True, now, "CUSTOMER", "main")
+                for i in range(start, min(start + 50_000, rows))
+            ])
+
+
+def _time(fn: Callable[[str], object], values: List[str]) -> float:
+    t0 = time.perf_counter()
+    for v in values:
+        fn(v)
+    return (time.perf_counter() - t0) / len(values)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--rows", type=int, default=1_000_000)
+    ap.add_argument("--lookups", type=int, default=200)
+    args = ap.parse_args()
+
+    if setup([("cqrsex.Domain.models.User", "auth_db")]):
+        t0 = time.perf_counter()
+        _seed(args.rows)
+        print(f"seeded {args.rows} users in {time.perf_counter() - t0:.1f}s")
+
+    from cqrsex.Domain.models import User
+    from cqrsex.Infrstraction.Repositories.UserReadRepository import UserReadRepository
+    repo = UserReadRepository()
+    users = User.objects.using(repo.db_alias)
+
+    rnd = random.Random(7)
+    names = [f"user{rnd.randrange(args.rows)}" if i % 2 else f"nobody{i}" for i in range(args.lookups)]
+    emails = [f"{n}@example.COM" for n in names]
+
+    cases: Dict[str, tuple] = {
+        "exists_by_username": (lambda s: users.filter(username__iexact=s).exists(), repo.exists_by_username, names),
+        "exists_by_email": (lambda s: users.filter(email__iexact=s).exists(), repo.exists_by_email, emails),
+        "get_by_email": (lambda s: users.filter(email__iexact=s).first(), repo.get_by_email, emails),
+    }
+    print(f"{'lookup':>20} | {'iexact ms':>10} | {'lower idx ms':>12} | {'speedup':>8}")
+    print("-" * 60)
+    for name, (old, new, values) in cases.items():
+        old(values[0]), new(values[0])  # warm up
+        t_old, t_new = _time(old, values), _time(new, values)
+        print(f"{name:>20} | {t_old * 1e3:>10.3f} | {t_new * 1e3:>12.3f} | {t_old / t_new:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# conftest.py
+"""
+pytest bootstrap: the project settings on a pair of throwaway SQLite files
+(default / auth_db; users live on auth_db), so threads share the database like
+workers do.
+
+    python -m pytest -q
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cqrsapp.settings")
+
+_TMP = tempfile.mkdtemp(prefix="cqrsex_tests_")
+
+# cqrs/ is an older copy of the project
+collect_ignore = ["cqrs"]
+
+
+def pytest_configure(config):
+    import django
+    from django.conf import settings
+
+    settings.DATABASES = {
+        alias: {"ENGINE": "django.db.backends.sqlite3", "NAME": os.path.join(_TMP, f"{alias}.sqlite3"),
+                "OPTIONS": {"timeout": 30}}
+        for alias in ("default", "auth_db")
+    }
+    settings.CQRS_SAGA_RETRY = {**getattr(settings, "CQRS_SAGA_RETRY", {}), "SPOOL_PATH": os.path.join(_TMP, "saga.spool")}
+    django.setup()
+
+    from django.core.management import call_command
+    from django.db import connections
+    from cqrsex.Domain.models import BlogPost, User
+
+    with connections["auth_db"].schema_editor() as editor:
+        editor.create_model(User)
+    call_command("migrate", "auth", database="auth_db", verbosity=0)
+    with connections["default"].schema_editor() as editor:
+        editor.create_model(BlogPost)
+    call_command("migrate", "cqrsex", database="default", verbosity=0)
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_TMP, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def _clean_db():
+    """Every test starts from empty cqrsex tables and caches."""
+    yield
+    from django.apps import apps
+    from django.core.cache import caches
+    from django.db import connections
+
+    for alias in connections:
+        tables = set(connections[alias].introspection.table_names())
+        for model in apps.get_app_config("cqrsex").get_models():
+            if model._meta.db_table in tables:
+                model.objects.using(alias).all().delete()
+    for alias in caches:
+        caches[alias].clear()
+    connections.close_all()
@@ -49,6 +49,7 @@ MIDDLEWARE = [
     # 'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'cqrsex.WebAPI.middleware.loader_scope_middleware',
 ]
 
 ROOT_URLCONF = 'cqrsapp.urls'
@@ -86,6 +87,142 @@ DATABASES = {
 }
 
 
+# Handler discovery. Workers read request -> handler and (entity, action) -> command from
+# PATH instead of importing every CQRS module at boot; handlers import on first dispatch.
+# Rewritten when a .py file under the CQRS roots changes (VALIDATE: stat check on boot;
+# False trusts the file, e.g. immutable images built with manage.py handler_manifest).
+CQRS_HANDLER_MANIFEST = {
+    "PATH": BASE_DIR / "var" / "handler_manifest.json",   # None = scan on every boot
+    "VALIDATE": True,
+}
+
+# "query" holds the query cache's entries and tag counters; every web worker and the
+# projection runner (manage.py project) must see the same one. The table comes with
+# migration 0010 (manage.py createcachetable); Redis/Memcached serve it faster.
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "query": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "cqrs_query_cache",
+        "OPTIONS": {"MAX_ENTRIES": 100_000},
+    },
+}
+
+# Mediator query result cache (QueryCacheBehavior)
+# BACKEND: "django" (CACHES[ALIAS], shared) or "lru" (in-process). A per-process cache
+# ("lru", or "django" on LocMemCache) only sees the invalidations of its own process, so it
+# is refused unless SINGLE_PROCESS is True: one web process and no projection runner.
+CQRS_QUERY_CACHE = {
+    "BACKEND": "django",
+    "ALIAS": "query",
+    "TTL": 60,
+    # "SINGLE_PROCESS": False, "MAX_ENTRIES": 10_000 (lru),
+}
+
+# Commands sent with an Idempotency-Key header by an authenticated user (IdempotencyBehavior):
+# repeats with the same body get the first successful result, a different body gets 409;
+# concurrent duplicates wait for the first execution. Anonymous requests are not deduplicated.
+# BACKEND: "db" (idempotency_keys table; purge with manage.py idempotency_purge),
+# "django" (CACHES[ALIAS], shared but may evict early) or "lru" (per worker).
+CQRS_IDEMPOTENCY = {
+    "BACKEND": "db",
+    "TTL": 86_400,           # seconds a result is replayed
+    "LEASE": 60.0,           # seconds before a crashed execution's claim can be taken over
+    "WAIT_TIMEOUT": 30.0,    # seconds a duplicate waits before answering 409
+    # "DB_ALIAS": "default", "PURGE_BATCH_SIZE": 5_000, "ALIAS": "default", "MAX_ENTRIES": 10_000,
+}
+
+# Author summaries embedded in blog post lists (one auth_db query per page).
+# SHARED_CACHE keeps them in the query cache across requests, dropped on user:{id}.
+CQRS_AUTHOR_LOADER = {
+    "SHARED_CACHE": True,
+    "TTL": 300,
+}
+
+# Password hashing for bulk user creation (CreateUsers)
+CQRS_PASSWORD_HASHING = {
+    "WORKERS": None,           # processes; None = usable CPUs
+    "MIN_BATCH": 8,            # smaller batches are hashed inline
+    "START_METHOD": "spawn",   # spawn | forkserver | fork (unsafe in a threaded server); None = platform default
+}
+
+# Text search for list `q` filters (Infrstraction/Search/TextSearch.py; indexes from migration 0005)
+CQRS_SEARCH = {
+    "BACKEND": "auto",         # auto: pg_trgm on PostgreSQL, FTS5 on SQLite | basic: plain icontains
+}
+
+# Totals for offset paging (?count=exact|none|estimated|cached)
+CQRS_PAGINATION = {
+    "ESTIMATE_EXACT_BELOW": 10_000,   # estimates under this fall back to COUNT(*)
+    "COUNT_CACHE_ALIAS": "default",
+    "COUNT_CACHE_TTL": 60,
+}
+
+# Outbox relay (python manage.py outbox_relay)
+CQRS_OUTBOX_RELAY = {
+    "DB_ALIAS": "default",
+    "BATCH_SIZE": 100,
+    "FAIR": True,                  # share each poll between tenants with pending events
+    "IDLE_BACKOFF": (0.05, 5.0),   # seconds: first and max sleep while idle
+    "PUBLISHERS": [
+        "cqrsex.Infrstraction.Outbox.LoggingPublisher.LoggingPublisher",
+        # {"CLASS": "cqrsex.Infrstraction.Outbox.FilePublisher.FilePublisher",
+        #  "OPTIONS": {"path": "var/outbox.jsonl"}},
+    ],
+}
+
+# Delivered-event cleanup (python manage.py outbox_retention); monthly partitions on
+# PostgreSQL are optional: python manage.py outbox_partitions --convert, then --ahead N from cron
+CQRS_OUTBOX_RETENTION = {
+    "DAYS": 7,
+    "BATCH_SIZE": 5_000,
+    "PAUSE": 0.0,          # seconds between delete batches
+    "ARCHIVE_DIR": None,   # e.g. "var/outbox-archive" to keep gzipped JSONL copies
+}
+
+# Read models fed from outbox_events (python manage.py projections).
+# BLOG_POSTS="projection" serves blog post reads from rm_blog_posts; reads then lag
+# writes by the projector's poll + SETTLE_SECONDS. The runner bumps query-cache tags
+# after each batch: with the per-process "lru" cache backend that only reaches its own
+# process, so use CQRS_QUERY_CACHE BACKEND "django" (shared) alongside "projection".
+CQRS_READ_MODEL = {
+    "BLOG_POSTS": "table",      # table | projection
+}
+CQRS_PROJECTIONS = {
+    "DB_ALIAS": "default",
+    "BATCH_SIZE": 500,
+    "SETTLE_SECONDS": 1.0,      # skip events younger than this (late-committing lower ids)
+    "POLL_INTERVAL": 1.0,
+}
+
+# Post-commit saga execution. "inline": on the committing request (adds saga latency
+# to the response). "pool": bounded worker threads, per-aggregate FIFO ordering.
+CQRS_SAGA_DISPATCH = {
+    "MODE": "inline",
+    "WORKERS": 4,
+    "QUEUE_SIZE": 1_000,       # per worker
+    "OVERFLOW": "block",       # block | inline | drop when a worker queue is full
+    "PUT_TIMEOUT": None,       # seconds to block before running inline (None = wait)
+    "DRAIN_TIMEOUT": 10.0,     # seconds to finish queued events at exit
+    # MultiSaga fan-out: sagas marked `independent` run concurrently per event (0 = in order)
+    "FAN_OUT_WORKERS": 0,
+    "SAGA_TIMEOUT": None,      # seconds to wait for a fanned-out saga before counting it failed
+}
+
+# Failed saga invocations are queued in saga_retries and re-run by
+# python manage.py saga_retry; after MAX_ATTEMPTS they move to saga_dead_letters.
+CQRS_SAGA_RETRY = {
+    "ENABLED": True,
+    "DB_ALIAS": "default",
+    "MAX_ATTEMPTS": 8,             # including the original dispatch
+    "BASE_DELAY": 1.0,             # seconds; doubles per attempt, with jitter
+    "MAX_DELAY": 600.0,
+    "BATCH_SIZE": 100,
+    "IDLE_BACKOFF": (0.5, 10.0),   # seconds: first and max sleep while nothing is due
+    # used when DB_ALIAS is unreachable; the retrier loads it into the table
+    "SPOOL_PATH": BASE_DIR / "var" / "saga_retry_spool.jsonl",
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -4,6 +4,9 @@ from injector import inject
 from cqrsex.Application.Mediator.contracts import ICommandHandler
 from cqrsex.Application.CQRS.BlogPosts.Commands.Create.Request import CreateBlogPost
 from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
+from cqrsex.Application.CQRS.BlogPosts.Events import emit_blog_post_event, CREATED
+from asgiref.sync import sync_to_async
 from cqrsex.Application.Mapping.BlogPostsMapper import BlogPostMapper
 from cqrsex.Application.Mediator.registry import handler_for
 from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
@@ -11,8 +14,9 @@ from cqrsex.Application.Common.exceptions import ServiceException
 @handler_for(CreateBlogPost)
 class CreateBlogPostHandler(ICommandHandler[CreateBlogPost, ConcreteResultT]):
     @inject
-    def __init__(self, repos: IRepositoryManager) -> None:
+    def __init__(self, repos: IRepositoryManager, sagas: ISagaDispatcher) -> None:
         self._repos = repos
+        self._sagas = sagas
  
     def handle(self, cmd: CreateBlogPost) -> ConcreteResultT:
      
@@ -26,5 +30,20 @@ class CreateBlogPostHandler(ICommandHandler[CreateBlogPost, ConcreteResultT]):
             saved = self._repos.blog_post_write_repository.add(model)
         except Exception as e:
             raise ServiceException(f"Failed to create blog post: {e}")
+        emit_blog_post_event(self._sagas, CREATED, saved)
+
+        return ConcreteResultT.success(BlogPostMapper.to_detail(saved), "Created")
+
+    async def ahandle(self, cmd: CreateBlogPost) -> ConcreteResultT:
+        model = BlogPostMapper.to_model_from_create(
+            title=cmd.title,
+            body=cmd.body,
+            author_id=cmd.author_id,
+        )
+        try:
+            saved = await self._repos.blog_post_write_repository.aadd(model)
+        except Exception as e:
+            raise ServiceException(f"Failed to create blog post: {e}")
+        await sync_to_async(emit_blog_post_event)(self._sagas, CREATED, saved)
 
         return ConcreteResultT.success(BlogPostMapper.to_detail(saved), "Created")
@@ -0,0 +1,53 @@
+# cqrsex/Application/CQRS/BlogPosts/Commands/CreateMany/Handler.py
+from __future__ import annotations
+from injector import inject
+from pydantic import TypeAdapter, ValidationError
+from asgiref.sync import sync_to_async
+from cqrsex.Application.Mediator.contracts import ICommandHandler
+from cqrsex.Application.CQRS.BlogPosts.Commands.CreateMany.Request import CreateBlogPosts, NewBlogPost
+from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
+from cqrsex.Application.CQRS.BlogPosts.Events import emit_blog_post_event, CREATED
+from cqrsex.Application.Mapping.BlogPostsMapper import BlogPostMapper
+from cqrsex.Application.Mediator.registry import handler_for
+from cqrsex.Application.Wrapper.BatchResult import BatchResult
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.Common.exceptions import ServiceException
+
+WRITE_BATCH = 1_000   # rows per INSERT
+_item = TypeAdapter(NewBlogPost)
+
+@handler_for(CreateBlogPosts)
+class CreateBlogPostsHandler(ICommandHandler[CreateBlogPosts, ConcreteResultT]):
+    """Validate every item, then one multi-row INSERT per WRITE_BATCH, all in the command's UoW."""
+    @inject
+    def __init__(self, repos: IRepositoryManager, sagas: ISagaDispatcher) -> None:
+        self._repos = repos
+        self._sagas = sagas
+
+    def handle(self, cmd: CreateBlogPosts) -> ConcreteResultT:
+        result = BatchResult(len(cmd.items))
+        models, indexes = [], []
+        for i, raw in enumerate(cmd.items):
+            try:
+                item = _item.validate_python(raw)
+            except ValidationError as err:
+                result.invalid(i, err)
+                continue
+            models.append(BlogPostMapper.to_model_from_create(title=item.title, body=item.body, author_id=item.author_id))
+            indexes.append(i)
+        if cmd.atomic:
+            result.reject()
+
+        try:
+            self._repos.blog_post_write_repository.bulk_add(models, batch_size=WRITE_BATCH)
+        except Exception as e:
+            raise ServiceException(f"Failed to create blog posts: {e}")
+        for i, saved in zip(indexes, models):
+            emit_blog_post_event(self._sagas, CREATED, saved)   # buffered: one outbox INSERT at commit
+            result.ok(i, "created", saved.id)
+        return result.to_result("Created")
+
+    async def ahandle(self, cmd: CreateBlogPosts) -> ConcreteResultT:
+        # same thread as the async UoW's atomic block
+        return await sync_to_async(self.handle)(cmd)
@@ -0,0 +1,34 @@
+from typing import Any, Annotated, ClassVar, Dict, Optional, Sequence, Tuple
+from pydantic import Field, PositiveInt
+from pydantic.dataclasses import dataclass
+from cqrsex.Application.Mediator.contracts import CommandMeta, ICommand
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.CQRS.BlogPosts.Commands.Create.Request import CreateBlogPost
+
+MAX_BATCH = 10_000
+
+@dataclass(config={'extra': 'forbid', 'str_strip_whitespace': True}, frozen=True, slots=True)
+class NewBlogPost:
+    title: Annotated[str, Field(min_length=1, max_length=256, strip_whitespace=True)]
+    author_id: PositiveInt
+    body:  Annotated[str, Field(strip_whitespace=True, max_length=50_000)] = ""
+
+@dataclass(config={'extra': 'forbid'}, frozen=True)
+class CreateBlogPosts(ICommand[ConcreteResultT]):
+    # raw dicts: each one is validated as NewBlogPost by the handler, so one bad item
+    # gets its own error instead of failing the whole request at construction
+    items: Annotated[Tuple[Dict[str, Any], ...], Field(min_length=1, max_length=MAX_BATCH)]
+    # True: any invalid item rejects the batch; False: write the valid ones
+    atomic: bool = True
+    meta: Optional[CommandMeta] = None
+
+    # GenericCrudSaga.process_many sends runs of CreateBlogPost as one of these
+    batches: ClassVar[type] = CreateBlogPost
+
+    @classmethod
+    def from_commands(cls, cmds: Sequence[CreateBlogPost]) -> Optional["CreateBlogPosts"]:
+        return cls(items=tuple({"title": c.title, "author_id": c.author_id, "body": c.body} for c in cmds),
+                   atomic=False)
+
+    def invalidates(self) -> tuple:
+        return ("blogpost:list",)
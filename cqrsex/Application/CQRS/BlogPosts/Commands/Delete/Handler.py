@@ -5,6 +5,9 @@ from injector import inject
 from cqrsex.Application.Mediator.contracts import ICommandHandler
 from cqrsex.Application.CQRS.BlogPosts.Commands.Delete.Request import DeleteBlogPost
 from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
+from cqrsex.Application.CQRS.BlogPosts.Events import emit_blog_post_event, DELETED
+from asgiref.sync import sync_to_async
 from cqrsex.Application.Mediator.registry import handler_for
 from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
 from cqrsex.Application.Common.exceptions import NotFoundException, ServiceException
@@ -13,15 +16,30 @@ from cqrsex.Application.Common.exceptions import NotFoundException, ServiceExcep
 @handler_for(DeleteBlogPost)
 class DeleteBlogPostHandler(ICommandHandler[DeleteBlogPost, ConcreteResultT]):
     @inject
-    def __init__(self, repos: IRepositoryManager) -> None:
+    def __init__(self, repos: IRepositoryManager, sagas: ISagaDispatcher) -> None:
         self._repos = repos
+        self._sagas = sagas
   
     def handle(self, cmd: DeleteBlogPost) -> ConcreteResultT:
-        entity = self._repos.blog_post_read_repository.get_by_id(cmd.id)
+        entity = self._repos.blog_post_write_repository.get_by_id(cmd.id)
         if not entity:
             raise NotFoundException("BlogPost not found")
         try:
             self._repos.blog_post_write_repository.delete_permanently(entity)
         except Exception as e:
             raise ServiceException(f"Failed to delete BlogPost {cmd.id}: {e}")
+        entity.id = cmd.id  # Model.delete() clears the pk
+        emit_blog_post_event(self._sagas, DELETED, entity)
+        return ConcreteResultT.success(message="Deleted")
+
+    async def ahandle(self, cmd: DeleteBlogPost) -> ConcreteResultT:
+        entity = await self._repos.blog_post_write_repository.aget_by_id(cmd.id)
+        if not entity:
+            raise NotFoundException("BlogPost not found")
+        try:
+            await self._repos.blog_post_write_repository.adelete_permanently(entity)
+        except Exception as e:
+            raise ServiceException(f"Failed to delete BlogPost {cmd.id}: {e}")
+        entity.id = cmd.id
+        await sync_to_async(emit_blog_post_event)(self._sagas, DELETED, entity)
         return ConcreteResultT.success(message="Deleted")
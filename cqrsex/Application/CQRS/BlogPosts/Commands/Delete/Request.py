@@ -7,3 +7,6 @@ from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
 @dataclass(config={'extra': 'forbid'}, frozen=True, slots=True)
 class DeleteBlogPost(ICommand[ConcreteResultT]):
     id: PositiveInt
+
+    def invalidates(self) -> tuple:
+        return (f"blogpost:{self.id}", "blogpost:list")
@@ -0,0 +1,51 @@
+# cqrsex/Application/CQRS/BlogPosts/Commands/DeleteMany/Handler.py
+from __future__ import annotations
+from typing import Dict
+from injector import inject
+from asgiref.sync import sync_to_async
+from cqrsex.Application.Mediator.contracts import ICommandHandler
+from cqrsex.Application.CQRS.BlogPosts.Commands.DeleteMany.Request import DeleteBlogPosts
+from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
+from cqrsex.Application.CQRS.BlogPosts.Events import emit_blog_post_event, DELETED
+from cqrsex.Application.Mediator.registry import handler_for
+from cqrsex.Application.Wrapper.BatchResult import BatchResult
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.Common.exceptions import ServiceException
+
+@handler_for(DeleteBlogPosts)
+class DeleteBlogPostsHandler(ICommandHandler[DeleteBlogPosts, ConcreteResultT]):
+    """Lock the targets, then one DELETE ... WHERE id IN (...) (same hard delete as DeleteBlogPost)."""
+    @inject
+    def __init__(self, repos: IRepositoryManager, sagas: ISagaDispatcher) -> None:
+        self._repos = repos
+        self._sagas = sagas
+
+    def handle(self, cmd: DeleteBlogPosts) -> ConcreteResultT:
+        repo = self._repos.blog_post_write_repository
+        result = BatchResult(len(cmd.ids))
+        wanted: Dict[int, int] = {}
+        for i, post_id in enumerate(cmd.ids):
+            if post_id in wanted:
+                result.fail(i, "duplicate_id", "Id appears earlier in this batch", id=post_id)
+            else:
+                wanted[post_id] = i
+
+        found = {m.id: m for m in repo.get_by_ids_for_update(list(wanted))}
+        for post_id, i in wanted.items():
+            if post_id not in found:
+                result.fail(i, "not_found", "BlogPost not found", id=post_id)
+        if cmd.atomic:
+            result.reject()
+
+        try:
+            repo.bulk_delete_permanently(list(found))
+        except Exception as e:
+            raise ServiceException(f"Failed to delete blog posts: {e}")
+        for post_id, model in found.items():
+            emit_blog_post_event(self._sagas, DELETED, model)
+            result.ok(wanted[post_id], "deleted", post_id)
+        return result.to_result("Deleted")
+
+    async def ahandle(self, cmd: DeleteBlogPosts) -> ConcreteResultT:
+        return await sync_to_async(self.handle)(cmd)
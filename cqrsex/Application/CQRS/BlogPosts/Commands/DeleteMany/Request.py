@@ -0,0 +1,23 @@
+from typing import Annotated, ClassVar, Optional, Sequence, Tuple
+from pydantic import Field, PositiveInt
+from pydantic.dataclasses import dataclass
+from cqrsex.Application.Mediator.contracts import ICommand
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.CQRS.BlogPosts.Commands.CreateMany.Request import MAX_BATCH
+from cqrsex.Application.CQRS.BlogPosts.Commands.Delete.Request import DeleteBlogPost
+
+@dataclass(config={'extra': 'forbid'}, frozen=True, slots=True)
+class DeleteBlogPosts(ICommand[ConcreteResultT]):
+    ids: Annotated[Tuple[PositiveInt, ...], Field(min_length=1, max_length=MAX_BATCH)]
+    atomic: bool = True
+
+    batches: ClassVar[type] = DeleteBlogPost
+
+    @classmethod
+    def from_commands(cls, cmds: Sequence[DeleteBlogPost]) -> Optional["DeleteBlogPosts"]:
+        if len({c.id for c in cmds}) != len(cmds):
+            return None     # the batch rejects repeated ids; send them one by one (in order)
+        return cls(ids=tuple(c.id for c in cmds), atomic=False)
+
+    def invalidates(self) -> tuple:
+        return ("blogpost:list", *(f"blogpost:{i}" for i in sorted(set(self.ids))))
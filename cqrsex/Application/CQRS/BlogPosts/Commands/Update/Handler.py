@@ -5,6 +5,9 @@ from injector import inject
 from cqrsex.Application.Mediator.contracts import ICommandHandler
 from cqrsex.Application.CQRS.BlogPosts.Commands.Update.Request import UpdateBlogPost
 from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
+from cqrsex.Application.CQRS.BlogPosts.Events import emit_blog_post_event, UPDATED
+from asgiref.sync import sync_to_async
 from cqrsex.Application.Mapping.BlogPostsMapper import BlogPostMapper
 from cqrsex.Application.Mediator.registry import handler_for
 from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
@@ -14,11 +17,12 @@ from cqrsex.Application.Common.exceptions import ValidationException, NotFoundEx
 @handler_for(UpdateBlogPost)
 class UpdateBlogPostHandler(ICommandHandler[UpdateBlogPost, ConcreteResultT]):
     @inject
-    def __init__(self, repos: IRepositoryManager) -> None:
+    def __init__(self, repos: IRepositoryManager, sagas: ISagaDispatcher) -> None:
         self._repos = repos
+        self._sagas = sagas
    
     def handle(self, cmd: UpdateBlogPost) -> ConcreteResultT:
-        model = self._repos.blog_post_read_repository.get_by_id(cmd.id)
+        model = self._repos.blog_post_write_repository.get_by_id(cmd.id)
         if not model:
             raise NotFoundException("BlogPost not found")
 
@@ -30,5 +34,23 @@ class UpdateBlogPostHandler(ICommandHandler[UpdateBlogPost, ConcreteResultT]):
             updated = self._repos.blog_post_write_repository.update(model)
         except Exception as e:
             raise ServiceException(f"Failed to update BlogPost {cmd.id}: {e}")
+        emit_blog_post_event(self._sagas, UPDATED, updated)
+
+        return ConcreteResultT.success(BlogPostMapper.to_detail(updated), "Updated")
+
+    async def ahandle(self, cmd: UpdateBlogPost) -> ConcreteResultT:
+        model = await self._repos.blog_post_write_repository.aget_by_id(cmd.id)
+        if not model:
+            raise NotFoundException("BlogPost not found")
+
+        if cmd.title is None and cmd.body is None:
+            raise ValidationException("Nothing to update")
+
+        try:
+            BlogPostMapper.apply_update(model, title=cmd.title, body=cmd.body)
+            updated = await self._repos.blog_post_write_repository.aupdate(model)
+        except Exception as e:
+            raise ServiceException(f"Failed to update BlogPost {cmd.id}: {e}")
+        await sync_to_async(emit_blog_post_event)(self._sagas, UPDATED, updated)
 
         return ConcreteResultT.success(BlogPostMapper.to_detail(updated), "Updated")
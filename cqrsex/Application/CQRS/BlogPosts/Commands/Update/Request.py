@@ -11,3 +11,6 @@ class UpdateBlogPost(ICommand[ConcreteResultT]):
     title: Optional[Annotated[str, Field(min_length=1, max_length=256, strip_whitespace=True)]] = None
     body:  Optional[Annotated[str, Field(strip_whitespace=True, max_length=50_000)]] = None
     # Handler enforces: at least one of {title, body} must be provided.
+
+    def invalidates(self) -> tuple:
+        return (f"blogpost:{self.id}", "blogpost:list")
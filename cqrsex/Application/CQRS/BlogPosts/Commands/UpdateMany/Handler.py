@@ -0,0 +1,68 @@
+# cqrsex/Application/CQRS/BlogPosts/Commands/UpdateMany/Handler.py
+from __future__ import annotations
+from typing import Dict, Tuple
+from injector import inject
+from pydantic import TypeAdapter, ValidationError
+from asgiref.sync import sync_to_async
+from cqrsex.Application.Mediator.contracts import ICommandHandler
+from cqrsex.Application.CQRS.BlogPosts.Commands.UpdateMany.Request import UpdateBlogPosts, BlogPostChange
+from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
+from cqrsex.Application.CQRS.BlogPosts.Events import emit_blog_post_event, UPDATED
+from cqrsex.Application.Mapping.BlogPostsMapper import BlogPostMapper
+from cqrsex.Application.Mediator.registry import handler_for
+from cqrsex.Application.Wrapper.BatchResult import BatchResult
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.Common.exceptions import ServiceException
+
+WRITE_BATCH = 500   # rows per UPDATE ... CASE
+_item = TypeAdapter(BlogPostChange)
+
+@handler_for(UpdateBlogPosts)
+class UpdateBlogPostsHandler(ICommandHandler[UpdateBlogPosts, ConcreteResultT]):
+    """Validate, lock all targets with one SELECT ... FOR UPDATE, write with bulk_update."""
+    @inject
+    def __init__(self, repos: IRepositoryManager, sagas: ISagaDispatcher) -> None:
+        self._repos = repos
+        self._sagas = sagas
+
+    def handle(self, cmd: UpdateBlogPosts) -> ConcreteResultT:
+        repo = self._repos.blog_post_write_repository
+        result = BatchResult(len(cmd.items))
+        changes: Dict[int, Tuple[int, BlogPostChange]] = {}
+        for i, raw in enumerate(cmd.items):
+            try:
+                change = _item.validate_python(raw)
+            except ValidationError as err:
+                result.invalid(i, err)
+                continue
+            if change.title is None and change.body is None:
+                result.fail(i, "nothing_to_update", "Nothing to update", id=change.id)
+            elif change.id in changes:
+                result.fail(i, "duplicate_id", "Id appears earlier in this batch", id=change.id)
+            else:
+                changes[change.id] = (i, change)
+
+        found = {m.id: m for m in repo.get_by_ids_for_update(list(changes))} if changes else {}
+        updated = []
+        for post_id, (i, change) in changes.items():
+            model = found.get(post_id)
+            if model is None:
+                result.fail(i, "not_found", "BlogPost not found", id=post_id)
+                continue
+            BlogPostMapper.apply_update(model, title=change.title, body=change.body)
+            updated.append((i, model))
+        if cmd.atomic:
+            result.reject()
+
+        try:
+            repo.bulk_update([m for _, m in updated], ["title", "body"], batch_size=WRITE_BATCH)
+        except Exception as e:
+            raise ServiceException(f"Failed to update blog posts: {e}")
+        for i, model in updated:
+            emit_blog_post_event(self._sagas, UPDATED, model)
+            result.ok(i, "updated", model.id)
+        return result.to_result("Updated")
+
+    async def ahandle(self, cmd: UpdateBlogPosts) -> ConcreteResultT:
+        return await sync_to_async(self.handle)(cmd)
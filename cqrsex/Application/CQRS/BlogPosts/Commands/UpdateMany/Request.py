@@ -0,0 +1,32 @@
+from typing import Any, Annotated, ClassVar, Dict, Optional, Sequence, Tuple
+from pydantic import Field, PositiveInt
+from pydantic.dataclasses import dataclass
+from cqrsex.Application.Mediator.contracts import ICommand
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.CQRS.BlogPosts.Commands.CreateMany.Request import MAX_BATCH
+from cqrsex.Application.CQRS.BlogPosts.Commands.Update.Request import UpdateBlogPost
+
+@dataclass(config={'extra': 'forbid', 'str_strip_whitespace': True}, frozen=True, slots=True)
+class BlogPostChange:
+    id: PositiveInt
+    title: Optional[Annotated[str, Field(min_length=1, max_length=256, strip_whitespace=True)]] = None
+    body:  Optional[Annotated[str, Field(strip_whitespace=True, max_length=50_000)]] = None
+
+@dataclass(config={'extra': 'forbid'}, frozen=True)
+class UpdateBlogPosts(ICommand[ConcreteResultT]):
+    items: Annotated[Tuple[Dict[str, Any], ...], Field(min_length=1, max_length=MAX_BATCH)]   # BlogPostChange
+    atomic: bool = True
+
+    batches: ClassVar[type] = UpdateBlogPost
+
+    @classmethod
+    def from_commands(cls, cmds: Sequence[UpdateBlogPost]) -> Optional["UpdateBlogPosts"]:
+        if len({c.id for c in cmds}) != len(cmds):
+            return None     # the batch rejects repeated ids; send them one by one (in order)
+        return cls(items=tuple({k: v for k, v in (("id", c.id), ("title", c.title), ("body", c.body)) if v is not None}
+                               for c in cmds), atomic=False)
+
+    def invalidates(self) -> tuple:
+        # per-id tags for every item that names an id
+        ids = {i.get("id") for i in self.items if isinstance(i.get("id"), int)}
+        return ("blogpost:list", *(f"blogpost:{i}" for i in sorted(ids)))
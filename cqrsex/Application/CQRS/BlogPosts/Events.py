@@ -0,0 +1,19 @@
+# cqrsex/Application/CQRS/BlogPosts/Events.py
+from __future__ import annotations
+from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
+from cqrsex.Application.Mapping.BlogPostsMapper import BlogPostMapper
+
+# Past-tense actions: GenericCrudSaga only routes (entity, action) pairs that match a
+# command folder (Create/Update/Delete), so these are never re-dispatched as commands.
+CREATED, UPDATED, DELETED = "Created", "Updated", "Deleted"
+
+
+def emit_blog_post_event(sagas: ISagaDispatcher, action: str, post) -> None:
+    # inside the command's unit of work: the outbox row commits with the post
+    sagas.emit(
+        entity="BlogPost",
+        action=action,
+        aggregate_id=post.id,
+        payload=BlogPostMapper.to_event_payload(post),
+        using="default",
+    )
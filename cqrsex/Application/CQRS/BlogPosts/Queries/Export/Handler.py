@@ -0,0 +1,49 @@
+# cqrsex/Application/CQRS/BlogPosts/Queries/Export/Handler.py
+from __future__ import annotations
+from typing import Any, Dict
+from injector import inject
+from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Mediator.contracts import IQueryHandler
+from cqrsex.Application.CQRS.BlogPosts.Queries.Export.Request import ExportBlogPosts
+from cqrsex.Application.Mediator.registry import handler_for
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.Wrapper.RowStream import RowStream
+from cqrsex.Application.Common.exceptions import AppException
+from cqrsex.Application.DTOs.post_dtos import BLOG_POST_EXPORT_FIELDS, pick_fields
+
+@handler_for(ExportBlogPosts)
+class ExportBlogPostsHandler(IQueryHandler[ExportBlogPosts, ConcreteResultT]):
+    @inject
+    def __init__(self, repos: IRepositoryManager) -> None:
+        self._repos = repos
+
+    @staticmethod
+    def _filters(q: ExportBlogPosts) -> Dict[str, Any]:
+        filters: Dict[str, Any] = {}
+        if q.author_id is not None:
+            filters["author_id"] = q.author_id
+        if q.created_from is not None:
+            filters["created_at__gte"] = q.created_from
+        if q.created_to is not None:
+            filters["created_at__lt"] = q.created_to
+        if q.q:
+            filters["title__icontains"] = q.q
+        return filters
+
+    def handle(self, q: ExportBlogPosts) -> ConcreteResultT:
+        try:
+            fields = pick_fields(q.fields, BLOG_POST_EXPORT_FIELDS)
+        except AppException as ex:
+            return ex.to_result()
+        rows = self._repos.blog_post_read_repository.iter_values(
+            fields, chunk_size=q.chunk_size, order_by=("id",), **self._filters(q))
+        return ConcreteResultT.success(RowStream(fields, rows))
+
+    async def ahandle(self, q: ExportBlogPosts) -> ConcreteResultT:
+        try:
+            fields = pick_fields(q.fields, BLOG_POST_EXPORT_FIELDS)
+        except AppException as ex:
+            return ex.to_result()
+        rows = self._repos.blog_post_read_repository.aiter_values(
+            fields, chunk_size=q.chunk_size, order_by=("id",), **self._filters(q))
+        return ConcreteResultT.success(RowStream(fields, rows))
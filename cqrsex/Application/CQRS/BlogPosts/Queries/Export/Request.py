@@ -0,0 +1,17 @@
+# cqrsex/Application/CQRS/BlogPosts/Queries/Export/Request.py
+from datetime import datetime
+from typing import Optional, Annotated, Tuple
+from pydantic.dataclasses import dataclass
+from pydantic import Field, PositiveInt
+from cqrsex.Application.Mediator.contracts import IQuery
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+
+@dataclass(config={'extra': 'forbid'}, frozen=True, slots=True)
+class ExportBlogPosts(IQuery[ConcreteResultT]):
+    # data = RowStream; no cache_tags(): a stream is never cached
+    fields:       Optional[Tuple[str, ...]] = None      # default: every BlogPostDetailDTO column
+    author_id:    Optional[PositiveInt] = None
+    created_from: Optional[datetime] = None             # inclusive
+    created_to:   Optional[datetime] = None             # exclusive
+    q:            Optional[Annotated[str, Field(max_length=200)]] = None   # title contains
+    chunk_size:   Annotated[int, Field(ge=100, le=10_000)] = 2_000
@@ -22,3 +22,9 @@ class GetBlogPostHandler(IQueryHandler[GetBlogPost, ConcreteResultT]):
         if not row:
             return ConcreteResultT.fail("BlogPost not found", StatusCode.NOT_FOUND)
         return ConcreteResultT.success(BlogPostMapper.to_detail(row))
+
+    async def ahandle(self, q: GetBlogPost) -> ConcreteResultT:
+        row = await self._repos.blog_post_read_repository.aget_by_id(q.id)
+        if not row:
+            return ConcreteResultT.fail("BlogPost not found", StatusCode.NOT_FOUND)
+        return ConcreteResultT.success(BlogPostMapper.to_detail(row))
@@ -7,3 +7,6 @@ from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
 @dataclass(config={'extra': 'forbid'}, frozen=True, slots=True)
 class GetBlogPost(IQuery[ConcreteResultT]):
     id: PositiveInt
+
+    def cache_tags(self) -> tuple:
+        return (f"blogpost:{self.id}",)
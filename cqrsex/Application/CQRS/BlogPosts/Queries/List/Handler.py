@@ -1,53 +1,87 @@
 # cqrsex/Application/CQRS/BlogPosts/Queries/List/Handler.py
 from __future__ import annotations
+from typing import Any, Dict, List
 from injector import inject
 from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Interfaces.Common.IAuthorLoader import IAuthorLoader
 from cqrsex.Application.Mediator.contracts import IQueryHandler
 from cqrsex.Application.CQRS.BlogPosts.Queries.List.Request import ListBlogPosts
 from cqrsex.Application.Mediator.registry import handler_for
 from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
 from cqrsex.Application.Common.MessageResult import StatusCode
-from cqrsex.Application.Mapping.BlogPostsMapper import BlogPostMapper
+from cqrsex.Application.Common.exceptions import AppException
+from cqrsex.Application.DTOs.post_dtos import BLOG_POST_LIST_FIELDS
 
 MAX_PAGE_SIZE = 200
 
 @handler_for(ListBlogPosts)
 class ListBlogPostsHandler(IQueryHandler[ListBlogPosts, ConcreteResultT]):
     @inject
-    def __init__(self, repos: IRepositoryManager) -> None:
+    def __init__(self, repos: IRepositoryManager, authors: IAuthorLoader) -> None:
         self._repos = repos
+        self._authors = authors
+
+    @staticmethod
+    def _page_args(q: ListBlogPosts) -> Dict[str, Any]:
+        # clamp page size and set deterministic order
+        eff_size = min(max(int(q.page_size or 20), 1), MAX_PAGE_SIZE)
+
+        filters = {}
+        # IMPORTANT: match your FK name. If your model FK is `author`,
+        # Django exposes `author_id` — this is correct. If your FK is
+        # named differently (e.g., `user`), change the key to `user_id`.
+        if q.author_id is not None:
+            filters["author_id"] = q.author_id
+
+        return dict(
+            page=max(int(q.page or 1), 1),
+            page_size=eff_size,
+            order_by=("-id",),   # force stable paging
+            fields=BLOG_POST_LIST_FIELDS,   # values() rows, no body, no model instances
+            **filters,
+        )
+
+    def _to_result(self, q: ListBlogPosts, dtos: List[Dict[str, Any]], pagination: Dict[str, Any]) -> ConcreteResultT:
+        # rows are already plain dicts (BlogPostListItemDTO fields)
+        if q.with_author:
+            self._authors.attach(dtos)
+        return ConcreteResultT.success(dtos, pagination=pagination)
+
+    async def _ato_result(self, q: ListBlogPosts, dtos: List[Dict[str, Any]], pagination: Dict[str, Any]) -> ConcreteResultT:
+        if q.with_author:
+            await self._authors.aattach(dtos)
+        return ConcreteResultT.success(dtos, pagination=pagination)
+
+    @staticmethod
+    def _cursor_args(q: ListBlogPosts, args: Dict[str, Any]) -> Dict[str, Any]:
+        # keyset mode seeks on "-id" — the same stable order offset paging forces
+        kw = {k: v for k, v in args.items() if k not in ("page", "order_by")}
+        return dict(kw, cursor=q.cursor, order_by="-id")
 
     def handle(self, q: ListBlogPosts) -> ConcreteResultT:
         try:
-            # clamp page size and set deterministic order
-            eff_size = min(max(int(q.page_size or 20), 1), MAX_PAGE_SIZE)
-
-            filters = {}
-            # IMPORTANT: match your FK name. If your model FK is `author`,
-            # Django exposes `author_id` — this is correct. If your FK is
-            # named differently (e.g., `user`), change the key to `user_id`.
-            if q.author_id is not None:
-                filters["author_id"] = q.author_id
-
-            items, total = self._repos.blog_post_read_repository.get_paginated(
-                page=max(int(q.page or 1), 1),
-                page_size=eff_size,
-                order_by=("-id",),   # force stable paging
-                **filters,
-            )
-
-            # map models -> plain dicts (DTOs) so JSON never drops them
-            dtos = [BlogPostMapper.to_summary(x) if hasattr(BlogPostMapper, "to_summary")
-                    else BlogPostMapper.to_detail(x)
-                    for x in items]
-
-            pagination = {
-                "total": total,
-                "page": q.page,
-                "page_size": eff_size,                         # use clamped size
-                "total_pages": (total + eff_size - 1) // eff_size,
-            }
-            return ConcreteResultT.success(dtos, pagination=pagination)
+            args = self._page_args(q)
+            if q.use_cursor:
+                kp = self._repos.blog_post_read_repository.get_keyset_page(**self._cursor_args(q, args))
+                return self._to_result(q, kp.items, kp.pagination(args["page_size"]))
+            op = self._repos.blog_post_read_repository.get_page(count_mode=q.count, **args)
+            return self._to_result(q, op.items, op.pagination())
+
+        except AppException as ex:           # e.g. invalid cursor/count mode -> 400, not 500
+            return ex.to_result()
+        except Exception as e:
+            return ConcreteResultT.fail(f"Failed to list BlogPosts: {e}", StatusCode.INTERNAL_SERVER_ERROR)
+
+    async def ahandle(self, q: ListBlogPosts) -> ConcreteResultT:
+        try:
+            args = self._page_args(q)
+            if q.use_cursor:
+                kp = await self._repos.blog_post_read_repository.aget_keyset_page(**self._cursor_args(q, args))
+                return await self._ato_result(q, kp.items, kp.pagination(args["page_size"]))
+            op = await self._repos.blog_post_read_repository.aget_page(count_mode=q.count, **args)
+            return await self._ato_result(q, op.items, op.pagination())
 
+        except AppException as ex:           # e.g. invalid cursor/count mode -> 400, not 500
+            return ex.to_result()
         except Exception as e:
             return ConcreteResultT.fail(f"Failed to list BlogPosts: {e}", StatusCode.INTERNAL_SERVER_ERROR)
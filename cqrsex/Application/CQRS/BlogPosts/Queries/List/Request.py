@@ -1,5 +1,5 @@
 # cqrsex/Application/CQRS/BlogPosts/Queries/List/Request.py
-from typing import Optional, Annotated
+from typing import Optional, Annotated, Literal
 from pydantic.dataclasses import dataclass
 from pydantic import Field, PositiveInt
 from cqrsex.Application.Mediator.contracts import IQuery
@@ -10,3 +10,17 @@ class ListBlogPosts(IQuery[ConcreteResultT]):
     page:      Annotated[int, Field(ge=1)] = 1
     page_size: Annotated[int, Field(ge=1, le=200)] = 20
     author_id: Optional[PositiveInt] = None
+    # "cursor" = keyset paging (no COUNT/OFFSET); a cursor implies it
+    paging:    Literal["offset", "cursor"] = "offset"
+    cursor:    Optional[Annotated[str, Field(max_length=512)]] = None
+    # how offset paging gets its total; "none" skips COUNT(*) entirely
+    count:     Literal["exact", "none", "estimated", "cached"] = "exact"
+    # embed {"author": {id, username, first_name, last_name}} (batched auth_db lookup)
+    with_author: bool = True
+
+    @property
+    def use_cursor(self) -> bool:
+        return self.paging == "cursor" or bool(self.cursor)
+
+    def cache_tags(self) -> tuple:
+        return ("blogpost:list",)
@@ -0,0 +1,44 @@
+# cqrsex/Application/CQRS/BlogPosts/Queries/Search/Handler.py
+from __future__ import annotations
+from injector import inject
+from cqrsex.Application.Interfaces.Common.IAuthorLoader import IAuthorLoader
+from cqrsex.Application.Interfaces.Repositories.IBlogPostSearchRepository import IBlogPostSearchRepository
+from cqrsex.Application.Mediator.contracts import IQueryHandler
+from cqrsex.Application.CQRS.BlogPosts.Queries.Search.Request import SearchBlogPosts
+from cqrsex.Application.Mediator.registry import handler_for
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.Common.MessageResult import StatusCode
+from cqrsex.Application.Common.exceptions import AppException
+
+@handler_for(SearchBlogPosts)
+class SearchBlogPostsHandler(IQueryHandler[SearchBlogPosts, ConcreteResultT]):
+    @inject
+    def __init__(self, search: IBlogPostSearchRepository, authors: IAuthorLoader) -> None:
+        self._search = search
+        self._authors = authors
+
+    @staticmethod
+    def _args(q: SearchBlogPosts) -> dict:
+        return dict(page_size=q.page_size, cursor=q.cursor, author_id=q.author_id, highlight=q.highlight)
+
+    def handle(self, q: SearchBlogPosts) -> ConcreteResultT:
+        try:
+            kp = self._search.search(q.q, **self._args(q))
+            if q.with_author:
+                self._authors.attach(kp.items)
+            return ConcreteResultT.success(kp.items, pagination=kp.pagination(q.page_size))
+        except AppException as ex:           # invalid cursor -> 400
+            return ex.to_result()
+        except Exception as e:
+            return ConcreteResultT.fail(f"Failed to search BlogPosts: {e}", StatusCode.INTERNAL_SERVER_ERROR)
+
+    async def ahandle(self, q: SearchBlogPosts) -> ConcreteResultT:
+        try:
+            kp = await self._search.asearch(q.q, **self._args(q))
+            if q.with_author:
+                await self._authors.aattach(kp.items)
+            return ConcreteResultT.success(kp.items, pagination=kp.pagination(q.page_size))
+        except AppException as ex:
+            return ex.to_result()
+        except Exception as e:
+            return ConcreteResultT.fail(f"Failed to search BlogPosts: {e}", StatusCode.INTERNAL_SERVER_ERROR)
@@ -0,0 +1,20 @@
+# cqrsex/Application/CQRS/BlogPosts/Queries/Search/Request.py
+from typing import Optional, Annotated
+from pydantic.dataclasses import dataclass
+from pydantic import Field, PositiveInt
+from cqrsex.Application.Mediator.contracts import IQuery
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+
+@dataclass(config={'extra': 'forbid'}, frozen=True, slots=True)
+class SearchBlogPosts(IQuery[ConcreteResultT]):
+    # full-text: words are stemmed and ranked (title above body), best match first
+    q:         Annotated[str, Field(min_length=1, max_length=200)]
+    page_size: Annotated[int, Field(ge=1, le=100)] = 20
+    cursor:    Optional[Annotated[str, Field(max_length=512)]] = None
+    author_id: Optional[PositiveInt] = None
+    # {"highlight": {"title", "body"}} with matches wrapped in <mark>, body as a snippet
+    highlight: bool = True
+    with_author: bool = True
+
+    def cache_tags(self) -> tuple:
+        return ("blogpost:search",)
@@ -1,6 +1,7 @@
 # cqrsex/Application/CQRS/Users/Commands/Create/Handler.py
 from __future__ import annotations
 import logging
+from asgiref.sync import sync_to_async
 from injector import inject
 from django.db import IntegrityError
 
@@ -22,14 +23,29 @@ class CreateUserHandler(ICommandHandler[CreateUser, ConcreteResultT]):
         self._repos = repos
         self._sagas = sagas
 
-    def handle(self, cmd: CreateUser) -> ConcreteResultT:
-        # validation
+    @staticmethod
+    def _validate(cmd: CreateUser) -> None:
         if not cmd.username: raise ValidationException("username is required")
         if not cmd.password: raise ValidationException("password is required")
         if not cmd.email:    raise ValidationException("email is required")
         if cmd.user_type not in {"ADMIN", "CUSTOMER", "SUPPLIER"}:
             raise ValidationException("invalid user_type")
 
+    def _emit_created(self, saved) -> None:
+        # emit post-commit event on SAME DB alias as the write repo
+        self._sagas.emit(
+            entity="User",
+            action="Created",
+            aggregate_id=saved.id,
+            payload={"id": saved.id, "email": saved.email},
+            #using=using_alias,
+            using="default",
+        )
+
+    def handle(self, cmd: CreateUser) -> ConcreteResultT:
+        # validation
+        self._validate(cmd)
+
         # pre-uniqueness checks (still keep them for fast fail)
         if self._repos.user_read_repository.exists_by_username(cmd.username.strip()):
             raise ValidationException("username already exists")
@@ -40,16 +56,7 @@ class CreateUserHandler(ICommandHandler[CreateUser, ConcreteResultT]):
             # write user
             user_model = to_model_from_create(cmd)
             saved = self._repos.user_write_repository.add(user_model)
-
-            # emit post-commit event on SAME DB alias as the write repo
-            self._sagas.emit(
-                entity="User",
-                action="Created",
-                aggregate_id=saved.id,
-                payload={"id": saved.id, "email": saved.email},
-                #using=using_alias,
-                using="default",
-            )
+            self._emit_created(saved)
 
             return ConcreteResultT.success(to_detail(saved), "Created")
 
@@ -60,3 +67,26 @@ class CreateUserHandler(ICommandHandler[CreateUser, ConcreteResultT]):
         except Exception as e:
             # unexpected — let TransactionBehavior roll back
             raise ServiceException(f"failed to create user: {e}")
+
+    async def ahandle(self, cmd: CreateUser) -> ConcreteResultT:
+        self._validate(cmd)
+
+        if await self._repos.user_read_repository.aexists_by_username(cmd.username.strip()):
+            raise ValidationException("username already exists")
+        if await self._repos.user_read_repository.aexists_by_email(cmd.email.strip()):
+            raise ValidationException("email already exists")
+
+        try:
+            # password hashing is CPU-bound: keep it off the event loop and the ORM thread
+            user_model = await sync_to_async(to_model_from_create, thread_sensitive=False)(cmd)
+            saved = await self._repos.user_write_repository.aadd(user_model)
+            # on_commit must be registered on the thread that owns the transaction
+            await sync_to_async(self._emit_created)(saved)
+
+            return ConcreteResultT.success(to_detail(saved), "Created")
+
+        except IntegrityError:
+            raise ValidationException("email already exists")
+
+        except Exception as e:
+            raise ServiceException(f"failed to create user: {e}")
@@ -1,6 +1,7 @@
 # cqrsex/Application/CQRS/Users/Commands/Create/Request.py
 from dataclasses import dataclass
-from cqrsex.Application.Mediator.contracts import ICommand
+from typing import Optional
+from cqrsex.Application.Mediator.contracts import CommandMeta, ICommand
 from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
 
 @dataclass(frozen=True)
@@ -11,4 +12,7 @@ class CreateUser(ICommand[ConcreteResultT]):
     user_type: str = "CUSTOMER"
     allow_anonymous: bool = False  # <-- keep this
     db_alias: str | None = None
+    meta: Optional[CommandMeta] = None  # idempotency_key: a retried signup creates one user
 
+    def invalidates(self) -> tuple:
+        return ("user:list",)
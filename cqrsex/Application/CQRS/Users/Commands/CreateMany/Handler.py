@@ -0,0 +1,131 @@
+# cqrsex/Application/CQRS/Users/Commands/CreateMany/Handler.py
+from __future__ import annotations
+import logging
+from typing import Dict, List, Tuple
+from asgiref.sync import sync_to_async
+from injector import inject
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError
+
+from cqrsex.Application.Mediator.contracts import ICommandHandler
+from cqrsex.Application.CQRS.Users.Commands.Create.Handler import CreateUserHandler
+from cqrsex.Application.CQRS.Users.Commands.Create.Request import CreateUser
+from cqrsex.Application.CQRS.Users.Commands.CreateMany.Request import CreateUsers
+from cqrsex.Application.Interfaces.Common.IPasswordHasher import IPasswordHasher
+from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
+from cqrsex.Application.Wrapper.BatchResult import BatchResult
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.Mediator.registry import handler_for
+from cqrsex.Application.Common.exceptions import ConflictException, ValidationException, ServiceException
+from cqrsex.Application.Mapping.UsersMapper import to_model_from_create
+
+log = logging.getLogger(__name__)
+
+WRITE_BATCH = 1_000
+_FIELDS = {"username", "password", "email", "user_type"}
+
+Accepted = List[Tuple[int, CreateUser]]
+
+@handler_for(CreateUsers)
+class CreateUsersHandler(ICommandHandler[CreateUsers, ConcreteResultT]):
+    """
+    CreateUser for many rows: emails and AUTH_PASSWORD_VALIDATORS checked per item, one
+    case-insensitive uniqueness query per column for the whole batch, passwords hashed on the IPasswordHasher pool, one bulk INSERT on auth_db,
+    and the Created events land in the outbox with one INSERT at commit.
+    """
+    @inject
+    def __init__(self, repos: IRepositoryManager, sagas: ISagaDispatcher, hasher: IPasswordHasher) -> None:
+        self._repos = repos
+        self._sagas = sagas
+        self._hasher = hasher
+
+    def _check(self, cmd: CreateUsers, result: BatchResult) -> Accepted:
+        rows: Accepted = []
+        for i, raw in enumerate(cmd.items):
+            if not isinstance(raw, dict):
+                result.fail(i, "validation_error", "item must be an object")
+                continue
+            unknown = set(raw) - _FIELDS
+            if unknown:
+                result.fail(i, "validation_error", f"unexpected fields: {sorted(unknown)}")
+                continue
+            values = {"username": "", "password": "", "email": "", **raw}
+            if not all(isinstance(v, str) for v in values.values()):
+                result.fail(i, "validation_error", "fields must be strings")
+                continue
+            user = CreateUser(**{k: (v.strip() if isinstance(v, str) else v) for k, v in values.items()})
+            try:
+                CreateUserHandler._validate(user)
+            except ValidationException as ex:
+                result.fail(i, "validation_error", ex.message)
+                continue
+            try:
+                validate_email(user.email)
+                # AUTH_PASSWORD_VALIDATORS, before any hashing work is spent on the row
+                validate_password(user.password, user=to_model_from_create(user, ""))
+            except DjangoValidationError as ex:
+                result.fail(i, "validation_error", " ".join(ex.messages))
+                continue
+            rows.append((i, user))
+
+        users = self._repos.user_read_repository
+        taken_names = users.existing_usernames(u.username for _, u in rows)
+        taken_emails = users.existing_emails(u.email for _, u in rows)
+        seen_names: Dict[str, int] = {}
+        seen_emails: Dict[str, int] = {}
+        accepted: Accepted = []
+        for i, user in rows:
+            name, email = user.username.lower(), user.email.lower()
+            if name in taken_names:
+                result.fail(i, "username_taken", "username already exists")
+            elif email in taken_emails:
+                result.fail(i, "email_taken", "email already exists")
+            elif name in seen_names:
+                result.fail(i, "duplicate_username", f"username repeats item {seen_names[name]}")
+            elif email in seen_emails:
+                result.fail(i, "duplicate_email", f"email repeats item {seen_emails[email]}")
+            else:
+                seen_names[name], seen_emails[email] = i, i
+                accepted.append((i, user))
+        if cmd.atomic:
+            result.reject()
+        return accepted
+
+    def _write(self, accepted: Accepted, hashes: List[str], result: BatchResult) -> ConcreteResultT:
+        models = [to_model_from_create(user, h) for (_, user), h in zip(accepted, hashes)]
+        try:
+            self._repos.user_write_repository.bulk_add(models, batch_size=WRITE_BATCH)
+        except IntegrityError:
+            # a concurrent insert took a name/email after _check; nothing of this batch was written
+            raise ConflictException("username or email already exists; retry the batch")
+        except Exception as e:
+            raise ServiceException(f"failed to create users: {e}")
+
+        for (i, _), saved in zip(accepted, models):
+            self._sagas.emit(
+                entity="User",
+                action="Created",
+                aggregate_id=saved.id,
+                payload={"id": saved.id, "email": saved.email},
+                using="default",
+            )
+            result.ok(i, "created", saved.id)
+        log.info("bulk user create: %d created, %d rejected", len(models), len(result.failed()))
+        return result.to_result("Created")
+
+    def handle(self, cmd: CreateUsers) -> ConcreteResultT:
+        result = BatchResult(len(cmd.items))
+        accepted = self._check(cmd, result)
+        hashes = self._hasher.hash_many([u.password for _, u in accepted])
+        return self._write(accepted, hashes, result)
+
+    async def ahandle(self, cmd: CreateUsers) -> ConcreteResultT:
+        result = BatchResult(len(cmd.items))
+        accepted = await sync_to_async(self._check)(cmd, result)
+        # CPU-bound and off the ORM thread, like CreateUserHandler.ahandle
+        hashes = await sync_to_async(self._hasher.hash_many, thread_sensitive=False)([u.password for _, u in accepted])
+        # on_commit / the outbox buffer belong to the thread that owns the transaction
+        return await sync_to_async(self._write)(accepted, hashes, result)
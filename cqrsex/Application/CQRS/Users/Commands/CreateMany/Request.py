@@ -0,0 +1,33 @@
+# cqrsex/Application/CQRS/Users/Commands/CreateMany/Request.py
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Optional, Sequence, Tuple
+from cqrsex.Application.Mediator.contracts import CommandMeta, ICommand
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.CQRS.Users.Commands.Create.Request import CreateUser
+
+MAX_BATCH = 5_000
+
+@dataclass(frozen=True)
+class CreateUsers(ICommand[ConcreteResultT]):
+    # each item has CreateUser's fields: username, password, email, user_type
+    items: Tuple[Dict[str, Any], ...]
+    # False (default): create the valid rows and report the rest; True: any bad row rejects all
+    atomic: bool = False
+    meta: Optional[CommandMeta] = None
+
+    batches: ClassVar[type] = CreateUser
+
+    @classmethod
+    def from_commands(cls, cmds: Sequence[CreateUser]) -> Optional["CreateUsers"]:
+        # the batch always writes to auth_db
+        if any(c.db_alias for c in cmds):
+            return None
+        return cls(items=tuple({"username": c.username, "password": c.password, "email": c.email,
+                                "user_type": c.user_type} for c in cmds))
+
+    def __post_init__(self) -> None:
+        if not 1 <= len(self.items) <= MAX_BATCH:
+            raise ValueError(f"items must hold 1..{MAX_BATCH} users")
+
+    def invalidates(self) -> tuple:
+        return ("user:list",)
@@ -28,3 +28,18 @@ class DeleteUserHandler(ICommandHandler[DeleteUser, ConcreteResultT]):
             raise ServiceException(f"failed to delete user {cmd.id}: {e}")
 
         return ConcreteResultT.success(message="Deleted")
+
+    async def ahandle(self, cmd: DeleteUser) -> ConcreteResultT:
+        if not cmd.acting_is_admin:
+            raise PermissionDeniedException("Only admin can delete users")
+
+        u = await self._repos.user_read_repository.aget_by_id(cmd.id)
+        if not u:
+            raise NotFoundException("User not found")
+
+        try:
+            await self._repos.user_write_repository.adelete_permanently(u)
+        except Exception as e:
+            raise ServiceException(f"failed to delete user {cmd.id}: {e}")
+
+        return ConcreteResultT.success(message="Deleted")
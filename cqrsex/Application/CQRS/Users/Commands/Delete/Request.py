@@ -7,3 +7,7 @@ class DeleteUser(ICommand[ConcreteResultT]):
     id: int
     acting_user_id: int | None = None
     acting_is_admin: bool = False
+
+    def invalidates(self) -> tuple:
+        # blog post lists/searches embed the author summary (with_author)
+        return (f"user:{self.id}", "user:list", "blogpost:list", "blogpost:search")
@@ -1,4 +1,6 @@
 from __future__ import annotations
+from typing import Optional
+from asgiref.sync import sync_to_async
 from injector import inject
 from django.contrib.auth import get_user_model
 
@@ -20,23 +22,19 @@ class UpdateUserHandler(ICommandHandler[UpdateUser, ConcreteResultT]):
     def __init__(self, repos: IRepositoryManager) -> None:
         self._repos = repos
 
-    def handle(self, cmd: UpdateUser) -> ConcreteResultT:
-        u = self._repos.user_read_repository.get_by_id(cmd.id)
-        if not u:
-            raise NotFoundException("User not found")
+    @staticmethod
+    def _clean_email(cmd: UpdateUser) -> Optional[str]:
+        if cmd.email is None:
+            return None
+        em = cmd.email.strip()
+        if not em:
+            raise ValidationException("email cannot be empty")
+        return em
 
-        # permissions
-        if not cmd.acting_is_admin and cmd.acting_user_id != u.id:
-            raise PermissionDeniedException("Not allowed")
-
-        # basic updates
-        if cmd.email is not None:
-            em = cmd.email.strip()
-            if not em:
-                raise ValidationException("email cannot be empty")
-            if self._repos.user_read_repository.exists_email_excluding_id(em, u.id):
-                raise ValidationException("email already in use")
-            u.email = em
+    @staticmethod
+    def _apply(cmd: UpdateUser, u, email: Optional[str]) -> None:
+        if email is not None:
+            u.email = email
 
         if cmd.first_name is not None:
             u.first_name = (cmd.first_name or "").strip()
@@ -63,9 +61,45 @@ class UpdateUserHandler(ICommandHandler[UpdateUser, ConcreteResultT]):
                 raise PermissionDeniedException("Only admin can change active status")
             u.is_active = bool(cmd.is_active)
 
+    def handle(self, cmd: UpdateUser) -> ConcreteResultT:
+        u = self._repos.user_read_repository.get_by_id(cmd.id)
+        if not u:
+            raise NotFoundException("User not found")
+
+        # permissions
+        if not cmd.acting_is_admin and cmd.acting_user_id != u.id:
+            raise PermissionDeniedException("Not allowed")
+
+        # basic updates
+        em = self._clean_email(cmd)
+        if em is not None and self._repos.user_read_repository.exists_email_excluding_id(em, u.id):
+            raise ValidationException("email already in use")
+        self._apply(cmd, u, em)
+
         try:
             saved = self._repos.user_write_repository.update(u)
         except Exception as e:
             raise ServiceException(f"failed to update user: {e}")
 
         return ConcreteResultT.success(to_detail(saved), "Updated")
+
+    async def ahandle(self, cmd: UpdateUser) -> ConcreteResultT:
+        u = await self._repos.user_read_repository.aget_by_id(cmd.id)
+        if not u:
+            raise NotFoundException("User not found")
+
+        if not cmd.acting_is_admin and cmd.acting_user_id != u.id:
+            raise PermissionDeniedException("Not allowed")
+
+        em = self._clean_email(cmd)
+        if em is not None and await self._repos.user_read_repository.aexists_email_excluding_id(em, u.id):
+            raise ValidationException("email already in use")
+        # set_password hashes: keep it off the event loop
+        await sync_to_async(self._apply, thread_sensitive=False)(cmd, u, em)
+
+        try:
+            saved = await self._repos.user_write_repository.aupdate(u)
+        except Exception as e:
+            raise ServiceException(f"failed to update user: {e}")
+
+        return ConcreteResultT.success(to_detail(saved), "Updated")
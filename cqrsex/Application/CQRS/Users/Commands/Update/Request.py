@@ -19,3 +19,10 @@ class UpdateUser(ICommand[ConcreteResultT]):
     # context from controller
     acting_user_id: Optional[int] = None
     acting_is_admin: bool = False
+
+    def invalidates(self) -> tuple:
+        tags = (f"user:{self.id}", "user:list")
+        # blog post lists/searches embed the author's name (with_author)
+        if self.first_name is not None or self.last_name is not None:
+            tags += ("blogpost:list", "blogpost:search")
+        return tags
@@ -0,0 +1,48 @@
+from __future__ import annotations
+from typing import Any, Dict
+from injector import inject
+from cqrsex.Application.Mediator.contracts import IQueryHandler
+from cqrsex.Application.CQRS.Users.Queries.Export.Request import ExportUsers
+from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.Wrapper.RowStream import RowStream
+from cqrsex.Application.Common.exceptions import AppException
+from cqrsex.Application.Mediator.registry import handler_for
+from cqrsex.Application.DTOs.post_dtos import pick_fields
+from cqrsex.Application.DTOs.user_dtos import USER_LIST_FIELDS
+
+MAX_CHUNK_SIZE = 10_000
+
+@handler_for(ExportUsers)
+class ExportUsersHandler(IQueryHandler[ExportUsers, ConcreteResultT]):
+    @inject
+    def __init__(self, repos: IRepositoryManager) -> None:
+        self._repos = repos
+
+    @staticmethod
+    def _args(q: ExportUsers) -> Dict[str, Any]:
+        args: Dict[str, Any] = dict(
+            chunk_size=min(max(int(q.chunk_size or 2_000), 100), MAX_CHUNK_SIZE),
+            q=q.q, user_type=q.user_type,
+        )
+        if q.is_active is not None:
+            args["is_active"] = q.is_active
+        if q.joined_from is not None:
+            args["date_joined__gte"] = q.joined_from
+        if q.joined_to is not None:
+            args["date_joined__lt"] = q.joined_to
+        return args
+
+    def handle(self, q: ExportUsers) -> ConcreteResultT:
+        try:
+            fields = pick_fields(q.fields, USER_LIST_FIELDS)
+        except AppException as ex:
+            return ex.to_result()
+        return ConcreteResultT.success(RowStream(fields, self._repos.user_read_repository.iter_values(fields, **self._args(q))))
+
+    async def ahandle(self, q: ExportUsers) -> ConcreteResultT:
+        try:
+            fields = pick_fields(q.fields, USER_LIST_FIELDS)
+        except AppException as ex:
+            return ex.to_result()
+        return ConcreteResultT.success(RowStream(fields, self._repos.user_read_repository.aiter_values(fields, **self._args(q))))
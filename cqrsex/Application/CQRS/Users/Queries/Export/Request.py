@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+from cqrsex.Application.Mediator.contracts import IQuery
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+
+@dataclass(frozen=True)
+class ExportUsers(IQuery[ConcreteResultT]):
+    # data = RowStream; no cache_tags(): a stream is never cached
+    fields: Optional[Tuple[str, ...]] = None   # subset of UserListItemDTO (never password)
+    q: Optional[str] = None                    # search username/email
+    user_type: Optional[str] = None
+    is_active: Optional[bool] = None
+    joined_from: Optional[datetime] = None     # inclusive
+    joined_to: Optional[datetime] = None       # exclusive
+    chunk_size: int = 2_000
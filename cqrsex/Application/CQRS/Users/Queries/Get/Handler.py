@@ -19,3 +19,9 @@ class GetUserHandler(IQueryHandler[GetUser, ConcreteResultT]):
         if not u:
             return ConcreteResultT.fail("User not found", StatusCode.NOT_FOUND)
         return ConcreteResultT.success(to_detail(u))
+
+    async def ahandle(self, q: GetUser) -> ConcreteResultT:
+        u = await self._repos.user_read_repository.aget_by_id(q.id)
+        if not u:
+            return ConcreteResultT.fail("User not found", StatusCode.NOT_FOUND)
+        return ConcreteResultT.success(to_detail(u))
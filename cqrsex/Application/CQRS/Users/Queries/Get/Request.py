@@ -5,3 +5,6 @@ from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
 @dataclass(frozen=True)
 class GetUser(IQuery[ConcreteResultT]):
     id: int
+
+    def cache_tags(self) -> tuple:
+        return (f"user:{self.id}",)
@@ -4,8 +4,10 @@ from cqrsex.Application.Mediator.contracts import IQueryHandler
 from cqrsex.Application.CQRS.Users.Queries.List.Request import ListUsers
 from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
 from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Application.Common.exceptions import AppException
 from cqrsex.Application.Mediator.registry import handler_for
-from cqrsex.Application.Mapping.UsersMapper import to_detail
+from cqrsex.Application.Mapping.UsersMapper import to_list_item
+from cqrsex.Application.DTOs.user_dtos import USER_LIST_FIELDS
 
 MAX_PAGE_SIZE = 200
 
@@ -15,18 +17,41 @@ class ListUsersHandler(IQueryHandler[ListUsers, ConcreteResultT]):
     def __init__(self, repos: IRepositoryManager) -> None:
         self._repos = repos
 
-    def handle(self, q: ListUsers) -> ConcreteResultT:
+    @staticmethod
+    def _page(q: ListUsers) -> tuple[int, int]:
         page = max(int(q.page or 1), 1)
         page_size = min(max(int(q.page_size or 20), 1), MAX_PAGE_SIZE)
+        return page, page_size
+
+    def handle(self, q: ListUsers) -> ConcreteResultT:
+        page, page_size = self._page(q)
+        repo = self._repos.user_read_repository
+        try:
+            if q.use_cursor:
+                kp = repo.get_keyset_page(page_size=page_size, cursor=q.cursor, q=q.q, user_type=q.user_type,
+                                         fields=USER_LIST_FIELDS)
+                return self._to_result(kp.items, kp.pagination(page_size))
+            op = repo.get_page(page=page, page_size=page_size, q=q.q, user_type=q.user_type, count_mode=q.count,
+                               fields=USER_LIST_FIELDS)
+            return self._to_result(op.items, op.pagination())
+        except AppException as ex:   # invalid cursor / count mode
+            return ex.to_result()
+
+    async def ahandle(self, q: ListUsers) -> ConcreteResultT:
+        page, page_size = self._page(q)
+        repo = self._repos.user_read_repository
+        try:
+            if q.use_cursor:
+                kp = await repo.aget_keyset_page(page_size=page_size, cursor=q.cursor, q=q.q, user_type=q.user_type,
+                                                fields=USER_LIST_FIELDS)
+                return self._to_result(kp.items, kp.pagination(page_size))
+            op = await repo.aget_page(page=page, page_size=page_size, q=q.q, user_type=q.user_type, count_mode=q.count,
+                                     fields=USER_LIST_FIELDS)
+            return self._to_result(op.items, op.pagination())
+        except AppException as ex:
+            return ex.to_result()
 
-        items, total = self._repos.user_read_repository.get_paginated(
-            page=page, page_size=page_size, q=q.q, user_type=q.user_type
-        )
-        data = [to_detail(u) for u in items]
-        pagination = {
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size,
-        }
-        return ConcreteResultT.success(data, pagination=pagination)
+    @staticmethod
+    def _to_result(rows, pagination: dict) -> ConcreteResultT:
+        # rows are values() dicts (USER_LIST_FIELDS): no model instances on the list path
+        return ConcreteResultT.success([to_list_item(r) for r in rows], pagination=pagination)
@@ -9,3 +9,13 @@ class ListUsers(IQuery[ConcreteResultT]):
     page_size: int = 20
     q: Optional[str] = None          # search username/email
     user_type: Optional[str] = None  # filter by role
+    paging: str = "offset"           # "offset" | "cursor" (keyset, no COUNT/OFFSET)
+    cursor: Optional[str] = None     # opaque; implies paging="cursor"
+    count: str = "exact"             # offset total: exact | none | estimated | cached
+
+    @property
+    def use_cursor(self) -> bool:
+        return self.paging == "cursor" or bool(self.cursor)
+
+    def cache_tags(self) -> tuple:
+        return ("user:list",)
@@ -12,7 +12,7 @@ def pydantic_error_to_result(err: ValidationError) -> ConcreteResultT:
             "type": e.get("type"),
         })
     return ConcreteResultT.fail(
-        message="Validation failed",
-        status=StatusCode.BAD_REQUEST,
-        errors=details,
+        "Validation failed",
+        StatusCode.BAD_REQUEST,
+        {"errors": details},
     )
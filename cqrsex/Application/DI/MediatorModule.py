@@ -5,25 +5,50 @@ from typing import Any, Callable, Dict, Type
 from injector import Module, provider, singleton, Injector
 
 from cqrsex.Application.Mediator.mediator import Mediator
-from cqrsex.Application.Mediator.behaviors import TransactionBehavior
+from cqrsex.Application.Mediator.behaviors import IdempotencyBehavior, TransactionBehavior, QueryCacheBehavior
 from cqrsex.Application.Interfaces.Common.IUnitOfWork import IUnitOfWork
-from cqrsex.Application.Mediator.registry import build_handler_factories
-from cqrsex.Application.Mediator.import_handlers import import_under
+from cqrsex.Application.Interfaces.Common.IAsyncUnitOfWork import IAsyncUnitOfWork
+from cqrsex.Application.Interfaces.Common.IQueryCache import IQueryCache
+from cqrsex.Application.Interfaces.Common.IIdempotencyStore import IIdempotencyStore
+from cqrsex.Application.Mediator.registry import build_handler_factories, lazy_handler_loader
+from cqrsex.Application.Mediator.manifest import get_manifest
 
 log = logging.getLogger(__name__)
 
+
+def manifest_config() -> dict:
+    from django.conf import settings
+    return {"PATH": None, "VALIDATE": True, **(getattr(settings, "CQRS_HANDLER_MANIFEST", {}) or {})}
+
+
+def idempotency_config() -> dict:
+    from django.conf import settings
+    return {"LEASE": 60.0, "WAIT_TIMEOUT": 30.0, **(getattr(settings, "CQRS_IDEMPOTENCY", {}) or {})}
+
+
 class MediatorModule(Module):
     @singleton
     @provider
     def provide_mediator(self, injector: Injector) -> Mediator:
-        import_under(["cqrsex.Application.CQRS"])
-
-        handlers: Dict[Type[Any], Callable[[], Any]] = build_handler_factories(injector)
-        if not handlers:
+        # a valid manifest means no CQRS module is imported here; handlers load on first send
+        cfg = manifest_config()
+        manifest = get_manifest(path=cfg["PATH"], validate=cfg["VALIDATE"])
+        if not manifest.handlers:
             raise RuntimeError("No handlers registered. Check @handler_for on classes, and __init__.py files.")
 
-        log.info("Mediator registered %d handlers: %s",
-                 len(handlers), ", ".join(t.__name__ for t in handlers.keys()))
+        # whatever is already imported (all of it after a scan) is registered up front
+        handlers: Dict[Type[Any], Callable[[], Any]] = build_handler_factories(injector)
+        log.info("Mediator: %d handlers (%d imported, manifest %s)", len(manifest.handlers), len(handlers),
+                 "file" if manifest.from_file else "scan")
 
         uow_factory: Callable[[], IUnitOfWork] = lambda: injector.get(IUnitOfWork)
-        return Mediator(handlers=handlers, behaviors=[TransactionBehavior(uow_factory)], cache_handlers=True)
+        async_uow_factory: Callable[[], IAsyncUnitOfWork] = lambda: injector.get(IAsyncUnitOfWork)
+        idem = idempotency_config()
+        behaviors = [
+            # outermost: a result is stored only after its transaction committed
+            IdempotencyBehavior(injector.get(IIdempotencyStore), lease=idem["LEASE"], wait_timeout=idem["WAIT_TIMEOUT"]),
+            TransactionBehavior(uow_factory, async_uow_factory),
+            QueryCacheBehavior(injector.get(IQueryCache)),  # inside the UoW: invalidates on commit
+        ]
+        return Mediator(handlers=handlers, behaviors=behaviors, cache_handlers=True,
+                        loader=lazy_handler_loader(injector, manifest.handlers))
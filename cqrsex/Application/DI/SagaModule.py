@@ -1,4 +1,5 @@
 # cqrsex/Application/DI/SagaModule.py
+import atexit
 from injector import Module, provider, singleton
 from cqrsex.Application.Mediator.mediator import Mediator
 from cqrsex.Application.Interfaces.Common.ISaga import ISaga
@@ -12,7 +13,11 @@ class SagaModule(Module):
         from cqrsex.Infrstraction.Saga.MultiSaga import MultiSaga
         from cqrsex.Application.Sagas.OutboxSaga import OutboxSaga
         from cqrsex.Application.Sagas.GenericCrudSaga import GenericCrudSaga
-        return MultiSaga([
+        from django.conf import settings
+        cfg = getattr(settings, "CQRS_SAGA_DISPATCH", {}) or {}
+        saga = MultiSaga([
             OutboxSaga(outbox_repo),   # accepts IOutboxRepository fine
             GenericCrudSaga(mediator),
-        ])
+        ], fan_out_workers=cfg.get("FAN_OUT_WORKERS", 0), timeout=cfg.get("SAGA_TIMEOUT"))
+        atexit.register(saga.shutdown, wait=False)
+        return saga
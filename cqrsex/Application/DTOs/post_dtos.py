@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 
 # ---- Write-side DTOs ----
 @dataclass(frozen=True)
@@ -32,3 +32,21 @@ class BlogPostDetailDTO:
     author_id: int
     created_at: datetime
     updated_at: datetime
+
+
+def dto_fields(dto: type) -> Tuple[str, ...]:
+    """Columns a read DTO needs; list queries select exactly these with values()."""
+    return tuple(f.name for f in fields(dto))
+
+def pick_fields(requested: Optional[Sequence[str]], allowed: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Caller's field selection checked against a DTO's columns (None/empty = all of them)."""
+    if not requested:
+        return allowed
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        from cqrsex.Application.Common.exceptions import ValidationException
+        raise ValidationException("Unknown field(s)", {"unknown": unknown, "allowed": list(allowed)}, code="invalid_fields")
+    return tuple(dict.fromkeys(requested))
+
+BLOG_POST_LIST_FIELDS = dto_fields(BlogPostListItemDTO)
+BLOG_POST_EXPORT_FIELDS = dto_fields(BlogPostDetailDTO)
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from cqrsex.Application.DTOs.post_dtos import dto_fields
+
+# ---- Read-side DTOs (view models) ----
+@dataclass(frozen=True)
+class UserListItemDTO:
+    id: int
+    username: str
+    email: str
+    first_name: str
+    last_name: str
+    user_type: Optional[str]
+    is_active: bool
+    date_joined: datetime
+
+USER_LIST_FIELDS = dto_fields(UserListItemDTO)
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+class IAsyncUnitOfWork(ABC):
+    @abstractmethod
+    async def __aenter__(self) -> "IAsyncUnitOfWork": ...
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc, tb) -> Optional[bool]: ...
+    @abstractmethod
+    async def commit(self) -> None: ...
+    @abstractmethod
+    async def rollback(self) -> None: ...
@@ -0,0 +1,31 @@
+# cqrsex/Application/Interfaces/Common/IAuthorLoader.py
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+
+
+class IAuthorLoader(ABC):
+    """
+    Batches author lookups against auth_db (DataLoader style): every id a result
+    references is resolved with one `id__in` query instead of one get_by_id per row.
+    """
+
+    @abstractmethod
+    def load_many(self, ids: Iterable[int]) -> Dict[int, Optional[dict]]:
+        """id -> author summary (None for unknown ids)."""
+
+    @abstractmethod
+    async def aload_many(self, ids: Iterable[int]) -> Dict[int, Optional[dict]]: ...
+
+    def attach(self, dtos: List[dict], *, key: str = "author_id", into: str = "author") -> List[dict]:
+        """Set dto[into] to the summary of dto[key] on every DTO, in place."""
+        found = self.load_many(d.get(key) for d in dtos)
+        for d in dtos:
+            d[into] = found.get(d.get(key))
+        return dtos
+
+    async def aattach(self, dtos: List[dict], *, key: str = "author_id", into: str = "author") -> List[dict]:
+        found = await self.aload_many(d.get(key) for d in dtos)
+        for d in dtos:
+            d[into] = found.get(d.get(key))
+        return dtos
@@ -13,9 +13,11 @@ T = TypeVar('T', bound=models.Model)
 from abc import ABC, abstractmethod
 from typing import (
     TypeVar, Generic, List, Optional, Callable, Any, Tuple,
-    Dict, Sequence, Iterable, Iterator
+    Dict, Sequence, Iterable, Iterator, AsyncIterator
 )
 from django.db import models
+from cqrsex.Application.Wrapper.KeysetPage import KeysetPage
+from cqrsex.Application.Wrapper.OffsetPage import OffsetPage
 class IGenericRepository(ABC, Generic[T]):
     # ---------- Base / Safe ----------
     @abstractmethod
@@ -37,6 +39,29 @@ class IGenericRepository(ABC, Generic[T]):
         **filters
     ) -> Tuple[List[T], int]: ...
     @abstractmethod
+    def get_keyset_page(
+        self,
+        page_size: int,
+        *,
+        cursor: Optional[str] = None,
+        order_by: str = "-id",
+        vendor_id: Optional[Any] = None,
+        fields: Optional[Sequence[str]] = None,   # values() rows instead of models
+        **filters
+    ) -> KeysetPage: ...
+    @abstractmethod
+    def get_page(
+        self,
+        page: int,
+        page_size: int,
+        *,
+        count_mode: str = "exact",
+        vendor_id: Optional[Any] = None,
+        order_by: Optional[Iterable[str]] = None,
+        fields: Optional[Sequence[str]] = None,   # values() rows instead of models
+        **filters
+    ) -> OffsetPage: ...
+    @abstractmethod
     def get_all_as(self, selector: Callable[[T], Any]) -> List[Any]: ...
 
     # ---------- Mutations ----------
@@ -65,9 +90,11 @@ class IGenericRepository(ABC, Generic[T]):
     @abstractmethod
     def atomic_increment(self, id: Any, field: str, amount: int = 1) -> bool: ...
     @abstractmethod
-    def bulk_add(self, entities: List[T], vendor_context: Optional[Any] = None) -> None: ...
+    def bulk_add(self, entities: List[T], vendor_context: Optional[Any] = None, *, batch_size: Optional[int] = None) -> None: ...
     @abstractmethod
-    def bulk_update(self, entities: List[T], fields: List[str]) -> None: ...
+    def bulk_update(self, entities: List[T], fields: List[str], *, batch_size: Optional[int] = None) -> None: ...
+    @abstractmethod
+    def bulk_delete_permanently(self, ids: List[Any]) -> int: ...
 
 
     @abstractmethod
@@ -190,3 +217,75 @@ class IGenericRepository(ABC, Generic[T]):
 
     @abstractmethod
     def bulk_deactivate(self, ids: List[Any], *, vendor_id: Optional[Any] = None) -> int: ...
+
+    # ============================================================
+    # Async (Django async ORM) – same semantics as the sync methods
+    # ============================================================
+    @abstractmethod
+    async def aget_by_id(self, id: Any) -> Optional[T]: ...
+
+    @abstractmethod
+    async def aget_paginated(
+        self,
+        page: int,
+        page_size: int,
+        *,
+        vendor_id: Optional[Any] = None,
+        order_by: Optional[Iterable[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        **filters
+    ) -> Tuple[List[T], int]: ...
+
+    @abstractmethod
+    async def aget_page(
+        self,
+        page: int,
+        page_size: int,
+        *,
+        count_mode: str = "exact",
+        vendor_id: Optional[Any] = None,
+        order_by: Optional[Iterable[str]] = None,
+        fields: Optional[Sequence[str]] = None,   # values() rows instead of models
+        **filters
+    ) -> OffsetPage: ...
+
+    @abstractmethod
+    async def aget_keyset_page(
+        self,
+        page_size: int,
+        *,
+        cursor: Optional[str] = None,
+        order_by: str = "-id",
+        vendor_id: Optional[Any] = None,
+        fields: Optional[Sequence[str]] = None,   # values() rows instead of models
+        **filters
+    ) -> KeysetPage: ...
+
+    @abstractmethod
+    async def afind(self, **filters) -> List[T]: ...
+
+    @abstractmethod
+    async def afind_one(self, **filters) -> Optional[T]: ...
+
+    @abstractmethod
+    async def aadd(self, entity: T, vendor_context: Optional[Any] = None) -> T: ...
+
+    @abstractmethod
+    async def aupdate(self, entity: T) -> T: ...
+
+    @abstractmethod
+    async def adelete_permanently(self, entity: T) -> None: ...
+
+    @abstractmethod
+    async def abulk_add(self, entities: List[T], vendor_context: Optional[Any] = None, *, batch_size: Optional[int] = None) -> None: ...
+
+    @abstractmethod
+    def aiter_values(
+        self,
+        fields: Sequence[str],
+        *,
+        chunk_size: int = 2000,
+        order_by: Optional[Iterable[str]] = None,
+        vendor_id: Optional[Any] = None,
+        **filters
+    ) -> AsyncIterator[Dict[str, Any]]: ...
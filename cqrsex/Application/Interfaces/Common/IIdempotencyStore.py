@@ -0,0 +1,58 @@
+# cqrsex/Application/Interfaces/Common/IIdempotencyStore.py
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class StoredResult(NamedTuple):
+    value: Any
+    # hash of the command that produced it; a repeat with another body must not get it
+    fingerprint: Optional[str] = None
+
+
+class IIdempotencyStore(ABC):
+    """
+    Results of commands sent with meta.idempotency_key (IdempotencyBehavior).
+    A key is claimed while its first execution runs, so a duplicate arriving meanwhile
+    (another worker, another process) waits for that result instead of running again.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[StoredResult]:
+        """The stored result, or None (never stored, expired, or only claimed)."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, *, fingerprint: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        """Store the result of `key`'s execution with its command's fingerprint; this also ends the claim."""
+
+    @abstractmethod
+    def claim(self, key: str, *, ttl: float) -> bool:
+        """
+        Reserve `key` for one execution. False if a result exists or another claim
+        is live; a claim older than `ttl` seconds counts as abandoned.
+        """
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """Drop a claim without a result (the execution failed; a repeat may run)."""
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Delete expired results and abandoned claims; returns how many."""
+
+    @abstractmethod
+    async def aget(self, key: str) -> Optional[StoredResult]: ...
+
+    @abstractmethod
+    async def aset(self, key: str, value: Any, *, fingerprint: Optional[str] = None,
+                   ttl: Optional[float] = None) -> None: ...
+
+    @abstractmethod
+    async def aclaim(self, key: str, *, ttl: float) -> bool: ...
+
+    @abstractmethod
+    async def arelease(self, key: str) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Counters: hits, misses, stores, claims, contended (+ backend specifics)."""
@@ -0,0 +1,21 @@
+# cqrsex/Application/Interfaces/Common/IOutboxPublisher.py
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+
+class IOutboxPublisher(ABC):
+    """
+    Delivers claimed outbox rows to a broker (or a stand-in).
+    Called inside the relay's claim transaction: raise to leave the batch unprocessed
+    for a later retry, return to have it marked processed. Delivery is at-least-once,
+    so consumers must tolerate duplicates (dedupe on event id).
+    """
+
+    @abstractmethod
+    def publish(self, events: Sequence[OutboxEvent]) -> None: ...
+
+    def close(self) -> None:
+        """Flush/release resources when the relay stops."""
@@ -0,0 +1,12 @@
+# cqrsex/Application/Interfaces/Common/IPasswordHasher.py
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+
+class IPasswordHasher(ABC):
+    """Turns raw passwords into Django password hashes (what User.set_password stores)."""
+
+    @abstractmethod
+    def hash_many(self, passwords: Sequence[str]) -> List[str]:
+        """Hashes in input order."""
@@ -0,0 +1,25 @@
+# cqrsex/Application/Interfaces/Common/IProjection.py
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Iterable, Sequence, Tuple
+
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+
+class IProjection(ABC):
+    """
+    Maintains a read model from outbox events.
+    The engine feeds events in id order and stores the projection's checkpoint in the
+    same transaction as apply(), so each event takes effect exactly once.
+    """
+    name: str = ""
+    aggregate_types: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()   # query-cache tags bumped wholesale after a rebuild
+
+    @abstractmethod
+    def apply(self, events: Sequence[OutboxEvent]) -> Iterable[str]:
+        """Apply a batch; return the query-cache tags whose results changed."""
+
+    @abstractmethod
+    def rebuild(self) -> None:
+        """Recreate the read model from the source tables (the outbox may be trimmed)."""
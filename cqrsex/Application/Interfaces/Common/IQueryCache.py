@@ -0,0 +1,52 @@
+# cqrsex/Application/Interfaces/Common/IQueryCache.py
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+
+class IQueryCache(ABC):
+    """
+    Tag-versioned query result cache.
+    A cached entry remembers the version of each of its tags at read time; bumping a
+    tag (invalidate_tags) makes every entry that carries it stale.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry/stale tags."""
+
+    @abstractmethod
+    def tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """Snapshot current tag versions. Take it BEFORE running the query."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, *, tags: Dict[str, int], ttl: Optional[float] = None) -> None:
+        """Store `value` under `key` with the tag snapshot from tag_versions(). ttl None = default, 0 = do not store."""
+
+    @abstractmethod
+    async def aget(self, key: Hashable) -> Optional[Any]:
+        """Async get(): never blocks the event loop on a networked backend."""
+
+    @abstractmethod
+    async def atag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """Async tag_versions()."""
+
+    @abstractmethod
+    async def aset(self, key: Hashable, value: Any, *, tags: Dict[str, int], ttl: Optional[float] = None) -> None:
+        """Async set()."""
+
+    @abstractmethod
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Bump the given tags now."""
+
+    @abstractmethod
+    def invalidate_after_commit(self, tags: Iterable[str], *, using: Optional[str] = None) -> None:
+        """Bump the given tags once the active transaction(s) commit (immediately if none)."""
+
+    @abstractmethod
+    async def ainvalidate_after_commit(self, tags: Iterable[str], *, using: Optional[str] = None) -> None:
+        """Async variant: registers the hook on the thread that owns the transaction."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Counters: hits, misses, evictions, invalidations (+ backend specifics)."""
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from cqrsex.Application.Interfaces.Repositories.IBlogPostReadRepository import IBlogPostReadRepository
 from cqrsex.Application.Interfaces.Repositories.IBlogPostWriteRepository import IBlogPostWriteRepository
+from cqrsex.Application.Interfaces.Repositories.IUserReadRepository import IUserReadRepository
+from cqrsex.Application.Interfaces.Repositories.IUserWriteRepository import IUserWriteRepository
 
 class IRepositoryManager(ABC):
     @property
@@ -10,3 +12,11 @@ class IRepositoryManager(ABC):
     @property
     @abstractmethod
     def blog_post_write_repository(self) -> IBlogPostWriteRepository: ...
+
+    @property
+    @abstractmethod
+    def user_read_repository(self) -> IUserReadRepository: ...
+
+    @property
+    @abstractmethod
+    def user_write_repository(self) -> IUserWriteRepository: ...
@@ -1,9 +1,58 @@
 # cqrsex/Application/Interfaces/Common/ISaga.py
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Optional, Sequence, Tuple
 
 class ISaga(ABC):
+    # True: shares no state or ordering with the other sagas of a MultiSaga, so it may
+    # run concurrently with them (MultiSaga fan-out). False: runs in list order.
+    independent: bool = False
+    # seconds before a fanned-out run counts as failed (None: MultiSaga's default)
+    timeout: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
     @abstractmethod
     def process(self, event: Any) -> None:
         ...
+
+    def process_many(self, events: Sequence[Any]) -> None:
+        """
+        Events committed together, in emit order. Override to vectorize (one INSERT, one
+        batch command); the default processes them one by one.
+        """
+        for event in events:
+            self.process(event)
+
+    def before_commit(self, event: Any) -> None:
+        """
+        Called while the emitting transaction is still open (only when a unit of work
+        with an outbox buffer is active on the event's alias). Work done here commits
+        or rolls back with the aggregate write. Default: nothing.
+        """
+
+
+class SagaFailures(Exception):
+    """Raised after every saga had its turn; carries each (saga, exception) that failed."""
+
+    def __init__(self, failures: List[Tuple[ISaga, BaseException]]) -> None:
+        self.failures = failures
+        super().__init__("; ".join(f"{s.name}: {type(e).__name__}: {e}" for s, e in failures))
+
+
+class SagaEventFailures(Exception):
+    """
+    Raised by process_many when only some events failed; carries each (event, exception),
+    so those events alone are retried.
+    """
+
+    def __init__(self, failures: List[Tuple[Any, BaseException]]) -> None:
+        self.failures = failures
+        first = failures[0][1] if failures else None
+        super().__init__(f"{len(failures)} event(s) failed" + (f", first: {type(first).__name__}: {first}" if first else ""))
+
+
+class SagaTimeout(TimeoutError):
+    """A fanned-out saga overran its timeout; it may still finish in the background."""
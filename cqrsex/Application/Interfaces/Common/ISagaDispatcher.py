@@ -10,7 +10,10 @@ class ISagaDispatcher(ABC):
         *,
         using: Optional[str] = None,
     ) -> None:
-        """Schedule an event to be dispatched AFTER the active transaction commits."""
+        """
+        Schedule an event to be dispatched AFTER the active transaction commits.
+        Events scheduled inside one unit of work are delivered together (ISaga.process_many).
+        """
 
     @abstractmethod
     def emit(
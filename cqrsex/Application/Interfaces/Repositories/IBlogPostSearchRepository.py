@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from cqrsex.Application.Wrapper.KeysetPage import KeysetPage
+
+
+class IBlogPostSearchRepository(ABC):
+    """Full-text search over the blog_post_search projection (ranked, keyset-paged)."""
+
+    @abstractmethod
+    def search(
+        self, q: str, *, page_size: int = 20, cursor: Optional[str] = None,
+        author_id: Optional[int] = None, highlight: bool = True,
+    ) -> KeysetPage:
+        """Items: {id, title, author_id, created_at, score[, highlight: {title, body}]}, best match first."""
+
+    @abstractmethod
+    async def asearch(
+        self, q: str, *, page_size: int = 20, cursor: Optional[str] = None,
+        author_id: Optional[int] = None, highlight: bool = True,
+    ) -> KeysetPage: ...
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Iterable, List
 from cqrsex.Domain.models.OutboxEvent import OutboxEvent
 
 
@@ -24,3 +24,28 @@ class IOutboxRepository(ABC):
     ) -> OutboxEvent:
         """Persist a new outbox event in the current DB alias and return it."""
         ...
+
+    @abstractmethod
+    def add_many(self, events: Iterable[Dict[str, Any]]) -> List[OutboxEvent]:
+        """Persist several events (add()'s keyword arguments each) with one INSERT."""
+        ...
+
+    # ---------- relay ----------
+    @abstractmethod
+    def pending_tenants(self, limit: int = 100, *, after: Optional[str] = None) -> List[str]:
+        """Tenants that currently have unprocessed events, in order from just after `after`, wrapping around."""
+        ...
+
+    @abstractmethod
+    def claim_batch(self, limit: int, *, tenant_id: Optional[str] = None) -> List[OutboxEvent]:
+        """
+        Lock up to `limit` unprocessed events, oldest first, skipping rows another relay
+        already holds (FOR UPDATE SKIP LOCKED). Must run inside transaction.atomic on
+        this alias; the locks last until that transaction ends.
+        """
+        ...
+
+    @abstractmethod
+    def mark_processed(self, ids: Iterable[int]) -> int:
+        """Flag the given events processed in one UPDATE; returns the row count."""
+        ...
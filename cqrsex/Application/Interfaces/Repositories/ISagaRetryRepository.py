@@ -0,0 +1,56 @@
+# cqrsex/Application/Interfaces/Repositories/ISagaRetryRepository.py
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from cqrsex.Domain.models.SagaRetry import SagaRetry
+
+
+class ISagaRetryRepository(ABC):
+    @abstractmethod
+    def using(self, db_alias: str) -> "ISagaRetryRepository":
+        """Return a clone of this repository that targets the given Django DB alias."""
+        ...
+
+    @abstractmethod
+    def add_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Queue failed invocations (SagaRetry field values each) with one INSERT. A row whose
+        (saga, idempotency_key) is already queued is skipped. Returns the rows submitted.
+        """
+        ...
+
+    @abstractmethod
+    def claim_due(self, limit: int) -> List[SagaRetry]:
+        """
+        Lock up to `limit` rows whose next_attempt_at has passed, earliest first, skipping
+        rows another retrier holds (FOR UPDATE SKIP LOCKED). Must run inside
+        transaction.atomic on this alias.
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, ids: Iterable[int]) -> int:
+        """Drop rows whose retry succeeded."""
+        ...
+
+    @abstractmethod
+    def reschedule(self, row: SagaRetry, error: str, next_attempt_at: datetime) -> None:
+        """Count one more failed attempt and schedule the next."""
+        ...
+
+    @abstractmethod
+    def bury(self, row: SagaRetry, error: str) -> None:
+        """Move a row that ran out of attempts to saga_dead_letters."""
+        ...
+
+    @abstractmethod
+    def requeue_dead(self, *, saga: Optional[str] = None, limit: Optional[int] = None) -> int:
+        """Move dead letters back to the queue, due now, with a fresh attempt budget."""
+        ...
+
+    @abstractmethod
+    def depth(self) -> Dict[str, Any]:
+        """Queue depth: queued, due now, dead, and the age of the oldest queued row."""
+        ...
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from cqrsex.Application.Wrapper.KeysetPage import KeysetPage
+from cqrsex.Application.Wrapper.OffsetPage import OffsetPage
 
 class IUserReadRepository(ABC):
     @abstractmethod
@@ -16,7 +18,88 @@ class IUserReadRepository(ABC):
     @abstractmethod
     def exists_email_excluding_id(self, email: str, exclude_id: int) -> bool: ...
 
+    @abstractmethod
+    def existing_usernames(self, usernames: Iterable[str]) -> Set[str]:
+        """Lower-cased usernames (case-insensitive match) that are already taken, in one query."""
+    @abstractmethod
+    def existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Lower-cased emails (case-insensitive match) that are already taken, in one query."""
+
+    @abstractmethod
+    def get_usernames(self, ids: Iterable[int]) -> Dict[int, str]:
+        """id -> username for the given ids, in one query (missing ids are absent)."""
+
+    @abstractmethod
+    def get_summaries(self, ids: Iterable[int]) -> Dict[int, dict]:
+        """id -> UsersMapper.to_summary() dict for the given ids, in one query."""
+
+    @abstractmethod
+    def iter_values(
+        self, fields: Sequence[str], *, chunk_size: int = 2000, q: str | None = None,
+        user_type: str | None = None, **filters
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream rows in id order through a server-side cursor (constant memory)."""
+
     @abstractmethod
     def get_paginated(
         self, *, page: int, page_size: int, q: str | None = None, user_type: str | None = None
     ) -> Tuple[List[object], int]: ...
+
+    @abstractmethod
+    def get_page(
+        self, *, page: int, page_size: int, q: str | None = None, user_type: str | None = None,
+        count_mode: str = "exact", fields: Sequence[str] | None = None,
+    ) -> OffsetPage: ...
+
+    @abstractmethod
+    def get_keyset_page(
+        self, *, page_size: int, cursor: str | None = None, q: str | None = None, user_type: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> KeysetPage: ...
+
+    # ---------- async ----------
+    @abstractmethod
+    async def aget_by_id(self, id: int): ...
+    @abstractmethod
+    async def aget_by_username(self, username: str): ...
+    @abstractmethod
+    async def aget_by_email(self, email: str): ...
+
+    @abstractmethod
+    async def aexists_by_username(self, username: str) -> bool: ...
+    @abstractmethod
+    async def aexists_by_email(self, email: str) -> bool: ...
+    @abstractmethod
+    async def aexists_email_excluding_id(self, email: str, exclude_id: int) -> bool: ...
+    @abstractmethod
+    async def aexisting_usernames(self, usernames: Iterable[str]) -> Set[str]: ...
+    @abstractmethod
+    async def aexisting_emails(self, emails: Iterable[str]) -> Set[str]: ...
+
+    @abstractmethod
+    async def aget_usernames(self, ids: Iterable[int]) -> Dict[int, str]: ...
+    @abstractmethod
+    async def aget_summaries(self, ids: Iterable[int]) -> Dict[int, dict]: ...
+
+    @abstractmethod
+    def aiter_values(
+        self, fields: Sequence[str], *, chunk_size: int = 2000, q: str | None = None,
+        user_type: str | None = None, **filters
+    ) -> AsyncIterator[Dict[str, Any]]: ...
+
+    @abstractmethod
+    async def aget_paginated(
+        self, *, page: int, page_size: int, q: str | None = None, user_type: str | None = None
+    ) -> Tuple[List[object], int]: ...
+
+    @abstractmethod
+    async def aget_page(
+        self, *, page: int, page_size: int, q: str | None = None, user_type: str | None = None,
+        count_mode: str = "exact", fields: Sequence[str] | None = None,
+    ) -> OffsetPage: ...
+
+    @abstractmethod
+    async def aget_keyset_page(
+        self, *, page_size: int, cursor: str | None = None, q: str | None = None, user_type: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> KeysetPage: ...
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Optional
 
 from cqrsex.Domain.models.User import User
 
@@ -10,3 +10,16 @@ class IUserWriteRepository(ABC):
     def update(self, user:User) -> Any: ...
     @abstractmethod
     def delete_permanently(self, user:User) -> None: ...
+    @abstractmethod
+    def bulk_add(self, users: List[User], *, batch_size: Optional[int] = None) -> List[User]:
+        """All-or-nothing multi-row INSERT; pks are set on `users` where the backend returns them."""
+
+    # ---------- async ----------
+    @abstractmethod
+    async def aadd(self, user:User) -> Any: ...
+    @abstractmethod
+    async def aupdate(self, user:User) -> Any: ...
+    @abstractmethod
+    async def adelete_permanently(self, user:User) -> None: ...
+    @abstractmethod
+    async def abulk_add(self, users: List[User], *, batch_size: Optional[int] = None) -> List[User]: ...
@@ -27,7 +27,7 @@ class BlogPostMapper:
 
     @staticmethod
     def to_detail(m: BlogPost) -> Dict[str, Any]:
-        return {
+        out = {
             "id": m.id,
             "title": m.title,
             "body": m.body,
@@ -35,3 +35,21 @@ class BlogPostMapper:
             "created_at": m.created_at,
             "updated_at": m.updated_at,
         }
+        # read-model rows (BlogPostView) carry the author's username
+        username = getattr(m, "author_username", None)
+        if username is not None:
+            out["author_username"] = username
+        return out
+
+    @staticmethod
+    def to_event_payload(m: BlogPost) -> Dict[str, Any]:
+        """JSON-safe post state carried by BlogPost outbox events."""
+        return {
+            "id": m.id,
+            "title": m.title,
+            "body": m.body,
+            "author_id": m.author_id,
+            "tenant_id": getattr(m, "tenant_id", "main"),
+            "created_at": m.created_at.isoformat() if m.created_at else None,
+            "updated_at": m.updated_at.isoformat() if m.updated_at else None,
+        }
@@ -0,0 +1,17 @@
+# cqrsex/Application/Mapping/OutboxMapper.py
+from __future__ import annotations
+from typing import Any, Dict
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+
+def to_message(evt: OutboxEvent) -> Dict[str, Any]:
+    """Broker-facing envelope for an outbox row. `id` is the consumer dedupe key."""
+    return {
+        "id": evt.id,
+        "aggregate_type": evt.aggregate_type,
+        "aggregate_id": str(evt.aggregate_id) if evt.aggregate_id is not None else None,
+        "event_type": evt.event_type,
+        "tenant_id": evt.tenant_id,
+        "created_at": evt.created_at.isoformat() if evt.created_at else None,
+        "payload": evt.payload,
+    }
@@ -5,15 +5,22 @@ from cqrsex.Application.CQRS.Users.Commands.Create.Request import CreateUser
 from cqrsex.Domain.models.User import User
 
 
-def to_model_from_create(cmd: CreateUser) -> User:
-    """حوّل CreateUser command إلى User model"""
+# the author block embedded in blog post DTOs (no email / contact data)
+SUMMARY_FIELDS = ("id", "username", "first_name", "last_name")
+
+
+def to_model_from_create(cmd: CreateUser, password_hash: str | None = None) -> User:
+    """حوّل CreateUser command إلى User model (password_hash: already hashed, e.g. by IPasswordHasher)"""
     u = User(
         username=(cmd.username or "").strip(),
         email=(cmd.email or "").strip(),
         user_type=cmd.user_type,
         is_active=True,
     )
-    u.set_password((cmd.password or "").strip())
+    if password_hash is not None:
+        u.password = password_hash
+    else:
+        u.set_password((cmd.password or "").strip())
     return u
 
 
@@ -40,3 +47,16 @@ def to_detail(u: User) -> dict:
         "is_active": u.is_active,
         "date_joined": u.date_joined.isoformat() if u.date_joined else None,
     }
+
+
+def to_list_item(row: dict) -> dict:
+    """values() row (USER_LIST_FIELDS) -> the same shape to_detail gives, without a model."""
+    joined = row.get("date_joined")
+    row["date_joined"] = joined.isoformat() if joined else None
+    return row
+
+
+def to_summary(u) -> dict:
+    """User model (or a values() row) -> public author summary."""
+    get = u.get if isinstance(u, dict) else (lambda a: getattr(u, a))
+    return {f: get(f) for f in SUMMARY_FIELDS}
@@ -1,16 +1,25 @@
 # cqrsex/Application/Mediator/behaviors.py
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
 import inspect
+import json
 import logging
+import threading
 import time
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
 
 from cqrsex.Application.Mediator.mediator import Behavior
-from cqrsex.Application.Mediator.contracts import ICommand
+from cqrsex.Application.Mediator.contracts import ICommand, IQuery
 from cqrsex.Application.Interfaces.Common.IUnitOfWork import IUnitOfWork
+from cqrsex.Application.Interfaces.Common.IAsyncUnitOfWork import IAsyncUnitOfWork
+from cqrsex.Application.Interfaces.Common.IQueryCache import IQueryCache
+from cqrsex.Application.Interfaces.Common.IIdempotencyStore import IIdempotencyStore, StoredResult
 from cqrsex.Application.Common.exceptions import (
     AppException,
+    ConflictException,
     ForbiddenException,
     ServiceException,
 )
@@ -25,6 +34,10 @@ def _call_maybe_await(fn: Optional[Callable[..., Any]], *args, **kwargs):
     return fn(*args, **kwargs)
 
 
+def _succeeded(res: Any) -> bool:
+    return bool(getattr(getattr(res, "status", None), "succeeded", True))
+
+
 # ---------- behaviors ----------
 class TransactionBehavior(Behavior):
     """
@@ -32,15 +45,19 @@ class TransactionBehavior(Behavior):
       - Success -> commit
       - AppException -> rollback + return ex.to_result()
       - Unknown -> rollback + ServiceException.to_result()
-    Queries pass through.
+    Queries never enter this behavior (applies_to).
     """
-    def __init__(self, uow_factory: Callable[[], IUnitOfWork]) -> None:
+    applies_to = (ICommand,)
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], IUnitOfWork],
+        async_uow_factory: Optional[Callable[[], IAsyncUnitOfWork]] = None,
+    ) -> None:
         self._uow_factory = uow_factory
+        self._async_uow_factory = async_uow_factory
 
     def handle(self, request: Any, next_call: Callable[[], Any]) -> Any:
-        if not isinstance(request, ICommand):
-            return next_call()
-
         with self._uow_factory() as uow:
             try:
                 res = next_call()
@@ -56,10 +73,7 @@ class TransactionBehavior(Behavior):
                 return ServiceException("Internal server error").to_result()
 
     async def ahandle(self, request: Any, next_call: Callable[[], Awaitable[Any]]) -> Any:
-        if not isinstance(request, ICommand):
-            return await next_call()
-
-        uow = self._uow_factory()
+        uow = (self._async_uow_factory or self._uow_factory)()
 
         # Prefer async context manager if available
         if hasattr(uow, "__aenter__") and hasattr(uow, "__aexit__"):
@@ -141,53 +155,269 @@ class MetricsBehavior(Behavior):
             log.info("Handled %s in %.2f ms (async)", type(request).__name__, ms)
 
 
+class _Flight:
+    """One execution of an idempotency key in this process; duplicates wait on `done`."""
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
 class IdempotencyBehavior(Behavior):
     """
-    For commands with meta.idempotency_key.
-    Store must implement:
-      - get(key) -> result | None   (sync or async)
-      - set(key, result) -> None    (sync or async)
+    For commands with meta.idempotency_key (see contracts.CommandMeta).
+    A repeated key gets the first execution's result back without running the handler.
+    Only successful results are stored: a failed attempt may be retried with the same key.
+
+    In-flight dedup: while the first execution runs, duplicates wait for it instead of
+    running the handler a second time - in this process on an event, across processes
+    by polling the store while the key is claimed (IIdempotencyStore.claim). A wait that
+    outlasts `wait_timeout` ends in a ConflictException result (409). A claim left by
+    a crashed worker expires after `lease` seconds.
+
+    The command's fields (all but meta) are fingerprinted and stored with the result: the
+    same key with a different body is refused (409) instead of getting the other's result.
+
+    Keys are scoped by command type. Register it FIRST, outside TransactionBehavior,
+    so a result is stored only once its transaction has committed.
+    Stores with just get/set (sync or async) still work, without in-flight dedup or
+    fingerprint checks.
     """
-    def __init__(self, store: Any) -> None:
+    applies_to = (ICommand,)
+
+    def __init__(
+        self,
+        store: Any,
+        *,
+        ttl: Optional[float] = None,
+        lease: float = 60.0,
+        wait_timeout: float = 30.0,
+        poll_interval: Tuple[float, float] = (0.005, 0.25),
+    ) -> None:
         self._store = store
+        self._ttl = ttl
+        self._lease = lease
+        self._wait_timeout = wait_timeout
+        self._poll_min, self._poll_max = poll_interval
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
 
-    def handle(self, request: Any, next_call: Callable[[], Any]) -> Any:
+    def applies(self, req_type: Type[Any]) -> bool:
+        return super().applies(req_type) and (
+            "meta" in getattr(req_type, "__dataclass_fields__", {}) or hasattr(req_type, "meta")
+        )
+
+    @staticmethod
+    def _key(request: Any) -> Optional[str]:
         meta = getattr(request, "meta", None)
         key = getattr(meta, "idempotency_key", None) if meta else None
+        return f"{type(request).__qualname__}:{key}" if key else None
+
+    @staticmethod
+    def _fingerprint(request: Any) -> str:
+        if dataclasses.is_dataclass(request):
+            fields = {f.name: getattr(request, f.name) for f in dataclasses.fields(request) if f.name != "meta"}
+        else:
+            fields = {k: v for k, v in vars(request).items() if k != "meta"}
+        raw = json.dumps([type(request).__qualname__, fields], sort_keys=True, default=repr)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _set_kwargs(self, fingerprint: str) -> Dict[str, Any]:
+        # plain get/set stores take (key, result) only
+        return {"fingerprint": fingerprint, "ttl": self._ttl} if isinstance(self._store, IIdempotencyStore) else {}
+
+    def _replay(self, key: str, stored: Any, fingerprint: str) -> Any:
+        if isinstance(stored, StoredResult):
+            if stored.fingerprint and stored.fingerprint != fingerprint:
+                return ConflictException("This idempotency key was already used with a different request",
+                                         {"idempotency_key": key}, code="idempotency_key_reused").log().to_result()
+            return stored.value
+        return stored
+
+    # ---------- store calls (claim/release optional) ----------
+    def _sync(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        fn = getattr(self._store, name, None)
+        if fn is None:
+            return True if name == "claim" else None
+        res = fn(*args, **kwargs)
+        if inspect.isawaitable(res):
+            raise RuntimeError("Async store used in sync pipeline. Use send_async().")
+        return res
+
+    async def _async(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        fn = getattr(self._store, "a" + name, None) or getattr(self._store, name, None)
+        if fn is None:
+            return True if name == "claim" else None
+        res = fn(*args, **kwargs)
+        return await res if inspect.isawaitable(res) else res
+
+    # ---------- local flights ----------
+    def _join(self, key: str) -> Tuple[_Flight, bool]:
+        """(flight, True if this caller leads it)."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            return flight, True
+
+    def _land(self, key: str, flight: _Flight) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.done.set()
+
+    def _conflict(self, key: str) -> Any:
+        return ConflictException("A request with this idempotency key is still being processed",
+                                 {"idempotency_key": key}).log().to_result()
+
+    def handle(self, request: Any, next_call: Callable[[], Any]) -> Any:
+        key = self._key(request)
         if not key:
             return next_call()
 
-        cached = self._store.get(key)
-        if inspect.isawaitable(cached):
-            raise RuntimeError("Async store used in sync pipeline. Use send_async().")
-        if cached is not None:
-            return cached
+        fingerprint = self._fingerprint(request)
+        deadline, polls = time.monotonic() + self._wait_timeout, 0
+        while True:
+            stored = self._sync("get", key)
+            if stored is not None:
+                return self._replay(key, stored, fingerprint)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return self._conflict(key)
+            flight, leader = self._join(key)
+            if not leader:
+                # same key running on another thread here: its result is in the store when it lands
+                flight.done.wait(remaining)
+                continue
+            try:
+                claimed = self._sync("claim", key, ttl=self._lease)
+            except Exception:
+                log.warning("Idempotency store.claim failed; running without dedup", exc_info=True)
+                claimed = True
+            if not claimed:
+                # another process holds it: let local duplicates poll along, back off, re-read
+                self._land(key, flight)
+                time.sleep(min(self._poll_max, self._poll_min * (2 ** polls), max(remaining, 0)))
+                polls += 1
+                continue
+            return self._lead(key, fingerprint, flight, next_call)
 
-        res = next_call()
+    def _lead(self, key: str, fingerprint: str, flight: _Flight, next_call: Callable[[], Any]) -> Any:
+        res, ok = None, False
         try:
-            maybe = self._store.set(key, res)
-            if inspect.isawaitable(maybe):
-                raise RuntimeError("Async store used in sync pipeline. Use send_async().")
-        except Exception:
-            log.warning("Idempotency store.set failed", exc_info=True)
-        return res
+            res = next_call()
+            ok = _succeeded(res)
+            return res
+        finally:
+            try:
+                self._sync("set", key, res, **self._set_kwargs(fingerprint)) if ok else self._sync("release", key)
+            except Exception:
+                log.warning("Idempotency store.set failed", exc_info=True)
+            self._land(key, flight)
 
     async def ahandle(self, request: Any, next_call: Callable[[], Awaitable[Any]]) -> Any:
-        meta = getattr(request, "meta", None)
-        key = getattr(meta, "idempotency_key", None) if meta else None
+        key = self._key(request)
         if not key:
             return await next_call()
 
-        cached = self._store.get(key)
-        cached = await cached if inspect.isawaitable(cached) else cached
+        fingerprint = self._fingerprint(request)
+        deadline, polls = time.monotonic() + self._wait_timeout, 0
+        while True:
+            stored = await self._async("get", key)
+            if stored is not None:
+                return self._replay(key, stored, fingerprint)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return self._conflict(key)
+            flight, leader = self._join(key)
+            if leader:
+                try:
+                    claimed = await self._async("claim", key, ttl=self._lease)
+                except Exception:
+                    log.warning("Idempotency store.claim failed (async); running without dedup", exc_info=True)
+                    claimed = True
+                if claimed:
+                    return await self._alead(key, fingerprint, flight, next_call)
+                self._land(key, flight)
+            elif flight.done.is_set():
+                continue
+            # never block the loop on the event: poll it (and the store) with backoff
+            await asyncio.sleep(min(self._poll_max, self._poll_min * (2 ** polls), max(remaining, 0)))
+            polls += 1
+
+    async def _alead(self, key: str, fingerprint: str, flight: _Flight, next_call: Callable[[], Awaitable[Any]]) -> Any:
+        res, ok = None, False
+        try:
+            res = await next_call()
+            ok = _succeeded(res)
+            return res
+        finally:
+            try:
+                await (self._async("set", key, res, **self._set_kwargs(fingerprint)) if ok
+                       else self._async("release", key))
+            except Exception:
+                log.warning("Idempotency store.set failed (async)", exc_info=True)
+            self._land(key, flight)
+
+
+class QueryCacheBehavior(Behavior):
+    """
+    Result cache keyed on the (frozen dataclass) request.
+      - Queries that define cache_tags() are served from / stored in the cache
+        (successful results only; optional `cache_ttl` class attribute).
+      - Commands that define invalidates() bump those tags after their transaction
+        commits, so readers never get pre-commit data back.
+    Invalidation only reaches readers sharing the cache: with a per-process cache
+    (LruQueryCache, LocMemCache) other workers serve their entry until its TTL runs out.
+    Register it AFTER TransactionBehavior so the on-commit hook joins the command's UoW.
+    """
+    applies_to = (IQuery, ICommand)
+
+    def __init__(self, cache: IQueryCache, *, ttl: Optional[float] = None) -> None:
+        self._cache = cache
+        self._ttl = ttl
+
+    def applies(self, req_type: Type[Any]) -> bool:
+        if issubclass(req_type, IQuery):
+            return callable(getattr(req_type, "cache_tags", None))
+        if issubclass(req_type, ICommand):
+            return callable(getattr(req_type, "invalidates", None))
+        return False
+
+    def _ttl_for(self, request: Any) -> Optional[float]:
+        ttl = getattr(request, "cache_ttl", None)
+        return self._ttl if ttl is None else ttl
+
+    def handle(self, request: Any, next_call: Callable[[], Any]) -> Any:
+        if isinstance(request, ICommand):
+            res = next_call()
+            if _succeeded(res):
+                self._cache.invalidate_after_commit(request.invalidates())
+            return res
+
+        cached = self._cache.get(request)
         if cached is not None:
             return cached
+        # snapshot before reading so a concurrent commit makes this entry stale
+        tags = self._cache.tag_versions(request.cache_tags())
+        res = next_call()
+        if _succeeded(res):
+            self._cache.set(request, res, tags=tags, ttl=self._ttl_for(request))
+        return res
 
+    async def ahandle(self, request: Any, next_call: Callable[[], Awaitable[Any]]) -> Any:
+        if isinstance(request, ICommand):
+            res = await next_call()
+            if _succeeded(res):
+                await self._cache.ainvalidate_after_commit(request.invalidates())
+            return res
+
+        cached = await self._cache.aget(request)
+        if cached is not None:
+            return cached
+        tags = await self._cache.atag_versions(request.cache_tags())
         res = await next_call()
-        try:
-            set_result = self._store.set(key, res)
-            if inspect.isawaitable(set_result):
-                await set_result
-        except Exception:
-            log.warning("Idempotency store.set failed (async)", exc_info=True)
+        if _succeeded(res):
+            await self._cache.aset(request, res, tags=tags, ttl=self._ttl_for(request))
         return res
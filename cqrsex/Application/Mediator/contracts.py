@@ -1,14 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from dataclasses import dataclass
+from typing import TypeVar, Generic, Optional
 
 TResult = TypeVar("TResult")
 
 class ICommand(ABC, Generic[TResult]): ...
 class IQuery(ABC, Generic[TResult]): ...
 
+# Optional per-call metadata; a command opts in with a `meta: Optional[CommandMeta] = None` field.
+# idempotency_key: repeats of the same key get the first successful result (IdempotencyBehavior).
+@dataclass(frozen=True)
+class CommandMeta:
+    idempotency_key: Optional[str] = None
+
 C = TypeVar("C", bound=ICommand)
 Q = TypeVar("Q", bound=IQuery)
 
+# Handlers may also define `async def ahandle(self, request)`; Mediator.send_async
+# prefers it over handle(), so async callers never block the event loop on the ORM.
 class ICommandHandler(ABC, Generic[C, TResult]):
     @abstractmethod
     def handle(self, command: C) -> TResult: ...
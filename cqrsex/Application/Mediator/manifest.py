@@ -0,0 +1,183 @@
+# cqrsex/Application/Mediator/manifest.py
+"""
+Handler manifest: what import_under + command discovery would find, saved as JSON so a
+worker can boot without importing every CQRS module.
+
+    {"version": 1, "roots": [...],
+     "sources":  {"cqrsex.Application.CQRS/BlogPosts/Events.py": [mtime_ns, size], ...},
+     "handlers": {"pkg.Request:ListBlogPosts": "pkg.Handler:ListBlogPostsHandler", ...},
+     "commands": {"blogpost:create": "pkg.Request:CreateBlogPost", ...},
+     "batches":  {"pkg.Request:CreateBlogPost": "pkg.Request:CreateBlogPosts", ...}}
+
+The file is trusted while the set of .py files under the roots, their mtimes and sizes
+are unchanged (a stat walk, no imports); otherwise everything is imported once, the
+manifest rebuilt and rewritten. Prebuild it at deploy time: manage.py handler_manifest
+"""
+from __future__ import annotations
+import importlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from cqrsex.Application.Mediator.import_handlers import import_under
+from cqrsex.Application.Mediator.registry import registered_handlers
+
+log = logging.getLogger(__name__)
+
+VERSION = 2
+CQRS_ROOTS: Tuple[str, ...] = ("cqrsex.Application.CQRS",)
+
+Sources = Dict[str, List[int]]
+
+
+def norm(s: Optional[str]) -> str:
+    return "".join((s or "")).replace("_", "").replace("-", "").strip().lower()
+
+
+def type_path(t: Type[Any]) -> str:
+    return f"{t.__module__}:{t.__qualname__}"
+
+
+def import_path(path: str) -> Any:
+    mod, _, qualname = path.partition(":")
+    obj: Any = importlib.import_module(mod)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+@dataclass
+class Manifest:
+    roots: Tuple[str, ...]
+    sources: Sources
+    handlers: Dict[str, str] = field(default_factory=dict)    # request type -> handler class
+    commands: Dict[str, str] = field(default_factory=dict)    # "entity:action" -> command class
+    batches: Dict[str, str] = field(default_factory=dict)     # command class -> its batch command (`batches`)
+    from_file: bool = False
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"version": VERSION, "roots": list(self.roots), "sources": self.sources,
+                "handlers": self.handlers, "commands": self.commands, "batches": self.batches}
+
+
+# ---------- source stamp (no imports) ----------
+def _package_dir(root: str) -> Optional[Path]:
+    spec = importlib.util.find_spec(root)     # imports the parents, not `root` itself
+    locations = list(spec.submodule_search_locations or ()) if spec else []
+    return Path(locations[0]) if locations else None
+
+
+def source_stamp(roots: Sequence[str]) -> Sources:
+    """mtime_ns/size of every module walk_packages would reach under `roots`."""
+    out: Sources = {}
+    for root in roots:
+        base = _package_dir(root)
+        if base is None:
+            continue
+        for dirpath, dirnames, filenames in os.walk(base):
+            # walk_packages only descends into packages
+            dirnames[:] = sorted(d for d in dirnames if (Path(dirpath, d) / "__init__.py").is_file())
+            for name in filenames:
+                if not name.endswith(".py"):
+                    continue
+                st = os.stat(os.path.join(dirpath, name))
+                rel = Path(dirpath, name).relative_to(base).as_posix()
+                out[f"{root}/{rel}"] = [st.st_mtime_ns, st.st_size]
+    return out
+
+
+# ---------- full scan (imports everything) ----------
+def _command_entries(mod_name: str, mod: Any) -> Iterable[Tuple[str, str, Type[Any]]]:
+    # [..., CQRS, {EntityPlural}, 'Commands', {Action}, 'Request'] -> class {Action}{Entity}
+    action = mod_name.split(".")[-2]
+    action_key = norm(action)
+    for attr in dir(mod):
+        if attr.startswith("_"):
+            continue
+        obj = getattr(mod, attr)
+        if not inspect.isclass(obj) or not norm(attr).startswith(action_key):
+            continue
+        entity_name = attr[len(action):]
+        if entity_name:
+            yield norm(entity_name), action_key, obj
+
+
+def scan(roots: Sequence[str] = CQRS_ROOTS) -> Manifest:
+    sources = source_stamp(roots)
+    import_under(roots)
+    prefixes = tuple(f"{r}." for r in roots)
+    handlers = {type_path(req): type_path(cls) for req, cls in registered_handlers().items()
+                if cls.__module__.startswith(prefixes)}
+    commands: Dict[str, str] = {}
+    batches: Dict[str, str] = {}
+    for mod_name in sorted(n for n in sys.modules if n.startswith(prefixes)):
+        if ".Commands." not in mod_name or not mod_name.endswith(".Request"):
+            continue
+        mod = sys.modules[mod_name]
+        for entity, action, cls in _command_entries(mod_name, mod):
+            commands[f"{entity}:{action}"] = type_path(cls)
+        for cls in vars(mod).values():
+            if inspect.isclass(cls) and cls.__module__ == mod_name and inspect.isclass(getattr(cls, "batches", None)):
+                batches[type_path(cls.batches)] = type_path(cls)
+    return Manifest(tuple(roots), sources, handlers, commands, batches)
+
+
+# ---------- file ----------
+def load(path: Path, roots: Sequence[str], *, validate: bool = True) -> Optional[Manifest]:
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != VERSION or data.get("roots") != list(roots):
+        return None
+    if validate and data.get("sources") != source_stamp(roots):
+        log.info("Handler manifest %s is stale; rescanning", path)
+        return None
+    return Manifest(tuple(roots), data.get("sources") or {}, dict(data.get("handlers") or {}),
+                    dict(data.get("commands") or {}), dict(data.get("batches") or {}), from_file=True)
+
+
+def save(path: Path, manifest: Manifest) -> bool:
+    # write-then-rename: concurrent workers never read a half-written file
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(manifest.to_json(), indent=1, sort_keys=True))
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        log.warning("Cannot write handler manifest %s; workers will rescan on boot", path, exc_info=True)
+        tmp.unlink(missing_ok=True)
+        return False
+
+
+# ---------- process-wide ----------
+_current: Optional[Manifest] = None
+_lock = threading.RLock()
+
+
+def get_manifest(roots: Sequence[str] = CQRS_ROOTS, *, path: Optional[Path] = None,
+                 validate: bool = True, refresh: bool = False) -> Manifest:
+    """
+    The manifest for this process (first call wins; MediatorModule passes the configured
+    path). No path: scan in-process, nothing written.
+    """
+    global _current
+    with _lock:
+        if _current is not None and not refresh and _current.roots == tuple(roots):
+            return _current
+        m = None if (refresh or path is None) else load(path, roots, validate=validate)
+        if m is None:
+            m = scan(roots)
+            if path is not None:
+                save(path, m)
+        _current = m
+        return m
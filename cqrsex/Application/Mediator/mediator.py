@@ -1,17 +1,44 @@
 # cqrsex/Application/Mediator/mediator.py
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Optional, Awaitable, Type
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Awaitable, Tuple, Type
 import inspect
+import threading
 
 Factory = Callable[[], Any]
-Resolver = Callable[[Type[Any]], Any] 
+Resolver = Callable[[Type[Any]], Any]
+Pipeline = Callable[[Any], Any]
 
 class Behavior:
+    # Request kinds/types this behavior runs for (e.g. (ICommand,) or (CreateUser, UpdateUser)).
+    # Empty = every request. The Mediator resolves this once per request type, so a
+    # behavior that does not apply never enters that type's pipeline.
+    applies_to: Tuple[Type[Any], ...] = ()
+
+    def applies(self, req_type: Type[Any]) -> bool:
+        return not self.applies_to or issubclass(req_type, self.applies_to)
+
     def handle(self, request: Any, next_call: Callable[[], Any]) -> Any:
         return next_call()
     async def ahandle(self, request: Any, next_call: Callable[[], Awaitable[Any]]) -> Any:
         return await next_call()
 
+# ---------- pipeline compilation ----------
+# Each layer is a plain function of `request`; the zero-arg `next_call` the behaviors
+# expect is a C-level partial over the inner layer, so dispatch builds no closures.
+def _bind(handle: Callable[..., Any], inner: Pipeline) -> Pipeline:
+    def step(request: Any) -> Any:
+        return handle(request, partial(inner, request))
+    return step
+
+def _as_async(fn: Callable[[Any], Any]) -> Callable[[Any], Awaitable[Any]]:
+    if inspect.iscoroutinefunction(fn):
+        return fn
+    async def final(request: Any) -> Any:
+        res = fn(request)
+        return await res if inspect.isawaitable(res) else res
+    return final
+
 class Mediator:
     def __init__(
         self,
@@ -20,18 +47,69 @@ class Mediator:
         resolver: Optional[Resolver] = None,     # optional DI resolver for future
         behaviors: Optional[List[Behavior]] = None,
         cache_handlers: bool = True,
+        loader: Optional[Callable[[Type[Any]], Optional[Factory]]] = None,
     ) -> None:
-        self._factories = handlers
+        self._factories = dict(handlers)
+        # resolves request types missing from `handlers` on first dispatch (lazy imports)
+        self._loader = loader
         self._behaviors = list(behaviors or [])
         self._resolver = resolver
         self._cache = cache_handlers
         self._cache_map: Dict[Type[Any], Any] = {}
+        # request type -> compiled chain (sync / async)
+        self._pipelines: Dict[Type[Any], Pipeline] = {}
+        self._apipelines: Dict[Type[Any], Callable[[Any], Awaitable[Any]]] = {}
+        self._lock = threading.RLock()
 
-    def _get_handler(self, req_type: Type[Any]) -> Any:
+    # ---------- registration / invalidation ----------
+    @property
+    def behaviors(self) -> List[Behavior]:
+        return list(self._behaviors)
+
+    def set_behaviors(self, behaviors: List[Behavior]) -> None:
+        with self._lock:
+            self._behaviors = list(behaviors)
+            self.invalidate()
+
+    def add_behavior(self, behavior: Behavior, *, index: Optional[int] = None) -> None:
+        with self._lock:
+            if index is None:
+                self._behaviors.append(behavior)
+            else:
+                self._behaviors.insert(index, behavior)
+            self.invalidate()
+
+    def register_handler(self, req_type: Type[Any], factory: Factory) -> None:
+        with self._lock:
+            self._factories[req_type] = factory
+            self._cache_map.pop(req_type, None)
+            self.invalidate(req_type)
+
+    def invalidate(self, req_type: Optional[Type[Any]] = None) -> None:
+        """Drop compiled pipelines (all, or only those of `req_type`)."""
+        with self._lock:
+            if req_type is None:
+                self._pipelines.clear()
+                self._apipelines.clear()
+            else:
+                self._pipelines.pop(req_type, None)
+                self._apipelines.pop(req_type, None)
+
+    # ---------- handlers ----------
+    def _factory_for(self, req_type: Type[Any]) -> Factory:
         fac = self._factories.get(req_type)
+        if fac is None and self._loader is not None:
+            with self._lock:
+                fac = self._factories.get(req_type) or self._loader(req_type)
+                if fac is not None:
+                    self._factories[req_type] = fac
         if fac is None:
             available = ", ".join(t.__name__ for t in self._factories.keys())
             raise RuntimeError(f"No handler registered for {req_type.__name__}. Registered: [{available}]")
+        return fac
+
+    def _get_handler(self, req_type: Type[Any]) -> Any:
+        fac = self._factory_for(req_type)
         if not self._cache:
             return fac()
         inst = self._cache_map.get(req_type)
@@ -40,28 +118,55 @@ class Mediator:
             self._cache_map[req_type] = inst
         return inst
 
+    def _handler_call(self, req_type: Type[Any], attr: str = "handle") -> Pipeline:
+        # attr="ahandle": native async handler method if the handler has one, else handle
+        if self._cache:
+            handler = self._get_handler(req_type)
+            return getattr(handler, attr, None) or handler.handle
+        self._factory_for(req_type)
+        # non-cached: resolve a fresh handler per dispatch
+        def call(request: Any) -> Any:
+            handler = self._get_handler(req_type)
+            return (getattr(handler, attr, None) or handler.handle)(request)
+        return call
+
+    # ---------- compilation ----------
+    def behaviors_for(self, req_type: Type[Any]) -> List[Behavior]:
+        return [b for b in self._behaviors if b.applies(req_type)]
+
+    def _compile(self, req_type: Type[Any]) -> Pipeline:
+        with self._lock:
+            pipeline = self._pipelines.get(req_type)
+            if pipeline is not None:
+                return pipeline
+            pipeline = self._handler_call(req_type)
+            for b in reversed(self.behaviors_for(req_type)):
+                pipeline = _bind(b.handle, pipeline)
+            self._pipelines[req_type] = pipeline
+            return pipeline
+
+    def _compile_async(self, req_type: Type[Any]) -> Callable[[Any], Awaitable[Any]]:
+        with self._lock:
+            pipeline = self._apipelines.get(req_type)
+            if pipeline is not None:
+                return pipeline
+            pipeline = _as_async(self._handler_call(req_type, "ahandle"))
+            for b in reversed(self.behaviors_for(req_type)):
+                # ahandle returns the coroutine; no extra frame per layer
+                pipeline = _bind(b.ahandle, pipeline)
+            self._apipelines[req_type] = pipeline
+            return pipeline
+
+    # ---------- dispatch ----------
     def send(self, request: Any) -> Any:
-        handler = self._get_handler(type(request))
-        def call(): return handler.handle(request)
-        nxt = call
-        for b in reversed(self._behaviors):
-            prev = nxt
-            nxt = (lambda bb=b, pn=prev: lambda: bb.handle(request, pn))()
-        res = nxt()
+        req_type = type(request)
+        pipeline = self._pipelines.get(req_type) or self._compile(req_type)
+        res = pipeline(request)
         if inspect.isawaitable(res):
             raise RuntimeError("Handler returned coroutine. Use send_async for async handlers.")
         return res
 
     async def send_async(self, request: Any) -> Any:
-        handler = self._get_handler(type(request))
-        async def final():
-            h = getattr(handler, "handle", None)
-            return await h(request) if inspect.iscoroutinefunction(h) else h(request)
-        nxt: Callable[[], Awaitable[Any]] = final
-        for b in reversed(self._behaviors):
-            prev = nxt
-            async def wrap(bb=b, pn=prev):
-                async def _inner(): return await bb.ahandle(request, pn)
-                return _inner
-            nxt = await wrap()
-        return await nxt()
+        req_type = type(request)
+        pipeline = self._apipelines.get(req_type) or self._compile_async(req_type)
+        return await pipeline(request)
@@ -1,6 +1,7 @@
 # cqrsex/Application/Mediator/registry.py
 from __future__ import annotations
-from typing import Any, Callable, Dict, Type
+import importlib
+from typing import Any, Callable, Dict, Mapping, Optional, Type
 
 _HANDLERS: Dict[Type[Any], Type[Any]] = {}
 
@@ -15,5 +16,26 @@ def handler_for(request_type: Type[Any]):
         return cls
     return _wrap
 
+def registered_handlers() -> Dict[Type[Any], Type[Any]]:
+    return dict(_HANDLERS)
+
 def build_handler_factories(injector: Any) -> Dict[Type[Any], Callable[[], Any]]:
     return {req: (lambda c=cls, inj=injector: inj.get(c)) for req, cls in _HANDLERS.items()}
+
+def lazy_handler_loader(injector: Any, handlers: Mapping[str, str]) -> Callable[[Type[Any]], Optional[Callable[[], Any]]]:
+    """
+    Mediator `loader` over a manifest's {"module:Request": "module:Handler"}: the handler's
+    module is imported (registering it via @handler_for) the first time its request is sent.
+    """
+    def load(req_type: Type[Any]) -> Optional[Callable[[], Any]]:
+        cls = _HANDLERS.get(req_type)
+        if cls is None:
+            path = handlers.get(f"{req_type.__module__}:{req_type.__qualname__}")
+            if path is None:
+                return None
+            importlib.import_module(path.partition(":")[0])
+            cls = _HANDLERS.get(req_type)
+            if cls is None:
+                raise RuntimeError(f"{path} no longer handles {req_type.__name__}; rebuild the handler manifest")
+        return lambda c=cls, inj=injector: inj.get(c)
+    return load
@@ -1,16 +1,16 @@
 from __future__ import annotations
 import logging
 import inspect
-import pkgutil
 import threading
 import re
-from importlib import import_module
-from types import ModuleType
-from typing import Any, Callable, Dict, Optional, Tuple, Type, List, DefaultDict, Set
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type, List, DefaultDict, Set
 from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
 from injector import inject
-from cqrsex.Application.Interfaces.Common.ISaga import ISaga
+from cqrsex.Application.Interfaces.Common.ISaga import ISaga, SagaEventFailures
 from cqrsex.Application.Mediator.mediator import Mediator
+from cqrsex.Application.Mediator.manifest import CQRS_ROOTS as MANIFEST_ROOTS, get_manifest, import_path, norm, type_path
 
 log = logging.getLogger(__name__)
 
@@ -19,21 +19,13 @@ log = logging.getLogger(__name__)
 ROUTES: Dict[Tuple[str, str], Callable[[Any], Any]] = {}
 
 # You can add more CQRS roots if you split features across packages
-CQRS_ROOTS: List[str] = ["cqrsex.Application.CQRS"]
-
-# ---- discovery registry (lazy, thread-safe) ----
-class _CmdMeta:
-    __slots__ = ("cls", "params")
-    def __init__(self, cls: Type[Any], params: Set[str]):
-        self.cls = cls
-        self.params = params
-
-# (entity_lower, action_lower) -> meta
-_COMMAND_INDEX: Dict[Tuple[str, str], _CmdMeta] = {}
-# entity_lower -> set[action_lower]
-_ACTIONS_BY_ENTITY: DefaultDict[str, Set[str]] = defaultdict(set)
-_DISCOVERY_DONE = False
-_DISCOVERY_LOCK = threading.RLock()
+CQRS_ROOTS: List[str] = list(MANIFEST_ROOTS)
+
+# Routing lookups remembered per raw string (event_type, entity/action, FQCN), hits and
+# misses alike; most saga traffic is past-tense events that route nowhere.
+ROUTE_CACHE_SIZE = 4096
+# commands per batch command in process_many
+SAGA_BATCH_SIZE = 1_000
 
 _CAMEL_RE = re.compile(r"""
     (?:[A-Z]+(?=[A-Z][a-z0-9]|[0-9]|\b)) |   # acronyms at start/middle (API, HTTP2)
@@ -41,17 +33,11 @@ _CAMEL_RE = re.compile(r"""
     (?:[A-Z])                                # single trailing capitals
 """, re.VERBOSE)
 
-def _norm(s: Optional[str]) -> str:
-    return "".join((s or "")).replace("_", "").replace("-", "").strip().lower()
+_norm = norm
 
 def _split_camel(name: str) -> List[str]:
     return [m.group(0) for m in _CAMEL_RE.finditer(name or "")] or []
 
-def _iter_modules(pkg: ModuleType):
-    if not hasattr(pkg, "__path__"):
-        return
-    yield from pkgutil.walk_packages(pkg.__path__, pkg.__name__ + ".")
-
 def _ctor_param_names(cls: Type[Any]) -> Set[str]:
     try:
         sig = inspect.signature(cls)  # class __init__ signature
@@ -59,181 +45,240 @@ def _ctor_param_names(cls: Type[Any]) -> Set[str]:
     except Exception:
         return set()
 
-def _discover_in_root(root_path: str):
-    try:
-        root = import_module(root_path)
-    except Exception:
-        log.exception("Cannot import CQRS root: %s", root_path)
-        return
-    for info in _iter_modules(root) or []:
-        mod_name = info.name
-        # only drill into *.Commands.*.Request
-        if ".Commands." not in mod_name or not mod_name.endswith(".Request"):
-            continue
-        try:
-            mod = import_module(mod_name)
-        except Exception:
-            log.debug("Skip import failure: %s", mod_name, exc_info=True)
-            continue
-
-        try:
-            parts = mod_name.split(".")
-            # [..., CQRS, {EntityPlural}, 'Commands', {Action}, 'Request']
-            action = parts[-2]
-            action_key = _norm(action)
-
-            for attr in dir(mod):
-                if attr.startswith("_"):
-                    continue
-                obj = getattr(mod, attr)
-                if not inspect.isclass(obj):
-                    continue
-                # Class name should begin with Action segment: {Action}{Entity}
-                if not _norm(attr).startswith(action_key):
-                    continue
-                entity_name = attr[len(action):]
-                if not entity_name:
-                    continue
-                entity_key = _norm(entity_name)
-
-                key = (entity_key, action_key)
-                _COMMAND_INDEX[key] = _CmdMeta(obj, _ctor_param_names(obj))
-                _ACTIONS_BY_ENTITY[entity_key].add(action_key)
-        except Exception:
-            log.debug("Indexing failed for %s", mod_name, exc_info=True)
-
-def _discover_commands_once():
-    global _DISCOVERY_DONE
-    if _DISCOVERY_DONE:
-        return
-    with _DISCOVERY_LOCK:
-        if _DISCOVERY_DONE:
-            return
-        for root in CQRS_ROOTS:
-            _discover_in_root(root)
-        _DISCOVERY_DONE = True
-        log.info("CQRS command discovery: %d commands / %d entities",
-                 len(_COMMAND_INDEX), len(_ACTIONS_BY_ENTITY))
-
-def refresh_discovery():
-    """Call on code reload if needed."""
-    global _DISCOVERY_DONE
-    with _DISCOVERY_LOCK:
-        _COMMAND_INDEX.clear()
-        _ACTIONS_BY_ENTITY.clear()
-        _DISCOVERY_DONE = False
-    _discover_commands_once()
-
-def _resolve_by_fqcn(fqcn: str) -> Optional[_CmdMeta]:
-    try:
-        mod_path, cls_name = fqcn.rsplit(".", 1)
-        mod = import_module(mod_path)
-        cls = getattr(mod, cls_name)
-        if not inspect.isclass(cls):
-            return None
-        return _CmdMeta(cls, _ctor_param_names(cls))
-    except Exception:
-        log.debug("Failed to import command by fqcn: %s", fqcn, exc_info=True)
-        return None
-
-def _resolve_by_entity_action(entity: str, action: str) -> Optional[_CmdMeta]:
-    _discover_commands_once()
-    return _COMMAND_INDEX.get((_norm(entity), _norm(action)))
-
-def _parse_event(evt: Any) -> Tuple[Optional[str], Optional[str], Optional[str], dict, Optional[str]]:
+class _Route:
+    """
+    A command constructor with its kwarg adapter prepared: the ctor's parameter names and
+    which defaults it takes are worked out once, on first use (the class imports lazily).
+    """
+    __slots__ = ("path", "cls", "params", "_anonymous", "_db_alias", "_id", "_lock")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.cls: Optional[Type[Any]] = None
+        self._lock = threading.Lock()
+
+    def prepare(self) -> bool:
+        if self.cls is not None:
+            return True
+        with self._lock:
+            if self.cls is None:
+                try:
+                    cls = import_path(self.path)
+                except Exception:
+                    log.debug("Failed to import command: %s", self.path, exc_info=True)
+                    return False
+                if not inspect.isclass(cls):
+                    return False
+                self.params = frozenset(_ctor_param_names(cls))
+                # Helpful defaults, but only if ctor accepts them
+                self._anonymous = "allow_anonymous" in self.params
+                self._db_alias = "db_alias" in self.params
+                self._id = "id" in self.params
+                self.cls = cls
+        return True
+
+    def command(self, evt: Any, payload: dict, db_alias: Optional[str]) -> Any:
+        params = self.params
+        # Filter to known params (safety)
+        kwargs = {k: v for k, v in payload.items() if k in params} if payload else {}
+        if self._anonymous:
+            kwargs.setdefault("allow_anonymous", True)
+        if db_alias and self._db_alias:
+            kwargs.setdefault("db_alias", db_alias)
+        # Common id propagation
+        if self._id and "id" not in kwargs:
+            agg_id = getattr(evt, "aggregate_id", None)
+            if agg_id is not None:
+                kwargs["id"] = agg_id
+        return self.cls(**kwargs)
+
+_Pair = Tuple[str, str]
+_Match = Tuple[Optional[_Pair], Optional[_Route]]   # normalized (entity, action), route
+
+class _Router:
     """
-    Return (entity, action, db_alias, payload, command_fqcn).
-    Priority:
-      1) evt.command (FQCN)
-      2) evt.entity + evt.action
-      3) evt.event_type -> split tokens, try every split present in index
+    Compiled once from the manifest's commands. Every lookup is a dict hit, or an LRU
+    hit for event_type strings (camel-split once) and for raw entity/action spellings.
     """
-    payload = getattr(evt, "payload", {}) or {}
-    db_alias = getattr(evt, "db_alias", None)
-    cmd_fqcn = getattr(evt, "command", None)
-
-    entity = getattr(evt, "entity", None)
-    action = getattr(evt, "action", None)
-    if entity and action:
-        return str(entity), str(action), db_alias, payload, cmd_fqcn
-
-    et = (getattr(evt, "event_type", "") or "").strip()
-    if not et:
-        return None, None, db_alias, payload, cmd_fqcn
-
-    tokens = _split_camel(et)
-    if len(tokens) >= 2:
-        _discover_commands_once()
+    def __init__(self, commands: Dict[str, str], batches: Optional[Dict[str, str]] = None,
+                 cache_size: int = ROUTE_CACHE_SIZE) -> None:
+        self.batches = dict(batches or {})
+        self.routes: Dict[_Pair, _Route] = {}
+        self.actions_by_entity: DefaultDict[str, Set[str]] = defaultdict(set)
+        for key, path in commands.items():
+            entity, _, action = key.partition(":")
+            self.routes[(entity, action)] = _Route(path)
+            self.actions_by_entity[entity].add(action)
+        self.by_pair: Callable[[str, str], _Match] = lru_cache(cache_size)(self._pair)
+        self.by_event_type: Callable[[str], Tuple[Optional[str], Optional[str], _Match]] = \
+            lru_cache(cache_size)(self._event_type)
+        self.by_fqcn: Callable[[str], Optional[_Route]] = lru_cache(cache_size)(self._fqcn)
+        self.batch_for: Callable[[Type[Any]], Optional[Type[Any]]] = lru_cache(None)(self._batch_for)
+
+    def _pair(self, entity: str, action: str) -> _Match:
+        key = (_norm(entity), _norm(action))
+        return key, self.routes.get(key)
+
+    def _event_type(self, et: str) -> Tuple[Optional[str], Optional[str], _Match]:
+        tokens = _split_camel(et.strip())
         # prefer longer action tail first
         for i in range(1, len(tokens)):
             e = "".join(tokens[:len(tokens) - i])
             a = "".join(tokens[len(tokens) - i:])
-            if (_norm(e), _norm(a)) in _COMMAND_INDEX:
-                return e, a, db_alias, payload, cmd_fqcn
-
-    return None, None, db_alias, payload, cmd_fqcn
+            key = (_norm(e), _norm(a))
+            if key in self.routes:
+                return e, a, (key, self.routes[key])
+        return None, None, (None, None)
+
+    def _batch_for(self, cmd_type: Type[Any]) -> Optional[Type[Any]]:
+        path = self.batches.get(type_path(cmd_type))
+        if path is None:
+            return None
+        try:
+            return import_path(path)
+        except Exception:
+            log.debug("Failed to import batch command: %s", path, exc_info=True)
+            return None
 
-def _build_kwargs(meta: _CmdMeta, evt: Any, payload: dict, db_alias: Optional[str]) -> Dict[str, Any]:
-    kwargs: Dict[str, Any] = dict(payload) if payload else {}
+    def _fqcn(self, fqcn: str) -> Optional[_Route]:
+        mod_path, _, cls_name = fqcn.rpartition(".")
+        route = _Route(f"{mod_path}:{cls_name}")
+        return route if route.prepare() else None
 
-    # Helpful defaults, but only if ctor accepts them
-    if "allow_anonymous" in meta.params:
-        kwargs.setdefault("allow_anonymous", True)
-    if db_alias and "db_alias" in meta.params:
-        kwargs.setdefault("db_alias", db_alias)
+_ROUTER: Optional[_Router] = None
+_DISCOVERY_LOCK = threading.RLock()
 
-    # Common id propagation
-    agg_id = getattr(evt, "aggregate_id", None)
-    if agg_id is not None and "id" in meta.params and "id" not in kwargs:
-        kwargs["id"] = agg_id
+def _router(refresh: bool = False) -> _Router:
+    global _ROUTER
+    router = _ROUTER
+    if router is not None and not refresh:
+        return router
+    with _DISCOVERY_LOCK:
+        if _ROUTER is None or refresh:
+            # the Mediator has usually loaded the manifest already; a scan only if not
+            manifest = get_manifest(tuple(CQRS_ROOTS), refresh=refresh)
+            _ROUTER = _Router(manifest.commands, manifest.batches)
+            log.info("CQRS command discovery: %d commands / %d entities",
+                     len(_ROUTER.routes), len(_ROUTER.actions_by_entity))
+        return _ROUTER
 
-    # Filter to known params (safety)
-    return {k: v for k, v in kwargs.items() if k in meta.params}
+def refresh_discovery():
+    """Call on code reload if needed."""
+    _router(refresh=True)
 
 class GenericCrudSaga(ISaga):
     """
     Dynamic saga that routes write events to actual CQRS commands discovered in codebase.
     No synonyms or guesses: if a command exists, it runs; otherwise it's skipped.
+
+    Routing priority: evt.command (FQCN), then evt.entity + evt.action, then
+    evt.event_type split on camel-case words (longest action tail first).
+    process_many sends consecutive commands of one type as their batch command
+    (a class in the CQRS tree declaring `batches = ThatCommand`), one transaction per batch.
     """
     @inject
     def __init__(self, mediator: Mediator) -> None:
         self._mediator = mediator
 
-    def process(self, event: Any):
-        entity, action, db_alias, payload, cmd_fqcn = _parse_event(event)
+    def _command(self, event: Any) -> Tuple[Any, bool]:
+        """(command or None, came from a ROUTES override)."""
+        router = _ROUTER or _router()
+        entity = getattr(event, "entity", None)
+        action = getattr(event, "action", None)
+        cmd_fqcn = getattr(event, "command", None)
+        key: Optional[_Pair] = None
+        route: Optional[_Route] = None
+        if entity and action:
+            entity, action = str(entity), str(action)
+            if not cmd_fqcn:
+                key, route = router.by_pair(entity, action)
+        else:
+            et = getattr(event, "event_type", "") or ""
+            if et:
+                entity, action, (key, route) = router.by_event_type(et)
 
         # 1) explicit FQCN wins
         if cmd_fqcn:
-            meta = _resolve_by_fqcn(cmd_fqcn)
-            if not meta:
+            route = router.by_fqcn(cmd_fqcn)
+            if route is None:
                 log.warning("[Saga] command fqcn not found: %s", cmd_fqcn)
-                return
+                return None, False
         else:
             if not entity or not action:
                 log.debug("[Saga] ignored event (no entity/action): %r", event)
-                return
+                return None, False
             # Override hook first
-            factory = ROUTES.get((_norm(entity), _norm(action)))
+            factory = ROUTES.get(key) if ROUTES else None
             if factory:
                 try:
                     cmd = factory(event)
                     log.info("[Saga] Dispatch %s (override)", type(cmd).__name__)
-                    self._mediator.send(cmd)
+                    return cmd, True
                 except Exception:
                     log.exception("[Saga] override failed for (%s, %s)", entity, action)
-                finally:
-                    return
-            meta = _resolve_by_entity_action(entity, action)
-            if not meta:
+                    return None, True
+            if route is None or not route.prepare():
                 log.info("[Saga] No command for (%s, %s); skipping.", entity, action)
-                return
+                return None, False
 
         try:
-            kwargs = _build_kwargs(meta, event, payload, db_alias)
-            cmd = meta.cls(**kwargs)
+            cmd = route.command(event, getattr(event, "payload", None) or {}, getattr(event, "db_alias", None))
         except Exception:
-            log.warning("Failed constructing %s with kwargs=%s", getattr(meta.cls, "__name__", meta.cls), kwargs, exc_info=True)
-            return
+            log.warning("Failed constructing %s from payload=%s", route.path, getattr(event, "payload", None),
+                        exc_info=True)
+            return None, False
 
         log.info("[Saga] Dispatch %s (entity=%s action=%s)", type(cmd).__name__, entity, action)
-        self._mediator.send(cmd)
+        return cmd, False
+
+    def process(self, event: Any):
+        cmd, override = self._command(event)
+        if cmd is None:
+            return
+        if not override:
+            self._mediator.send(cmd)
+            return
+        try:
+            self._mediator.send(cmd)
+        except Exception:
+            log.exception("[Saga] override failed for %s", type(cmd).__name__)
+
+    def process_many(self, events: Sequence[Any]) -> None:
+        sends = [(c, e) for e, (c, _) in zip(events, map(self._command, events)) if c is not None]
+        router = _ROUTER or _router()
+        failures: List[Tuple[Any, BaseException]] = []
+        # runs of one command type, so commands never overtake each other
+        for cmd_type, run in groupby(sends, key=lambda s: type(s[0])):
+            run = list(run)
+            batch_type = router.batch_for(cmd_type) if len(run) > 1 else None
+            if batch_type is None:
+                for c, e in run:
+                    self._send(c, (e,), failures)
+                continue
+            for start in range(0, len(run), SAGA_BATCH_SIZE):
+                chunk = run[start:start + SAGA_BATCH_SIZE]
+                try:
+                    batch = batch_type.from_commands([c for c, _ in chunk]) if len(chunk) > 1 else None
+                except Exception:
+                    log.warning("[Saga] cannot batch %d %s", len(chunk), cmd_type.__name__, exc_info=True)
+                    batch = None
+                if batch is not None:
+                    self._send(batch, [e for _, e in chunk], failures)
+                else:
+                    for c, e in chunk:
+                        self._send(c, (e,), failures)
+        if failures:
+            # the rest went through; only these events are retried
+            raise SagaEventFailures(failures)
+
+    def _send(self, cmd: Any, events: Sequence[Any], failures: List[Tuple[Any, BaseException]]) -> None:
+        # one failing command must not cost the rest of the batch
+        try:
+            res = self._mediator.send(cmd)
+        except Exception as ex:
+            log.exception("[Saga] %s failed", type(cmd).__name__)
+            failures.extend((e, ex) for e in events)
+            return
+        status = getattr(res, "status", None)
+        if status is not None and not status.succeeded:
+            log.warning("[Saga] %s: %s", type(cmd).__name__, getattr(res, "message", None))
@@ -1,26 +1,58 @@
 # cqrsex/Application/Sagas/OutboxSaga.py
 from __future__ import annotations
-from typing import Any
+from itertools import groupby
+from typing import Any, Dict, List, Sequence, Tuple
 from injector import inject
 from cqrsex.Application.Interfaces.Repositories.IOutboxRepository import IOutboxRepository
-from cqrsex.Application.Interfaces.Common.ISaga import ISaga
+from cqrsex.Application.Interfaces.Common.ISaga import ISaga, SagaEventFailures
 
 class OutboxSaga(ISaga):
+    # only appends outbox rows: safe to run alongside the other sagas
+    independent = True
+
     @inject
     def __init__(self, outbox_repo: IOutboxRepository) -> None:
         self._outbox_repo = outbox_repo
 
-    def process(self, event: Any) -> None:
-        db = getattr(event, "db_alias", "default")
-        entity = getattr(event, "entity", None) or "Unknown"
-        action = getattr(event, "action", None) or "Unknown"
-        agg_id = getattr(event, "aggregate_id", None)
-        payload = getattr(event, "payload", {}) or {}
+    @staticmethod
+    def _alias(event: Any) -> str:
+        return getattr(event, "db_alias", "default")
 
-        self._outbox_repo.using(db).add(
-            aggregate_type=entity,
-            aggregate_id=agg_id,
-            event_type=action,
+    @staticmethod
+    def _fields(event: Any) -> Dict[str, Any]:
+        payload = getattr(event, "payload", {}) or {}
+        return dict(
+            aggregate_type=getattr(event, "entity", None) or "Unknown",
+            aggregate_id=getattr(event, "aggregate_id", None),
+            event_type=getattr(event, "action", None) or "Unknown",
             payload=payload,
             tenant_id=payload.get("tenant_id", "main"),
         )
+
+    def _append(self, event: Any) -> None:
+        self._outbox_repo.using(self._alias(event)).add(**self._fields(event))
+
+    def before_commit(self, event: Any) -> None:
+        # inside the unit of work: buffered, then bulk-inserted with the aggregate write
+        self._append(event)
+        event.outboxed = True
+
+    def process(self, event: Any) -> None:
+        # post-commit fallback for events emitted outside a unit of work
+        if getattr(event, "outboxed", False):
+            return
+        self._append(event)
+
+    def process_many(self, events: Sequence[Any]) -> None:
+        # one INSERT per run of events on the same database
+        pending = [e for e in events if not getattr(e, "outboxed", False)]
+        failures: List[Tuple[Any, BaseException]] = []
+        for db, group in groupby(pending, key=self._alias):
+            group = list(group)
+            try:
+                self._outbox_repo.using(db).add_many(self._fields(e) for e in group)
+            except Exception as ex:
+                # runs already inserted must not be inserted again on retry
+                failures.extend((e, ex) for e in group)
+        if failures:
+            raise SagaEventFailures(failures)
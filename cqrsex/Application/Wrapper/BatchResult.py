@@ -0,0 +1,50 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from cqrsex.Application.Common.exceptions import ValidationException
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+
+
+class BatchResult:
+    """
+    Per-item outcome of a bulk command, in request order:
+        {"index": 3, "status": "created", "id": 42}
+        {"index": 4, "status": "failed", "code": "not_found", "message": "..."}
+    """
+
+    def __init__(self, size: int) -> None:
+        self.items: List[Optional[Dict[str, Any]]] = [None] * size
+
+    def ok(self, index: int, status: str, id: Any) -> None:
+        self.items[index] = {"index": index, "status": status, "id": id}
+
+    def fail(self, index: int, code: str, message: str, *, id: Any = None, details: Any = None) -> None:
+        item: Dict[str, Any] = {"index": index, "status": "failed", "code": code, "message": message}
+        if id is not None:
+            item["id"] = id
+        if details:
+            item["details"] = details
+        self.items[index] = item
+
+    def invalid(self, index: int, err: ValidationError) -> None:
+        self.fail(index, "validation_error", "Invalid item",
+                  details=[{"loc": list(e["loc"]), "msg": e["msg"]} for e in err.errors()])
+
+    def failed(self) -> List[Dict[str, Any]]:
+        return [i for i in self.items if i is not None and i["status"] == "failed"]
+
+    def reject(self) -> None:
+        """All-or-nothing batches: any failed item aborts the whole command (UoW rolls back)."""
+        failed = self.failed()
+        if failed:
+            raise ValidationException(
+                f"{len(failed)} of {len(self.items)} item(s) rejected; nothing was written",
+                {"items": failed}, code="batch_rejected",
+            )
+
+    def to_result(self, message: str) -> ConcreteResultT:
+        failed = len(self.failed())
+        return ConcreteResultT.success(
+            {"items": self.items, "succeeded": len(self.items) - failed, "failed": failed}, message
+        )
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class KeysetPage:
+    """One page of a cursor (keyset) listing. Cursors are opaque to callers."""
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+    def pagination(self, page_size: int) -> Dict[str, Any]:
+        return {
+            "mode": "cursor",
+            "page_size": page_size,
+            "next_cursor": self.next_cursor,
+            "prev_cursor": self.prev_cursor,
+            "has_next": self.has_next,
+            "has_prev": self.has_prev,
+        }
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# How a paginated listing obtains its total:
+#   exact     - COUNT(*) on every call
+#   none      - no total; has_next comes from fetching page_size + 1 rows
+#   estimated - planner estimate (PostgreSQL), exact when small or unsupported
+#   cached    - exact COUNT(*) memoized per filter signature for a TTL
+COUNT_MODES = ("exact", "none", "estimated", "cached")
+
+
+@dataclass
+class OffsetPage:
+    """One page of a page/page_size listing. `count_mode` is the mode that actually produced `total`."""
+    items: List[Any]
+    page: int
+    page_size: int
+    has_next: bool
+    total: Optional[int] = None
+    count_mode: str = "exact"
+
+    @property
+    def total_pages(self) -> Optional[int]:
+        if self.total is None:
+            return None
+        return (self.total + self.page_size - 1) // self.page_size
+
+    def pagination(self) -> Dict[str, Any]:
+        return {
+            "mode": "offset",
+            "count_mode": self.count_mode,
+            "total": self.total,
+            "page": self.page,
+            "page_size": self.page_size,
+            "total_pages": self.total_pages,
+            "has_next": self.has_next,
+            "has_prev": self.page > 1,
+        }
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Dict, Iterable, Tuple, Union
+
+
+@dataclass
+class RowStream:
+    """
+    Lazy export result: `rows` yields dicts (keys = `fields`) as the database returns them.
+    Sync handlers hand out an Iterable, async handlers an AsyncIterable; nothing is
+    materialised, so the consumer decides how much sits in memory.
+    """
+    fields: Tuple[str, ...]
+    rows: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
@@ -5,8 +5,17 @@ import threading
 from injector import Injector
 
 from cqrsex.Application.DI.MediatorModule import MediatorModule
+from cqrsex.Application.DI.SagaModule import SagaModule
+from cqrsex.Infrstraction.DI.SagaDispatchModule import SagaDispatchModule
+from cqrsex.Infrstraction.DI.SagaRetryModule import SagaRetryModule
 from cqrsex.Infrstraction.DI.UoWModule import UoWModule
 from cqrsex.Infrstraction.DI.RepositoryModule import RepositoryModule
+from cqrsex.Infrstraction.DI.QueryCacheModule import QueryCacheModule
+from cqrsex.Infrstraction.DI.IdempotencyModule import IdempotencyModule
+from cqrsex.Infrstraction.DI.OutboxRelayModule import OutboxRelayModule
+from cqrsex.Infrstraction.DI.ProjectionModule import ProjectionModule
+from cqrsex.Infrstraction.DI.AuthorLoaderModule import AuthorLoaderModule
+from cqrsex.Infrstraction.DI.PasswordHasherModule import PasswordHasherModule
 from cqrsex.Application.Mediator.mediator import Mediator
 
 _injector: Injector | None = None
@@ -20,7 +29,16 @@ def get_injector() -> Injector:
                 _injector = Injector([
                     RepositoryModule(),
                     UoWModule(),
+                    QueryCacheModule(),
+                    IdempotencyModule(),
+                    AuthorLoaderModule(),
+                    PasswordHasherModule(),
                     MediatorModule(),
+                    SagaModule(),
+                    SagaDispatchModule(),
+                    SagaRetryModule(),
+                    OutboxRelayModule(),
+                    ProjectionModule(),
                 ])
     return _injector
 
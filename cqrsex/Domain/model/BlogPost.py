@@ -1,10 +1,5 @@
-from django.db import models
+# Legacy import path. The model lives in cqrsex.Domain.models; defining it twice in the
+# same app makes Django refuse to load ("Conflicting 'blogpost' models").
+from cqrsex.Domain.models.BlogPost import BlogPost
 
-class BlogPost(models.Model):
-    title = models.CharField(max_length=255)
-    body = models.TextField(blank=True)
-    author_id = models.IntegerField()  # keep simple; replace with FK if you want
-
-    is_deleted = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+__all__ = ["BlogPost"]
@@ -0,0 +1,12 @@
+from django.db import models
+
+class AuthorPostCount(models.Model):
+    """Read model: live post count per author."""
+    author_id = models.IntegerField(primary_key=True)
+    author_username = models.CharField(max_length=150, blank=True, default="")
+    post_count = models.IntegerField(default=0)
+    last_post_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "rm_author_post_counts"
+        managed = True
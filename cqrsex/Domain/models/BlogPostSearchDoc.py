@@ -0,0 +1,19 @@
+from django.db import models
+
+class BlogPostSearchDoc(models.Model):
+    """
+    Read model: the searchable text of each live post (projection of BlogPost events).
+    The full-text index over it is not a model field: a generated tsvector column +
+    GIN index on PostgreSQL, an FTS5 table on SQLite (Infrstraction/Search/FullTextIndex).
+    """
+    id = models.BigIntegerField(primary_key=True)        # = blog_posts.id
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    author_id = models.IntegerField()
+    tenant_id = models.CharField(max_length=20, default="main")
+    created_at = models.DateTimeField()
+    version = models.BigIntegerField(default=0)          # id of the last outbox event applied
+
+    class Meta:
+        db_table = "rm_blog_post_search"
+        managed = True
@@ -0,0 +1,20 @@
+from django.db import models
+
+class BlogPostView(models.Model):
+    """Read model: one denormalized row per live post (projection of BlogPost events)."""
+    id = models.BigIntegerField(primary_key=True)        # = blog_posts.id
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    author_id = models.IntegerField()
+    author_username = models.CharField(max_length=150, blank=True, default="")  # from auth_db
+    tenant_id = models.CharField(max_length=20, default="main")
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    version = models.BigIntegerField(default=0)          # id of the last outbox event applied
+
+    class Meta:
+        db_table = "rm_blog_posts"
+        managed = True
+        indexes = [
+            models.Index(fields=["author_id", "id"], name="rm_blog_posts_author_idx"),
+        ]
@@ -0,0 +1,18 @@
+from django.db import models
+
+class IdempotencyRecord(models.Model):
+    """Stored result of a command sent with an idempotency key; NULL result = execution in flight."""
+    key = models.CharField(max_length=64, primary_key=True)   # sha256 of the client's key
+    result = models.BinaryField(null=True)
+    # sha256 of the command's fields: the same key with another body is refused
+    fingerprint = models.CharField(max_length=64, blank=True, default="")
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "idempotency_keys"
+        managed = True
+        indexes = [
+            # purge scan: expired rows first
+            models.Index(fields=["expires_at"], name="idempotency_expiry_idx"),
+        ]
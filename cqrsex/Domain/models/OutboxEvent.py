@@ -10,7 +10,22 @@ class OutboxEvent(models.Model):
     tenant_id = models.CharField(max_length=20, default="main")
     created_at = models.DateTimeField(auto_now_add=True)
     processed = models.BooleanField(default=False)
+    processed_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "outbox_events"
         managed = True
+        indexes = [
+            # relay scan: only the (small) pending set, in claim order per tenant
+            models.Index(
+                fields=["tenant_id", "created_at", "id"],
+                name="outbox_pending_idx",
+                condition=models.Q(processed=False),
+            ),
+            # retention scan: oldest delivered rows first
+            models.Index(
+                fields=["processed_at"],
+                name="outbox_done_idx",
+                condition=models.Q(processed=True),
+            ),
+        ]
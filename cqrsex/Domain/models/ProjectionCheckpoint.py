@@ -0,0 +1,11 @@
+from django.db import models
+
+class ProjectionCheckpoint(models.Model):
+    """Last outbox event id each projection has applied."""
+    name = models.CharField(max_length=100, primary_key=True)
+    position = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "projection_checkpoints"
+        managed = True
@@ -0,0 +1,19 @@
+from django.db import models
+
+class SagaDeadLetter(models.Model):
+    """A saga invocation that still failed after the last retry; replay with saga_retry --requeue-dead."""
+    id = models.BigAutoField(primary_key=True)
+    saga = models.CharField(max_length=100)
+    idempotency_key = models.CharField(max_length=64)
+    event = models.JSONField()
+    attempts = models.IntegerField()
+    last_error = models.TextField(blank=True, default="")
+    first_failed_at = models.DateTimeField()
+    dead_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "saga_dead_letters"
+        managed = True
+        constraints = [
+            models.UniqueConstraint(fields=["saga", "idempotency_key"], name="saga_dead_key_uniq"),
+        ]
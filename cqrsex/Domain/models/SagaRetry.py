@@ -0,0 +1,25 @@
+from django.db import models
+
+class SagaRetry(models.Model):
+    """A failed saga invocation (one saga, one event) waiting for its next attempt."""
+    id = models.BigAutoField(primary_key=True)
+    saga = models.CharField(max_length=100)
+    # sha256 of (saga, event): the same failure recorded twice stays one row
+    idempotency_key = models.CharField(max_length=64)
+    event = models.JSONField()
+    attempts = models.IntegerField(default=1)
+    last_error = models.TextField(blank=True, default="")
+    next_attempt_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "saga_retries"
+        managed = True
+        constraints = [
+            models.UniqueConstraint(fields=["saga", "idempotency_key"], name="saga_retry_key_uniq"),
+        ]
+        indexes = [
+            # retrier scan: due rows, oldest schedule first
+            models.Index(fields=["next_attempt_at", "id"], name="saga_retry_due_idx"),
+        ]
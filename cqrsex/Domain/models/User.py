@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 class User(AbstractUser):
     class UserRole(models.TextChoices):
@@ -16,3 +17,8 @@ class User(AbstractUser):
     class Meta:
         db_table = "users"
         managed = True
+        # case-insensitive lookups (UserReadRepository._ci / _taken filter on LOWER(col))
+        indexes = [
+            models.Index(Lower("username"), name="users_username_lower_idx"),
+            models.Index(Lower("email"), name="users_email_lower_idx"),
+        ]
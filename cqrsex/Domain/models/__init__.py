@@ -1,10 +1,23 @@
-
 from cqrsex.Domain.models.BlogPost import BlogPost
 from cqrsex.Domain.models.OutboxEvent import OutboxEvent
 from cqrsex.Domain.models.User import User
+from cqrsex.Domain.models.BlogPostView import BlogPostView
+from cqrsex.Domain.models.AuthorPostCount import AuthorPostCount
+from cqrsex.Domain.models.ProjectionCheckpoint import ProjectionCheckpoint
+from cqrsex.Domain.models.BlogPostSearchDoc import BlogPostSearchDoc
+from cqrsex.Domain.models.SagaRetry import SagaRetry
+from cqrsex.Domain.models.SagaDeadLetter import SagaDeadLetter
+from cqrsex.Domain.models.IdempotencyRecord import IdempotencyRecord
 
 __all__ = [
     "BlogPost",
     "User",
-    "OutboxEvent"
-           ]
\ No newline at end of file
+    "OutboxEvent",
+    "BlogPostView",
+    "AuthorPostCount",
+    "ProjectionCheckpoint",
+    "BlogPostSearchDoc",
+    "SagaRetry",
+    "SagaDeadLetter",
+    "IdempotencyRecord",
+           ]
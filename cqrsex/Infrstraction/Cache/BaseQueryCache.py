@@ -0,0 +1,52 @@
+# cqrsex/Infrstraction/Cache/BaseQueryCache.py
+from __future__ import annotations
+import threading
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+from asgiref.sync import sync_to_async
+from django.db import transaction, connections
+
+from cqrsex.Application.Interfaces.Common.IQueryCache import IQueryCache
+
+
+class BaseQueryCache(IQueryCache):
+    """
+    Shared counters + on-commit invalidation for the concrete backends. The async
+    accessors run the sync ones in a worker thread; in-process backends override them.
+    """
+
+    def __init__(self) -> None:
+        self._stats_lock = threading.Lock()
+        self._counters: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._counters[name] += n
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._counters)
+
+    async def aget(self, key: Hashable) -> Optional[Any]:
+        return await sync_to_async(self.get, thread_sensitive=True)(key)
+
+    async def atag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        return await sync_to_async(self.tag_versions, thread_sensitive=True)(tuple(tags))
+
+    async def aset(self, key: Hashable, value: Any, *, tags: Dict[str, int], ttl: Optional[float] = None) -> None:
+        await sync_to_async(self.set, thread_sensitive=True)(key, value, tags=tags, ttl=ttl)
+
+    def invalidate_after_commit(self, tags: Iterable[str], *, using: Optional[str] = None) -> None:
+        tags = tuple(tags)
+        if not tags:
+            return
+        aliases = [using] if using else [a for a in connections if connections[a].in_atomic_block]
+        if not aliases:
+            self.invalidate_tags(tags)
+            return
+        # one bump per committing alias: readers never keep data read before the last commit
+        for alias in aliases:
+            transaction.on_commit(lambda: self.invalidate_tags(tags), using=alias)
+
+    async def ainvalidate_after_commit(self, tags: Iterable[str], *, using: Optional[str] = None) -> None:
+        await sync_to_async(self.invalidate_after_commit, thread_sensitive=True)(tuple(tags), using=using)
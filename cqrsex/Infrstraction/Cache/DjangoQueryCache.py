@@ -0,0 +1,77 @@
+# cqrsex/Infrstraction/Cache/DjangoQueryCache.py
+from __future__ import annotations
+import hashlib
+import time
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+from django.core.cache import caches
+
+from cqrsex.Infrstraction.Cache.BaseQueryCache import BaseQueryCache
+
+
+class DjangoQueryCache(BaseQueryCache):
+    """
+    Backed by a Django cache alias (Redis/Memcached/...), so invalidation is shared
+    across workers. Tag versions live in the cache as `<prefix>:tag:<tag>` counters.
+    A missing counter (never bumped, or evicted) is seeded with time.time_ns(), never
+    0: an evicted counter must not come back at a version old entries were stored with.
+    `evictions` counts entries found stale (tag bumped) on read; TTL expiry is the
+    backend's business and shows up as a miss.
+    """
+
+    def __init__(self, alias: str = "default", *, prefix: str = "qc", default_ttl: Optional[float] = 60.0) -> None:
+        super().__init__()
+        self._cache = caches[alias]
+        self._prefix = prefix
+        self._ttl = default_ttl
+
+    def _key(self, key: Hashable) -> str:
+        raw = f"{type(key).__module__}.{type(key).__qualname__}:{key!r}"
+        return f"{self._prefix}:q:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._prefix}:tag:{tag}"
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._cache.get(self._key(key))
+        if entry is None:
+            self._count("misses")
+            return None
+        value, snapshot = entry
+        if snapshot and self.tag_versions(snapshot.keys()) != snapshot:
+            self._cache.delete(self._key(key))
+            self._count("evictions")
+            self._count("misses")
+            return None
+        self._count("hits")
+        return value
+
+    def tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        tags = list(tags)
+        found = self._cache.get_many([self._tag_key(t) for t in tags])
+        missing = [t for t in tags if self._tag_key(t) not in found]
+        for t in missing:
+            # add(): a concurrent seed or bump wins, re-read below
+            self._cache.add(self._tag_key(t), time.time_ns(), timeout=None)
+        if missing:
+            found.update(self._cache.get_many([self._tag_key(t) for t in missing]))
+        return {t: int(found.get(self._tag_key(t), 0)) for t in tags}
+
+    def set(self, key: Hashable, value: Any, *, tags: Dict[str, int], ttl: Optional[float] = None) -> None:
+        ttl = self._ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            return  # ttl 0: not cached
+        self._cache.set(self._key(key), (value, dict(tags)), timeout=ttl)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        n = 0
+        for t in tags:
+            k = self._tag_key(t)
+            # add() is atomic on shared backends; incr() keeps concurrent bumps distinct
+            if not self._cache.add(k, time.time_ns(), timeout=None):
+                try:
+                    self._cache.incr(k)
+                except ValueError:
+                    self._cache.set(k, time.time_ns(), timeout=None)
+            n += 1
+        self._count("invalidations", n)
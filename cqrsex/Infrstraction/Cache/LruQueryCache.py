@@ -0,0 +1,114 @@
+# cqrsex/Infrstraction/Cache/LruQueryCache.py
+from __future__ import annotations
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from cqrsex.Infrstraction.Cache.BaseQueryCache import BaseQueryCache
+
+# key -> (value, expires_at | None, tag snapshot)
+_Entry = Tuple[Any, Optional[float], Dict[str, int]]
+
+
+class LruQueryCache(BaseQueryCache):
+    """
+    In-process LRU with TTL. Per worker; invalidation is local to the process, so with
+    several workers the others can serve stale results for up to the TTL.
+
+    Tag versions come from one process-wide sequence and are never reused, so a tag no
+    live entry refers to can be forgotten: it comes back with a fresh version, and any
+    entry snapshotted before that just misses. Tags are pruned that way whenever they
+    outgrow twice the live ones (at least 2 x max_entries).
+    """
+
+    def __init__(self, max_entries: int = 10_000, default_ttl: Optional[float] = 60.0) -> None:
+        super().__init__()
+        self._max = max(int(max_entries), 1)
+        self._ttl = default_ttl
+        self._data: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._tags: Dict[str, int] = {}
+        self._seq = itertools.count(1)
+        self._prune_at = 2 * self._max
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._count("misses")
+                return None
+            value, expires_at, snapshot = entry
+            if (expires_at is not None and expires_at <= time.monotonic()) or any(
+                self._tags.get(t, 0) != v for t, v in snapshot.items()
+            ):
+                del self._data[key]
+                self._count("evictions")
+                self._count("misses")
+                return None
+            self._data.move_to_end(key)
+        self._count("hits")
+        return value
+
+    def _version(self, tag: str) -> int:
+        v = self._tags.get(tag)
+        if v is None:
+            v = self._tags[tag] = next(self._seq)
+        return v
+
+    def _prune_tags(self) -> None:
+        live = {t for _, _, snapshot in self._data.values() for t in snapshot}
+        self._tags = {t: v for t, v in self._tags.items() if t in live}
+        self._prune_at = max(2 * self._max, 2 * len(self._tags))
+
+    def tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        with self._lock:
+            out = {t: self._version(t) for t in tags}
+            if len(self._tags) > self._prune_at:
+                self._prune_tags()
+            return out
+
+    def set(self, key: Hashable, value: Any, *, tags: Dict[str, int], ttl: Optional[float] = None) -> None:
+        ttl = self._ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            return  # ttl 0: not cached
+        expires_at = time.monotonic() + ttl if ttl else None
+        evicted = 0
+        with self._lock:
+            self._data[key] = (value, expires_at, dict(tags))
+            self._data.move_to_end(key)
+            while len(self._data) > self._max:
+                self._data.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._count("evictions", evicted)
+
+    # in-memory: no I/O, so no thread hop from the event loop
+    async def aget(self, key: Hashable) -> Optional[Any]:
+        return self.get(key)
+
+    async def atag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        return self.tag_versions(tags)
+
+    async def aset(self, key: Hashable, value: Any, *, tags: Dict[str, int], ttl: Optional[float] = None) -> None:
+        self.set(key, value, tags=tags, ttl=ttl)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        n = 0
+        with self._lock:
+            for t in tags:
+                self._tags[t] = next(self._seq)
+                n += 1
+            if len(self._tags) > self._prune_at:
+                self._prune_tags()
+        self._count("invalidations", n)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        out = super().stats()
+        out["size"] = len(self._data)
+        return out
@@ -0,0 +1,99 @@
+# cqrsex/Infrstraction/Cache/test_query_cache.py
+import asyncio
+
+import pytest
+from django.db import transaction
+
+from cqrsex.Infrstraction.Cache.DjangoQueryCache import DjangoQueryCache
+from cqrsex.Infrstraction.Cache.LruQueryCache import LruQueryCache
+
+CACHES = {
+    "lru": lambda: LruQueryCache(max_entries=100),
+    # CACHES["query"]: the shared DatabaseCache the project runs on
+    "django": lambda: DjangoQueryCache("query"),
+}
+
+
+@pytest.fixture(params=sorted(CACHES))
+def cache(request):
+    return CACHES[request.param]()
+
+
+def _store(cache, key="k", value="v", tags=("post:1",)):
+    cache.set(key, value, tags=cache.tag_versions(tags))
+
+
+def test_entry_is_served_until_its_tag_is_bumped(cache):
+    _store(cache)
+    _store(cache, "other", tags=("post:2",))
+    assert cache.get("k") == "v"
+    cache.invalidate_tags(["post:1"])
+    assert cache.get("k") is None
+    assert cache.get("other") == "v"
+
+
+def test_invalidation_waits_for_commit(cache):
+    _store(cache)
+    with transaction.atomic():
+        cache.invalidate_after_commit(["post:1"])
+        # readers inside the transaction (or elsewhere) still see the committed state
+        assert cache.get("k") == "v"
+    assert cache.get("k") is None
+
+
+def test_rollback_does_not_invalidate(cache):
+    _store(cache)
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            cache.invalidate_after_commit(["post:1"])
+            raise RuntimeError
+    assert cache.get("k") == "v"
+
+
+def test_entry_read_before_commit_is_dropped_after_it(cache):
+    # a reader that cached the pre-commit row must not outlive the commit
+    with transaction.atomic():
+        cache.invalidate_after_commit(["post:1"])
+        _store(cache, value="stale")
+    assert cache.get("k") is None
+
+
+def test_outside_a_transaction_invalidation_is_immediate(cache):
+    _store(cache)
+    cache.invalidate_after_commit(["post:1"])
+    assert cache.get("k") is None
+
+
+def test_invalidation_on_another_alias_waits_for_that_commit(cache):
+    _store(cache)
+    with transaction.atomic(using="auth_db"):
+        cache.invalidate_after_commit(["post:1"], using="auth_db")
+        assert cache.get("k") == "v"
+    assert cache.get("k") is None
+
+
+def test_zero_ttl_is_not_stored(cache):
+    cache.set("k", "v", tags=cache.tag_versions(["post:1"]), ttl=0)
+    assert cache.get("k") is None
+
+
+def test_async_accessors_share_the_sync_state(cache):
+    async def main():
+        await cache.aset("k", "v", tags=await cache.atag_versions(["post:1"]))
+        hit = await cache.aget("k")
+        await cache.ainvalidate_after_commit(["post:1"])
+        return hit, await cache.aget("k")
+
+    assert asyncio.run(main()) == ("v", None)
+
+
+def test_lru_tag_versions_survive_pruning():
+    cache = LruQueryCache(max_entries=2)
+    _store(cache)
+    before = cache.tag_versions(["post:1"])
+    for i in range(50):
+        cache.tag_versions([f"noise:{i}"])
+    assert cache.tag_versions(["post:1"]) == before
+    assert cache.get("k") == "v"
+    cache.invalidate_tags(["post:1"])
+    assert cache.get("k") is None
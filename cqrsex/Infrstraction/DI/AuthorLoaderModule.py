@@ -0,0 +1,16 @@
+# cqrsex/Infrstraction/DI/AuthorLoaderModule.py
+from injector import Module, provider, singleton
+from django.conf import settings
+
+from cqrsex.Application.Interfaces.Common.IAuthorLoader import IAuthorLoader
+from cqrsex.Application.Interfaces.Common.IQueryCache import IQueryCache
+from cqrsex.Application.Interfaces.Repositories.IUserReadRepository import IUserReadRepository
+from cqrsex.Infrstraction.Loaders.AuthorLoader import AuthorLoader
+
+
+class AuthorLoaderModule(Module):
+    @singleton
+    @provider
+    def provide_author_loader(self, users: IUserReadRepository, cache: IQueryCache) -> IAuthorLoader:
+        cfg = getattr(settings, "CQRS_AUTHOR_LOADER", {}) or {}
+        return AuthorLoader(users, cache if cfg.get("SHARED_CACHE", True) else None, ttl=cfg.get("TTL", 300))
@@ -0,0 +1,23 @@
+# cqrsex/Infrstraction/DI/IdempotencyModule.py
+from injector import Module, provider, singleton
+from django.conf import settings
+
+from cqrsex.Application.Interfaces.Common.IIdempotencyStore import IIdempotencyStore
+
+
+class IdempotencyModule(Module):
+    @singleton
+    @provider
+    def provide_idempotency_store(self) -> IIdempotencyStore:
+        cfg = getattr(settings, "CQRS_IDEMPOTENCY", {}) or {}
+        backend = (cfg.get("BACKEND") or "db").lower()
+        ttl = cfg.get("TTL", 86_400)
+        if backend == "django":
+            from cqrsex.Infrstraction.Idempotency.DjangoCacheIdempotencyStore import DjangoCacheIdempotencyStore
+            return DjangoCacheIdempotencyStore(cfg.get("ALIAS", "default"), prefix=cfg.get("PREFIX", "idem"), default_ttl=ttl)
+        if backend == "lru":
+            from cqrsex.Infrstraction.Idempotency.LruIdempotencyStore import LruIdempotencyStore
+            return LruIdempotencyStore(max_entries=cfg.get("MAX_ENTRIES", 10_000), default_ttl=ttl)
+        from cqrsex.Infrstraction.Idempotency.DbIdempotencyStore import DbIdempotencyStore
+        return DbIdempotencyStore(cfg.get("DB_ALIAS", "default"), default_ttl=ttl,
+                                  purge_batch_size=cfg.get("PURGE_BATCH_SIZE", 5_000))
@@ -0,0 +1,45 @@
+# cqrsex/Infrstraction/DI/OutboxRelayModule.py
+from typing import Any, List
+from injector import Module, provider, singleton
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from cqrsex.Application.Interfaces.Common.IOutboxPublisher import IOutboxPublisher
+from cqrsex.Application.Interfaces.Repositories.IOutboxRepository import IOutboxRepository
+from cqrsex.Infrstraction.Outbox.OutboxRelay import OutboxRelay
+
+DEFAULT_PUBLISHER = "cqrsex.Infrstraction.Outbox.LoggingPublisher.LoggingPublisher"
+
+
+def relay_config() -> dict:
+    cfg = dict(getattr(settings, "CQRS_OUTBOX_RELAY", {}) or {})
+    cfg.setdefault("PUBLISHERS", [DEFAULT_PUBLISHER])
+    return cfg
+
+
+def build_relay(repo: IOutboxRepository, cfg: dict) -> OutboxRelay:
+    return OutboxRelay(
+        repo,
+        build_publishers(cfg["PUBLISHERS"]),
+        db_alias=cfg.get("DB_ALIAS", "default"),
+        batch_size=cfg.get("BATCH_SIZE", 100),
+        fair=cfg.get("FAIR", True),
+        idle_backoff=tuple(cfg.get("IDLE_BACKOFF", (0.05, 5.0))),
+    )
+
+
+def build_publishers(specs: List[Any]) -> List[IOutboxPublisher]:
+    # "dotted.Path" or {"CLASS": "dotted.Path", "OPTIONS": {...}}
+    out: List[IOutboxPublisher] = []
+    for spec in specs:
+        if isinstance(spec, str):
+            spec = {"CLASS": spec}
+        out.append(import_string(spec["CLASS"])(**(spec.get("OPTIONS") or {})))
+    return out
+
+
+class OutboxRelayModule(Module):
+    @singleton
+    @provider
+    def provide_outbox_relay(self, repo: IOutboxRepository) -> OutboxRelay:
+        return build_relay(repo, relay_config())
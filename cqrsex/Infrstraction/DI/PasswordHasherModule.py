@@ -0,0 +1,21 @@
+# cqrsex/Infrstraction/DI/PasswordHasherModule.py
+import atexit
+from injector import Module, provider, singleton
+from django.conf import settings
+
+from cqrsex.Application.Interfaces.Common.IPasswordHasher import IPasswordHasher
+from cqrsex.Infrstraction.Security.PasswordHashPool import PasswordHashPool
+
+
+class PasswordHasherModule(Module):
+    @singleton
+    @provider
+    def provide_password_hasher(self) -> IPasswordHasher:
+        cfg = getattr(settings, "CQRS_PASSWORD_HASHING", {}) or {}
+        pool = PasswordHashPool(
+            cfg.get("WORKERS"),
+            min_batch=cfg.get("MIN_BATCH", 8),
+            start_method=cfg.get("START_METHOD", "spawn"),
+        )
+        atexit.register(pool.shutdown)
+        return pool
@@ -0,0 +1,29 @@
+# cqrsex/Infrstraction/DI/ProjectionModule.py
+from injector import Module, provider, singleton
+from django.conf import settings
+
+from cqrsex.Application.Interfaces.Common.IQueryCache import IQueryCache
+from cqrsex.Application.Interfaces.Repositories.IUserReadRepository import IUserReadRepository
+from cqrsex.Infrstraction.Projections.AuthorPostCountProjection import AuthorPostCountProjection
+from cqrsex.Infrstraction.Projections.BlogPostListProjection import BlogPostListProjection
+from cqrsex.Infrstraction.Projections.BlogPostSearchProjection import BlogPostSearchProjection
+from cqrsex.Infrstraction.Projections.ProjectionEngine import ProjectionEngine
+
+
+def projection_config() -> dict:
+    return dict(getattr(settings, "CQRS_PROJECTIONS", {}) or {})
+
+
+class ProjectionModule(Module):
+    @singleton
+    @provider
+    def provide_projection_engine(self, users: IUserReadRepository, cache: IQueryCache) -> ProjectionEngine:
+        cfg = projection_config()
+        db = cfg.get("DB_ALIAS", "default")
+        return ProjectionEngine(
+            [BlogPostListProjection(users, db), AuthorPostCountProjection(users, db), BlogPostSearchProjection(db)],
+            db_alias=db,
+            batch_size=cfg.get("BATCH_SIZE", 500),
+            settle_seconds=cfg.get("SETTLE_SECONDS", 1.0),
+            cache=cache,
+        )
@@ -0,0 +1,31 @@
+# cqrsex/Infrstraction/DI/QueryCacheModule.py
+from injector import Module, provider, singleton
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+
+from cqrsex.Application.Interfaces.Common.IQueryCache import IQueryCache
+
+
+class QueryCacheModule(Module):
+    @singleton
+    @provider
+    def provide_query_cache(self) -> IQueryCache:
+        cfg = getattr(settings, "CQRS_QUERY_CACHE", {}) or {}
+        backend = (cfg.get("BACKEND") or "django").lower()
+        alias = cfg.get("ALIAS", "default")
+        ttl = cfg.get("TTL", 60)
+        # invalidations only reach readers of the same cache: another worker or the
+        # projection runner would keep serving stale entries until their TTL
+        per_process = backend != "django" or isinstance(caches[alias], LocMemCache)
+        if per_process and not cfg.get("SINGLE_PROCESS", False):
+            raise ImproperlyConfigured(
+                "CQRS_QUERY_CACHE: %s is per process; use BACKEND 'django' on a shared CACHES alias "
+                "or set SINGLE_PROCESS: True" % ("'lru'" if backend != "django" else f"CACHES[{alias!r}]")
+            )
+        if backend == "django":
+            from cqrsex.Infrstraction.Cache.DjangoQueryCache import DjangoQueryCache
+            return DjangoQueryCache(alias, prefix=cfg.get("PREFIX", "qc"), default_ttl=ttl)
+        from cqrsex.Infrstraction.Cache.LruQueryCache import LruQueryCache
+        return LruQueryCache(max_entries=cfg.get("MAX_ENTRIES", 10_000), default_ttl=ttl)
@@ -1,11 +1,22 @@
 from injector import Module, provider, singleton
+from django.conf import settings
 
 from cqrsex.Application.Interfaces.Repositories.IBlogPostReadRepository import IBlogPostReadRepository
 from cqrsex.Application.Interfaces.Repositories.IBlogPostWriteRepository import IBlogPostWriteRepository
+from cqrsex.Application.Interfaces.Repositories.IUserReadRepository import IUserReadRepository
+from cqrsex.Application.Interfaces.Repositories.IUserWriteRepository import IUserWriteRepository
+from cqrsex.Application.Interfaces.Repositories.IOutboxRepository import IOutboxRepository
+from cqrsex.Application.Interfaces.Repositories.IBlogPostSearchRepository import IBlogPostSearchRepository
+from cqrsex.Application.Interfaces.Repositories.ISagaRetryRepository import ISagaRetryRepository
 from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
 
 from cqrsex.Infrstraction.Repositories.BlogPostReadRepository import BlogPostReadRepository
 from cqrsex.Infrstraction.Repositories.BlogPostWriteRepository import BlogPostWriteRepository
+from cqrsex.Infrstraction.Repositories.UserReadRepository import UserReadRepository
+from cqrsex.Infrstraction.Repositories.UserWriteRepository import UserWriteRepository
+from cqrsex.Infrstraction.Repositories.OutboxRepository import OutboxRepository
+from cqrsex.Infrstraction.Repositories.BlogPostSearchRepository import BlogPostSearchRepository
+from cqrsex.Infrstraction.Repositories.SagaRetryRepository import SagaRetryRepository
 from cqrsex.Infrstraction.Repositories.RepositoryManager import RepositoryManager
 
 class RepositoryModule(Module):
@@ -13,6 +24,10 @@ class RepositoryModule(Module):
     @singleton
     @provider
     def provide_blog_post_read_repository(self) -> IBlogPostReadRepository:
+        # "projection": serve reads from rm_blog_posts (python manage.py projections)
+        if (getattr(settings, "CQRS_READ_MODEL", {}) or {}).get("BLOG_POSTS") == "projection":
+            from cqrsex.Infrstraction.Repositories.BlogPostViewRepository import BlogPostViewRepository
+            return BlogPostViewRepository()
         return BlogPostReadRepository()
 
     @singleton
@@ -20,12 +35,40 @@ class RepositoryModule(Module):
     def provide_blog_post_write_repository(self) -> IBlogPostWriteRepository:
         return BlogPostWriteRepository()
 
+    @singleton
+    @provider
+    def provide_user_read_repository(self) -> IUserReadRepository:
+        return UserReadRepository()
+
+    @singleton
+    @provider
+    def provide_user_write_repository(self) -> IUserWriteRepository:
+        return UserWriteRepository()
+
+    @singleton
+    @provider
+    def provide_outbox_repository(self) -> IOutboxRepository:
+        return OutboxRepository()
+
+    @singleton
+    @provider
+    def provide_saga_retry_repository(self) -> ISagaRetryRepository:
+        return SagaRetryRepository()
+
+    @singleton
+    @provider
+    def provide_blog_post_search_repository(self) -> IBlogPostSearchRepository:
+        # same database the projections write to
+        return BlogPostSearchRepository((getattr(settings, "CQRS_PROJECTIONS", {}) or {}).get("DB_ALIAS", "default"))
+
     @singleton
     @provider
     def provide_repository_manager(
         self,
         read_repo: IBlogPostReadRepository,
         write_repo: IBlogPostWriteRepository,
+        user_read_repo: IUserReadRepository,
+        user_write_repo: IUserWriteRepository,
     ) -> IRepositoryManager:
         # NOTE: pass by POSITION, not keyword, to avoid param-name mismatches
-        return RepositoryManager(read_repo, write_repo)
+        return RepositoryManager(read_repo, write_repo, user_read_repo, user_write_repo)
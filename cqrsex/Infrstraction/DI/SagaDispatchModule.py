@@ -1,12 +1,32 @@
-# cqrsex/Application/DI/SagaDispatchModule.py
+# cqrsex/Infrstraction/DI/SagaDispatchModule.py
+import atexit
 from injector import Module, provider, singleton
+from django.conf import settings
 from cqrsex.Application.Interfaces.Common.ISaga import ISaga
 from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
+from cqrsex.Infrstraction.DI.SagaRetryModule import retry_config
+from cqrsex.Infrstraction.Saga.SagaRetryQueue import SagaRetryQueue
 
 class SagaDispatchModule(Module):
     @singleton
     @provider
-    def provide_saga_dispatcher(self, saga: ISaga) -> ISagaDispatcher:
+    def provide_saga_dispatcher(self, saga: ISaga, retry: SagaRetryQueue) -> ISagaDispatcher:
         # lazy import to avoid import cycles at startup
         from cqrsex.Infrstraction.Saga.SagaDispatcher import SagaDispatcher
-        return SagaDispatcher(saga)
+        cfg = getattr(settings, "CQRS_SAGA_DISPATCH", {}) or {}
+        retry = retry if retry_config()["ENABLED"] else None
+        if (cfg.get("MODE") or "inline").lower() != "pool":
+            return SagaDispatcher(saga, retry=retry)
+
+        from cqrsex.Infrstraction.Saga.SagaWorkerPool import SagaWorkerPool
+        pool = SagaWorkerPool(
+            saga,
+            workers=cfg.get("WORKERS", 4),
+            queue_size=cfg.get("QUEUE_SIZE", 1_000),
+            overflow=cfg.get("OVERFLOW", "block"),
+            put_timeout=cfg.get("PUT_TIMEOUT"),
+            retry=retry,
+        )
+        # graceful drain when the process exits
+        atexit.register(pool.shutdown, drain=True, timeout=cfg.get("DRAIN_TIMEOUT", 10.0))
+        return SagaDispatcher(saga, pool, retry)
@@ -0,0 +1,43 @@
+# cqrsex/Infrstraction/DI/SagaRetryModule.py
+from injector import Module, provider, singleton
+from django.conf import settings
+
+from cqrsex.Application.Interfaces.Common.ISaga import ISaga
+from cqrsex.Application.Interfaces.Repositories.ISagaRetryRepository import ISagaRetryRepository
+from cqrsex.Infrstraction.Saga.SagaRetrier import SagaRetrier
+from cqrsex.Infrstraction.Saga.SagaRetryQueue import SagaRetryQueue
+
+
+def retry_config() -> dict:
+    cfg = dict(getattr(settings, "CQRS_SAGA_RETRY", {}) or {})
+    cfg.setdefault("ENABLED", True)
+    return cfg
+
+
+def build_retrier(queue: SagaRetryQueue, saga: ISaga, cfg: dict) -> SagaRetrier:
+    return SagaRetrier(
+        queue,
+        saga,
+        batch_size=cfg.get("BATCH_SIZE", 100),
+        idle_backoff=tuple(cfg.get("IDLE_BACKOFF", (0.5, 10.0))),
+    )
+
+
+class SagaRetryModule(Module):
+    @singleton
+    @provider
+    def provide_saga_retry_queue(self, repo: ISagaRetryRepository) -> SagaRetryQueue:
+        cfg = retry_config()
+        return SagaRetryQueue(
+            repo,
+            db_alias=cfg.get("DB_ALIAS", "default"),
+            max_attempts=cfg.get("MAX_ATTEMPTS", 8),
+            base_delay=cfg.get("BASE_DELAY", 1.0),
+            max_delay=cfg.get("MAX_DELAY", 600.0),
+            spool_path=cfg.get("SPOOL_PATH"),
+        )
+
+    @singleton
+    @provider
+    def provide_saga_retrier(self, queue: SagaRetryQueue, saga: ISaga) -> SagaRetrier:
+        return build_retrier(queue, saga, retry_config())
@@ -0,0 +1,47 @@
+# cqrsex/Infrstraction/Idempotency/BaseIdempotencyStore.py
+from __future__ import annotations
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+from asgiref.sync import sync_to_async
+
+from cqrsex.Application.Interfaces.Common.IIdempotencyStore import IIdempotencyStore, StoredResult
+
+
+class BaseIdempotencyStore(IIdempotencyStore):
+    """Shared counters + async variants (the sync calls on Django's sync thread)."""
+
+    def __init__(self, default_ttl: Optional[float] = 86_400.0) -> None:
+        self._ttl = default_ttl
+        self._stats_lock = threading.Lock()
+        self._counters: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "claims": 0, "contended": 0}
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        # fixed width whatever the client sent
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _ttl_or_default(self, ttl: Optional[float]) -> Optional[float]:
+        return self._ttl if ttl is None else ttl
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._counters)
+
+    async def aget(self, key: str) -> Optional[StoredResult]:
+        return await sync_to_async(self.get, thread_sensitive=True)(key)
+
+    async def aset(self, key: str, value: Any, *, fingerprint: Optional[str] = None,
+                   ttl: Optional[float] = None) -> None:
+        await sync_to_async(self.set, thread_sensitive=True)(key, value, fingerprint=fingerprint, ttl=ttl)
+
+    async def aclaim(self, key: str, *, ttl: float) -> bool:
+        return await sync_to_async(self.claim, thread_sensitive=True)(key, ttl=ttl)
+
+    async def arelease(self, key: str) -> None:
+        await sync_to_async(self.release, thread_sensitive=True)(key)
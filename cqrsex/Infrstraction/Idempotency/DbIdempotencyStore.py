@@ -0,0 +1,79 @@
+# cqrsex/Infrstraction/Idempotency/DbIdempotencyStore.py
+from __future__ import annotations
+import pickle
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Optional
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from cqrsex.Domain.models.IdempotencyRecord import IdempotencyRecord
+from cqrsex.Application.Interfaces.Common.IIdempotencyStore import StoredResult
+from cqrsex.Infrstraction.Idempotency.BaseIdempotencyStore import BaseIdempotencyStore
+
+# results stored with ttl=None
+_NEVER = datetime(9999, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class DbIdempotencyStore(BaseIdempotencyStore):
+    """
+    idempotency_keys table: primary key = sha256 of the key, pickled result, expires_at
+    (indexed for purge_expired). A claim is a row without a result: the primary key
+    makes the INSERT race-free across processes, and a claim past its expiry is taken
+    over by a conditional UPDATE. Durable, shared, never evicted early.
+    """
+
+    def __init__(self, db_alias: str = "default", *, default_ttl: Optional[float] = 86_400.0,
+                 purge_batch_size: int = 5_000) -> None:
+        super().__init__(default_ttl)
+        self.db_alias = db_alias
+        self.purge_batch_size = max(int(purge_batch_size), 1)
+
+    def _rows(self):
+        return IdempotencyRecord.objects.using(self.db_alias)
+
+    def get(self, key: str) -> Optional[StoredResult]:
+        row = (self._rows()
+               .filter(key=self._digest(key), result__isnull=False, expires_at__gt=timezone.now())
+               .values_list("result", "fingerprint").first())
+        self._count("hits" if row is not None else "misses")
+        return StoredResult(pickle.loads(bytes(row[0])), row[1] or None) if row is not None else None
+
+    def set(self, key: str, value: Any, *, fingerprint: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        ttl = self._ttl_or_default(ttl)
+        expires_at = timezone.now() + timedelta(seconds=ttl) if ttl else _NEVER
+        self._rows().update_or_create(
+            key=self._digest(key),
+            defaults={"result": pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                      "fingerprint": fingerprint or "", "expires_at": expires_at},
+        )
+        self._count("stores")
+
+    def claim(self, key: str, *, ttl: float) -> bool:
+        digest, now = self._digest(key), timezone.now()
+        until = now + timedelta(seconds=ttl)
+        try:
+            # savepoint: a duplicate key must not break a caller's transaction
+            with transaction.atomic(using=self.db_alias):
+                self._rows().create(key=digest, result=None, expires_at=until)
+            ok = True
+        except IntegrityError:
+            # an abandoned claim or an expired result can be taken over; a live one cannot
+            ok = bool(self._rows().filter(key=digest, expires_at__lte=now).update(result=None, expires_at=until))
+        self._count("claims" if ok else "contended")
+        return ok
+
+    def release(self, key: str) -> None:
+        self._rows().filter(key=self._digest(key), result__isnull=True).delete()
+
+    def purge_expired(self) -> int:
+        """Delete expired rows in batches of purge_batch_size (short transactions, index scan)."""
+        total, now = 0, timezone.now()
+        while True:
+            keys = list(self._rows().filter(expires_at__lte=now).order_by("expires_at")
+                        .values_list("key", flat=True)[: self.purge_batch_size])
+            if not keys:
+                return total
+            total += self._rows().filter(key__in=keys, expires_at__lte=now).delete()[0]
+            if len(keys) < self.purge_batch_size:
+                return total
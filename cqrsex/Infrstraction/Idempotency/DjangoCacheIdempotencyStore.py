@@ -0,0 +1,58 @@
+# cqrsex/Infrstraction/Idempotency/DjangoCacheIdempotencyStore.py
+from __future__ import annotations
+from typing import Any, Optional
+
+from django.core.cache import caches
+
+from cqrsex.Application.Interfaces.Common.IIdempotencyStore import StoredResult
+from cqrsex.Infrstraction.Idempotency.BaseIdempotencyStore import BaseIdempotencyStore
+
+
+class DjangoCacheIdempotencyStore(BaseIdempotencyStore):
+    """
+    Backed by a Django cache alias (Redis/Memcached/...), shared by every worker.
+    Claims are `<prefix>:c:<key>` entries taken with add() (atomic on shared backends)
+    and expiring on their own; results are `<prefix>:r:<key>`. Expiry is the backend's
+    business, so purge_expired() has nothing to do. An evicting cache can forget a
+    result early: use "db" where a replayed write must never run twice.
+    """
+
+    def __init__(self, alias: str = "default", *, prefix: str = "idem", default_ttl: Optional[float] = 86_400.0) -> None:
+        super().__init__(default_ttl)
+        self._cache = caches[alias]
+        self._prefix = prefix
+
+    def _result_key(self, key: str) -> str:
+        return f"{self._prefix}:r:{self._digest(key)}"
+
+    def _claim_key(self, key: str) -> str:
+        return f"{self._prefix}:c:{self._digest(key)}"
+
+    def get(self, key: str) -> Optional[StoredResult]:
+        entry = self._cache.get(self._result_key(key))
+        self._count("hits" if entry is not None else "misses")
+        return StoredResult(*entry) if entry is not None else None
+
+    def set(self, key: str, value: Any, *, fingerprint: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        self._cache.set(self._result_key(key), (value, fingerprint), timeout=self._ttl_or_default(ttl) or None)
+        self._cache.delete(self._claim_key(key))
+        self._count("stores")
+
+    def claim(self, key: str, *, ttl: float) -> bool:
+        claim_key = self._claim_key(key)
+        if not self._cache.add(claim_key, 1, timeout=ttl):
+            self._count("contended")
+            return False
+        if self._cache.get(self._result_key(key)) is not None:
+            # finished before we got here: give the claim back, the caller reads the result
+            self._cache.delete(claim_key)
+            self._count("contended")
+            return False
+        self._count("claims")
+        return True
+
+    def release(self, key: str) -> None:
+        self._cache.delete(self._claim_key(key))
+
+    def purge_expired(self) -> int:
+        return 0
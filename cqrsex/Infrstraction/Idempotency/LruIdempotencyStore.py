@@ -0,0 +1,97 @@
+# cqrsex/Infrstraction/Idempotency/LruIdempotencyStore.py
+from __future__ import annotations
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from cqrsex.Application.Interfaces.Common.IIdempotencyStore import StoredResult
+from cqrsex.Infrstraction.Idempotency.BaseIdempotencyStore import BaseIdempotencyStore
+
+
+class LruIdempotencyStore(BaseIdempotencyStore):
+    """
+    In-process LRU with TTL. Per worker: a duplicate that lands on another process is
+    not seen, so use "db" or "django" behind more than one worker.
+    """
+
+    def __init__(self, max_entries: int = 10_000, default_ttl: Optional[float] = 86_400.0) -> None:
+        super().__init__(default_ttl)
+        self._max = max(int(max_entries), 1)
+        # key -> (result, expires_at | None)
+        self._data: "OrderedDict[str, Tuple[StoredResult, Optional[float]]]" = OrderedDict()
+        # key -> claim expiry
+        self._claims: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str, now: float) -> Optional[Tuple[StoredResult, Optional[float]]]:
+        entry = self._data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= now:
+            del self._data[key]
+            return None
+        return entry
+
+    def get(self, key: str) -> Optional[StoredResult]:
+        with self._lock:
+            entry = self._live(key, time.monotonic())
+            if entry is not None:
+                self._data.move_to_end(key)
+        self._count("hits" if entry is not None else "misses")
+        return entry[0] if entry is not None else None
+
+    def set(self, key: str, value: Any, *, fingerprint: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        ttl = self._ttl_or_default(ttl)
+        with self._lock:
+            self._data[key] = (StoredResult(value, fingerprint), time.monotonic() + ttl if ttl else None)
+            self._data.move_to_end(key)
+            self._claims.pop(key, None)
+            while len(self._data) > self._max:
+                self._data.popitem(last=False)
+        self._count("stores")
+
+    def claim(self, key: str, *, ttl: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            held = self._claims.get(key)
+            if self._live(key, now) is not None or (held is not None and held > now):
+                ok = False
+            else:
+                self._claims[key] = now + ttl
+                ok = True
+        self._count("claims" if ok else "contended")
+        return ok
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._claims.pop(key, None)
+
+    def purge_expired(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            dead = [k for k, (_, exp) in self._data.items() if exp is not None and exp <= now]
+            for k in dead:
+                del self._data[k]
+            stale = [k for k, exp in self._claims.items() if exp <= now]
+            for k in stale:
+                del self._claims[k]
+        return len(dead) + len(stale)
+
+    # no I/O: the async variants need no thread hop
+    async def aget(self, key: str) -> Optional[StoredResult]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, *, fingerprint: Optional[str] = None,
+                   ttl: Optional[float] = None) -> None:
+        self.set(key, value, fingerprint=fingerprint, ttl=ttl)
+
+    async def aclaim(self, key: str, *, ttl: float) -> bool:
+        return self.claim(key, ttl=ttl)
+
+    async def arelease(self, key: str) -> None:
+        self.release(key)
+
+    def stats(self) -> Dict[str, int]:
+        out = super().stats()
+        out["size"] = len(self._data)
+        out["in_flight"] = len(self._claims)
+        return out
@@ -0,0 +1,172 @@
+# cqrsex/Infrstraction/Idempotency/test_idempotency.py
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+from django.db import connections, transaction
+
+from cqrsex.Application.Common.MessageResult import StatusCode
+from cqrsex.Application.Mediator.behaviors import IdempotencyBehavior
+from cqrsex.Application.Mediator.contracts import CommandMeta, ICommand
+from cqrsex.Application.Wrapper.ConcreteResultT import ConcreteResultT
+from cqrsex.Domain.models.IdempotencyRecord import IdempotencyRecord
+from cqrsex.Infrstraction.Idempotency.DbIdempotencyStore import DbIdempotencyStore
+from cqrsex.Infrstraction.Idempotency.DjangoCacheIdempotencyStore import DjangoCacheIdempotencyStore
+from cqrsex.Infrstraction.Idempotency.LruIdempotencyStore import LruIdempotencyStore
+
+STORES = {
+    "lru": LruIdempotencyStore,
+    "db": DbIdempotencyStore,
+    "django": DjangoCacheIdempotencyStore,
+}
+
+
+@dataclass(frozen=True)
+class Ping(ICommand[ConcreteResultT]):
+    body: str = ""
+    meta: Optional[CommandMeta] = None
+
+
+def ping(key: str, body: str = "x") -> Ping:
+    return Ping(body=body, meta=CommandMeta(key))
+
+
+class Handler:
+    """Counts executions; each returns a distinct result."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay, self.fail, self.runs = delay, fail, 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> ConcreteResultT:
+        time.sleep(self.delay)
+        with self._lock:
+            self.runs += 1
+            n = self.runs
+        if self.fail:
+            return ConcreteResultT.fail("nope", StatusCode.BAD_REQUEST)
+        return ConcreteResultT.success({"run": n})
+
+    async def acall(self) -> ConcreteResultT:
+        await asyncio.sleep(self.delay)
+        return self()
+
+
+@pytest.fixture(params=sorted(STORES))
+def store(request):
+    return STORES[request.param]()
+
+
+def _in_threads(n: int, fn) -> list:
+    out: list = []
+
+    def run():
+        try:
+            out.append(fn())
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=run) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return out
+
+
+def test_concurrent_duplicates_run_the_handler_once(store):
+    behavior, handler = IdempotencyBehavior(store), Handler(delay=0.2)
+    results = _in_threads(6, lambda: behavior.handle(ping("k"), handler))
+    assert handler.runs == 1
+    assert [r.data for r in results] == [{"run": 1}] * 6
+
+
+def test_duplicate_through_another_behavior_waits_on_the_claim(store):
+    # two behaviors over one store = two worker processes
+    first, second, handler = IdempotencyBehavior(store), IdempotencyBehavior(store), Handler(delay=0.3)
+    leader = threading.Thread(target=lambda: (first.handle(ping("k"), handler), connections.close_all()))
+    leader.start()
+    time.sleep(0.05)
+    res = second.handle(ping("k"), handler)
+    leader.join()
+    assert handler.runs == 1
+    assert res.data == {"run": 1}
+
+
+def test_same_key_different_body_is_refused(store):
+    behavior, handler = IdempotencyBehavior(store), Handler()
+    assert behavior.handle(ping("k", "a"), handler).data == {"run": 1}
+    assert behavior.handle(ping("k", "a"), handler).data == {"run": 1}
+    res = behavior.handle(ping("k", "b"), handler)
+    assert res.status.code == StatusCode.CONFLICT
+    assert handler.runs == 1
+
+
+def test_failed_result_is_not_stored_and_releases_the_claim(store):
+    behavior, failing = IdempotencyBehavior(store, wait_timeout=0.5), Handler(fail=True)
+    behavior.handle(ping("k"), failing)
+    behavior.handle(ping("k"), failing)
+    assert failing.runs == 2
+    assert behavior.handle(ping("k"), Handler()).data == {"run": 1}
+
+
+def test_exception_releases_the_claim(store):
+    behavior = IdempotencyBehavior(store, wait_timeout=0.5)
+
+    def boom():
+        raise RuntimeError("handler crashed")
+
+    with pytest.raises(RuntimeError):
+        behavior.handle(ping("k"), boom)
+    assert behavior.handle(ping("k"), Handler()).data == {"run": 1}
+
+
+def test_live_claim_elsewhere_ends_in_409(store):
+    assert store.claim("Ping:k", ttl=60)
+    handler = Handler()
+    res = IdempotencyBehavior(store, wait_timeout=0.2).handle(ping("k"), handler)
+    assert res.status.code == StatusCode.CONFLICT
+    assert handler.runs == 0
+
+
+def test_abandoned_claim_is_taken_over_after_the_lease(store):
+    assert store.claim("Ping:k", ttl=0.1)
+    assert not store.claim("Ping:k", ttl=0.1)
+    time.sleep(0.2)
+    handler = Handler()
+    assert IdempotencyBehavior(store, wait_timeout=1.0).handle(ping("k"), handler).data == {"run": 1}
+    assert handler.runs == 1
+
+
+def test_async_duplicates_run_the_handler_once(store):
+    behavior, handler = IdempotencyBehavior(store), Handler(delay=0.2)
+
+    async def main():
+        return await asyncio.gather(*(behavior.ahandle(ping("k"), handler.acall) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert handler.runs == 1
+    assert {r.data["run"] for r in results} == {1}
+
+
+def test_db_claim_inside_a_callers_transaction():
+    store = DbIdempotencyStore()
+    with transaction.atomic():
+        assert store.claim("Ping:k", ttl=60)
+        # the duplicate's IntegrityError stays in its savepoint: the outer transaction goes on
+        assert not store.claim("Ping:k", ttl=60)
+        store.set("Ping:k", {"ok": True}, fingerprint="f")
+        assert IdempotencyRecord.objects.count() == 1
+    assert store.get("Ping:k") == ({"ok": True}, "f")
+
+
+def test_db_claim_rolls_back_with_the_callers_transaction():
+    store = DbIdempotencyStore()
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            assert store.claim("Ping:k", ttl=60)
+            raise RuntimeError
+    assert store.claim("Ping:k", ttl=60)
@@ -0,0 +1,105 @@
+# cqrsex/Infrstraction/Loaders/AuthorLoader.py
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from cqrsex.Application.Interfaces.Common.IAuthorLoader import IAuthorLoader
+from cqrsex.Application.Interfaces.Common.IQueryCache import IQueryCache
+from cqrsex.Application.Interfaces.Repositories.IUserReadRepository import IUserReadRepository
+
+# per-request memo (found and missing ids); only present inside request_scope()
+_memo: ContextVar[Optional[Dict[int, Optional[dict]]]] = ContextVar("author_loader_memo", default=None)
+
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    """Share author lookups for the duration of one request (see WebAPI.middleware)."""
+    token = _memo.set({})
+    try:
+        yield
+    finally:
+        _memo.reset(token)
+
+
+def _tag(author_id: int) -> str:
+    # the tag UpdateUser/DeleteUser already invalidate
+    return f"user:{author_id}"
+
+
+class AuthorLoader(IAuthorLoader):
+    """
+    Lookup order per id: request memo -> shared query cache (optional, across requests,
+    dropped by the user:{id} tag) -> one batched auth_db query for whatever is left.
+    """
+
+    def __init__(self, users: IUserReadRepository, cache: Optional[IQueryCache] = None, *, ttl: Optional[float] = 300.0) -> None:
+        self._users = users
+        self._cache = cache
+        self._ttl = ttl
+
+    @staticmethod
+    def _ids(ids: Iterable[Optional[int]]) -> Set[int]:
+        return {int(i) for i in ids if i is not None}
+
+    @staticmethod
+    def _from_memo(ids: Set[int]) -> Tuple[Dict[int, Optional[dict]], List[int]]:
+        memo = _memo.get()
+        found: Dict[int, Optional[dict]] = {}
+        missing: List[int] = []
+        for i in ids:
+            if memo is not None and i in memo:
+                found[i] = memo[i]
+            else:
+                missing.append(i)
+        return found, missing
+
+    @staticmethod
+    def _hits(found: Dict[int, Optional[dict]], ids: List[int], hits: List[Optional[dict]]) -> List[int]:
+        missing: List[int] = []
+        for i, hit in zip(ids, hits):
+            if hit is not None:
+                found[i] = hit
+            else:
+                missing.append(i)
+        return missing
+
+    @staticmethod
+    def _remember(found: Dict[int, Optional[dict]], fetched: Dict[int, dict], missing: List[int]) -> None:
+        memo = _memo.get()
+        for i in missing:
+            found[i] = fetched.get(i)
+        if memo is not None:
+            memo.update((i, v) for i, v in found.items() if i not in memo)
+
+    @staticmethod
+    def _entries(fetched: Dict[int, dict], versions: Dict[str, int]) -> List[Tuple[int, dict, Dict[str, int]]]:
+        return [(i, s, {_tag(i): versions.get(_tag(i), 0)}) for i, s in fetched.items() if s is not None]
+
+    # snapshot tag versions BEFORE querying so an update racing the read leaves the entry stale
+    def load_many(self, ids: Iterable[int]) -> Dict[int, Optional[dict]]:
+        found, missing = self._from_memo(self._ids(ids))
+        if missing and self._cache is not None:
+            missing = self._hits(found, missing, [self._cache.get(("author", i)) for i in missing])
+        if missing:
+            versions = self._cache.tag_versions(_tag(i) for i in missing) if self._cache is not None else {}
+            fetched = self._users.get_summaries(missing)
+            if self._cache is not None:
+                for i, summary, tags in self._entries(fetched, versions):
+                    self._cache.set(("author", i), summary, tags=tags, ttl=self._ttl)
+            self._remember(found, fetched, missing)
+        return found
+
+    async def aload_many(self, ids: Iterable[int]) -> Dict[int, Optional[dict]]:
+        # same steps through the cache's async accessors: no cache I/O on the event loop
+        found, missing = self._from_memo(self._ids(ids))
+        if missing and self._cache is not None:
+            missing = self._hits(found, missing, [await self._cache.aget(("author", i)) for i in missing])
+        if missing:
+            versions = await self._cache.atag_versions(_tag(i) for i in missing) if self._cache is not None else {}
+            fetched = await self._users.aget_summaries(missing)
+            if self._cache is not None:
+                for i, summary, tags in self._entries(fetched, versions):
+                    await self._cache.aset(("author", i), summary, tags=tags, ttl=self._ttl)
+            self._remember(found, fetched, missing)
+        return found
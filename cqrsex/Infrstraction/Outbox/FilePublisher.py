@@ -0,0 +1,43 @@
+# cqrsex/Infrstraction/Outbox/FilePublisher.py
+from __future__ import annotations
+import json
+import os
+import threading
+from typing import Sequence
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from cqrsex.Application.Interfaces.Common.IOutboxPublisher import IOutboxPublisher
+from cqrsex.Application.Mapping.OutboxMapper import to_message
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+
+class FilePublisher(IOutboxPublisher):
+    """Appends one JSON line per event; fsync per batch so 'processed' never outruns the file."""
+
+    def __init__(self, path: str, *, fsync: bool = True) -> None:
+        self.path = path
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._fh = None
+
+    def _file(self):
+        if self._fh is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+        return self._fh
+
+    def publish(self, events: Sequence[OutboxEvent]) -> None:
+        data = "".join(json.dumps(to_message(e), cls=DjangoJSONEncoder) + "\n" for e in events)
+        with self._lock:
+            fh = self._file()
+            fh.write(data)
+            fh.flush()
+            if self._fsync:
+                os.fsync(fh.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
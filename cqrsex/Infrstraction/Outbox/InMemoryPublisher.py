@@ -0,0 +1,25 @@
+# cqrsex/Infrstraction/Outbox/InMemoryPublisher.py
+from __future__ import annotations
+import threading
+from typing import Any, Dict, List, Sequence
+
+from cqrsex.Application.Interfaces.Common.IOutboxPublisher import IOutboxPublisher
+from cqrsex.Application.Mapping.OutboxMapper import to_message
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+
+class InMemoryPublisher(IOutboxPublisher):
+    """Broker stand-in for tests/dev: keeps every published message in a list."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.messages: List[Dict[str, Any]] = []
+
+    def publish(self, events: Sequence[OutboxEvent]) -> None:
+        batch = [to_message(e) for e in events]
+        with self._lock:
+            self.messages.extend(batch)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.messages.clear()
@@ -0,0 +1,17 @@
+# cqrsex/Infrstraction/Outbox/LoggingPublisher.py
+from __future__ import annotations
+import logging
+from typing import Sequence
+
+from cqrsex.Application.Interfaces.Common.IOutboxPublisher import IOutboxPublisher
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+log = logging.getLogger(__name__)
+
+
+class LoggingPublisher(IOutboxPublisher):
+    """Default publisher until a broker is configured: logs each event."""
+
+    def publish(self, events: Sequence[OutboxEvent]) -> None:
+        for e in events:
+            log.info("[Outbox] %s.%s id=%s tenant=%s", e.aggregate_type, e.event_type, e.id, e.tenant_id)
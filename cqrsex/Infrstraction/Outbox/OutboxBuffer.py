@@ -0,0 +1,83 @@
+# cqrsex/Infrstraction/Outbox/OutboxBuffer.py
+from __future__ import annotations
+from contextvars import ContextVar, Token
+from itertools import groupby
+from typing import Any, Callable, List, Optional, Tuple
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+_current: ContextVar[Optional["OutboxBuffer"]] = ContextVar("cqrs_outbox_buffer", default=None)
+
+
+class OutboxBuffer:
+    """
+    Outbox rows appended while a unit of work is open on `using`.
+    The UoW writes them with ONE bulk_create right before its transaction commits,
+    so they share the aggregate write's transaction at the cost of a single INSERT.
+    Post-commit work deferred into it (`defer`) is handed to its sink as one list by a
+    single on_commit hook, so N events of a transaction cost one saga call, not N.
+    Lives in a ContextVar: per thread / per asyncio task, inherited by sync_to_async.
+    """
+
+    def __init__(self, using: str = DEFAULT_DB_ALIAS, *, batch_size: int = 500) -> None:
+        self.using = using
+        self._batch_size = batch_size
+        self._rows: List[OutboxEvent] = []
+        self._deferred: List[Tuple[Callable[[List[Any]], None], Any]] = []
+
+    # ---------- scope ----------
+    @staticmethod
+    def current(using: Optional[str] = None) -> Optional["OutboxBuffer"]:
+        buf = _current.get()
+        if buf is None or (using is not None and buf.using != using):
+            return None
+        return buf
+
+    def activate(self) -> Token:
+        return _current.set(self)
+
+    @staticmethod
+    def deactivate(token: Token) -> None:
+        _current.reset(token)
+
+    # ---------- rows ----------
+    def append(self, row: OutboxEvent) -> OutboxEvent:
+        self._rows.append(row)
+        return row
+
+    def defer(self, sink: Callable[[List[Any]], None], item: Any) -> None:
+        """Run sink([item, ...]) once after the transaction commits."""
+        self._deferred.append((sink, item))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def mark(self) -> Tuple[int, int]:
+        return len(self._rows), len(self._deferred)
+
+    def truncate(self, mark: Optional[Tuple[int, int]] = None) -> None:
+        """Drop what was added after `mark` (a nested UoW that rolled back its savepoint); None: all."""
+        rows, deferred = mark or (0, 0)
+        del self._rows[rows:]
+        del self._deferred[deferred:]
+
+    def discard(self) -> None:
+        self._rows.clear()
+        self._deferred.clear()
+
+    def flush(self) -> int:
+        rows, self._rows = self._rows, []
+        if rows:
+            OutboxEvent.objects.using(self.using).bulk_create(rows, batch_size=self._batch_size)
+        deferred, self._deferred = self._deferred, []
+        if deferred:
+            transaction.on_commit(lambda: _run_deferred(deferred), using=self.using)
+        return len(rows)
+
+
+def _run_deferred(deferred: List[Tuple[Callable[[List[Any]], None], Any]]) -> None:
+    # consecutive items of one sink stay together, so emit order is kept across sinks
+    for sink, group in groupby(deferred, key=lambda d: d[0]):
+        sink([item for _, item in group])
@@ -0,0 +1,162 @@
+# cqrsex/Infrstraction/Outbox/OutboxPartitions.py
+"""
+Optional monthly RANGE(created_at) partitioning of outbox_events on PostgreSQL.
+
+With partitions, retention becomes DETACH + DROP of whole months instead of row
+DELETEs, and the pending-row index stays per-partition small. Other backends keep
+the plain table (every function here is a no-op / False there).
+
+    convert(alias)              # once, in a maintenance window: copy into a partitioned table
+    ensure(alias, ahead=2)      # cron: create next months' partitions
+    expired(alias, cutoff)      # partitions wholly older than cutoff with nothing pending
+"""
+from __future__ import annotations
+import logging
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from django.db import connections, transaction
+
+log = logging.getLogger(__name__)
+
+TABLE = "outbox_events"
+
+
+def supported(alias: str) -> bool:
+    return connections[alias].vendor == "postgresql"
+
+
+def is_partitioned(alias: str) -> bool:
+    if not supported(alias):
+        return False
+    with connections[alias].cursor() as cur:
+        cur.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [TABLE])
+        return cur.fetchone() is not None
+
+
+def _month(d: date, add: int = 0) -> date:
+    y, m = divmod(d.month - 1 + add, 12)
+    return date(d.year + y, m + 1, 1)
+
+
+def _name(start: date) -> str:
+    return f"{TABLE}_p{start:%Y%m}"
+
+
+def partitions(alias: str) -> List[Tuple[str, Optional[datetime], Optional[datetime]]]:
+    """(name, lower, upper) for every range partition; the DEFAULT partition has no bounds."""
+    with connections[alias].cursor() as cur:
+        cur.execute(
+            """
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(%s) ORDER BY c.relname
+            """,
+            [TABLE],
+        )
+        rows = cur.fetchall()
+    out = []
+    for name, bound in rows:
+        # FOR VALUES FROM ('2025-01-01 00:00:00+00') TO ('2025-02-01 00:00:00+00')
+        if "FROM (" not in bound:
+            out.append((name, None, None))
+            continue
+        lo = bound.split("FROM ('", 1)[1].split("'", 1)[0]
+        hi = bound.split("TO ('", 1)[1].split("'", 1)[0]
+        out.append((name, datetime.fromisoformat(lo), datetime.fromisoformat(hi)))
+    return out
+
+
+def ensure(alias: str, *, ahead: int = 2, start: Optional[date] = None) -> List[str]:
+    """Create monthly partitions from `start` (default: this month) to `ahead` months out."""
+    if not is_partitioned(alias):
+        return []
+    first = _month(start or date.today())
+    last = _month(date.today(), ahead)
+    created, cur_month = [], first
+    with connections[alias].cursor() as cur:
+        while cur_month <= last:
+            name = _name(cur_month)
+            cur.execute("SELECT to_regclass(%s)", [name])
+            if cur.fetchone()[0] is None:
+                cur.execute(
+                    f'CREATE TABLE "{name}" PARTITION OF {TABLE} FOR VALUES FROM (%s) TO (%s)',
+                    [cur_month.isoformat(), _month(cur_month, 1).isoformat()],
+                )
+                created.append(name)
+            cur_month = _month(cur_month, 1)
+    if created:
+        log.info("[OutboxPartitions] created %s", ", ".join(created))
+    return created
+
+
+def convert(alias: str, *, ahead: int = 2, keep_legacy: bool = False) -> int:
+    """
+    Swap outbox_events for a partitioned copy (PostgreSQL). Takes an exclusive lock for
+    the copy: run with the relay stopped. Returns the number of rows copied.
+    """
+    if not supported(alias):
+        raise RuntimeError("outbox partitioning requires PostgreSQL")
+    if is_partitioned(alias):
+        return 0
+    legacy = f"{TABLE}_legacy"
+    with transaction.atomic(using=alias), connections[alias].cursor() as cur:
+        cur.execute(f"LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE")
+        cur.execute(f"SELECT min(created_at), coalesce(max(id), 0) FROM {TABLE}")
+        oldest, max_id = cur.fetchone()
+        cur.execute(f"ALTER TABLE {TABLE} RENAME TO {legacy}")
+        cur.execute("SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'", [legacy])
+        pk = cur.fetchone()
+        if pk:  # free the "<table>_pkey" name for the new table
+            cur.execute(f'ALTER TABLE {legacy} RENAME CONSTRAINT "{pk[0]}" TO {legacy}_pkey')
+        cur.execute("ALTER INDEX IF EXISTS outbox_pending_idx RENAME TO outbox_pending_idx_legacy")
+        cur.execute("ALTER INDEX IF EXISTS outbox_done_idx RENAME TO outbox_done_idx_legacy")
+        # the partition key must be part of the primary key
+        cur.execute(f"CREATE TABLE {TABLE} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+        cur.execute(f"ALTER TABLE {TABLE} ADD PRIMARY KEY (id, created_at)")
+        # own sequence (works whether the legacy id was serial or identity)
+        cur.execute(f"CREATE SEQUENCE {TABLE}_pid_seq OWNED BY {TABLE}.id")
+        cur.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_pid_seq')")
+        cur.execute(f"SELECT setval('{TABLE}_pid_seq', %s, true)", [max(max_id, 1)])
+        cur.execute(f"CREATE INDEX outbox_pending_idx ON {TABLE} (tenant_id, created_at, id) WHERE NOT processed")
+        cur.execute(f"CREATE INDEX outbox_done_idx ON {TABLE} (processed_at) WHERE processed")
+        # safety net for rows outside the created months; ensure() keeps it empty
+        cur.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+        ensure(alias, ahead=ahead, start=oldest.date() if oldest else None)
+        cur.execute(f"INSERT INTO {TABLE} SELECT * FROM {legacy}")
+        copied = cur.rowcount
+        if not keep_legacy:
+            cur.execute(f"DROP TABLE {legacy}")
+    log.info("[OutboxPartitions] converted %s (%s rows)", TABLE, copied)
+    return copied
+
+
+def expired(alias: str, cutoff: datetime, keep_after: Optional[int] = None) -> List[str]:
+    """
+    Partitions whose whole range is older than `cutoff` and hold no pending events
+    (nor, with `keep_after`, any event id above it).
+    """
+    if not is_partitioned(alias):
+        return []
+    out = []
+    with connections[alias].cursor() as cur:
+        for name, _lo, hi in partitions(alias):
+            if hi is None or hi > cutoff:
+                continue
+            if keep_after is None:
+                cur.execute(f'SELECT EXISTS (SELECT 1 FROM "{name}" WHERE NOT processed)')
+            else:
+                cur.execute(f'SELECT EXISTS (SELECT 1 FROM "{name}" WHERE NOT processed OR id > %s)', [keep_after])
+            if not cur.fetchone()[0]:
+                out.append(name)
+    return out
+
+
+def drop(alias: str, name: str) -> int:
+    """DETACH then DROP one partition; returns the rows it held."""
+    with connections[alias].cursor() as cur:
+        cur.execute(f'SELECT count(*) FROM "{name}"')
+        rows = cur.fetchone()[0]
+        cur.execute(f'ALTER TABLE {TABLE} DETACH PARTITION "{name}"')
+        cur.execute(f'DROP TABLE "{name}"')
+    return rows
@@ -0,0 +1,144 @@
+# cqrsex/Infrstraction/Outbox/OutboxRelay.py
+from __future__ import annotations
+import logging
+import random
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from django.db import transaction
+
+from cqrsex.Application.Interfaces.Common.IOutboxPublisher import IOutboxPublisher
+from cqrsex.Application.Interfaces.Repositories.IOutboxRepository import IOutboxRepository
+from cqrsex.Infrstraction.Outbox.RelayMetrics import RelayMetrics
+
+log = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Drains `outbox_events` to the configured publishers.
+
+    One poll = for each tenant with pending rows (up to max_tenants, equal share of
+    batch_size), a short transaction that claims rows FOR UPDATE SKIP LOCKED,
+    hands them to every publisher and marks them processed with one UPDATE. A
+    publisher error rolls that tenant's batch back so it is retried on a later poll
+    (at-least-once). Run several relays against the same table to scale out.
+
+    Tenants are served round-robin: each poll's window starts after a cursor that moves
+    past the tenants just served (by one when they all fit in the window of
+    min(max_tenants, batch_size)), so with more tenants than that each still gets a turn.
+
+        relay = OutboxRelay(OutboxRepository(), [InMemoryPublisher()], batch_size=200)
+        relay.run_until_empty()        # or relay.run() until stop()
+    """
+
+    def __init__(
+        self,
+        repo: IOutboxRepository,
+        publishers: Sequence[IOutboxPublisher],
+        *,
+        db_alias: str = "default",
+        batch_size: int = 100,
+        fair: bool = True,
+        max_tenants: int = 100,
+        idle_backoff: Tuple[float, float] = (0.05, 5.0),
+        metrics: Optional[RelayMetrics] = None,
+    ) -> None:
+        if not publishers:
+            raise ValueError("OutboxRelay needs at least one publisher")
+        self._repo = repo.using(db_alias)
+        self._publishers = list(publishers)
+        self.db_alias = db_alias
+        self.batch_size = max(int(batch_size), 1)
+        self.fair = fair
+        self.max_tenants = max_tenants
+        self.idle_min, self.idle_max = idle_backoff
+        self.metrics = metrics or RelayMetrics()
+        self._cursor: Optional[str] = None
+        self._stop = threading.Event()
+
+    # ---------- one poll ----------
+    def _tenants(self) -> List[Optional[str]]:
+        if not self.fair:
+            return [None]
+        # every tenant in the window gets at least one row of batch_size
+        window = min(self.max_tenants, self.batch_size)
+        # one extra tells whether tenants are left outside the window
+        tenants: List[Optional[str]] = list(self._repo.pending_tenants(window + 1, after=self._cursor))
+        if len(tenants) > window:
+            # more than fit: the next poll continues after the last one served
+            tenants = tenants[:window]
+            self._cursor = tenants[-1]
+        elif tenants:
+            # all fit: rotate so the same tenant does not always get the first slot
+            self._cursor = tenants[0]
+        return tenants
+
+    def _relay_batch(self, limit: int, tenant_id: Optional[str]) -> int:
+        events: list = []
+        started = time.perf_counter()
+        try:
+            with transaction.atomic(using=self.db_alias):
+                events = self._repo.claim_batch(limit, tenant_id=tenant_id)
+                if not events:
+                    return 0
+                for publisher in self._publishers:
+                    publisher.publish(events)
+                self._repo.mark_processed([e.id for e in events])
+        except Exception:
+            log.exception("[OutboxRelay] batch failed tenant=%s size=%s; will retry", tenant_id, len(events))
+            self.metrics.failure(len(events))
+            return 0
+        self.metrics.batch(events, time.perf_counter() - started)
+        return len(events)
+
+    def relay_once(self) -> int:
+        """One poll across tenants; returns the number of events delivered."""
+        tenants = self._tenants()
+        published = 0
+        if tenants:
+            quota = max(1, self.batch_size // len(tenants))
+            for tenant_id in tenants:
+                published += self._relay_batch(quota, tenant_id)
+        self.metrics.poll(published)
+        return published
+
+    # ---------- loops ----------
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run(self, *, max_polls: Optional[int] = None, metrics_every: Optional[float] = None) -> None:
+        """Poll until stop(); back off exponentially (with jitter) while idle."""
+        self._stop.clear()
+        idle, polls, last_report = 0, 0, time.monotonic()
+        try:
+            while not self._stop.is_set() and (max_polls is None or polls < max_polls):
+                polls += 1
+                if self.relay_once():
+                    idle = 0
+                else:
+                    delay = min(self.idle_max, self.idle_min * (2 ** idle))
+                    idle = min(idle + 1, 16)
+                    self._stop.wait(delay * random.uniform(0.5, 1.0))
+                if metrics_every and time.monotonic() - last_report >= metrics_every:
+                    log.info("[OutboxRelay] %s", self.metrics.snapshot())
+                    last_report = time.monotonic()
+        finally:
+            self.close()
+
+    def run_until_empty(self) -> int:
+        """Drain what is pending now (tests, cron, one-shot). Returns events delivered."""
+        total = 0
+        while True:
+            n = self.relay_once()
+            if not n:
+                return total
+            total += n
+
+    def close(self) -> None:
+        for publisher in self._publishers:
+            try:
+                publisher.close()
+            except Exception:
+                log.exception("[OutboxRelay] publisher close failed")
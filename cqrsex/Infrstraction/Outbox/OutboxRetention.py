@@ -0,0 +1,172 @@
+# cqrsex/Infrstraction/Outbox/OutboxRetention.py
+from __future__ import annotations
+import gzip
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.db.models import Min, Q
+from django.utils import timezone
+
+from cqrsex.Application.Mapping.OutboxMapper import to_message
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+from cqrsex.Domain.models.ProjectionCheckpoint import ProjectionCheckpoint
+from cqrsex.Infrstraction.Outbox import OutboxPartitions
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionReport:
+    deleted: int = 0
+    archived: int = 0
+    batches: int = 0
+    partitions_dropped: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+    size_before: Dict[str, Any] = field(default_factory=dict)
+    size_after: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return round(self.deleted / self.seconds, 1) if self.seconds else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "deleted": self.deleted, "archived": self.archived, "batches": self.batches,
+            "partitions_dropped": self.partitions_dropped, "seconds": round(self.seconds, 3),
+            "rows_per_sec": self.rows_per_sec, "size_before": self.size_before, "size_after": self.size_after,
+        }
+
+
+def table_size(alias: str) -> Dict[str, Any]:
+    """Row count plus on-disk bytes where the backend can tell (PostgreSQL; SQLite with dbstat)."""
+    conn = connections[alias]
+    out: Dict[str, Any] = {"rows": OutboxEvent.objects.using(alias).count(), "bytes": None}
+    table = OutboxEvent._meta.db_table
+    try:
+        with conn.cursor() as cur:
+            if conn.vendor == "postgresql":
+                # a partitioned parent has no storage of its own: sum its partitions
+                cur.execute(
+                    """
+                    SELECT coalesce(sum(pg_total_relation_size(i.inhrelid)), pg_total_relation_size(to_regclass(%s)))
+                    FROM pg_inherits i WHERE i.inhparent = to_regclass(%s)
+                    """,
+                    [table, table],
+                )
+                out["bytes"] = int(cur.fetchone()[0] or 0)
+            elif conn.vendor == "sqlite":
+                cur.execute("SELECT sum(pgsize) FROM dbstat WHERE name = %s OR tbl_name = %s", [table, table])
+                out["bytes"] = cur.fetchone()[0]
+    except Exception:
+        log.debug("table size unavailable on %s", conn.vendor, exc_info=True)
+    return out
+
+
+class JsonlArchive:
+    """Gzipped JSON-lines archive, one file per retention run."""
+
+    def __init__(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"outbox-{timezone.now():%Y%m%dT%H%M%S}.jsonl.gz")
+        self._fh = gzip.open(self.path, "at", encoding="utf-8")
+
+    def write(self, rows: List[OutboxEvent]) -> None:
+        self._fh.write("".join(json.dumps(to_message(r), cls=DjangoJSONEncoder) + "\n" for r in rows))
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class OutboxRetention:
+    """
+    Removes delivered outbox events older than a cutoff.
+
+    Plain table: repeated short transactions of `DELETE ... WHERE id IN (<batch_size ids>)`
+    picked via outbox_done_idx, optionally archived first and paced with `pause`, so no
+    lock is held for long and replicas/vacuum keep up. Partitioned table (PostgreSQL):
+    months that are entirely past the cutoff and hold nothing pending are detached
+    and dropped first; the row path then handles the remainder.
+
+    Events past the lowest projection checkpoint are kept even when delivered, so a
+    lagging read-model projection never has its input deleted under it.
+    """
+
+    def __init__(
+        self,
+        db_alias: str = "default",
+        *,
+        batch_size: int = 5_000,
+        pause: float = 0.0,
+        archive: Optional[JsonlArchive] = None,
+        drop_partitions: bool = True,
+        respect_projections: bool = True,
+    ) -> None:
+        self.db_alias = db_alias
+        self.batch_size = max(int(batch_size), 1)
+        self.pause = pause
+        self.archive = archive
+        self.drop_partitions = drop_partitions
+        self.respect_projections = respect_projections
+        self.keep_after: Optional[int] = None
+
+    def _projection_floor(self) -> Optional[int]:
+        if not self.respect_projections:
+            return None
+        return ProjectionCheckpoint.objects.using(self.db_alias).aggregate(m=Min("position"))["m"]
+
+    def _expired(self, cutoff: datetime):
+        # rows delivered before processed_at existed fall back to created_at
+        qs = OutboxEvent.objects.using(self.db_alias).filter(processed=True).filter(
+            Q(processed_at__lt=cutoff) | Q(processed_at__isnull=True, created_at__lt=cutoff)
+        )
+        return qs if self.keep_after is None else qs.filter(id__lte=self.keep_after)
+
+    def _delete_batch(self, cutoff: datetime) -> int:
+        with transaction.atomic(using=self.db_alias):
+            if self.archive is not None:
+                rows = list(self._expired(cutoff).order_by("id")[: self.batch_size])
+                if not rows:
+                    return 0
+                ids = [r.id for r in rows]
+                self.archive.write(rows)
+            else:
+                ids = list(self._expired(cutoff).order_by("id").values_list("id", flat=True)[: self.batch_size])
+                if not ids:
+                    return 0
+            deleted, _ = OutboxEvent.objects.using(self.db_alias).filter(id__in=ids).delete()
+        return deleted
+
+    def run(self, cutoff: datetime, *, max_batches: Optional[int] = None) -> RetentionReport:
+        report = RetentionReport(size_before=table_size(self.db_alias))
+        started = time.perf_counter()
+        self.keep_after = self._projection_floor()
+        try:
+            if self.drop_partitions and self.archive is None:
+                for name in OutboxPartitions.expired(self.db_alias, cutoff, self.keep_after):
+                    report.deleted += OutboxPartitions.drop(self.db_alias, name)
+                    report.partitions_dropped.append(name)
+            while max_batches is None or report.batches < max_batches:
+                n = self._delete_batch(cutoff)
+                if not n:
+                    break
+                report.batches += 1
+                report.deleted += n
+                if self.archive is not None:
+                    report.archived += n
+                if self.pause:
+                    time.sleep(self.pause)
+        finally:
+            if self.archive is not None:
+                self.archive.close()
+        report.seconds = time.perf_counter() - started
+        report.size_after = table_size(self.db_alias)
+        log.info("[OutboxRetention] %s", report.as_dict())
+        return report
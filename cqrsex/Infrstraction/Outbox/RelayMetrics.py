@@ -0,0 +1,62 @@
+# cqrsex/Infrstraction/Outbox/RelayMetrics.py
+from __future__ import annotations
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Sequence, Tuple
+
+from django.utils import timezone
+
+
+class RelayMetrics:
+    """Counters + sliding-window throughput for one relay process."""
+
+    def __init__(self, window: float = 60.0) -> None:
+        self._lock = threading.Lock()
+        self._window = window
+        self._started = time.monotonic()
+        self._recent: Deque[Tuple[float, int]] = deque()
+        self._counters: Dict[str, int] = {
+            "polls": 0, "idle_polls": 0, "batches": 0, "published": 0, "failed_batches": 0, "failed_events": 0,
+        }
+        self._publish_seconds = 0.0
+        self._last_lag = None  # seconds between event creation and delivery (oldest of last batch)
+
+    def poll(self, published: int) -> None:
+        with self._lock:
+            self._counters["polls"] += 1
+            if not published:
+                self._counters["idle_polls"] += 1
+
+    def batch(self, events: Sequence[Any], seconds: float) -> None:
+        now = time.monotonic()
+        oldest = min((e.created_at for e in events if e.created_at), default=None)
+        with self._lock:
+            self._counters["batches"] += 1
+            self._counters["published"] += len(events)
+            self._publish_seconds += seconds
+            self._recent.append((now, len(events)))
+            if oldest is not None:
+                self._last_lag = (timezone.now() - oldest).total_seconds()
+
+    def failure(self, n_events: int) -> None:
+        with self._lock:
+            self._counters["failed_batches"] += 1
+            self._counters["failed_events"] += n_events
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and now - self._recent[0][0] > self._window:
+                self._recent.popleft()
+            in_window = sum(n for _, n in self._recent)
+            span = min(self._window, now - self._started) or 1e-9
+            out: Dict[str, Any] = dict(self._counters)
+            out.update(
+                events_per_sec=round(in_window / span, 2),
+                avg_batch_ms=round(1000 * self._publish_seconds / self._counters["batches"], 2)
+                if self._counters["batches"] else None,
+                last_lag_seconds=self._last_lag,
+                uptime_seconds=round(now - self._started, 1),
+            )
+            return out
@@ -0,0 +1,71 @@
+# cqrsex/Infrstraction/Outbox/test_outbox_relay.py
+import uuid
+
+import pytest
+
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+from cqrsex.Infrstraction.Outbox.InMemoryPublisher import InMemoryPublisher
+from cqrsex.Infrstraction.Outbox.OutboxRelay import OutboxRelay
+from cqrsex.Infrstraction.Repositories.OutboxRepository import OutboxRepository
+
+
+def emit(tenant_id="main", n=1):
+    OutboxEvent.objects.bulk_create([
+        OutboxEvent(aggregate_type="BlogPost", aggregate_id=uuid.uuid4(), event_type="Created",
+                    payload={"i": i}, tenant_id=tenant_id)
+        for i in range(n)
+    ])
+
+
+class Broken(InMemoryPublisher):
+    def publish(self, events):
+        raise ConnectionError("broker down")
+
+
+def test_claim_takes_the_oldest_pending_rows_of_a_tenant():
+    emit("a", 3)
+    emit("b", 2)
+    repo = OutboxRepository()
+    first = repo.claim_batch(2, tenant_id="a")
+    assert [e.payload["i"] for e in first] == [0, 1]
+    repo.mark_processed([e.id for e in first])
+    assert [e.payload["i"] for e in repo.claim_batch(5, tenant_id="a")] == [2]
+    assert len(repo.claim_batch(10)) == 3
+
+
+def test_relay_delivers_everything_once():
+    emit("a", 7)
+    emit("b", 5)
+    publisher = InMemoryPublisher()
+    assert OutboxRelay(OutboxRepository(), [publisher], batch_size=4).run_until_empty() == 12
+    assert sorted(m["id"] for m in publisher.messages) == sorted(OutboxEvent.objects.values_list("id", flat=True))
+    assert not OutboxEvent.objects.filter(processed=False).exists()
+
+
+def test_publisher_error_leaves_the_batch_pending():
+    emit("a", 3)
+    relay = OutboxRelay(OutboxRepository(), [InMemoryPublisher(), Broken()])
+    assert relay.relay_once() == 0
+    assert OutboxEvent.objects.filter(processed=False).count() == 3
+    publisher = InMemoryPublisher()
+    assert OutboxRelay(OutboxRepository(), [publisher]).run_until_empty() == 3
+
+
+@pytest.mark.parametrize("tenants", [3, 4, 10])
+def test_every_tenant_is_served_when_they_outnumber_the_window(tenants):
+    for t in range(tenants):
+        emit(f"t{t:02d}", 5)
+    publisher = InMemoryPublisher()
+    relay = OutboxRelay(OutboxRepository(), [publisher], batch_size=3, max_tenants=3)
+    served = set()
+    for _ in range(-(-tenants // 3)):
+        relay.relay_once()
+        served |= {m["tenant_id"] for m in publisher.messages}
+    assert len(served) == tenants
+
+
+def test_unfair_relay_claims_across_tenants():
+    emit("a", 2)
+    emit("b", 2)
+    relay = OutboxRelay(OutboxRepository(), [InMemoryPublisher()], batch_size=10, fair=False)
+    assert relay.relay_once() == 4
@@ -0,0 +1,55 @@
+# cqrsex/Infrstraction/Projections/AuthorPostCountProjection.py
+from __future__ import annotations
+from typing import Iterable, Optional, Sequence, Set
+
+from django.db.models import Count, Max
+
+from cqrsex.Application.Interfaces.Common.IProjection import IProjection
+from cqrsex.Application.Interfaces.Repositories.IUserReadRepository import IUserReadRepository
+from cqrsex.Domain.models.AuthorPostCount import AuthorPostCount
+from cqrsex.Domain.models.BlogPost import BlogPost
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+
+class AuthorPostCountProjection(IProjection):
+    """
+    rm_author_post_counts. Events only say which authors changed; their counts are
+    recomputed from blog_posts, so replaying or overlapping a rebuild never double-counts.
+    """
+    name = "author_post_counts"
+    aggregate_types = ("BlogPost",)
+
+    def __init__(self, users: IUserReadRepository, db_alias: str = "default") -> None:
+        self._users = users
+        self._db = db_alias
+
+    def _refresh(self, author_ids: Optional[Set[int]]) -> None:
+        src = BlogPost.objects.using(self._db).filter(is_deleted=False)
+        if author_ids is not None:
+            src = src.filter(author_id__in=author_ids)
+        stats = {
+            r["author_id"]: r
+            for r in src.values("author_id").annotate(n=Count("id"), last=Max("created_at"))
+        }
+        usernames = self._users.get_usernames(stats.keys())
+        rows = AuthorPostCount.objects.using(self._db)
+        stale = set(author_ids or ()) - stats.keys()
+        if stale:
+            rows.filter(author_id__in=stale).delete()
+        for author_id, r in stats.items():
+            rows.update_or_create(
+                author_id=author_id,
+                defaults={"post_count": r["n"], "last_post_at": r["last"],
+                          "author_username": usernames.get(author_id, "")},
+            )
+
+    def apply(self, events: Sequence[OutboxEvent]) -> Iterable[str]:
+        ids = {(e.payload or {}).get("author_id") for e in events}
+        ids.discard(None)
+        if ids:
+            self._refresh(ids)
+        return ()
+
+    def rebuild(self) -> None:
+        AuthorPostCount.objects.using(self._db).all().delete()
+        self._refresh(None)
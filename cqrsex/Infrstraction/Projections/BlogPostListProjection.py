@@ -0,0 +1,77 @@
+# cqrsex/Infrstraction/Projections/BlogPostListProjection.py
+from __future__ import annotations
+from typing import Iterable, Sequence, Set
+
+from django.utils.dateparse import parse_datetime
+
+from cqrsex.Application.CQRS.BlogPosts.Events import DELETED
+from cqrsex.Application.Interfaces.Common.IProjection import IProjection
+from cqrsex.Application.Interfaces.Repositories.IUserReadRepository import IUserReadRepository
+from cqrsex.Domain.models.BlogPost import BlogPost
+from cqrsex.Domain.models.BlogPostView import BlogPostView
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+REBUILD_CHUNK = 1_000
+
+
+class BlogPostListProjection(IProjection):
+    """rm_blog_posts: post fields + author username (auth_db), no cross-DB work at read time."""
+    name = "blog_post_list"
+    aggregate_types = ("BlogPost",)
+    tags = ("blogpost:list",)
+
+    def __init__(self, users: IUserReadRepository, db_alias: str = "default") -> None:
+        self._users = users
+        self._db = db_alias
+
+    def _rows(self):
+        return BlogPostView.objects.using(self._db)
+
+    def apply(self, events: Sequence[OutboxEvent]) -> Iterable[str]:
+        usernames = self._users.get_usernames(
+            {(e.payload or {}).get("author_id") for e in events if e.event_type != DELETED}
+        )
+        tags: Set[str] = {"blogpost:list"}
+        for e in events:
+            p = e.payload or {}
+            pid = p.get("id")
+            if pid is None:
+                continue
+            tags.add(f"blogpost:{pid}")
+            if e.event_type == DELETED:
+                self._rows().filter(id=pid).delete()
+                continue
+            fields = dict(
+                title=p.get("title") or "",
+                body=p.get("body") or "",
+                author_id=p.get("author_id"),
+                author_username=usernames.get(p.get("author_id"), ""),
+                tenant_id=p.get("tenant_id") or "main",
+                created_at=parse_datetime(p["created_at"]) if p.get("created_at") else e.created_at,
+                updated_at=parse_datetime(p["updated_at"]) if p.get("updated_at") else e.created_at,
+                version=e.id,
+            )
+            # version guard: a row already at/after this event is left alone (replay-safe)
+            if not self._rows().filter(id=pid, version__lt=e.id).update(**fields):
+                if not self._rows().filter(id=pid).exists():
+                    self._rows().create(id=pid, **fields)
+        return tags
+
+    def rebuild(self) -> None:
+        self._rows().all().delete()
+        src = BlogPost.objects.using(self._db).filter(is_deleted=False).order_by("id")
+        last = 0
+        while True:
+            chunk = list(src.filter(id__gt=last)[:REBUILD_CHUNK])
+            if not chunk:
+                return
+            usernames = self._users.get_usernames({b.author_id for b in chunk})
+            self._rows().bulk_create([
+                BlogPostView(
+                    id=b.id, title=b.title, body=b.body, author_id=b.author_id,
+                    author_username=usernames.get(b.author_id, ""), tenant_id=b.tenant_id,
+                    created_at=b.created_at, updated_at=b.updated_at, version=0,
+                )
+                for b in chunk
+            ])
+            last = chunk[-1].id
@@ -0,0 +1,65 @@
+# cqrsex/Infrstraction/Projections/BlogPostSearchProjection.py
+from __future__ import annotations
+from typing import Iterable, Sequence
+
+from django.utils.dateparse import parse_datetime
+
+from cqrsex.Application.CQRS.BlogPosts.Events import DELETED
+from cqrsex.Application.Interfaces.Common.IProjection import IProjection
+from cqrsex.Domain.models.BlogPost import BlogPost
+from cqrsex.Domain.models.BlogPostSearchDoc import BlogPostSearchDoc
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+
+REBUILD_CHUNK = 1_000
+
+
+class BlogPostSearchProjection(IProjection):
+    """
+    rm_blog_post_search: title/body per live post. The database keeps the full-text
+    index in step with each write (generated tsvector / FTS5 triggers).
+    Reindex: python manage.py projections --rebuild blog_post_search
+    """
+    name = "blog_post_search"
+    aggregate_types = ("BlogPost",)
+    tags = ("blogpost:search",)
+
+    def __init__(self, db_alias: str = "default") -> None:
+        self._db = db_alias
+
+    def _rows(self):
+        return BlogPostSearchDoc.objects.using(self._db)
+
+    def apply(self, events: Sequence[OutboxEvent]) -> Iterable[str]:
+        for e in events:
+            p = e.payload or {}
+            pid = p.get("id")
+            if pid is None:
+                continue
+            if e.event_type == DELETED:
+                self._rows().filter(id=pid).delete()
+                continue
+            fields = dict(
+                title=p.get("title") or "",
+                body=p.get("body") or "",
+                author_id=p.get("author_id"),
+                tenant_id=p.get("tenant_id") or "main",
+                created_at=parse_datetime(p["created_at"]) if p.get("created_at") else e.created_at,
+                version=e.id,
+            )
+            # version guard, as in BlogPostListProjection
+            if not self._rows().filter(id=pid, version__lt=e.id).update(**fields):
+                if not self._rows().filter(id=pid).exists():
+                    self._rows().create(id=pid, **fields)
+        return self.tags
+
+    def rebuild(self) -> None:
+        self._rows().all().delete()
+        src = BlogPost.objects.using(self._db).filter(is_deleted=False).order_by("id")
+        last = 0
+        while True:
+            chunk = list(src.filter(id__gt=last).values("id", "title", "body", "author_id", "tenant_id", "created_at")
+                         [:REBUILD_CHUNK])
+            if not chunk:
+                return
+            self._rows().bulk_create([BlogPostSearchDoc(version=0, **row) for row in chunk])
+            last = chunk[-1]["id"]
@@ -0,0 +1,134 @@
+# cqrsex/Infrstraction/Projections/ProjectionEngine.py
+from __future__ import annotations
+import logging
+import threading
+from datetime import timedelta
+from typing import Dict, List, Optional, Sequence
+
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from cqrsex.Application.Interfaces.Common.IProjection import IProjection
+from cqrsex.Application.Interfaces.Common.IQueryCache import IQueryCache
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+from cqrsex.Domain.models.ProjectionCheckpoint import ProjectionCheckpoint
+
+log = logging.getLogger(__name__)
+
+
+class ProjectionEngine:
+    """
+    Feeds outbox events to projections, each with its own checkpoint (last event id).
+
+    A batch and its checkpoint commit together, and the checkpoint row is locked for
+    the batch, so concurrent runners never apply an event twice. Events younger than
+    `settle_seconds` are left for the next poll: outbox ids are taken at INSERT time,
+    and this gives a lower id that commits late a chance to land before it is passed.
+    Outbox rows are flushed right before commit (OutboxBuffer), so that window is short.
+    """
+
+    def __init__(
+        self,
+        projections: Sequence[IProjection],
+        *,
+        db_alias: str = "default",
+        batch_size: int = 500,
+        settle_seconds: float = 1.0,
+        cache: Optional[IQueryCache] = None,
+    ) -> None:
+        self._projections: Dict[str, IProjection] = {p.name: p for p in projections}
+        self.db_alias = db_alias
+        self.batch_size = max(int(batch_size), 1)
+        self.settle = timedelta(seconds=settle_seconds)
+        self._cache = cache
+        self._stop = threading.Event()
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._projections)
+
+    def _checkpoints(self):
+        return ProjectionCheckpoint.objects.using(self.db_alias)
+
+    def position(self, name: str) -> int:
+        cp, _ = self._checkpoints().get_or_create(name=name)
+        return cp.position
+
+    def positions(self) -> Dict[str, int]:
+        return {n: self.position(n) for n in self._projections}
+
+    # ---------- catch-up ----------
+    def _step(self, p: IProjection) -> int:
+        pos = self.position(p.name)
+        events = list(
+            OutboxEvent.objects.using(self.db_alias)
+            .filter(id__gt=pos, aggregate_type__in=p.aggregate_types, created_at__lte=timezone.now() - self.settle)
+            .order_by("id")[: self.batch_size]
+        )
+        if not events:
+            return 0
+        with transaction.atomic(using=self.db_alias):
+            cp = self._checkpoints().select_for_update().get(name=p.name)
+            if cp.position != pos:
+                return 0  # another runner got here first
+            tags = list(p.apply(events) or ())
+            cp.position = events[-1].id
+            cp.save(update_fields=["position", "updated_at"])
+            if tags and self._cache is not None:
+                self._cache.invalidate_after_commit(tags, using=self.db_alias)
+        return len(events)
+
+    def run_once(self, names: Optional[Sequence[str]] = None) -> int:
+        """One batch per projection; returns events applied."""
+        total = 0
+        for name in names or self.names:
+            p = self._projections[name]
+            try:
+                total += self._step(p)
+            except Exception:
+                log.exception("[Projection] %s failed; will retry from its checkpoint", name)
+        return total
+
+    def catch_up(self, names: Optional[Sequence[str]] = None) -> int:
+        total = 0
+        while True:
+            n = self.run_once(names)
+            if not n:
+                return total
+            total += n
+
+    def run(self, *, poll_interval: float = 1.0) -> None:
+        self._stop.clear()
+        while not self._stop.is_set():
+            if not self.run_once():
+                self._stop.wait(poll_interval)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    # ---------- rebuild ----------
+    def rebuild(self, names: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """
+        Recreate read models from the source tables, then resume after the outbox head
+        taken before the snapshot. Events after it are re-applied on top, which both
+        projections tolerate (upsert with version guard / recomputed counts).
+        """
+        out: Dict[str, int] = {}
+        for name in names or self.names:
+            p = self._projections[name]
+            with transaction.atomic(using=self.db_alias):
+                head = OutboxEvent.objects.using(self.db_alias).aggregate(m=Max("id"))["m"] or 0
+                cp, _ = self._checkpoints().select_for_update().get_or_create(name=name)
+                p.rebuild()
+                cp.position = head
+                cp.save(update_fields=["position", "updated_at"])
+                if p.tags and self._cache is not None:
+                    self._cache.invalidate_after_commit(p.tags, using=self.db_alias)
+            out[name] = head
+            log.info("[Projection] rebuilt %s at outbox position %s", name, head)
+        return out
+
+    def min_position(self) -> Optional[int]:
+        """Lowest checkpoint across projections (outbox rows after it are still needed)."""
+        return self._checkpoints().filter(name__in=self.names).aggregate(m=Min("position"))["m"]
@@ -0,0 +1,75 @@
+# cqrsex/Infrstraction/Projections/test_blog_post_list_projection.py
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from cqrsex.Application.CQRS.BlogPosts.Events import CREATED, DELETED, UPDATED
+from cqrsex.Domain.models.BlogPostView import BlogPostView
+from cqrsex.Domain.models.OutboxEvent import OutboxEvent
+from cqrsex.Domain.models.ProjectionCheckpoint import ProjectionCheckpoint
+from cqrsex.Infrstraction.Cache.LruQueryCache import LruQueryCache
+from cqrsex.Infrstraction.Projections.BlogPostListProjection import BlogPostListProjection
+from cqrsex.Infrstraction.Projections.ProjectionEngine import ProjectionEngine
+
+
+class Users:
+    def get_usernames(self, ids):
+        return {i: f"user{i}" for i in ids if i is not None}
+
+
+def emit(event_type, post_id=1, title="t"):
+    return OutboxEvent.objects.create(
+        aggregate_type="BlogPost", event_type=event_type,
+        payload={"id": post_id, "title": title, "body": "", "author_id": 7, "tenant_id": "main"},
+    )
+
+
+@pytest.fixture
+def projection():
+    return BlogPostListProjection(Users())
+
+
+def test_events_build_the_row(projection):
+    projection.apply([emit(CREATED, title="a"), emit(UPDATED, title="b")])
+    row = BlogPostView.objects.get(id=1)
+    assert (row.title, row.author_username) == ("b", "user7")
+    assert row.version == OutboxEvent.objects.latest("id").id
+
+
+def test_older_event_does_not_overwrite_a_newer_row(projection):
+    created, updated = emit(CREATED, title="a"), emit(UPDATED, title="b")
+    projection.apply([updated])
+    projection.apply([created])          # late / replayed
+    row = BlogPostView.objects.get(id=1)
+    assert (row.title, row.version) == ("b", updated.id)
+
+
+def test_replaying_a_batch_is_a_no_op(projection):
+    events = [emit(CREATED, title="a"), emit(UPDATED, title="b"), emit(CREATED, post_id=2)]
+    projection.apply(events)
+    before = list(BlogPostView.objects.order_by("id").values())
+    projection.apply(events)
+    assert list(BlogPostView.objects.order_by("id").values()) == before
+
+
+def test_delete_removes_the_row_and_returns_its_tags(projection):
+    projection.apply([emit(CREATED)])
+    assert projection.apply([emit(DELETED)]) == {"blogpost:list", "blogpost:1"}
+    assert not BlogPostView.objects.exists()
+
+
+def test_engine_advances_the_checkpoint_and_invalidates_after_commit(projection):
+    cache = LruQueryCache()
+    cache.set("list", ["stale"], tags=cache.tag_versions(["blogpost:list"]))
+    engine = ProjectionEngine([projection], settle_seconds=0, cache=cache)
+    emit(CREATED, title="a")
+    last = emit(UPDATED, title="b")
+    # rows younger than settle_seconds wait for the next poll
+    OutboxEvent.objects.update(created_at=timezone.now() - timedelta(seconds=1))
+
+    assert engine.catch_up() == 2
+    assert ProjectionCheckpoint.objects.get(name="blog_post_list").position == last.id
+    assert BlogPostView.objects.get(id=1).title == "b"
+    assert cache.get("list") is None
+    assert engine.catch_up() == 0
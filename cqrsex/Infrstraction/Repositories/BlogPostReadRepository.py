@@ -6,5 +6,7 @@ from cqrsex.Infrstraction.Repositories.GenericRepository import GenericRepositor
 
 
 class BlogPostReadRepository(GenericRepository[BlogPost], IBlogPostReadRepository):
+    search_fields = ("title", "body")
+
     def __init__(self) -> None:
         super().__init__(BlogPost)
@@ -0,0 +1,60 @@
+from typing import Any, Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+
+from cqrsex.Application.Interfaces.Repositories.IBlogPostSearchRepository import IBlogPostSearchRepository
+from cqrsex.Application.Wrapper.KeysetPage import KeysetPage
+from cqrsex.Domain.models.BlogPostSearchDoc import BlogPostSearchDoc
+from cqrsex.Infrstraction.Repositories.Keyset import KeysetPager
+from cqrsex.Infrstraction.Search.FullTextIndex import SCORE
+from cqrsex.Infrstraction.Search.indexes import BLOG_POST_SEARCH
+
+ITEM_FIELDS = ("id", "title", "author_id", "created_at")
+
+
+class BlogPostSearchRepository(IBlogPostSearchRepository):
+    """
+    Three bounded queries per page: ranked ids (index only), the page's rows by pk,
+    and highlights for the page's rows.
+    """
+    def __init__(self, db_alias: str = "default") -> None:
+        self.db_alias = db_alias
+        self._index = BLOG_POST_SEARCH
+
+    def search(
+        self, q: str, *, page_size: int = 20, cursor: Optional[str] = None,
+        author_id: Optional[int] = None, highlight: bool = True,
+    ) -> KeysetPage:
+        pager = KeysetPager(f"-{SCORE}", page_size, cursor)
+        hits = self._index.search(
+            self.db_alias, q,
+            filters={"author_id": author_id} if author_id is not None else None,
+            after=pager.key, backwards=pager.direction == "prev", limit=pager.page_size + 1,
+        )
+        page = pager.page(hits)
+        page.items = self._items(q, page.items, highlight)
+        return page
+
+    async def asearch(
+        self, q: str, *, page_size: int = 20, cursor: Optional[str] = None,
+        author_id: Optional[int] = None, highlight: bool = True,
+    ) -> KeysetPage:
+        # raw cursor work: run it on the ORM thread
+        return await sync_to_async(self.search)(
+            q, page_size=page_size, cursor=cursor, author_id=author_id, highlight=highlight
+        )
+
+    def _items(self, q: str, hits: List[Dict[str, Any]], highlight: bool) -> List[Dict[str, Any]]:
+        ids = [h["id"] for h in hits]
+        rows = {r["id"]: r for r in BlogPostSearchDoc.objects.using(self.db_alias).filter(id__in=ids).values(*ITEM_FIELDS)}
+        marks = self._index.highlights(self.db_alias, q, ids) if highlight else {}
+        items = []
+        for h in hits:
+            row = rows.get(h["id"])
+            if row is None:          # deleted between the two queries
+                continue
+            item = dict(row, score=h[SCORE])
+            if highlight:
+                item["highlight"] = marks.get(h["id"], {})
+            items.append(item)
+        return items
@@ -0,0 +1,9 @@
+from cqrsex.Application.Interfaces.Repositories.IBlogPostReadRepository import IBlogPostReadRepository
+from cqrsex.Domain.models.BlogPostView import BlogPostView
+from cqrsex.Infrstraction.Repositories.GenericRepository import GenericRepository
+
+
+class BlogPostViewRepository(GenericRepository[BlogPostView], IBlogPostReadRepository):
+    """Blog post reads served from the rm_blog_posts projection (deleted posts are already gone)."""
+    def __init__(self) -> None:
+        super().__init__(BlogPostView)
@@ -0,0 +1,142 @@
+# cqrsex/Infrstraction/Repositories/Counting.py
+from __future__ import annotations
+import hashlib
+import json
+import logging
+from typing import Any, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.db.models import QuerySet
+
+from cqrsex.Application.Common.exceptions import ValidationException
+from cqrsex.Application.Wrapper.OffsetPage import COUNT_MODES, OffsetPage
+
+log = logging.getLogger(__name__)
+
+
+def _cfg() -> dict:
+    return getattr(settings, "CQRS_PAGINATION", {}) or {}
+
+
+def check_mode(mode: Optional[str]) -> str:
+    mode = (mode or "exact").lower()
+    if mode not in COUNT_MODES:
+        raise ValidationException(
+            f"Unknown count mode '{mode}'", {"allowed": list(COUNT_MODES)}, code="invalid_count_mode"
+        )
+    return mode
+
+
+# ---------- estimated ----------
+def _pg_estimate(qs: QuerySet) -> Optional[int]:
+    conn = connections[qs.db]
+    with conn.cursor() as cur:
+        if not qs.query.where:
+            # unfiltered: table statistics, no scan at all
+            cur.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)", [qs.model._meta.db_table])
+            row = cur.fetchone()
+        else:
+            sql, params = qs.query.get_compiler(qs.db).as_sql()
+            cur.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cur.fetchone()[0]
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            row = (plan[0]["Plan"]["Plan Rows"],)
+    # reltuples is -1 for a never-analyzed table
+    return int(row[0]) if row and row[0] is not None and row[0] >= 0 else None
+
+
+def estimate(qs: QuerySet) -> Optional[int]:
+    """Planner row estimate, or None where the backend has none (e.g. SQLite)."""
+    if connections[qs.db].vendor != "postgresql":
+        return None
+    try:
+        return _pg_estimate(qs.order_by())
+    except Exception:
+        log.debug("row estimate failed for %s", qs.model.__name__, exc_info=True)
+        return None
+
+
+# ---------- cached ----------
+def _signature(qs: QuerySet) -> str:
+    sql, params = qs.order_by().query.get_compiler(qs.db).as_sql()
+    raw = f"{qs.db}|{sql}|{params!r}"
+    return f"{_cfg().get('COUNT_CACHE_PREFIX', 'cnt')}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def _count_cache():
+    return caches[_cfg().get("COUNT_CACHE_ALIAS", "default")]
+
+
+# ---------- counting ----------
+def count(qs: QuerySet, mode: str) -> Tuple[Optional[int], str]:
+    """(total, mode that produced it). Never called for mode 'none'."""
+    if mode == "estimated":
+        est = estimate(qs)
+        # small tables: exact is cheap and estimates there are noisy
+        if est is not None and est >= _cfg().get("ESTIMATE_EXACT_BELOW", 10_000):
+            return est, "estimated"
+        return qs.count(), "exact"
+    if mode == "cached":
+        key, cache = _signature(qs), _count_cache()
+        total = cache.get(key)
+        if total is None:
+            total = qs.count()
+            cache.set(key, total, _cfg().get("COUNT_CACHE_TTL", 60))
+        return total, "cached"
+    return qs.count(), "exact"
+
+
+async def acount(qs: QuerySet, mode: str) -> Tuple[Optional[int], str]:
+    if mode == "estimated":
+        est = await sync_to_async(estimate)(qs)
+        if est is not None and est >= _cfg().get("ESTIMATE_EXACT_BELOW", 10_000):
+            return est, "estimated"
+        return await qs.acount(), "exact"
+    if mode == "cached":
+        key, cache = _signature(qs), _count_cache()
+        total = await cache.aget(key)
+        if total is None:
+            total = await qs.acount()
+            await cache.aset(key, total, _cfg().get("COUNT_CACHE_TTL", 60))
+        return total, "cached"
+    return await qs.acount(), "exact"
+
+
+# ---------- paging ----------
+def _window(page: int, page_size: int) -> Tuple[int, int, int]:
+    page = max(int(page or 1), 1)
+    page_size = max(int(page_size or 10), 1)
+    return page, page_size, (page - 1) * page_size
+
+
+def _page(rows: List[Any], page: int, page_size: int, total: Optional[int], mode: str) -> OffsetPage:
+    # one extra row is always fetched, so has_next is exact even when the total is not
+    return OffsetPage(rows[:page_size], page, page_size, has_next=len(rows) > page_size, total=total, count_mode=mode)
+
+
+def paginate(qs: QuerySet, page: int, page_size: int, count_mode: str = "exact") -> OffsetPage:
+    mode = check_mode(count_mode)
+    page, page_size, start = _window(page, page_size)
+    rows = list(qs[start:start + page_size + 1])
+    if mode == "none":
+        return _page(rows, page, page_size, None, "none")
+    if start == 0 and len(rows) <= page_size:
+        # first page holds everything: the total is known for free
+        return _page(rows, page, page_size, len(rows), "exact")
+    total, mode = count(qs, mode)
+    return _page(rows, page, page_size, total, mode)
+
+
+async def apaginate(qs: QuerySet, page: int, page_size: int, count_mode: str = "exact") -> OffsetPage:
+    mode = check_mode(count_mode)
+    page, page_size, start = _window(page, page_size)
+    rows = [r async for r in qs[start:start + page_size + 1]]
+    if mode == "none":
+        return _page(rows, page, page_size, None, "none")
+    if start == 0 and len(rows) <= page_size:
+        return _page(rows, page, page_size, len(rows), "exact")
+    total, mode = await acount(qs, mode)
+    return _page(rows, page, page_size, total, mode)
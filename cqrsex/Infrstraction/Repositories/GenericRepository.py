@@ -1,10 +1,15 @@
-from typing import TypeVar, Generic, List, Optional, Callable, Type, Any, Tuple, Dict, Sequence, Iterable, Iterator
+from typing import TypeVar, Generic, List, Optional, Callable, Type, Any, Tuple, Dict, Sequence, Iterable, Iterator, AsyncIterator
 import logging
 from django.db import models, transaction
 from django.db.models import F, QuerySet, Q
 from django.utils import timezone
 
 from cqrsex.Application.Interfaces.Common.IGenericRepository import IGenericRepository
+from cqrsex.Application.Wrapper.KeysetPage import KeysetPage
+from cqrsex.Application.Wrapper.OffsetPage import OffsetPage
+from cqrsex.Infrstraction.Repositories.Keyset import KeysetPager
+from cqrsex.Infrstraction.Repositories.Counting import paginate, apaginate
+from cqrsex.Infrstraction.Search.TextSearch import TextSearch
 
 
 logger = logging.getLogger(__name__)
@@ -13,8 +18,12 @@ T = TypeVar('T', bound=models.Model)
 
 
 class GenericRepository(IGenericRepository[T], Generic[T]):
+    # columns the `q` filter of paginate_values matches (see TextSearch); override per repository
+    search_fields: Tuple[str, ...] = ("en_name", "ar_name", "description")
+
     def __init__(self, model: Type[T]):
         self.model = model
+        self._search = TextSearch(self.search_fields)
         # cached model capabilities
         self._has_vendor: bool = any(getattr(f, "attname", "") == "vendor_id" for f in self.model._meta.fields)
         self._has_active: bool = any(getattr(f, "attname", "") == "is_active" for f in self.model._meta.fields)
@@ -101,6 +110,36 @@ class GenericRepository(IGenericRepository[T], Generic[T]):
         end = start + page_size
         return list(queryset[start:end]), total_count
 
+    def get_keyset_page(
+        self,
+        page_size: int = 20,
+        *,
+        cursor: Optional[str] = None,
+        order_by: str = "-id",
+        vendor_id: Optional[Any] = None,
+        fields: Optional[Sequence[str]] = None,   # values() rows instead of models
+        **filters,
+    ) -> KeysetPage:
+        # seek on (order_by, id) — no COUNT(*), no OFFSET; cost is flat at any depth
+        pager = KeysetPager(order_by, page_size, cursor)
+        queryset = pager.queryset(self._filtered(vendor_id=vendor_id, fields=fields, **filters))
+        return pager.page(list(queryset))
+
+    def get_page(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        *,
+        count_mode: str = "exact",
+        vendor_id: Optional[Any] = None,
+        order_by: Optional[Iterable[str]] = None,
+        fields: Optional[Sequence[str]] = None,   # values() rows instead of models
+        **filters,
+    ) -> OffsetPage:
+        # like get_paginated, but the total follows count_mode (exact|none|estimated|cached)
+        queryset = self._filtered(vendor_id=vendor_id, order_by=order_by, fields=fields, **filters)
+        return paginate(queryset, page, page_size, count_mode)
+
     def get_all_as(self, selector: Callable[[T], Any]) -> List[Any]:
         return [selector(item) for item in self._base_queryset()]
 
@@ -164,15 +203,28 @@ class GenericRepository(IGenericRepository[T], Generic[T]):
             qs = qs.filter(is_deleted=False)
         return qs.filter(id=id).update(**{field: F(field) + amount}) > 0
 
-    def bulk_add(self, entities: List[T], vendor_context: Optional[Any] = None) -> None:
+    def bulk_add(self, entities: List[T], vendor_context: Optional[Any] = None, *, batch_size: Optional[int] = None) -> None:
+        # PostgreSQL/SQLite/MariaDB set the new pks on `entities` (RETURNING)
         if vendor_context and self._supports_vendor():
             for entity in entities:
                 if getattr(entity, "vendor_id", None) is None:
                     setattr(entity, "vendor_id", getattr(vendor_context, "id", None))
-        self.model.objects.bulk_create(entities)
+        self.model.objects.bulk_create(entities, batch_size=batch_size)
 
-    def bulk_update(self, entities: List[T], fields: List[str]) -> None:
-        self.model.objects.bulk_update(entities, fields)
+    def bulk_update(self, entities: List[T], fields: List[str], *, batch_size: Optional[int] = None) -> None:
+        # bulk_update skips auto_now: stamp updated_at here so it matches save()
+        if "updated_at" in {getattr(f, "attname", "") for f in self.model._meta.fields} and "updated_at" not in fields:
+            now = timezone.now()
+            for entity in entities:
+                entity.updated_at = now
+            fields = list(fields) + ["updated_at"]
+        self.model.objects.bulk_update(entities, fields, batch_size=batch_size)
+
+    def bulk_delete_permanently(self, ids: List[Any]) -> int:
+        """delete_permanently() for many rows: one DELETE ... WHERE id IN (...)."""
+        if not ids:
+            return 0
+        return self.model.objects.filter(id__in=ids).delete()[0]
 
     # ============================================================
     # PROJECTIONS (RAW mode – NO soft-delete injection)
@@ -274,6 +326,12 @@ class GenericRepository(IGenericRepository[T], Generic[T]):
             qs = qs[:limit]
         return list(qs)
 
+    def _streamed(self, filters: Dict[str, Any]) -> QuerySet:
+        # exports skip soft-deleted rows like paginate_values (with_deleted=1 keeps them)
+        include_deleted = self._truthy(filters.pop("with_deleted", None))
+        qs = self.model.objects.filter(**filters)
+        return qs.filter(is_deleted=False) if self._has_deleted and not include_deleted else qs
+
     def iter_values(
         self,
         fields: Sequence[str],
@@ -283,7 +341,7 @@ class GenericRepository(IGenericRepository[T], Generic[T]):
         vendor_id: Optional[Any] = None,
         **filters
     ) -> Iterator[Dict[str, Any]]:
-        qs = self.model.objects.filter(**filters)
+        qs = self._streamed(filters)
         if vendor_id is not None and self._supports_vendor():
             qs = qs.filter(vendor_id=vendor_id)
         if order_by:
@@ -323,20 +381,15 @@ class GenericRepository(IGenericRepository[T], Generic[T]):
             else:
                 qs = qs.filter(vendor_id=vendor_id)
 
-        if search:
-            qs = qs.filter(
-                Q(en_name__icontains=search) |
-                Q(ar_name__icontains=search) |
-                Q(description__icontains=search)
-            )
-
         if filters:
             qs = qs.filter(**filters)
 
-        total = qs.count()
-
         if order_by:
             qs = qs.order_by(*order_by)
+        # without an explicit order_by, search results come best match first
+        qs = self._search.apply(qs, search, rank=not order_by)
+
+        total = qs.count()
 
         start = (page - 1) * page_size
         end = start + page_size
@@ -468,3 +521,120 @@ class GenericRepository(IGenericRepository[T], Generic[T]):
 
     def bulk_deactivate(self, ids: List[Any], *, vendor_id: Optional[Any] = None, modified_by: Optional[str] = None) -> int:
         return self.bulk_set_active(ids, False, vendor_id=vendor_id, modified_by=modified_by)
+
+    # ============================================================
+    # Async (Django async ORM: afirst / acount / aiterator / asave)
+    # ============================================================
+    def _filtered(
+        self,
+        *,
+        vendor_id: Optional[Any] = None,
+        order_by: Optional[Iterable[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        **filters,
+    ) -> QuerySet:
+        qs = self._base_queryset()
+        if filters:
+            qs = qs.filter(**filters)
+        if vendor_id is not None and self._supports_vendor():
+            qs = qs.filter(vendor_id=vendor_id)
+        if order_by:
+            qs = qs.order_by(*order_by)
+        # model-free list path: only these columns, rows come back as dicts
+        return qs.values(*fields) if fields else qs
+
+    async def aget_by_id(self, id: Any) -> Optional[T]:
+        return await self._base_queryset().filter(id=id).afirst()
+
+    async def aget_page(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        *,
+        count_mode: str = "exact",
+        vendor_id: Optional[Any] = None,
+        order_by: Optional[Iterable[str]] = None,
+        fields: Optional[Sequence[str]] = None,   # values() rows instead of models
+        **filters,
+    ) -> OffsetPage:
+        queryset = self._filtered(vendor_id=vendor_id, order_by=order_by, fields=fields, **filters)
+        return await apaginate(queryset, page, page_size, count_mode)
+
+    async def aget_paginated(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        *,
+        vendor_id: Optional[Any] = None,
+        order_by: Optional[Iterable[str]] = None,
+        fields: Optional[Sequence[str]] = None,   # values() rows instead of models
+        **filters,
+    ) -> Tuple[List[T], int]:
+        page = max(int(page or 1), 1)
+        page_size = max(int(page_size or 10), 1)
+
+        queryset = self._filtered(vendor_id=vendor_id, order_by=order_by, fields=fields, **filters)
+        total_count = await queryset.acount()
+        start = (page - 1) * page_size
+        return [row async for row in queryset[start:start + page_size]], total_count
+
+    async def aget_keyset_page(
+        self,
+        page_size: int = 20,
+        *,
+        cursor: Optional[str] = None,
+        order_by: str = "-id",
+        vendor_id: Optional[Any] = None,
+        fields: Optional[Sequence[str]] = None,   # values() rows instead of models
+        **filters,
+    ) -> KeysetPage:
+        pager = KeysetPager(order_by, page_size, cursor)
+        queryset = pager.queryset(self._filtered(vendor_id=vendor_id, fields=fields, **filters))
+        return pager.page([row async for row in queryset])
+
+    async def afind(self, **filters) -> List[T]:
+        filters = self._apply_soft_delete_filter(filters)
+        return [row async for row in self.model.objects.filter(**filters)]
+
+    async def afind_one(self, **filters) -> Optional[T]:
+        filters = self._apply_soft_delete_filter(filters)
+        return await self.model.objects.filter(**filters).afirst()
+
+    async def aadd(self, entity: T, vendor_context: Optional[Any] = None) -> T:
+        if vendor_context and self._supports_vendor() and getattr(entity, "vendor_id", None) is None:
+            setattr(entity, "vendor_id", getattr(vendor_context, "id", None))
+        await entity.asave()
+        return entity
+
+    async def aupdate(self, entity: T) -> T:
+        logger.debug(f"Updating entity id {getattr(entity, 'id', None)}")
+        await entity.asave()
+        return entity
+
+    async def adelete_permanently(self, entity: T) -> None:
+        await entity.adelete()
+
+    async def abulk_add(self, entities: List[T], vendor_context: Optional[Any] = None, *, batch_size: Optional[int] = None) -> None:
+        if vendor_context and self._supports_vendor():
+            for entity in entities:
+                if getattr(entity, "vendor_id", None) is None:
+                    setattr(entity, "vendor_id", getattr(vendor_context, "id", None))
+        await self.model.objects.abulk_create(entities, batch_size=batch_size)
+
+    async def aiter_values(
+        self,
+        fields: Sequence[str],
+        *,
+        chunk_size: int = 2000,
+        order_by: Optional[Iterable[str]] = None,
+        vendor_id: Optional[Any] = None,
+        **filters
+    ) -> AsyncIterator[Dict[str, Any]]:
+        qs = self._streamed(filters)
+        if vendor_id is not None and self._supports_vendor():
+            qs = qs.filter(vendor_id=vendor_id)
+        if order_by:
+            qs = qs.order_by(*order_by)
+
+        async for row in qs.values(*fields).aiterator(chunk_size=chunk_size):
+            yield row
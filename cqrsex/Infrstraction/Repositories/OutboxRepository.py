@@ -1,8 +1,11 @@
 # cqrsex/Infrstraction/Repositories/OutboxRepository.py
 from __future__ import annotations
-from django.db import transaction
+from typing import Iterable, List, Optional
+from django.db import transaction, connections
+from django.utils import timezone
 from cqrsex.Domain.models.OutboxEvent import OutboxEvent
 from cqrsex.Application.Interfaces.Repositories.IOutboxRepository import IOutboxRepository
+from cqrsex.Infrstraction.Outbox.OutboxBuffer import OutboxBuffer
 
 class OutboxRepository(IOutboxRepository):
     def __init__(self, db_alias: str = "default"):
@@ -19,11 +22,61 @@ class OutboxRepository(IOutboxRepository):
         payload: dict,
         tenant_id: str = "main",
     ) -> OutboxEvent:
+        row = OutboxEvent(
+            aggregate_type=aggregate_type,
+            aggregate_id=aggregate_id,
+            event_type=event_type,
+            payload=payload,
+            tenant_id=tenant_id,
+        )
+        buffer = OutboxBuffer.current(self.db_alias)
+        if buffer is not None:
+            # unit of work open: written with the rest of the batch right before commit
+            # (the returned row has no id until then)
+            return buffer.append(row)
         with transaction.atomic(using=self.db_alias):
-            return OutboxEvent.objects.using(self.db_alias).create(
-                aggregate_type=aggregate_type,
-                aggregate_id=aggregate_id,
-                event_type=event_type,
-                payload=payload,
-                tenant_id=tenant_id,
-            )
+            row.save(using=self.db_alias)
+            return row
+
+    def add_many(self, events: Iterable[dict]) -> List[OutboxEvent]:
+        rows = [OutboxEvent(**e) for e in events]
+        if not rows:
+            return rows
+        buffer = OutboxBuffer.current(self.db_alias)
+        if buffer is not None:
+            for row in rows:
+                buffer.append(row)
+            return rows
+        with transaction.atomic(using=self.db_alias):
+            return OutboxEvent.objects.using(self.db_alias).bulk_create(rows)
+
+    # ---------- relay ----------
+    def _pending(self):
+        return OutboxEvent.objects.using(self.db_alias).filter(processed=False)
+
+    def pending_tenants(self, limit: int = 100, *, after: Optional[str] = None) -> List[str]:
+        qs = self._pending().order_by("tenant_id").values_list("tenant_id", flat=True).distinct()
+        if after is None:
+            return list(qs[:limit])
+        # a window over the ring of tenants: those after the cursor, then from the start
+        tenants = list(qs.filter(tenant_id__gt=after)[:limit])
+        if len(tenants) < limit:
+            tenants += qs.filter(tenant_id__lte=after)[:limit - len(tenants)]
+        return tenants
+
+    def claim_batch(self, limit: int, *, tenant_id: Optional[str] = None) -> List[OutboxEvent]:
+        qs = self._pending()
+        if tenant_id is not None:
+            qs = qs.filter(tenant_id=tenant_id)
+        # SKIP LOCKED lets N relays drain the table in parallel without double delivery;
+        # backends without row locks (SQLite) serialize writers anyway
+        if connections[self.db_alias].features.has_select_for_update_skip_locked:
+            qs = qs.select_for_update(skip_locked=True)
+        # (created_at, id) matches outbox_pending_idx
+        return list(qs.order_by("created_at", "id")[:limit])
+
+    def mark_processed(self, ids: Iterable[int]) -> int:
+        ids = list(ids)
+        if not ids:
+            return 0
+        return OutboxEvent.objects.using(self.db_alias).filter(id__in=ids).update(processed=True, processed_at=timezone.now())
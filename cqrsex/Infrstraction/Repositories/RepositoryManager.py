@@ -1,11 +1,21 @@
 from cqrsex.Application.Interfaces.Common.IRepositoryManager import IRepositoryManager
 from cqrsex.Application.Interfaces.Repositories.IBlogPostReadRepository import IBlogPostReadRepository
 from cqrsex.Application.Interfaces.Repositories.IBlogPostWriteRepository import IBlogPostWriteRepository
+from cqrsex.Application.Interfaces.Repositories.IUserReadRepository import IUserReadRepository
+from cqrsex.Application.Interfaces.Repositories.IUserWriteRepository import IUserWriteRepository
 
 class RepositoryManager(IRepositoryManager):
-    def __init__(self, read_repo: IBlogPostReadRepository, write_repo: IBlogPostWriteRepository) -> None:
+    def __init__(
+        self,
+        read_repo: IBlogPostReadRepository,
+        write_repo: IBlogPostWriteRepository,
+        user_read_repo: IUserReadRepository,
+        user_write_repo: IUserWriteRepository,
+    ) -> None:
         self._read = read_repo
         self._write = write_repo
+        self._user_read = user_read_repo
+        self._user_write = user_write_repo
 
     @property
     def blog_post_read_repository(self) -> IBlogPostReadRepository:
@@ -14,3 +24,11 @@ class RepositoryManager(IRepositoryManager):
     @property
     def blog_post_write_repository(self) -> IBlogPostWriteRepository:
         return self._write
+
+    @property
+    def user_read_repository(self) -> IUserReadRepository:
+        return self._user_read
+
+    @property
+    def user_write_repository(self) -> IUserWriteRepository:
+        return self._user_write
@@ -0,0 +1,81 @@
+# cqrsex/Infrstraction/Repositories/SagaRetryRepository.py
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from django.db import transaction, connections
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+from cqrsex.Domain.models.SagaRetry import SagaRetry
+from cqrsex.Domain.models.SagaDeadLetter import SagaDeadLetter
+from cqrsex.Application.Interfaces.Repositories.ISagaRetryRepository import ISagaRetryRepository
+
+class SagaRetryRepository(ISagaRetryRepository):
+    def __init__(self, db_alias: str = "default"):
+        self.db_alias = db_alias
+
+    def using(self, db_alias: str) -> "SagaRetryRepository":
+        return SagaRetryRepository(db_alias=db_alias)
+
+    def add_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        objs = [SagaRetry(**r) for r in rows]
+        if objs:
+            SagaRetry.objects.using(self.db_alias).bulk_create(objs, ignore_conflicts=True)
+        return len(objs)
+
+    def claim_due(self, limit: int) -> List[SagaRetry]:
+        qs = SagaRetry.objects.using(self.db_alias).filter(next_attempt_at__lte=timezone.now())
+        # as OutboxRepository.claim_batch: N retriers in parallel on PostgreSQL/MySQL;
+        # SQLite serializes writers anyway
+        if connections[self.db_alias].features.has_select_for_update_skip_locked:
+            qs = qs.select_for_update(skip_locked=True)
+        # (next_attempt_at, id) matches saga_retry_due_idx
+        return list(qs.order_by("next_attempt_at", "id")[:limit])
+
+    def delete(self, ids: Iterable[int]) -> int:
+        ids = list(ids)
+        if not ids:
+            return 0
+        return SagaRetry.objects.using(self.db_alias).filter(id__in=ids).delete()[0]
+
+    def reschedule(self, row: SagaRetry, error: str, next_attempt_at: datetime) -> None:
+        SagaRetry.objects.using(self.db_alias).filter(id=row.id).update(
+            attempts=F("attempts") + 1, last_error=error, next_attempt_at=next_attempt_at, updated_at=timezone.now(),
+        )
+
+    def bury(self, row: SagaRetry, error: str) -> None:
+        with transaction.atomic(using=self.db_alias):
+            SagaDeadLetter.objects.using(self.db_alias).bulk_create([SagaDeadLetter(
+                saga=row.saga,
+                idempotency_key=row.idempotency_key,
+                event=row.event,
+                attempts=row.attempts + 1,
+                last_error=error,
+                first_failed_at=row.created_at,
+            )], ignore_conflicts=True)
+            SagaRetry.objects.using(self.db_alias).filter(id=row.id).delete()
+
+    def requeue_dead(self, *, saga: Optional[str] = None, limit: Optional[int] = None) -> int:
+        with transaction.atomic(using=self.db_alias):
+            qs = SagaDeadLetter.objects.using(self.db_alias).order_by("id")
+            if saga:
+                qs = qs.filter(saga=saga)
+            dead = list(qs[:limit] if limit else qs)
+            if not dead:
+                return 0
+            now = timezone.now()
+            self.add_many(dict(saga=d.saga, idempotency_key=d.idempotency_key, event=d.event, attempts=0,
+                               last_error=d.last_error, next_attempt_at=now) for d in dead)
+            SagaDeadLetter.objects.using(self.db_alias).filter(id__in=[d.id for d in dead]).delete()
+            return len(dead)
+
+    def depth(self) -> Dict[str, Any]:
+        now = timezone.now()
+        agg = SagaRetry.objects.using(self.db_alias).aggregate(
+            queued=Count("id"), due=Count("id", filter=Q(next_attempt_at__lte=now)), oldest=Min("created_at"),
+        )
+        return {
+            "queued": agg["queued"],
+            "due": agg["due"],
+            "dead": SagaDeadLetter.objects.using(self.db_alias).count(),
+            "oldest_age_s": round((now - agg["oldest"]).total_seconds(), 1) if agg["oldest"] else None,
+        }
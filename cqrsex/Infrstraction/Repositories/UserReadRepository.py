@@ -1,11 +1,25 @@
-from typing import List, Tuple, Optional
-from django.db.models import Q
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Sequence, Set, Tuple, Optional
+from django.db.models import Value
+from django.db.models.functions import Lower
 from cqrsex.Application.Interfaces.Repositories.IUserReadRepository import IUserReadRepository
 from cqrsex.Domain.models.User import User
+from cqrsex.Application.Mapping.UsersMapper import SUMMARY_FIELDS, to_summary
+from cqrsex.Application.Wrapper.KeysetPage import KeysetPage
+from cqrsex.Application.Wrapper.OffsetPage import OffsetPage
+from cqrsex.Infrstraction.Repositories.Keyset import KeysetPager
+from cqrsex.Infrstraction.Repositories.Counting import paginate, apaginate
+from cqrsex.Infrstraction.Search.TextSearch import TextSearch
 
 class UserReadRepository(IUserReadRepository):
+    search_fields = ("username", "email")   # ListUsers / ExportUsers `q`
+
     def __init__(self, db_alias: str = "auth_db") -> None:
         self.db_alias = db_alias
+        self._search = TextSearch(self.search_fields)
+
+    def _ci(self, field: str, value: str):
+        # LOWER(field) = LOWER(%s) rather than __iexact's UPPER(...): matches users_*_lower_idx
+        return User.objects.using(self.db_alias).alias(_ci=Lower(field)).filter(_ci=Lower(Value(value)))
 
     def get_by_id(self, id: int) -> Optional[User]:
         return User.objects.using(self.db_alias).filter(id=id).first()
@@ -14,39 +28,173 @@ class UserReadRepository(IUserReadRepository):
         s = (username or "").strip()
         if not s:
             return None
-        return User.objects.using(self.db_alias).filter(username__iexact=s).first()
+        return self._ci("username", s).first()
 
     def get_by_email(self, email: str) -> Optional[User]:
         s = (email or "").strip()
         if not s:
             return None
-        return User.objects.using(self.db_alias).filter(email__iexact=s).first()
+        return self._ci("email", s).first()
 
     def exists_by_username(self, username: str) -> bool:
         s = (username or "").strip()
-        return bool(s) and User.objects.using(self.db_alias).filter(username__iexact=s).exists()
+        return bool(s) and self._ci("username", s).exists()
 
     def exists_by_email(self, email: str) -> bool:
         s = (email or "").strip()
-        return bool(s) and User.objects.using(self.db_alias).filter(email__iexact=s).exists()
+        return bool(s) and self._ci("email", s).exists()
 
     def exists_email_excluding_id(self, email: str, exclude_id: int) -> bool:
         s = (email or "").strip()
         if not s:
             return False
-        return User.objects.using(self.db_alias).filter(email__iexact=s).exclude(id=exclude_id).exists()
+        return self._ci("email", s).exclude(id=exclude_id).exists()
 
-    def get_paginated(
-        self, *, page: int, page_size: int, q: str | None = None, user_type: str | None = None
-    ) -> Tuple[List[User], int]:
+    def _taken(self, field: str, values: Iterable[str]):
+        # WHERE LOWER(field) IN (...): the set-wise form of _ci(), same indexes
+        wanted = {(v or "").strip().lower() for v in values} - {""}
+        if not wanted:
+            return None
+        return (User.objects.using(self.db_alias).annotate(_key=Lower(field))
+                .filter(_key__in=wanted).values_list("_key", flat=True))
+
+    def existing_usernames(self, usernames: Iterable[str]) -> Set[str]:
+        qs = self._taken("username", usernames)
+        return set(qs) if qs is not None else set()
+
+    def existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        qs = self._taken("email", emails)
+        return set(qs) if qs is not None else set()
+
+    def get_usernames(self, ids: Iterable[int]) -> Dict[int, str]:
+        ids = {int(i) for i in ids if i is not None}
+        if not ids:
+            return {}
+        return dict(User.objects.using(self.db_alias).filter(id__in=ids).values_list("id", "username"))
+
+    def get_summaries(self, ids: Iterable[int]) -> Dict[int, dict]:
+        ids = {int(i) for i in ids if i is not None}
+        if not ids:
+            return {}
+        rows = User.objects.using(self.db_alias).filter(id__in=ids).values(*SUMMARY_FIELDS)
+        return {r["id"]: to_summary(r) for r in rows}
+
+    def _list_queryset(self, q: str | None, user_type: str | None, fields: Sequence[str] | None = None,
+                       *, rank: bool = False):
+        # rank: offset pages put the best matches first; keyset/export keep id order
         qs = User.objects.using(self.db_alias).all().order_by("-id")
-        if q:
-            s = q.strip()
-            qs = qs.filter(Q(username__icontains=s) | Q(email__icontains=s))
         if user_type:
             qs = qs.filter(user_type=user_type)
+        qs = self._search.apply(qs, q, rank=rank)
+        return qs.values(*fields) if fields else qs
+
+    def _export_queryset(self, fields: Sequence[str], q: str | None, user_type: str | None, filters: Dict[str, Any]):
+        return self._list_queryset(q, user_type).filter(**filters).order_by("id").values(*fields)
 
+    def iter_values(
+        self, fields: Sequence[str], *, chunk_size: int = 2000, q: str | None = None,
+        user_type: str | None = None, **filters
+    ) -> Iterator[Dict[str, Any]]:
+        yield from self._export_queryset(fields, q, user_type, filters).iterator(chunk_size=chunk_size)
+
+    def get_paginated(
+        self, *, page: int, page_size: int, q: str | None = None, user_type: str | None = None
+    ) -> Tuple[List[User], int]:
+        qs = self._list_queryset(q, user_type, rank=True)
         total = qs.count()
         start = max(page - 1, 0) * page_size
         end = start + page_size
         return list(qs[start:end]), total
+
+    def get_page(
+        self, *, page: int, page_size: int, q: str | None = None, user_type: str | None = None,
+        count_mode: str = "exact", fields: Sequence[str] | None = None,
+    ) -> OffsetPage:
+        return paginate(self._list_queryset(q, user_type, fields, rank=True), page, page_size, count_mode)
+
+    def get_keyset_page(
+        self, *, page_size: int, cursor: str | None = None, q: str | None = None, user_type: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> KeysetPage:
+        pager = KeysetPager("-id", page_size, cursor)
+        return pager.page(list(pager.queryset(self._list_queryset(q, user_type, fields))))
+
+    # ---------- async (Django async ORM) ----------
+    async def aget_by_id(self, id: int) -> Optional[User]:
+        return await User.objects.using(self.db_alias).filter(id=id).afirst()
+
+    async def aget_by_username(self, username: str) -> Optional[User]:
+        s = (username or "").strip()
+        if not s:
+            return None
+        return await self._ci("username", s).afirst()
+
+    async def aget_by_email(self, email: str) -> Optional[User]:
+        s = (email or "").strip()
+        if not s:
+            return None
+        return await self._ci("email", s).afirst()
+
+    async def aexists_by_username(self, username: str) -> bool:
+        s = (username or "").strip()
+        return bool(s) and await self._ci("username", s).aexists()
+
+    async def aexists_by_email(self, email: str) -> bool:
+        s = (email or "").strip()
+        return bool(s) and await self._ci("email", s).aexists()
+
+    async def aexists_email_excluding_id(self, email: str, exclude_id: int) -> bool:
+        s = (email or "").strip()
+        if not s:
+            return False
+        return await self._ci("email", s).exclude(id=exclude_id).aexists()
+
+    async def aexisting_usernames(self, usernames: Iterable[str]) -> Set[str]:
+        qs = self._taken("username", usernames)
+        return {k async for k in qs} if qs is not None else set()
+
+    async def aexisting_emails(self, emails: Iterable[str]) -> Set[str]:
+        qs = self._taken("email", emails)
+        return {k async for k in qs} if qs is not None else set()
+
+    async def aget_usernames(self, ids: Iterable[int]) -> Dict[int, str]:
+        ids = {int(i) for i in ids if i is not None}
+        if not ids:
+            return {}
+        qs = User.objects.using(self.db_alias).filter(id__in=ids).values_list("id", "username")
+        return {i: name async for i, name in qs}
+
+    async def aget_summaries(self, ids: Iterable[int]) -> Dict[int, dict]:
+        ids = {int(i) for i in ids if i is not None}
+        if not ids:
+            return {}
+        rows = User.objects.using(self.db_alias).filter(id__in=ids).values(*SUMMARY_FIELDS)
+        return {r["id"]: to_summary(r) async for r in rows}
+
+    async def aiter_values(
+        self, fields: Sequence[str], *, chunk_size: int = 2000, q: str | None = None,
+        user_type: str | None = None, **filters
+    ) -> AsyncIterator[Dict[str, Any]]:
+        async for row in self._export_queryset(fields, q, user_type, filters).aiterator(chunk_size=chunk_size):
+            yield row
+
+    async def aget_paginated(
+        self, *, page: int, page_size: int, q: str | None = None, user_type: str | None = None
+    ) -> Tuple[List[User], int]:
+        qs = self._list_queryset(q, user_type, rank=True)
+        total = await qs.acount()
+        start = max(page - 1, 0) * page_size
+        return [u async for u in qs[start:start + page_size]], total
+
+    async def aget_page(
+        self, *, page: int, page_size: int, q: str | None = None, user_type: str | None = None,
+        count_mode: str = "exact", fields: Sequence[str] | None = None,
+    ) -> OffsetPage:
+        return await apaginate(self._list_queryset(q, user_type, fields, rank=True), page, page_size, count_mode)
+
+    async def aget_keyset_page(
+        self, *, page_size: int, cursor: str | None = None, q: str | None = None, user_type: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> KeysetPage:
+        pager = KeysetPager("-id", page_size, cursor)
+        return pager.page([u async for u in pager.queryset(self._list_queryset(q, user_type, fields))])
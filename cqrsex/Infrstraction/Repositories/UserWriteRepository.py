@@ -1,4 +1,6 @@
-from typing import Any
+from typing import Any, List, Optional
+from asgiref.sync import sync_to_async
+from django.db import transaction
 from cqrsex.Application.Interfaces.Repositories.IUserWriteRepository import IUserWriteRepository
 from cqrsex.Domain.models.User import User
 
@@ -16,3 +18,22 @@ class UserWriteRepository(IUserWriteRepository):
 
     def delete_permanently(self, user: User) -> None:
         user.delete(using=self.db_alias)
+
+    def bulk_add(self, users: List[User], *, batch_size: Optional[int] = None) -> List[User]:
+        # auth_db is outside the command's UoW: keep the batches of one call together
+        with transaction.atomic(using=self.db_alias):
+            return User.objects.using(self.db_alias).bulk_create(users, batch_size=batch_size)
+
+    async def aadd(self, user: User) -> Any:
+        await user.asave(using=self.db_alias)
+        return user
+
+    async def aupdate(self, user: User) -> Any:
+        await user.asave(using=self.db_alias)
+        return user
+
+    async def adelete_permanently(self, user: User) -> None:
+        await user.adelete(using=self.db_alias)
+
+    async def abulk_add(self, users: List[User], *, batch_size: Optional[int] = None) -> List[User]:
+        return await sync_to_async(self.bulk_add)(users, batch_size=batch_size)
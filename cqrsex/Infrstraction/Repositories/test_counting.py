@@ -0,0 +1,64 @@
+# cqrsex/Infrstraction/Repositories/test_counting.py
+import asyncio
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from cqrsex.Application.Common.exceptions import ValidationException
+from cqrsex.Domain.models.BlogPost import BlogPost
+from cqrsex.Infrstraction.Repositories.Counting import apaginate, paginate
+
+
+@pytest.fixture
+def qs():
+    BlogPost.objects.bulk_create([BlogPost(title=f"p{i}", author_id=1) for i in range(12)])
+    return BlogPost.objects.order_by("id")
+
+
+def _counts(ctx) -> int:
+    return sum("COUNT(" in q["sql"].upper() for q in ctx.captured_queries)
+
+
+@pytest.mark.parametrize("mode", ["exact", "estimated", "cached"])
+def test_total_matches_the_table(qs, mode):
+    page = paginate(qs, 2, 5, mode)
+    assert [p.title for p in page.items] == ["p5", "p6", "p7", "p8", "p9"]
+    assert page.total == 12 and page.has_next
+    # SQLite has no planner estimate: estimated falls back to exact
+    assert page.count_mode == {"estimated": "exact"}.get(mode, mode)
+
+
+def test_none_skips_the_count_and_still_knows_has_next(qs):
+    with CaptureQueriesContext(connection) as ctx:
+        page = paginate(qs, 2, 5, "none")
+    assert page.total is None and page.has_next and _counts(ctx) == 0
+    assert not paginate(qs, 3, 5, "none").has_next
+
+
+def test_first_page_holding_everything_needs_no_count(qs):
+    with CaptureQueriesContext(connection) as ctx:
+        page = paginate(qs, 1, 20, "exact")
+    assert page.total == 12 and page.count_mode == "exact" and _counts(ctx) == 0
+
+
+def test_cached_count_is_reused(qs):
+    assert paginate(qs, 2, 5, "cached").total == 12
+    BlogPost.objects.create(title="late", author_id=1)
+    with CaptureQueriesContext(connection) as ctx:
+        page = paginate(qs, 2, 5, "cached")
+    # served from the count cache until COUNT_CACHE_TTL: the new row is not counted yet
+    assert page.total == 12 and _counts(ctx) == 0
+
+
+def test_unknown_mode_is_refused(qs):
+    with pytest.raises(ValidationException):
+        paginate(qs, 1, 5, "approximate")
+
+
+@pytest.mark.parametrize("mode", ["exact", "none", "cached"])
+def test_async_matches_sync(qs, mode):
+    sync = paginate(qs, 2, 5, mode)
+    page = asyncio.run(apaginate(qs, 2, 5, mode))
+    assert [p.id for p in page.items] == [p.id for p in sync.items]
+    assert (page.total, page.count_mode, page.has_next) == (sync.total, sync.count_mode, sync.has_next)
@@ -0,0 +1,78 @@
+# cqrsex/Infrstraction/Repositories/test_keyset.py
+import pytest
+
+from cqrsex.Application.Common.exceptions import ValidationException
+from cqrsex.Domain.models.BlogPost import BlogPost
+from cqrsex.Infrstraction.Repositories.BlogPostReadRepository import BlogPostReadRepository
+from cqrsex.Infrstraction.Repositories.Keyset import KeysetPager, encode_cursor
+
+
+@pytest.fixture
+def posts():
+    # author_id repeats, so ordering on it needs the id tiebreak
+    BlogPost.objects.bulk_create([BlogPost(title=f"p{i}", author_id=i % 3) for i in range(23)])
+    BlogPost.objects.filter(title="p5").update(is_deleted=True)
+    return BlogPostReadRepository()
+
+
+def _walk(repo, order_by, page_size=5):
+    pages, cursor = [], None
+    while True:
+        page = repo.get_keyset_page(page_size, cursor=cursor, order_by=order_by)
+        pages.append(page)
+        if not page.has_next:
+            return pages
+        cursor = page.next_cursor
+
+
+def _ids(page):
+    return [p.id for p in page.items]
+
+
+@pytest.mark.parametrize("order_by", ["-id", "id", "author_id", "-author_id"])
+def test_next_cursors_visit_every_row_once_in_order(posts, order_by):
+    pages = _walk(posts, order_by)
+    expected = list(BlogPost.objects.filter(is_deleted=False).order_by(order_by, order_by.replace("author_id", "id"))
+                    .values_list("id", flat=True))
+    assert [i for p in pages for i in _ids(p)] == expected
+    assert [len(p.items) for p in pages] == [5, 5, 5, 5, 2]
+    assert not pages[0].has_prev and all(p.has_prev for p in pages[1:])
+
+
+@pytest.mark.parametrize("order_by", ["-id", "author_id"])
+def test_prev_cursors_walk_back_to_the_same_pages(posts, order_by):
+    pages = _walk(posts, order_by)
+    page = pages[-1]
+    for expected in reversed(pages[:-1]):
+        page = posts.get_keyset_page(5, cursor=page.prev_cursor, order_by=order_by)
+        assert _ids(page) == _ids(expected)
+        assert page.has_next
+    assert not page.has_prev
+
+
+def test_values_rows_page_like_models(posts):
+    models = _walk(posts, "author_id")
+    rows = []
+    cursor = None
+    while True:
+        page = posts.get_keyset_page(5, cursor=cursor, order_by="author_id", fields=("id", "author_id"))
+        rows.extend(r["id"] for r in page.items)
+        if not page.has_next:
+            break
+        cursor = page.next_cursor
+    assert rows == [i for p in models for i in _ids(p)]
+
+
+def test_empty_listing_has_no_cursors(posts):
+    page = posts.get_keyset_page(5, title="missing")
+    assert page.items == [] and not page.has_next and not page.has_prev
+
+
+def test_garbage_cursor_is_a_validation_error():
+    with pytest.raises(ValidationException):
+        KeysetPager("-id", 5, "not-a-cursor!")
+
+
+def test_cursor_from_another_ordering_is_refused():
+    with pytest.raises(ValidationException):
+        KeysetPager("-id", 5, encode_cursor("author_id", [1, 2], "next"))
@@ -1,12 +1,136 @@
 # cqrsex/Infrstraction/Saga/MultiSaga.py
 from __future__ import annotations
-from typing import Any, Iterable
-from cqrsex.Application.Interfaces.Common.ISaga import ISaga
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.db import close_old_connections
+
+from cqrsex.Application.Interfaces.Common.ISaga import ISaga, SagaFailures, SagaTimeout
+from cqrsex.Infrstraction.Saga.SagaMetrics import SagaMetrics
+
+log = logging.getLogger(__name__)
+
 
 class MultiSaga(ISaga):
-    def __init__(self, sagas: Iterable[ISaga]) -> None:
+    """
+    Runs every event through each of its sagas.
+
+    - sequential (fan_out_workers=0): in list order, on the calling thread.
+    - fan-out: sagas declaring `independent = True` run on a thread pool while the
+      others, the ordering-dependent chain, still run in list order on the calling
+      thread. Dispatch latency becomes max(saga) instead of sum(saga).
+
+    Failures are isolated: a failing or timed-out saga is logged and the rest still
+    run; afterwards all of them are raised together as SagaFailures. `timeout` bounds
+    how long a fanned-out saga is waited for (ISaga.timeout overrides it per saga); the
+    thread itself cannot be interrupted and finishes in the background. before_commit
+    always runs sequentially: it shares the emitting transaction.
+    """
+
+    def __init__(
+        self,
+        sagas: Iterable[ISaga],
+        *,
+        fan_out_workers: int = 0,
+        timeout: Optional[float] = None,
+        independent: bool = False,
+        metrics: Optional[SagaMetrics] = None,
+    ) -> None:
         self._sagas = list(sagas)
+        self._workers = max(int(fan_out_workers or 0), 0)
+        self._timeout = timeout
+        # a MultiSaga nested in another can itself be one independent unit
+        self.independent = independent
+        self.metrics = metrics or SagaMetrics()
+        # a lone saga gains nothing from a thread hop
+        fan_out = self._workers and len(self._sagas) > 1
+        self._parallel = [s for s in self._sagas if s.independent] if fan_out else []
+        self._chain = [s for s in self._sagas if s not in self._parallel]
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    # ---------- execution ----------
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self._workers, thread_name_prefix="saga-fanout")
+        return self._executor
+
+    def _call(self, saga: ISaga, method: str, arg: Any) -> Optional[BaseException]:
+        started, ok = time.perf_counter(), False
+        try:
+            getattr(saga, method)(arg)
+            ok = True
+            return None
+        except Exception as ex:
+            log.exception("[MultiSaga] %s.%s failed", saga.name, method)
+            return ex
+        finally:
+            self.metrics.observe(saga.name, time.perf_counter() - started, ok=ok)
 
+    def _call_pooled(self, saga: ISaga, method: str, arg: Any) -> Optional[BaseException]:
+        # pool threads are long-lived: honour CONN_MAX_AGE before and after, like SagaWorkerPool
+        close_old_connections()
+        try:
+            return self._call(saga, method, arg)
+        finally:
+            close_old_connections()
+
+    def _run(self, method: str, arg: Any) -> None:
+        submitted: List[Tuple[ISaga, Future, Optional[float]]] = []
+        if self._parallel:
+            pool, now = self._pool(), time.monotonic()
+            for s in self._parallel:
+                limit = s.timeout if s.timeout is not None else self._timeout
+                deadline = now + limit if limit is not None else None
+                submitted.append((s, pool.submit(self._call_pooled, s, method, arg), deadline))
+
+        failures: List[Tuple[ISaga, BaseException]] = []
+        for s in self._chain:
+            ex = self._call(s, method, arg)
+            if ex is not None:
+                failures.append((s, ex))
+
+        for s, fut, deadline in submitted:
+            try:
+                ex = fut.result(None if deadline is None else max(deadline - time.monotonic(), 0))
+            except FutureTimeout:
+                self.metrics.timeout(s.name)
+                log.error("[MultiSaga] %s.%s timed out; left running in the background", s.name, method)
+                ex = SagaTimeout(f"{s.name} did not finish within {s.timeout or self._timeout}s")
+            if ex is not None:
+                failures.append((s, ex))
+        if failures:
+            raise SagaFailures(failures)
+
+    # ---------- ISaga ----------
     def process(self, event: Any) -> None:
+        self._run("process", event)
+
+    def process_many(self, events: Sequence[Any]) -> None:
+        self._run("process_many", events)
+
+    def before_commit(self, event: Any) -> None:
         for s in self._sagas:
-            s.process(event)
+            s.before_commit(event)
+
+    # ---------- lifecycle / metrics ----------
+    @property
+    def sagas(self) -> List[ISaga]:
+        return list(self._sagas)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def saga_metrics(self) -> Dict[str, Any]:
+        return {
+            "mode": "fan-out" if self._parallel else "sequential",
+            "parallel": [s.name for s in self._parallel],
+            "chain": [s.name for s in self._chain],
+            "sagas": self.metrics.snapshot(),
+        }
@@ -1,14 +1,18 @@
 # cqrsex/Infrstraction/Saga/SagaDispatcher.py
 from __future__ import annotations
 import logging
+import uuid
 from types import SimpleNamespace
-from typing import Any, Optional, Callable
+from typing import Any, List, Optional, Callable
 
-from injector import inject
+from injector import inject, NoInject
 from django.db import transaction, connections, DEFAULT_DB_ALIAS
 
 from cqrsex.Application.Interfaces.Common.ISagaDispatcher import ISagaDispatcher
 from cqrsex.Application.Interfaces.Common.ISaga import ISaga
+from cqrsex.Infrstraction.Outbox.OutboxBuffer import OutboxBuffer
+from cqrsex.Infrstraction.Saga.SagaRetryQueue import SagaRetryQueue
+from cqrsex.Infrstraction.Saga.SagaWorkerPool import SagaWorkerPool
 
 log = logging.getLogger(__name__)
 
@@ -25,8 +29,21 @@ def _infer_alias(using: Optional[str]) -> str:
 
 class SagaDispatcher(ISagaDispatcher):
     @inject
-    def __init__(self, saga: ISaga) -> None:
+    def __init__(
+        self,
+        saga: ISaga,
+        pool: NoInject[Optional[SagaWorkerPool]] = None,
+        retry: NoInject[Optional[SagaRetryQueue]] = None,
+    ) -> None:
         self._saga = saga
+        # pool: post-commit sagas run on worker threads instead of the committing request
+        self._pool = pool
+        # retry: failed invocations are queued for the retrier instead of being lost
+        self._retry = retry
+
+    @property
+    def pool(self) -> Optional[SagaWorkerPool]:
+        return self._pool
 
     def _dispatch_now(self, evt: Any) -> None:
         log.info(
@@ -35,10 +52,31 @@ class SagaDispatcher(ISagaDispatcher):
             getattr(evt, "action", None),
             getattr(evt, "db_alias", None),
         )
+        if self._pool is not None and self._pool.submit(evt):
+            return
         try:
             self._saga.process(evt)
-        except Exception:
+        except Exception as ex:
             log.exception("Saga dispatch failed")
+            self._record(ex, [evt])
+
+    def _dispatch_many(self, items: List[Any]) -> None:
+        events = [i() if callable(i) else i for i in items]
+        log.info("[SagaDispatcher] dispatching %d event(s) committed together", len(events))
+        if self._pool is not None:
+            # per-aggregate queues keep their ordering; only events the pool refuses run here
+            events = [e for e in events if not self._pool.submit(e)]
+            if not events:
+                return
+        try:
+            self._saga.process_many(events)
+        except Exception as ex:
+            log.exception("Saga dispatch failed")
+            self._record(ex, events)
+
+    def _record(self, ex: BaseException, events: List[Any]) -> None:
+        if self._retry is not None:
+            self._retry.record(self._saga, ex, events)
 
     def after_commit(
         self,
@@ -47,6 +85,15 @@ class SagaDispatcher(ISagaDispatcher):
         using: Optional[str] = None,
     ) -> None:
         alias = _infer_alias(using)
+        buffer = OutboxBuffer.current(alias)
+        if buffer is not None:
+            if not callable(evt_or_factory):
+                # a UoW is open on this alias: let sagas record in-transaction work (outbox rows)
+                # now; errors here must fail the command, so they are not swallowed
+                self._saga.before_commit(evt_or_factory)
+            # everything the UoW emits reaches the sagas as one process_many after commit
+            buffer.defer(self._dispatch_many, evt_or_factory)
+            return
         log.info("[SagaDispatcher] scheduled on_commit for alias=%s", alias)
 
         def _runner():
@@ -75,5 +122,7 @@ class SagaDispatcher(ISagaDispatcher):
             aggregate_id=aggregate_id,
             db_alias=alias,
             command=command,
+            # unique per emit: keeps retry idempotency keys of identical events apart
+            event_id=uuid.uuid4().hex,
         )
         self.after_commit(evt, using=alias)
@@ -0,0 +1,76 @@
+# cqrsex/Infrstraction/Saga/SagaMetrics.py
+from __future__ import annotations
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+# upper bounds in milliseconds; a last, open bucket catches the rest
+BUCKETS_MS: Sequence[float] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; percentiles are bucket upper bounds (never under-reported)."""
+
+    def __init__(self, buckets_ms: Sequence[float] = BUCKETS_MS) -> None:
+        self.bounds = list(buckets_ms)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.total:
+            return None
+        rank, seen = q * self.total, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else round(self.max_ms, 2)
+        return round(self.max_ms, 2)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.total,
+            "avg_ms": round(self.sum_ms / self.total, 2) if self.total else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 2),
+            "buckets": {**{f"le_{b:g}": n for b, n in zip(self.bounds, self.counts)}, "inf": self.counts[-1]},
+        }
+
+
+class SagaMetrics:
+    """Per-saga latency histograms and outcome counters for MultiSaga."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _entry(self, saga: str) -> Dict[str, int]:
+        counters = self._counters.get(saga)
+        if counters is None:
+            counters = self._counters[saga] = {"ok": 0, "failed": 0, "timeouts": 0}
+            self._latency[saga] = LatencyHistogram()
+        return counters
+
+    def observe(self, saga: str, seconds: float, *, ok: bool) -> None:
+        with self._lock:
+            self._entry(saga)["ok" if ok else "failed"] += 1
+            self._latency[saga].observe(seconds * 1000)
+
+    def timeout(self, saga: str) -> None:
+        with self._lock:
+            self._entry(saga)["timeouts"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {name: {**counters, "latency": self._latency[name].snapshot()}
+                    for name, counters in self._counters.items()}
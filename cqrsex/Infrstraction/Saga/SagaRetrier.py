@@ -0,0 +1,148 @@
+# cqrsex/Infrstraction/Saga/SagaRetrier.py
+from __future__ import annotations
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import transaction
+
+from cqrsex.Application.Interfaces.Common.ISaga import ISaga
+from cqrsex.Infrstraction.Saga.SagaRetryQueue import SagaRetryQueue, decode_event, describe
+
+log = logging.getLogger(__name__)
+
+
+class SagaRetrier:
+    """
+    Re-runs failed saga invocations from saga_retries.
+
+    One poll = load the spool file, then one transaction that claims due rows FOR UPDATE
+    SKIP LOCKED and runs each through its saga (by name; members of a MultiSaga are
+    looked up individually) inside a savepoint:
+      - success: the row is deleted in the same transaction as the saga's writes, so
+        sagas writing to the retry database are applied exactly once;
+      - failure: the savepoint rolls back, attempts + 1, next attempt after exponential
+        backoff with jitter; after max_attempts the row moves to saga_dead_letters.
+    Sagas writing elsewhere (auth_db) are at-least-once. Run several retriers on
+    PostgreSQL/MySQL to scale out.
+    """
+
+    def __init__(
+        self,
+        queue: SagaRetryQueue,
+        saga: ISaga,
+        *,
+        batch_size: int = 100,
+        idle_backoff: Tuple[float, float] = (0.5, 10.0),
+    ) -> None:
+        self.queue = queue
+        self.db_alias = queue.db_alias
+        self.batch_size = max(int(batch_size), 1)
+        self.idle_min, self.idle_max = idle_backoff
+        self._sagas = self._index(saga)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._m: Dict[str, float] = {"polls": 0, "retried": 0, "succeeded": 0, "failed": 0, "dead": 0, "busy_seconds": 0.0}
+
+    @staticmethod
+    def _index(saga: ISaga) -> Dict[str, ISaga]:
+        out: Dict[str, ISaga] = {}
+        stack = [saga]
+        while stack:
+            s = stack.pop()
+            out.setdefault(s.name, s)
+            stack.extend(getattr(s, "sagas", ()))
+        return out
+
+    # ---------- one poll ----------
+    def _retry(self, row: Any) -> Optional[str]:
+        """Run one row; None on success, else the error."""
+        saga = self._sagas.get(row.saga)
+        if saga is None:
+            return f"unknown saga {row.saga!r}"
+        try:
+            with transaction.atomic(using=self.db_alias):
+                saga.process(decode_event(row.event))
+        except Exception as ex:
+            log.warning("[SagaRetrier] %s attempt %d failed: %s", row.saga, row.attempts + 1, ex)
+            return describe(ex)
+        return None
+
+    def retry_once(self) -> int:
+        """One poll; returns the number of invocations attempted."""
+        try:
+            self.queue.drain_spool()
+        except Exception:
+            log.exception("[SagaRetrier] spool load failed; will retry")
+        started = time.perf_counter()
+        done: List[int] = []
+        failed = dead = 0
+        try:
+            with transaction.atomic(using=self.db_alias):
+                rows = self.queue.repo.claim_due(self.batch_size)
+                for row in rows:
+                    error = self._retry(row)
+                    if error is None:
+                        done.append(row.id)
+                    elif row.attempts + 1 >= self.queue.max_attempts:
+                        dead += 1
+                        self.queue.repo.bury(row, error)
+                        log.error("[SagaRetrier] %s gave up after %d attempts; dead-lettered key=%s",
+                                  row.saga, row.attempts + 1, row.idempotency_key)
+                    else:
+                        failed += 1
+                        self.queue.repo.reschedule(row, error, self.queue.next_attempt_at(row.attempts + 1))
+                self.queue.repo.delete(done)
+        except Exception:
+            # lost the connection mid-batch: nothing was recorded, the rows come back next poll
+            log.exception("[SagaRetrier] batch failed; will retry")
+            return 0
+        with self._lock:
+            self._m["polls"] += 1
+            self._m["retried"] += len(rows)
+            self._m["succeeded"] += len(done)
+            self._m["failed"] += failed
+            self._m["dead"] += dead
+            self._m["busy_seconds"] += time.perf_counter() - started
+        return len(rows)
+
+    # ---------- loops ----------
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run(self, *, max_polls: Optional[int] = None, metrics_every: Optional[float] = None) -> None:
+        """Poll until stop(); back off exponentially (with jitter) while nothing is due."""
+        self._stop.clear()
+        idle, polls, last_report = 0, 0, time.monotonic()
+        while not self._stop.is_set() and (max_polls is None or polls < max_polls):
+            polls += 1
+            if self.retry_once():
+                idle = 0
+            else:
+                delay = min(self.idle_max, self.idle_min * (2 ** idle))
+                idle = min(idle + 1, 16)
+                self._stop.wait(delay * random.uniform(0.5, 1.0))
+            if metrics_every and time.monotonic() - last_report >= metrics_every:
+                log.info("[SagaRetrier] %s", self.metrics())
+                last_report = time.monotonic()
+
+    def run_until_empty(self) -> int:
+        """Attempt everything due now (tests, cron, one-shot). Returns invocations attempted."""
+        total = 0
+        while True:
+            n = self.retry_once()
+            if not n:
+                return total
+            total += n
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            m = dict(self._m)
+        try:
+            depth = self.queue.depth()
+        except Exception:
+            depth = None
+        return {**{k: int(v) for k, v in m.items() if k != "busy_seconds"},
+                "busy_seconds": round(m["busy_seconds"], 3), "recorded": self.queue.metrics(), "depth": depth}
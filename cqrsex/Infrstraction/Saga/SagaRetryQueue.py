@@ -0,0 +1,191 @@
+# cqrsex/Infrstraction/Saga/SagaRetryQueue.py
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from cqrsex.Application.Interfaces.Common.ISaga import ISaga, SagaEventFailures, SagaFailures, SagaTimeout
+from cqrsex.Application.Interfaces.Repositories.ISagaRetryRepository import ISagaRetryRepository
+
+log = logging.getLogger(__name__)
+
+MAX_ERROR_CHARS = 2_000
+
+
+def encode_event(event: Any) -> Dict[str, Any]:
+    """The event's public attributes as plain JSON (UUIDs, datetimes, decimals become strings)."""
+    data = {k: v for k, v in vars(event).items() if not k.startswith("_")}
+    return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+
+
+def decode_event(data: Dict[str, Any]) -> SimpleNamespace:
+    return SimpleNamespace(**data)
+
+
+def idempotency_key(saga: str, data: Dict[str, Any]) -> str:
+    # emit() stamps each event with a unique event_id, so two identical emits stay two keys
+    raw = json.dumps([saga, data], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def describe(ex: BaseException) -> str:
+    return f"{type(ex).__name__}: {ex}"[:MAX_ERROR_CHARS]
+
+
+class SagaRetryQueue:
+    """
+    Records failed saga invocations in saga_retries for the retrier (manage.py saga_retry).
+
+    One row per (saga, event) that failed: SagaFailures from MultiSaga narrows it to the
+    sagas that failed, SagaEventFailures to the events. The idempotency key is a hash of
+    both, so recording the same failure twice (pool and inline path, a crash between
+    retry and delete) keeps one row. Fanned-out sagas that timed out are not recorded:
+    they may still finish on their own.
+
+    If the database is unreachable (often the reason the saga failed) rows go to an
+    append-only JSONL spool file instead; the retrier loads it into the table.
+    """
+
+    def __init__(
+        self,
+        repo: ISagaRetryRepository,
+        *,
+        db_alias: str = "default",
+        max_attempts: int = 8,
+        base_delay: float = 1.0,
+        max_delay: float = 600.0,
+        spool_path: Optional[str] = None,
+    ) -> None:
+        self.repo = repo.using(db_alias)
+        self.db_alias = db_alias
+        self.max_attempts = max(int(max_attempts), 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.spool_path = os.fspath(spool_path) if spool_path else None
+        self._lock = threading.Lock()
+        self._m = {"recorded": 0, "spooled": 0, "lost": 0, "skipped_timeouts": 0}
+
+    # ---------- schedule ----------
+    def backoff(self, attempts: int) -> float:
+        """Seconds before the next attempt after `attempts` failures: exponential, equal jitter."""
+        delay = min(self.max_delay, self.base_delay * (2 ** max(attempts - 1, 0)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def next_attempt_at(self, attempts: int, now: Optional[datetime] = None) -> datetime:
+        return (now or timezone.now()) + timedelta(seconds=self.backoff(attempts))
+
+    # ---------- record ----------
+    def _invocations(self, saga: ISaga, ex: BaseException, events: Sequence[Any]) -> Iterator[Tuple[str, Any, BaseException]]:
+        if isinstance(ex, SagaFailures):
+            for s, e in ex.failures:
+                yield from self._invocations(s, e, events)
+        elif isinstance(ex, SagaEventFailures):
+            for evt, e in ex.failures:
+                yield saga.name, evt, e
+        elif isinstance(ex, SagaTimeout):
+            self._bump("skipped_timeouts")
+            log.warning("[SagaRetry] %s timed out; not retried (it may still complete)", saga.name)
+        else:
+            for evt in events:
+                yield saga.name, evt, ex
+
+    def record(self, saga: ISaga, ex: BaseException, events: Sequence[Any]) -> int:
+        """Queue what `ex` says failed out of `events`; returns the invocations recorded."""
+        now = timezone.now()
+        rows: List[Dict[str, Any]] = []
+        for name, evt, err in self._invocations(saga, ex, events):
+            try:
+                data = encode_event(evt)
+            except Exception:
+                self._bump("lost")
+                log.exception("[SagaRetry] cannot serialize event for %s; not retried: %r", name, evt)
+                continue
+            rows.append(dict(
+                saga=name,
+                idempotency_key=idempotency_key(name, data),
+                event=data,
+                attempts=1,
+                last_error=describe(err),
+                next_attempt_at=self.next_attempt_at(1, now),
+            ))
+        if not rows:
+            return 0
+        try:
+            self.repo.add_many(rows)
+            self._bump("recorded", len(rows))
+        except Exception:
+            log.exception("[SagaRetry] cannot queue %d retry(ies) in %s; spooling", len(rows), self.db_alias)
+            self._spool(rows)
+        return len(rows)
+
+    # ---------- spool ----------
+    def _spool(self, rows: List[Dict[str, Any]]) -> None:
+        if not self.spool_path:
+            self._bump("lost", len(rows))
+            log.error("[SagaRetry] no SPOOL_PATH; %d failed invocation(s) dropped", len(rows))
+            return
+        lines = "".join(json.dumps(r, cls=DjangoJSONEncoder) + "\n" for r in rows)
+        try:
+            with self._lock:
+                os.makedirs(os.path.dirname(self.spool_path) or ".", exist_ok=True)
+                with open(self.spool_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+        except OSError:
+            self._bump("lost", len(rows))
+            log.exception("[SagaRetry] spool write failed; %d failed invocation(s) dropped", len(rows))
+            return
+        self._bump("spooled", len(rows))
+
+    def drain_spool(self) -> int:
+        """Move spooled rows into the table; returns how many. Safe to call from several retriers."""
+        if not self.spool_path:
+            return 0
+        draining = self.spool_path + ".draining"
+        try:
+            # writers append to a fresh file from here on; a leftover .draining is a
+            # previous drain that failed half way (rows already queued are skipped by key)
+            if not os.path.exists(draining):
+                os.replace(self.spool_path, draining)
+            with open(draining, encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return 0
+        for r in rows:
+            r["next_attempt_at"] = datetime.fromisoformat(r["next_attempt_at"])
+        self.repo.add_many(rows)
+        os.remove(draining)
+        if rows:
+            log.info("[SagaRetry] loaded %d spooled retry(ies)", len(rows))
+        return len(rows)
+
+    # ---------- metrics ----------
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self._m[key] += n
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._m)
+
+    def depth(self) -> Dict[str, Any]:
+        """Retry queue depth (saga_retries / saga_dead_letters) plus spooled bytes not yet loaded."""
+        out = self.repo.depth()
+        spooled = 0
+        for path in filter(None, (self.spool_path, self.spool_path and self.spool_path + ".draining")):
+            try:
+                spooled += os.path.getsize(path)
+            except OSError:
+                pass
+        out["spool_bytes"] = spooled
+        return out
@@ -0,0 +1,185 @@
+# cqrsex/Infrstraction/Saga/SagaWorkerPool.py
+from __future__ import annotations
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from django.db import close_old_connections, connections
+
+from cqrsex.Application.Interfaces.Common.ISaga import ISaga
+from cqrsex.Infrstraction.Saga.SagaRetryQueue import SagaRetryQueue
+
+log = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class SagaWorkerPool:
+    """
+    Runs ISaga.process for committed events on N worker threads, off the request path.
+
+    - ordering: events of one aggregate (entity, aggregate_id) always land on the same
+      worker's FIFO queue, so they are processed in commit order; events without an
+      aggregate id are spread round-robin.
+    - backpressure: each worker queue is bounded (queue_size). When full, `overflow`
+      decides: "block" (caller waits, up to put_timeout, then runs it inline),
+      "inline" (caller runs it now; may overtake queued events of that aggregate) or
+      "drop" (logged and counted).
+    - shutdown(drain=True) stops intake and waits for queued events to finish.
+    """
+
+    OVERFLOW = ("block", "inline", "drop")
+
+    def __init__(
+        self,
+        saga: ISaga,
+        *,
+        workers: int = 4,
+        queue_size: int = 1_000,
+        overflow: str = "block",
+        put_timeout: Optional[float] = None,
+        name: str = "saga",
+        retry: Optional[SagaRetryQueue] = None,
+    ) -> None:
+        if overflow not in self.OVERFLOW:
+            raise ValueError(f"overflow must be one of {self.OVERFLOW}")
+        self._saga = saga
+        # failures are queued for the retrier instead of being lost
+        self._retry = retry
+        self._overflow = overflow
+        self._put_timeout = put_timeout
+        self._queues: List[queue.Queue] = [queue.Queue(maxsize=max(int(queue_size), 1)) for _ in range(max(int(workers), 1))]
+        self._rr = itertools.count()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._m: Dict[str, float] = {
+            "submitted": 0, "processed": 0, "failed": 0, "inline": 0, "dropped": 0,
+            "max_depth": 0, "lag_total": 0.0, "lag_max": 0.0, "last_lag": 0.0, "busy_seconds": 0.0,
+        }
+        self._threads = [
+            threading.Thread(target=self._work, args=(q,), name=f"{name}-worker-{i}", daemon=True)
+            for i, q in enumerate(self._queues)
+        ]
+        for t in self._threads:
+            t.start()
+
+    # ---------- intake ----------
+    def _slot(self, evt: Any) -> queue.Queue:
+        agg = getattr(evt, "aggregate_id", None)
+        if agg is None:
+            return self._queues[next(self._rr) % len(self._queues)]
+        return self._queues[hash((getattr(evt, "entity", None), str(agg))) % len(self._queues)]
+
+    def _bump(self, key: str, n: float = 1) -> None:
+        with self._lock:
+            self._m[key] += n
+
+    def _run_inline(self, evt: Any) -> None:
+        self._bump("inline")
+        self._process(evt, time.monotonic())
+
+    def submit(self, evt: Any) -> bool:
+        """Queue `evt`; False once the pool is shut down (caller should run it itself)."""
+        if self._closed:
+            return False
+        q = self._slot(evt)
+        item = (evt, time.monotonic())
+        try:
+            if self._overflow == "block":
+                q.put(item, timeout=self._put_timeout)
+            else:
+                q.put_nowait(item)
+        except queue.Full:
+            if self._overflow == "drop":
+                self._bump("dropped")
+                log.error("[SagaWorkerPool] queue full, dropped entity=%s action=%s",
+                          getattr(evt, "entity", None), getattr(evt, "action", None))
+            else:
+                self._run_inline(evt)
+            return True
+        with self._lock:
+            self._m["submitted"] += 1
+            self._m["max_depth"] = max(self._m["max_depth"], q.qsize())
+        return True
+
+    # ---------- workers ----------
+    def _process(self, evt: Any, enqueued: float) -> None:
+        started = time.monotonic()
+        lag = started - enqueued
+        try:
+            self._saga.process(evt)
+            ok = True
+        except Exception as ex:
+            ok = False
+            log.exception("[SagaWorkerPool] saga failed entity=%s action=%s",
+                          getattr(evt, "entity", None), getattr(evt, "action", None))
+            if self._retry is not None:
+                self._retry.record(self._saga, ex, [evt])
+        with self._lock:
+            self._m["processed" if ok else "failed"] += 1
+            self._m["lag_total"] += lag
+            self._m["lag_max"] = max(self._m["lag_max"], lag)
+            self._m["last_lag"] = lag
+            self._m["busy_seconds"] += time.monotonic() - started
+
+    def _work(self, q: queue.Queue) -> None:
+        try:
+            while True:
+                item = q.get()
+                try:
+                    if item is _STOP:
+                        return
+                    # long-lived thread: honour CONN_MAX_AGE / drop broken connections
+                    close_old_connections()
+                    self._process(*item)
+                finally:
+                    q.task_done()
+        finally:
+            connections.close_all()
+
+    # ---------- lifecycle / metrics ----------
+    def shutdown(self, *, drain: bool = True, timeout: Optional[float] = None) -> int:
+        """Stop intake; with drain, finish queued events. Returns events left unprocessed."""
+        self._closed = True
+        left = 0
+        if not drain:
+            for q in self._queues:
+                while True:
+                    try:
+                        q.get_nowait()
+                        q.task_done()
+                        left += 1
+                    except queue.Empty:
+                        break
+        for q in self._queues:
+            q.put(_STOP)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for t in self._threads:
+            t.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+        left += sum(max(q.qsize() - 1, 0) for q, t in zip(self._queues, self._threads) if t.is_alive())
+        if left:
+            log.warning("[SagaWorkerPool] shutdown left %s event(s) unprocessed", left)
+        return left
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            m = dict(self._m)
+        done = m["processed"] + m["failed"]
+        return {
+            "workers": len(self._queues),
+            "queue_depth": sum(q.qsize() for q in self._queues),
+            "max_depth": int(m["max_depth"]),
+            "submitted": int(m["submitted"]),
+            "processed": int(m["processed"]),
+            "failed": int(m["failed"]),
+            "inline": int(m["inline"]),
+            "dropped": int(m["dropped"]),
+            "avg_lag_ms": round(1000 * m["lag_total"] / done, 2) if done else None,
+            "max_lag_ms": round(1000 * m["lag_max"], 2),
+            "last_lag_ms": round(1000 * m["last_lag"], 2),
+            "avg_process_ms": round(1000 * m["busy_seconds"] / done, 2) if done else None,
+            "closed": self._closed,
+        }
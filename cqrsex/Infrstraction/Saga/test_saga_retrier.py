@@ -0,0 +1,134 @@
+# cqrsex/Infrstraction/Saga/test_saga_retrier.py
+import os
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from django.conf import settings
+from django.utils import timezone
+
+from cqrsex.Application.Interfaces.Common.ISaga import ISaga, SagaFailures
+from cqrsex.Domain.models.BlogPost import BlogPost
+from cqrsex.Domain.models.SagaDeadLetter import SagaDeadLetter
+from cqrsex.Domain.models.SagaRetry import SagaRetry
+from cqrsex.Infrstraction.Repositories.SagaRetryRepository import SagaRetryRepository
+from cqrsex.Infrstraction.Saga.MultiSaga import MultiSaga
+from cqrsex.Infrstraction.Saga.SagaRetrier import SagaRetrier
+from cqrsex.Infrstraction.Saga.SagaRetryQueue import SagaRetryQueue
+
+
+class Flaky(ISaga):
+    """Writes a post, then fails the first `failures` calls (the write must roll back)."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def process(self, evt) -> None:
+        self.calls += 1
+        BlogPost.objects.create(title=evt.title, author_id=1)
+        if self.calls <= self.failures:
+            raise RuntimeError(f"attempt {self.calls}")
+
+
+class Other(Flaky):
+    pass
+
+
+def _queue(**kw) -> SagaRetryQueue:
+    return SagaRetryQueue(SagaRetryRepository(), **{"max_attempts": 3, "base_delay": 0, **kw})
+
+
+def _fail_once(queue, saga, title="t"):
+    evt = SimpleNamespace(event_id=title, title=title)
+    queue.record(saga, RuntimeError("first run"), [evt])
+
+
+def test_success_applies_the_write_and_deletes_the_row():
+    queue, saga = _queue(), Flaky(failures=0)
+    _fail_once(queue, saga)
+    assert SagaRetrier(queue, saga).retry_once() == 1
+    assert SagaRetry.objects.count() == 0
+    assert list(BlogPost.objects.values_list("title", flat=True)) == ["t"]
+
+
+def test_failure_is_rescheduled_with_its_writes_rolled_back():
+    queue, saga = _queue(base_delay=60), Flaky(failures=1)
+    _fail_once(queue, saga)
+    SagaRetry.objects.update(next_attempt_at=timezone.now())
+    retrier = SagaRetrier(queue, saga)
+
+    assert retrier.retry_once() == 1
+    row = SagaRetry.objects.get()
+    assert row.attempts == 2 and row.last_error == "RuntimeError: attempt 1"
+    # exponential backoff: attempt 2 waits base_delay * 2 with equal jitter
+    assert timedelta(seconds=59) <= row.next_attempt_at - timezone.now() <= timedelta(seconds=121)
+    assert not BlogPost.objects.exists()
+    assert retrier.retry_once() == 0          # not due yet
+
+    SagaRetry.objects.update(next_attempt_at=timezone.now())
+    assert retrier.retry_once() == 1
+    assert not SagaRetry.objects.exists()
+    assert BlogPost.objects.count() == 1
+    assert retrier.metrics()["succeeded"] == 1 and retrier.metrics()["failed"] == 1
+
+
+def test_last_attempt_buries_the_row():
+    queue, saga = _queue(), Flaky(failures=99)
+    _fail_once(queue, saga)
+    retrier = SagaRetrier(queue, saga)
+    assert retrier.run_until_empty() == 2     # attempts 2 and 3; max_attempts=3
+    assert not SagaRetry.objects.exists()
+    dead = SagaDeadLetter.objects.get()
+    assert (dead.saga, dead.attempts, dead.last_error) == ("Flaky", 3, "RuntimeError: attempt 2")
+    assert dead.event == {"event_id": "t", "title": "t"}
+    assert not BlogPost.objects.exists()
+    assert retrier.metrics()["dead"] == 1
+
+
+def test_requeued_dead_letter_gets_a_fresh_run():
+    queue, saga = _queue(), Flaky(failures=2)
+    _fail_once(queue, saga)
+    retrier = SagaRetrier(queue, saga)
+    retrier.run_until_empty()
+    assert SagaDeadLetter.objects.count() == 1
+    assert queue.repo.requeue_dead() == 1
+    assert retrier.run_until_empty() == 1
+    assert not SagaDeadLetter.objects.exists() and not SagaRetry.objects.exists()
+    assert BlogPost.objects.count() == 1
+
+
+def test_recording_the_same_failure_twice_keeps_one_row():
+    queue, saga = _queue(), Flaky(failures=0)
+    _fail_once(queue, saga)
+    _fail_once(queue, saga)
+    _fail_once(queue, saga, title="u")
+    assert SagaRetry.objects.count() == 2
+
+
+def test_multisaga_failure_is_retried_per_member():
+    flaky, other = Flaky(failures=0), Other(failures=0)
+    queue = _queue()
+    evt = SimpleNamespace(event_id="e", title="t")
+    queue.record(MultiSaga([flaky, other]), SagaFailures([(other, RuntimeError("x"))]), [evt])
+    assert list(SagaRetry.objects.values_list("saga", flat=True)) == ["Other"]
+    SagaRetrier(queue, MultiSaga([flaky, other])).run_until_empty()
+    assert (flaky.calls, other.calls) == (0, 1)
+
+
+def test_unknown_saga_ends_in_the_dead_letters():
+    queue = _queue()
+    _fail_once(queue, Other(failures=0))
+    SagaRetrier(queue, Flaky(failures=0)).run_until_empty()
+    assert SagaDeadLetter.objects.get().last_error == "unknown saga 'Other'"
+
+
+def test_unreachable_database_spools_and_the_retrier_loads_it():
+    spool = settings.CQRS_SAGA_RETRY["SPOOL_PATH"]
+    down = SagaRetryQueue(SagaRetryRepository(), db_alias="missing", spool_path=spool, base_delay=0)
+    _fail_once(down, Flaky(failures=0))
+    assert down.metrics()["spooled"] == 1 and os.path.getsize(spool) > 0
+
+    queue, saga = _queue(spool_path=spool), Flaky(failures=0)
+    assert SagaRetrier(queue, saga).run_until_empty() == 1
+    assert saga.calls == 1 and not os.path.exists(spool)
@@ -0,0 +1,116 @@
+# cqrsex/Infrstraction/Saga/test_saga_worker_pool.py
+import random
+import threading
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+from cqrsex.Application.Interfaces.Common.ISaga import ISaga
+from cqrsex.Domain.models.SagaRetry import SagaRetry
+from cqrsex.Infrstraction.Repositories.SagaRetryRepository import SagaRetryRepository
+from cqrsex.Infrstraction.Saga.SagaRetryQueue import SagaRetryQueue
+from cqrsex.Infrstraction.Saga.SagaWorkerPool import SagaWorkerPool
+
+
+def event(aggregate_id, seq, **extra):
+    return SimpleNamespace(entity="BlogPost", action="Updated", aggregate_id=aggregate_id, seq=seq, **extra)
+
+
+class Recorder(ISaga):
+    """Records (aggregate, seq, thread) in processing order; optional jitter, gate and failures."""
+
+    def __init__(self, jitter: float = 0.0) -> None:
+        self.jitter = jitter
+        self.seen = []
+        self.started = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+        self._lock = threading.Lock()
+
+    def process(self, evt) -> None:
+        if getattr(evt, "hold", False):
+            self.started.set()
+            self.gate.wait(5)
+        if self.jitter:
+            time.sleep(random.uniform(0, self.jitter))
+        if getattr(evt, "fail", False):
+            raise RuntimeError(f"boom {evt.seq}")
+        with self._lock:
+            self.seen.append((evt.aggregate_id, evt.seq, threading.current_thread().name))
+
+
+def test_events_of_one_aggregate_are_processed_in_submit_order():
+    saga = Recorder(jitter=0.002)
+    pool = SagaWorkerPool(saga, workers=4)
+    # 7 aggregates over 4 workers: plain round-robin would split every aggregate
+    submitted = [event(agg, seq) for seq in range(25) for agg in range(7)]
+    for evt in submitted:
+        assert pool.submit(evt)
+    assert pool.shutdown(drain=True, timeout=30) == 0
+
+    per_agg, threads = defaultdict(list), defaultdict(set)
+    for agg, seq, thread in saga.seen:
+        per_agg[agg].append(seq)
+        threads[agg].add(thread)
+    assert len(saga.seen) == len(submitted)
+    assert all(seqs == list(range(25)) for seqs in per_agg.values())
+    # one aggregate, one worker; the aggregates still spread over the pool
+    assert all(len(t) == 1 for t in threads.values())
+    assert len(set().union(*threads.values())) > 1
+    assert pool.metrics()["processed"] == len(submitted)
+
+
+def test_events_without_an_aggregate_are_spread_round_robin():
+    saga = Recorder()
+    pool = SagaWorkerPool(saga, workers=3)
+    for seq in range(9):
+        pool.submit(event(None, seq))
+    pool.shutdown()
+    assert len({thread for _, _, thread in saga.seen}) == 3
+
+
+@pytest.mark.parametrize("overflow, inline, dropped", [("drop", 0, 1), ("inline", 1, 0)])
+def test_full_queue_follows_the_overflow_policy(overflow, inline, dropped):
+    saga = Recorder()
+    saga.gate.clear()
+    pool = SagaWorkerPool(saga, workers=1, queue_size=1, overflow=overflow)
+    pool.submit(event(1, 0, hold=True))
+    assert saga.started.wait(5)          # the worker is busy with event 0
+    pool.submit(event(1, 1))             # fills the queue
+    pool.submit(event(1, 2))             # overflows
+    saga.gate.set()
+    pool.shutdown()
+    m = pool.metrics()
+    assert (m["inline"], m["dropped"]) == (inline, dropped)
+    assert len(saga.seen) == 3 - dropped
+
+
+def test_shutdown_without_drain_reports_what_was_left():
+    saga = Recorder()
+    saga.gate.clear()
+    pool = SagaWorkerPool(saga, workers=1, queue_size=10)
+    pool.submit(event(1, 0, hold=True))
+    assert saga.started.wait(5)
+    for seq in range(1, 4):
+        pool.submit(event(1, seq))
+    # released only after shutdown has emptied the queue
+    threading.Timer(0.1, saga.gate.set).start()
+    assert pool.shutdown(drain=False, timeout=5) == 3
+    assert not pool.submit(event(1, 9))
+    assert [seq for _, seq, _ in saga.seen] == [0]
+
+
+def test_failures_are_queued_for_the_retrier():
+    saga = Recorder()
+    queue = SagaRetryQueue(SagaRetryRepository(), base_delay=0)
+    pool = SagaWorkerPool(saga, workers=2, retry=queue)
+    pool.submit(event(1, 0))
+    pool.submit(event(1, 1, fail=True))
+    pool.submit(event(2, 0, fail=True))
+    pool.shutdown()
+    assert pool.metrics()["failed"] == 2
+    rows = list(SagaRetry.objects.order_by("id"))
+    assert {(r.event["aggregate_id"], r.event["seq"]) for r in rows} == {(1, 1), (2, 0)}
+    assert all(r.saga == "Recorder" and r.attempts == 1 and "boom" in r.last_error for r in rows)
@@ -0,0 +1,162 @@
+# cqrsex/Infrstraction/Search/FullTextIndex.py
+"""
+Ranked, highlighted full-text search over a read-model table.
+
+  postgresql  generated column "document" = weighted to_tsvector(...) STORED + GIN index;
+              matched with websearch_to_tsquery, ranked by ts_rank_cd, ts_headline.
+  sqlite      FTS5 external-content table (porter/unicode61 tokenizer) kept in sync by
+              triggers; ranked by -bm25 with the same field weights, highlight()/snippet().
+  otherwise   every term icontains some field; unranked (score 0), newest first.
+
+Pages seek on (score, id) — see KeysetPager — so deep pages cost the same as the first.
+Highlights are HTML-escaped text with matches wrapped in <mark>.
+"""
+from __future__ import annotations
+import html
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.db import connections
+from django.db.models import Q
+
+from cqrsex.Infrstraction.Search import fts5
+
+SCORE = "search_rank"
+_START, _STOP = "\x02", "\x03"          # placeholder delimiters, swapped for <mark> after escaping
+_PG_WEIGHTS = {"A": 1.0, "B": 0.4, "C": 0.2, "D": 0.1}   # ts_rank_cd defaults, reused for bm25
+
+
+def _marked(text: Optional[str]) -> str:
+    return html.escape(text or "").replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+def _terms(q: str) -> List[str]:
+    return re.findall(r"\w+", q or "")
+
+
+class FullTextIndex:
+    def __init__(self, model, fields: Sequence[Tuple[str, str]], *, snippet: Sequence[str] = (),
+                 config: str = "english") -> None:
+        """fields: (column, weight A-D) pairs; snippet: columns shown as fragments instead of in full."""
+        self.model = model
+        self.fields = tuple(fields)
+        self.snippet = tuple(snippet)
+        self.config = config
+        self.table = model._meta.db_table
+        self.pk = model._meta.pk.column
+
+    # ---------- schema (migrations) ----------
+    def install(self, schema_editor) -> None:
+        vendor = schema_editor.connection.vendor
+        if vendor == "postgresql":
+            vector = " || ".join(
+                f"setweight(to_tsvector('{self.config}'::regconfig, coalesce(\"{f}\", '')), '{w}')"
+                for f, w in self.fields
+            )
+            schema_editor.execute(
+                f'ALTER TABLE "{self.table}" ADD COLUMN IF NOT EXISTS "document" tsvector '
+                f"GENERATED ALWAYS AS ({vector}) STORED"
+            )
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{self.table}_document_gin" ON "{self.table}" USING gin ("document")'
+            )
+        elif vendor == "sqlite":
+            fts5.create(schema_editor, self.table, [f for f, _ in self.fields], pk=self.pk,
+                        tokenize="porter unicode61 remove_diacritics 2")
+
+    def uninstall(self, schema_editor) -> None:
+        vendor = schema_editor.connection.vendor
+        if vendor == "postgresql":
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{self.table}_document_gin"')
+            schema_editor.execute(f'ALTER TABLE "{self.table}" DROP COLUMN IF EXISTS "document"')
+        elif vendor == "sqlite":
+            fts5.drop(schema_editor, self.table)
+
+    # ---------- queries ----------
+    def _match_sql(self, vendor: str, q: str) -> Tuple[str, List[Any]]:
+        """SELECT <pk> AS id, <score> AS search_rank for every matching row."""
+        if vendor == "postgresql":
+            return (
+                f'SELECT d."{self.pk}" AS id, ts_rank_cd(d."document", q.query) AS {SCORE} '
+                f'FROM "{self.table}" d, websearch_to_tsquery(%s::regconfig, %s) AS q(query) '
+                f'WHERE d."document" @@ q.query',
+                [self.config, q],
+            )
+        fts = fts5.fts_table(self.table)
+        weights = ", ".join(str(_PG_WEIGHTS[w]) for _, w in self.fields)
+        return (
+            f'SELECT d."{self.pk}" AS id, -bm25("{fts}", {weights}) AS {SCORE} '
+            f'FROM "{fts}" JOIN "{self.table}" d ON d."{self.pk}" = "{fts}".rowid WHERE "{fts}" MATCH %s',
+            [" ".join(f'"{t}"' for t in _terms(q))],   # quoted terms, implicitly AND-ed
+        )
+
+    def search(self, using: str, q: str, *, filters: Optional[Dict[str, Any]] = None,
+               after: Optional[Sequence[Any]] = None, backwards: bool = False, limit: int = 20
+               ) -> List[Dict[str, Any]]:
+        """
+        [{"id", "search_rank"}] best first (worst first when `backwards`), starting past the
+        (search_rank, id) key `after`. `filters`: column equality on the indexed table.
+        """
+        conn = connections[using]
+        if not _terms(q):
+            return []
+        if conn.vendor not in ("postgresql", "sqlite"):
+            return self._search_basic(using, q, filters, after, backwards, limit)
+
+        sql, params = self._match_sql(conn.vendor, q)
+        for col, val in (filters or {}).items():
+            sql += f' AND d."{col}" = %s'
+            params.append(val)
+        sql = f"SELECT id, {SCORE} FROM ({sql}) s"
+        op, order = (">", "ASC") if backwards else ("<", "DESC")
+        if after is not None:
+            sql += f" WHERE ({SCORE} {op} %s OR ({SCORE} = %s AND id {op} %s))"
+            params += [after[0], after[0], after[1]]
+        sql += f" ORDER BY {SCORE} {order}, id {order} LIMIT %s"
+        params.append(limit)
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            return [{"id": i, SCORE: float(score)} for i, score in cur.fetchall()]
+
+    def _search_basic(self, using, q, filters, after, backwards, limit) -> List[Dict[str, Any]]:
+        qs = self.model.objects.using(using).filter(**(filters or {}))
+        for term in _terms(q):
+            any_field = Q()
+            for f, _ in self.fields:
+                any_field |= Q(**{f"{f}__icontains": term})
+            qs = qs.filter(any_field)
+        if after is not None:
+            qs = qs.filter(pk__gt=after[1]) if backwards else qs.filter(pk__lt=after[1])
+        ids = qs.order_by("pk" if backwards else "-pk").values_list("pk", flat=True)[:limit]
+        return [{"id": i, SCORE: 0.0} for i in ids]
+
+    def highlights(self, using: str, q: str, ids: Sequence[Any]) -> Dict[Any, Dict[str, str]]:
+        """id -> {column: highlighted text} for the given rows (one query)."""
+        conn = connections[using]
+        if not ids or not _terms(q) or conn.vendor not in ("postgresql", "sqlite"):
+            return {}
+        marks = ", ".join(["%s"] * len(ids))
+        columns = [f for f, _ in self.fields]
+        if conn.vendor == "postgresql":
+            exprs, params = [], []
+            for f in columns:
+                opts = (f'StartSel="{_START}", StopSel="{_STOP}", MaxFragments=2, MaxWords=24, MinWords=8, '
+                        f'FragmentDelimiter=" … "') if f in self.snippet else \
+                       f'StartSel="{_START}", StopSel="{_STOP}", HighlightAll=true'
+                exprs.append(f'ts_headline(%s::regconfig, coalesce(d."{f}", \'\'), q.query, %s)')
+                params += [self.config, opts]
+            sql = (f'SELECT d."{self.pk}", {", ".join(exprs)} FROM "{self.table}" d, '
+                   f'websearch_to_tsquery(%s::regconfig, %s) AS q(query) WHERE d."{self.pk}" IN ({marks})')
+            params += [self.config, q, *ids]
+        else:
+            fts = fts5.fts_table(self.table)
+            exprs = [
+                (f"snippet(\"{fts}\", {i}, char(2), char(3), '…', 24)" if f in self.snippet
+                 else f'highlight("{fts}", {i}, char(2), char(3))')
+                for i, f in enumerate(columns)
+            ]
+            sql = f'SELECT rowid, {", ".join(exprs)} FROM "{fts}" WHERE "{fts}" MATCH %s AND rowid IN ({marks})'
+            params = [" ".join(f'"{t}"' for t in _terms(q)), *ids]
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            return {row[0]: {f: _marked(v) for f, v in zip(columns, row[1:])} for row in cur.fetchall()}
@@ -0,0 +1,139 @@
+# cqrsex/Infrstraction/Search/TextSearch.py
+"""
+Substring search over a repository's `search_fields`, using what the database offers:
+
+  postgresql  the match stays `icontains`, which compiles to UPPER(col::text) LIKE ...;
+              install() adds pg_trgm GIN indexes on exactly that expression, so it no
+              longer scans. Ranked by the best TrigramWordSimilarity over the fields.
+  sqlite      FTS5 external-content table "<table>_fts" (trigram tokenizer, so still a
+              case-insensitive substring match) kept in sync by triggers. Ranked by
+              -bm25. Queries shorter than 3 characters use the basic path.
+  otherwise   OR of icontains, unranked.
+
+Until install() has run (migration 0005) — or with CQRS_SEARCH["BACKEND"] = "basic" —
+every backend takes the basic path.
+"""
+from __future__ import annotations
+import logging
+from typing import Dict, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import FloatField, Q, QuerySet
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
+
+from cqrsex.Infrstraction.Search import fts5
+
+log = logging.getLogger(__name__)
+
+RANK = "search_rank"
+_MIN_FTS_CHARS = 3   # trigram tokenizer: shorter strings have no trigrams
+
+# (alias, table) -> "postgresql" | "sqlite" | "basic"
+_backends: Dict[Tuple[str, str], str] = {}
+
+
+def _cfg() -> dict:
+    return getattr(settings, "CQRS_SEARCH", {}) or {}
+
+
+def _detect(alias: str, table: str, fields: Sequence[str]) -> str:
+    conn = connections[alias]
+    try:
+        with conn.cursor() as cur:
+            if conn.vendor == "postgresql":
+                cur.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                return "postgresql" if cur.fetchone() else "basic"
+            if conn.vendor == "sqlite":
+                cur.execute(f'PRAGMA table_info("{fts5.fts_table(table)}")')
+                columns = {row[1] for row in cur.fetchall()}
+                # the FTS table must cover this repository's field set
+                return "sqlite" if columns and set(fields) <= columns else "basic"
+    except Exception:
+        log.warning("search backend detection failed for %s on %s", table, alias, exc_info=True)
+    return "basic"
+
+
+class TextSearch:
+    """`apply(qs, q)` filters `qs` to rows whose search fields contain `q`."""
+
+    def __init__(self, fields: Sequence[str]) -> None:
+        self.fields = tuple(fields)
+
+    def backend(self, qs: QuerySet) -> str:
+        if (_cfg().get("BACKEND") or "auto").lower() == "basic":
+            return "basic"
+        key = (qs.db, qs.model._meta.db_table)
+        found = _backends.get(key)
+        if found is None:
+            found = _backends[key] = _detect(qs.db, key[1], self.fields)
+        return found
+
+    def apply(self, qs: QuerySet, q: Optional[str], *, rank: bool = False) -> QuerySet:
+        """rank=True: best matches first (annotated as `search_rank`), the existing ordering breaks ties."""
+        q = (q or "").strip()
+        if not q or not self.fields:
+            return qs
+        backend = self.backend(qs)
+        if backend == "sqlite" and len(q) >= _MIN_FTS_CHARS:
+            qs, score = self._fts5(qs, q)
+        elif backend == "postgresql":
+            qs, score = self._basic(qs, q), self._trigram_score(q)
+        else:
+            return self._basic(qs, q)
+        if not rank:
+            return qs
+        tiebreak = qs.query.order_by or (f"-{qs.model._meta.pk.attname}",)
+        return qs.annotate(**{RANK: score}).order_by(f"-{RANK}", *tiebreak)
+
+    # ---------- backends ----------
+    def _basic(self, qs: QuerySet, q: str) -> QuerySet:
+        cond = Q()
+        for f in self.fields:
+            cond |= Q(**{f"{f}__icontains": q})
+        return qs.filter(cond)
+
+    def _trigram_score(self, q: str):
+        from django.contrib.postgres.search import TrigramWordSimilarity
+        scores = [TrigramWordSimilarity(q, f) for f in self.fields]
+        return scores[0] if len(scores) == 1 else Greatest(*scores)
+
+    def _fts5(self, qs: QuerySet, q: str):
+        meta = qs.model._meta
+        fts, pk = fts5.fts_table(meta.db_table), meta.pk.column
+        cols = " ".join(self.fields)
+        match = '{%s} : "%s"' % (cols, q.replace('"', '""'))
+        qs = qs.filter(pk__in=RawSQL(f'SELECT rowid FROM "{fts}" WHERE "{fts}" MATCH %s', [match]))
+        score = RawSQL(
+            f'SELECT -bm25("{fts}") FROM "{fts}" WHERE "{fts}" MATCH %s AND rowid = "{meta.db_table}"."{pk}"',
+            [match], output_field=FloatField(),
+        )
+        return qs, score
+
+
+# ---------- schema (used by migrations) ----------
+def install(schema_editor, table: str, fields: Sequence[str], *, pk: str = "id") -> None:
+    """Create the search indexes for `table` on the schema editor's database (idempotent)."""
+    conn = schema_editor.connection
+    if conn.vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for f in fields:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{table}_{f}_trgm" ON "{table}" '
+                f'USING gin ((UPPER("{f}"::text)) gin_trgm_ops)'
+            )
+    elif conn.vendor == "sqlite":
+        # trigram tokenizer: case-insensitive substring matching, like icontains (SQLite 3.34+)
+        fts5.create(schema_editor, table, fields, pk=pk, tokenize="trigram")
+    _backends.clear()
+
+
+def uninstall(schema_editor, table: str, fields: Sequence[str]) -> None:
+    conn = schema_editor.connection
+    if conn.vendor == "postgresql":
+        for f in fields:
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_{f}_trgm"')
+    elif conn.vendor == "sqlite":
+        fts5.drop(schema_editor, table)
+    _backends.clear()
@@ -0,0 +1,52 @@
+# cqrsex/Infrstraction/Search/fts5.py
+"""SQLite FTS5 external-content tables over a regular table, kept in sync by triggers."""
+from __future__ import annotations
+import logging
+from typing import Sequence
+
+from django.db import transaction
+
+log = logging.getLogger(__name__)
+
+
+def fts_table(table: str) -> str:
+    return f"{table}_fts"
+
+
+def create(schema_editor, table: str, fields: Sequence[str], *, pk: str = "id", tokenize: str) -> bool:
+    """Create "<table>_fts" + triggers and index the existing rows. False if FTS5/the tokenizer is missing."""
+    fts = fts_table(table)
+    cols = ", ".join(f'"{f}"' for f in fields)
+    new = ", ".join(f'new."{f}"' for f in fields)
+    old = ", ".join(f'old."{f}"' for f in fields)
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5({cols}, '
+                f"content='{table}', content_rowid='{pk}', tokenize='{tokenize}')"
+            )
+    except Exception:
+        log.warning("SQLite FTS5 (tokenize=%s) unavailable for %s", tokenize, table, exc_info=True)
+        return False
+    schema_editor.execute(f"INSERT INTO \"{fts}\"(\"{fts}\") VALUES ('rebuild')")
+    schema_editor.execute(
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_ai" AFTER INSERT ON "{table}" BEGIN '
+        f'INSERT INTO "{fts}"(rowid, {cols}) VALUES (new."{pk}", {new}); END'
+    )
+    schema_editor.execute(
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_ad" AFTER DELETE ON "{table}" BEGIN '
+        f"INSERT INTO \"{fts}\"(\"{fts}\", rowid, {cols}) VALUES ('delete', old.\"{pk}\", {old}); END"
+    )
+    schema_editor.execute(
+        f'CREATE TRIGGER IF NOT EXISTS "{fts}_au" AFTER UPDATE ON "{table}" BEGIN '
+        f"INSERT INTO \"{fts}\"(\"{fts}\", rowid, {cols}) VALUES ('delete', old.\"{pk}\", {old}); "
+        f'INSERT INTO "{fts}"(rowid, {cols}) VALUES (new."{pk}", {new}); END'
+    )
+    return True
+
+
+def drop(schema_editor, table: str) -> None:
+    fts = fts_table(table)
+    for suffix in ("ai", "ad", "au"):
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS "{fts}_{suffix}"')
+    schema_editor.execute(f'DROP TABLE IF EXISTS "{fts}"')
@@ -0,0 +1,6 @@
+# cqrsex/Infrstraction/Search/indexes.py
+"""Full-text indexes of the read models (shared by migrations, projections and repositories)."""
+from cqrsex.Domain.models.BlogPostSearchDoc import BlogPostSearchDoc
+from cqrsex.Infrstraction.Search.FullTextIndex import FullTextIndex
+
+BLOG_POST_SEARCH = FullTextIndex(BlogPostSearchDoc, (("title", "A"), ("body", "B")), snippet=("body",))
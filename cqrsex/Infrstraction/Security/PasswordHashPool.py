@@ -0,0 +1,72 @@
+# cqrsex/Infrstraction/Security/PasswordHashPool.py
+from __future__ import annotations
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+from django.contrib.auth.hashers import make_password
+
+from cqrsex.Application.Interfaces.Common.IPasswordHasher import IPasswordHasher
+
+log = logging.getLogger(__name__)
+
+
+def _usable_cpus() -> int:
+    # CPUs this process may run on (container/affinity limits), not the host's count
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_worker() -> None:
+    # spawn/forkserver children start without Django (DJANGO_SETTINGS_MODULE comes with
+    # the environment); fork children inherit it
+    from django.conf import settings
+    if not settings.configured:
+        import django
+        django.setup()
+
+
+class PasswordHashPool(IPasswordHasher):
+    """
+    PBKDF2 (or whatever PASSWORD_HASHERS[0] is) across a process pool: hashing holds
+    the GIL, so threads do not help. Batches under `min_batch` are hashed inline —
+    shipping a handful of passwords to another process costs more than it saves.
+    The pool starts on first use.
+
+    Workers are spawned by default: forking a threaded server copies whatever locks
+    other threads held at that moment (logging, DB drivers) into the child, where they
+    are never released. Pass start_method=None for the platform default.
+    """
+
+    def __init__(self, workers: Optional[int] = None, *, min_batch: int = 8,
+                 start_method: Optional[str] = "spawn") -> None:
+        self.workers = max(int(workers or _usable_cpus()), 1)
+        self.min_batch = max(int(min_batch), 1)
+        self._start_method = start_method
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                ctx = multiprocessing.get_context(self._start_method) if self._start_method else None
+                self._pool = ProcessPoolExecutor(self.workers, mp_context=ctx, initializer=_init_worker)
+                log.info("password hash pool started (%d workers)", self.workers)
+            return self._pool
+
+    def hash_many(self, passwords: Sequence[str]) -> List[str]:
+        if self.workers == 1 or len(passwords) < self.min_batch:
+            return [make_password(p) for p in passwords]
+        chunk = max(len(passwords) // (self.workers * 4), 1)
+        return list(self._executor().map(make_password, passwords, chunksize=chunk))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
@@ -0,0 +1,67 @@
+# cqrsex/Infrstraction/UoW/AsyncUnitOfWork.py
+from typing import Optional
+from asgiref.sync import sync_to_async
+from django.db import transaction, DEFAULT_DB_ALIAS
+from cqrsex.Application.Interfaces.Common.IAsyncUnitOfWork import IAsyncUnitOfWork
+from cqrsex.Infrstraction.Outbox.OutboxBuffer import OutboxBuffer
+
+class AsyncUnitOfWork(IAsyncUnitOfWork):
+    """
+    transaction.atomic() for async handlers.
+    Django's async ORM runs every query through sync_to_async(thread_sensitive=True),
+    i.e. on the request's single sync thread; the atomic block is entered/exited on that
+    same thread, so aget/afirst/asave inside `async with uow:` share its connection.
+    The outbox buffer is bound in the task's context (sync_to_async copies it to the
+    worker thread) and flushed on that thread just before the atomic block exits.
+    """
+    def __init__(self, using: Optional[str] = None) -> None:
+        self._using = using or DEFAULT_DB_ALIAS
+        self._tx = None
+        self._committed = False
+        self._outbox: Optional[OutboxBuffer] = None
+        self._outbox_token = None
+        self._outbox_mark = None
+
+    def _enter(self) -> None:
+        self._tx = transaction.atomic(using=self._using)
+        self._tx.__enter__()
+
+    def _exit(self, exc_type, exc, tb) -> Optional[bool]:
+        owner = self._outbox_token is not None
+        try:
+            if exc_type or not self._committed:
+                transaction.set_rollback(True, using=self._using)
+                self._outbox.truncate(None if owner else self._outbox_mark)
+            elif owner:
+                self._outbox.flush()
+        except BaseException as flush_exc:
+            transaction.set_rollback(True, using=self._using)
+            self._tx.__exit__(type(flush_exc), flush_exc, flush_exc.__traceback__)
+            raise
+        return self._tx.__exit__(exc_type, exc, tb)
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        self._committed = False
+        await sync_to_async(self._enter, thread_sensitive=True)()
+        outer = OutboxBuffer.current(self._using)
+        if outer is None:
+            self._outbox = OutboxBuffer(self._using)
+            self._outbox_token = self._outbox.activate()
+        else:
+            self._outbox, self._outbox_mark = outer, outer.mark()
+        return self
+
+    async def commit(self) -> None:
+        self._committed = True
+
+    async def rollback(self) -> None:
+        # applied in __aexit__, on the transaction's own thread
+        self._committed = False
+
+    async def __aexit__(self, exc_type, exc, tb) -> Optional[bool]:
+        try:
+            return await sync_to_async(self._exit, thread_sensitive=True)(exc_type, exc, tb)
+        finally:
+            if self._outbox_token is not None:
+                OutboxBuffer.deactivate(self._outbox_token)
+                self._outbox_token = None
@@ -1,26 +1,52 @@
 # cqrsex/Infrstraction/UoW/UnitOfWork.py
 from typing import Optional
-from django.db import transaction
+from django.db import transaction, DEFAULT_DB_ALIAS
 from cqrsex.Application.Interfaces.Common.IUnitOfWork import IUnitOfWork
+from cqrsex.Infrstraction.Outbox.OutboxBuffer import OutboxBuffer
 
 class UnitOfWork(IUnitOfWork):
-    def __init__(self) -> None:
+    def __init__(self, using: Optional[str] = None) -> None:
+        self._using = using or DEFAULT_DB_ALIAS
         self._tx = None
         self._committed = False
+        self._outbox: Optional[OutboxBuffer] = None
+        self._outbox_token = None
+        self._outbox_mark = None
 
     def __enter__(self) -> "UnitOfWork":
-        self._tx = transaction.atomic()
+        self._tx = transaction.atomic(using=self._using)
         self._tx.__enter__()
         self._committed = False
+        # outermost UoW owns the outbox buffer; nested ones only remember where they started
+        outer = OutboxBuffer.current(self._using)
+        if outer is None:
+            self._outbox = OutboxBuffer(self._using)
+            self._outbox_token = self._outbox.activate()
+        else:
+            self._outbox, self._outbox_mark = outer, outer.mark()
         return self
 
     def commit(self) -> None:
         self._committed = True
 
     def rollback(self) -> None:
-        transaction.set_rollback(True)
+        transaction.set_rollback(True, using=self._using)
 
     def __exit__(self, exc_type, exc, tb) -> Optional[bool]:
-        if exc_type or not self._committed:
-            transaction.set_rollback(True)
+        owner = self._outbox_token is not None
+        try:
+            if exc_type or not self._committed:
+                transaction.set_rollback(True, using=self._using)
+                self._outbox.truncate(None if owner else self._outbox_mark)
+            elif owner:
+                # last statement of the transaction: all buffered events in one INSERT
+                self._outbox.flush()
+        except BaseException as flush_exc:
+            transaction.set_rollback(True, using=self._using)
+            self._tx.__exit__(type(flush_exc), flush_exc, flush_exc.__traceback__)
+            raise
+        finally:
+            if owner:
+                OutboxBuffer.deactivate(self._outbox_token)
+                self._outbox_token = None
         return self._tx.__exit__(exc_type, exc, tb)
@@ -1,13 +1,22 @@
 # blog/api/viewsets.py
+from rest_framework.decorators import action
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from cqrsex.Bootstrap.container import get_mediator
+from cqrsex.WebAPI.async_viewset import AsyncViewSet
+from cqrsex.WebAPI.middleware import command_meta
 
 from cqrsex.Application.CQRS.BlogPosts.Queries.List.Request import ListBlogPosts
 from cqrsex.Application.CQRS.BlogPosts.Queries.Get.Request import GetBlogPost
 from cqrsex.Application.CQRS.BlogPosts.Commands.Create.Request import CreateBlogPost
 from cqrsex.Application.CQRS.BlogPosts.Commands.Update.Request import UpdateBlogPost
 from cqrsex.Application.CQRS.BlogPosts.Commands.Delete.Request import DeleteBlogPost
+from cqrsex.Application.CQRS.BlogPosts.Commands.CreateMany.Request import CreateBlogPosts
+from cqrsex.Application.CQRS.BlogPosts.Commands.UpdateMany.Request import UpdateBlogPosts
+from cqrsex.Application.CQRS.BlogPosts.Commands.DeleteMany.Request import DeleteBlogPosts
+from cqrsex.Application.CQRS.BlogPosts.Queries.Export.Request import ExportBlogPosts
+from cqrsex.Application.CQRS.BlogPosts.Queries.Search.Request import SearchBlogPosts
+from cqrsex.WebAPI.streaming import parse_when, split_fields
 
 class BlogPostViewSet(ViewSet):
     def list(self, request):
@@ -15,7 +24,10 @@ class BlogPostViewSet(ViewSet):
         page_size = int(request.query_params.get("page_size", 20))
         author_id = request.query_params.get("author_id")
         author_id = int(author_id) if author_id is not None else None
-        res = get_mediator().send(ListBlogPosts(page=page, page_size=page_size, author_id=author_id))
+        res = get_mediator().send(ListBlogPosts(page=page, page_size=page_size, author_id=author_id,
+            paging=request.query_params.get("paging", "offset"), cursor=request.query_params.get("cursor"),
+            count=request.query_params.get("count", "exact"),
+            with_author=request.query_params.get("with_author", "1") not in ("0", "false")))
         return Response(res.to_dict(), status=res.status.status_code)
 
     def retrieve(self, request, pk=None):
@@ -28,6 +40,7 @@ class BlogPostViewSet(ViewSet):
             title=p.get("title", ""),
             body=p.get("body", ""),
             author_id=int(p.get("author_id", 0)),
+            meta=command_meta(request),
         ))
         return Response(res.to_dict(), status=res.status.status_code)
 
@@ -43,3 +56,115 @@ class BlogPostViewSet(ViewSet):
     def destroy(self, request, pk=None):
         res = get_mediator().send(DeleteBlogPost(id=int(pk)))
         return Response(res.to_dict(), status=res.status.status_code)
+
+    # /blog/search/?q=&page_size=&cursor=&author_id=&highlight=
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        res = get_mediator().send(blog_search_query(request.query_params))
+        return Response(res.to_dict(), status=res.status.status_code)
+
+    # /blog/bulk/  POST {"items": [...]} | PATCH {"items": [...]} | DELETE {"ids": [...]}; "atomic": false = partial
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        res = get_mediator().send(bulk_create_command(request.data or {}, command_meta(request)))
+        return Response(res.to_dict(), status=res.status.status_code)
+
+    @bulk_create.mapping.patch
+    def bulk_update(self, request):
+        res = get_mediator().send(bulk_update_command(request.data or {}))
+        return Response(res.to_dict(), status=res.status.status_code)
+
+    @bulk_create.mapping.delete
+    def bulk_destroy(self, request):
+        res = get_mediator().send(bulk_delete_command(request.data or {}))
+        return Response(res.to_dict(), status=res.status.status_code)
+
+
+class AsyncBlogPostViewSet(AsyncViewSet):
+    """Same endpoints as BlogPostViewSet, dispatched through Mediator.send_async."""
+
+    async def list(self, request):
+        page = int(request.query_params.get("page", 1))
+        page_size = int(request.query_params.get("page_size", 20))
+        author_id = request.query_params.get("author_id")
+        author_id = int(author_id) if author_id is not None else None
+        return await get_mediator().send_async(ListBlogPosts(page=page, page_size=page_size, author_id=author_id,
+            paging=request.query_params.get("paging", "offset"), cursor=request.query_params.get("cursor"),
+            count=request.query_params.get("count", "exact"),
+            with_author=request.query_params.get("with_author", "1") not in ("0", "false")))
+
+    async def retrieve(self, request, pk=None):
+        return await get_mediator().send_async(GetBlogPost(id=int(pk)))
+
+    async def create(self, request):
+        p = request.data or {}
+        return await get_mediator().send_async(CreateBlogPost(
+            title=p.get("title", ""),
+            body=p.get("body", ""),
+            author_id=int(p.get("author_id", 0)),
+            meta=command_meta(request),
+        ))
+
+    async def update(self, request, pk=None):
+        p = request.data or {}
+        return await get_mediator().send_async(UpdateBlogPost(
+            id=int(pk),
+            title=p.get("title"),
+            body=p.get("body"),
+        ))
+
+    async def destroy(self, request, pk=None):
+        return await get_mediator().send_async(DeleteBlogPost(id=int(pk)))
+
+    async def search(self, request):
+        return await get_mediator().send_async(blog_search_query(request.query_params))
+
+    async def bulk_create(self, request):
+        return await get_mediator().send_async(bulk_create_command(request.data or {}, command_meta(request)))
+
+    async def bulk_update(self, request):
+        return await get_mediator().send_async(bulk_update_command(request.data or {}))
+
+    async def bulk_destroy(self, request):
+        return await get_mediator().send_async(bulk_delete_command(request.data or {}))
+
+
+def _flag(params, name: str) -> bool:
+    return params.get(name, "1") not in ("0", "false")
+
+
+def blog_search_query(params) -> SearchBlogPosts:
+    author_id = params.get("author_id")
+    return SearchBlogPosts(
+        q=params.get("q", ""),
+        page_size=int(params.get("page_size", 20)),
+        cursor=params.get("cursor"),
+        author_id=int(author_id) if author_id else None,
+        highlight=_flag(params, "highlight"),
+        with_author=_flag(params, "with_author"),
+    )
+
+
+def bulk_create_command(p, meta=None) -> CreateBlogPosts:
+    return CreateBlogPosts(items=tuple(p.get("items") or ()), atomic=p.get("atomic", True), meta=meta)
+
+
+def bulk_update_command(p) -> UpdateBlogPosts:
+    return UpdateBlogPosts(items=tuple(p.get("items") or ()), atomic=p.get("atomic", True))
+
+
+def bulk_delete_command(p) -> DeleteBlogPosts:
+    return DeleteBlogPosts(ids=tuple(p.get("ids") or ()), atomic=p.get("atomic", True))
+
+
+def blog_export_query(params) -> ExportBlogPosts:
+    """GET /blog/export/?format=&fields=&author_id=&created_from=&created_to=&q=&chunk_size="""
+    author_id = params.get("author_id")
+    return ExportBlogPosts(
+        fields=split_fields(params.get("fields")),
+        author_id=int(author_id) if author_id else None,
+        created_from=parse_when(params, "created_from"),
+        created_to=parse_when(params, "created_to"),
+        q=params.get("q") or None,
+        chunk_size=int(params.get("chunk_size", 2_000)),
+    )
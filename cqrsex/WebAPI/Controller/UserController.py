@@ -1,24 +1,45 @@
 from __future__ import annotations
+from rest_framework.decorators import action
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, BasePermission
+from rest_framework.settings import api_settings
 
 from cqrsex.Bootstrap.container import get_mediator
+from cqrsex.WebAPI.async_viewset import AsyncViewSet
+from cqrsex.WebAPI.middleware import command_meta
 from cqrsex.Application.CQRS.Users.Queries.List.Request import ListUsers
 from cqrsex.Application.CQRS.Users.Queries.Get.Request import GetUser
 from cqrsex.Application.CQRS.Users.Commands.Create.Request import CreateUser
+from cqrsex.Application.CQRS.Users.Commands.CreateMany.Request import CreateUsers
 from cqrsex.Application.CQRS.Users.Commands.Update.Request import UpdateUser
 from cqrsex.Application.CQRS.Users.Commands.Delete.Request import DeleteUser
+from cqrsex.Application.CQRS.Users.Queries.Export.Request import ExportUsers
+from cqrsex.WebAPI.streaming import parse_bool, parse_when, split_fields
 
-class UserViewSet(ViewSet):
-    # no auth backends => no CSRF/session hurdle; open API
-    authentication_classes: list = []
-    permission_classes = [AllowAny]
+def is_admin(user) -> bool:
+    return bool(getattr(user, "is_authenticated", False) and getattr(user, "user_type", "") == "ADMIN")
+
+class IsAdmin(BasePermission):
+    def has_permission(self, request, view) -> bool:
+        return is_admin(request.user)
 
+class _ActingUserMixin:
     # helpers (fixed to include self)
     def _is_admin(self, request) -> bool:
-        u = getattr(request, "user", None)
-        return bool(getattr(u, "is_authenticated", False) and getattr(u, "user_type", "") == "ADMIN")
+        return is_admin(getattr(request, "user", None))
+
+    def _bulk_create_command(self, request) -> CreateUsers:
+        p = request.data or {}
+        items = []
+        for item in p.get("items") or ():
+            if isinstance(item, dict):
+                item = dict(item)
+                role = item.get("user_type") or "CUSTOMER"
+                # same rule as create(): only admins pick a role
+                item["user_type"] = role.upper() if isinstance(role, str) and self._is_admin(request) else "CUSTOMER"
+            items.append(item)
+        return CreateUsers(items=tuple(items), atomic=bool(p.get("atomic", False)), meta=command_meta(request))
 
     def _user_id(self, request) -> int:
         try:
@@ -27,12 +48,20 @@ class UserViewSet(ViewSet):
         except Exception:
             return 0
 
+
+class UserViewSet(_ActingUserMixin, ViewSet):
+    # no auth backends => no CSRF/session hurdle; open API
+    authentication_classes: list = []
+    permission_classes = [AllowAny]
+
     def list(self, request):
         page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("page_size", 20))
         q = request.query_params.get("q")
         user_type = request.query_params.get("user_type")
-        res = get_mediator().send(ListUsers(page=page, page_size=page_size, q=q, user_type=user_type))
+        res = get_mediator().send(ListUsers(page=page, page_size=page_size, q=q, user_type=user_type,
+            paging=request.query_params.get("paging", "offset"), cursor=request.query_params.get("cursor"),
+            count=request.query_params.get("count", "exact")))
         return Response(res.to_dict(), status=res.status.status_code)
 
     def retrieve(self, request, pk=None):
@@ -51,9 +80,18 @@ class UserViewSet(ViewSet):
             email=(p.get("email") or "").strip(),
             user_type=requested_role,
             allow_anonymous=True,   # <<< key line
+            meta=command_meta(request),
         ))
         return Response(res.to_dict(), status=res.status.status_code)
 
+    # POST /users/bulk/ {"items": [{"username", "password", "email", "user_type"}, ...], "atomic": false}
+    # admins only: up to MAX_BATCH accounts and a password hash each per request
+    @action(detail=False, methods=["post"], url_path="bulk",
+            authentication_classes=api_settings.DEFAULT_AUTHENTICATION_CLASSES, permission_classes=[IsAdmin])
+    def bulk_create(self, request):
+        res = get_mediator().send(self._bulk_create_command(request))
+        return Response(res.to_dict(), status=res.status.status_code)
+
     def update(self, request, pk=None):
         p = request.data or {}
         res = get_mediator().send(UpdateUser(
@@ -76,3 +114,72 @@ class UserViewSet(ViewSet):
             acting_is_admin=self._is_admin(request),
         ))
         return Response(res.to_dict(), status=res.status.status_code)
+
+
+class AsyncUserViewSet(_ActingUserMixin, AsyncViewSet):
+    """Same endpoints as UserViewSet, dispatched through Mediator.send_async."""
+    permissions = {"bulk_create": is_admin}
+
+    async def list(self, request):
+        page = int(request.query_params.get("page", 1))
+        page_size = int(request.query_params.get("page_size", 20))
+        q = request.query_params.get("q")
+        user_type = request.query_params.get("user_type")
+        return await get_mediator().send_async(ListUsers(page=page, page_size=page_size, q=q, user_type=user_type,
+            paging=request.query_params.get("paging", "offset"), cursor=request.query_params.get("cursor"),
+            count=request.query_params.get("count", "exact")))
+
+    async def retrieve(self, request, pk=None):
+        return await get_mediator().send_async(GetUser(id=int(pk)))
+
+    async def create(self, request):
+        p = request.data or {}
+        requested_role = (p.get("user_type") or "CUSTOMER").upper()
+        if not self._is_admin(request):  # prevent role escalation on public signup
+            requested_role = "CUSTOMER"
+
+        return await get_mediator().send_async(CreateUser(
+            username=(p.get("username") or "").strip(),
+            password=p.get("password") or "",
+            email=(p.get("email") or "").strip(),
+            user_type=requested_role,
+            allow_anonymous=True,
+            meta=command_meta(request),
+        ))
+
+    async def bulk_create(self, request):
+        return await get_mediator().send_async(self._bulk_create_command(request))
+
+    async def update(self, request, pk=None):
+        p = request.data or {}
+        return await get_mediator().send_async(UpdateUser(
+            id=int(pk),
+            email=p.get("email"),
+            first_name=p.get("first_name"),
+            last_name=p.get("last_name"),
+            password=p.get("password"),
+            user_type=p.get("user_type"),
+            is_active=p.get("is_active"),
+            acting_user_id=self._user_id(request),
+            acting_is_admin=self._is_admin(request),
+        ))
+
+    async def destroy(self, request, pk=None):
+        return await get_mediator().send_async(DeleteUser(
+            id=int(pk),
+            acting_user_id=self._user_id(request),
+            acting_is_admin=self._is_admin(request),
+        ))
+
+
+def user_export_query(params) -> ExportUsers:
+    """GET /users/export/?format=&fields=&q=&user_type=&is_active=&joined_from=&joined_to=&chunk_size= (admins only)"""
+    return ExportUsers(
+        fields=split_fields(params.get("fields")),
+        q=params.get("q") or None,
+        user_type=params.get("user_type") or None,
+        is_active=parse_bool(params, "is_active"),
+        joined_from=parse_when(params, "joined_from"),
+        joined_to=parse_when(params, "joined_to"),
+        chunk_size=int(params.get("chunk_size", 2_000)),
+    )
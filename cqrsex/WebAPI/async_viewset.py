@@ -0,0 +1,110 @@
+# cqrsex/WebAPI/async_viewset.py
+from __future__ import annotations
+import json
+from typing import Any, Callable, Dict, List
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.urls import path
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from pydantic import ValidationError
+
+from cqrsex.Application.Common.errors import pydantic_error_to_result
+from cqrsex.Application.Common.exceptions import AppException, ForbiddenException, ValidationException
+from cqrsex.WebAPI.streaming import request_user
+
+
+class AsyncViewSet(View):
+    """
+    Async counterpart of the DRF ViewSets in WebAPI/Controller.
+    DRF dispatches synchronously, so this sits on Django's native async View: subclasses
+    implement `async def list/retrieve/create/update/destroy` exactly like the DRF
+    versions (request.query_params / request.data are populated) and return a
+    ConcreteResultT, rendered the same way as Response(res.to_dict(), status=...).
+    `{prefix}/bulk/` routes POST/PATCH/DELETE to bulk_create/bulk_update/bulk_destroy
+    (405 when the subclass does not define them); GET `{prefix}/search/` routes to `search`.
+    request.user is the caller per DRF's DEFAULT_AUTHENTICATION_CLASSES, as on the DRF
+    ViewSets (AnonymousUser without credentials). `permissions` maps an action name to
+    fn(user) -> bool; those actions are refused with 403 unless fn allows it.
+    """
+    http_method_names = ["get", "post", "put", "patch", "delete"]
+    permissions: Dict[str, Callable[[Any], bool]] = {}
+
+    @classmethod
+    def urls(cls, prefix: str, basename: str) -> List[Any]:
+        view = csrf_exempt(cls.as_view())
+        return [
+            path(f"{prefix}/", view, name=f"{basename}-list"),
+            path(f"{prefix}/bulk/", view, {"bulk": True}, name=f"{basename}-bulk"),
+            path(f"{prefix}/search/", view, {"search": True}, name=f"{basename}-search"),
+            path(f"{prefix}/<int:pk>/", view, name=f"{basename}-detail"),
+        ]
+
+    @staticmethod
+    def _parse(request) -> None:
+        request.query_params = request.GET
+        if request.content_type == "application/json" and request.body:
+            try:
+                request.data = json.loads(request.body)
+            except ValueError:
+                raise ValidationException("Malformed JSON body")
+        else:
+            request.data = request.POST
+
+    async def _run(self, action: str, request, **kwargs) -> JsonResponse:
+        fn = getattr(self, action, None)
+        if fn is None:
+            return JsonResponse({"detail": "Method not allowed"}, status=405)
+        try:
+            request.user = await sync_to_async(request_user, thread_sensitive=True)(request)
+            allowed = self.permissions.get(action)
+            if allowed is not None and not allowed(request.user):
+                raise ForbiddenException(f"Not allowed to {action.replace('_', ' ')}")
+            self._parse(request)
+            res = await fn(request, **kwargs)
+        except AppException as ex:
+            res = ex.log().to_result()
+        except ValidationError as err:
+            res = pydantic_error_to_result(err)
+        except (TypeError, ValueError) as ex:
+            res = ValidationException(str(ex)).to_result()
+        return JsonResponse(res.to_dict(), status=res.status.status_code, encoder=DjangoJSONEncoder)
+
+    async def get(self, request, pk=None, bulk=False, search=False):
+        if bulk:
+            return JsonResponse({"detail": "Method not allowed"}, status=405)
+        if search:
+            return await self._run("search", request)
+        if pk is None:
+            return await self._run("list", request)
+        return await self._run("retrieve", request, pk=pk)
+
+    async def post(self, request, pk=None, bulk=False, search=False):
+        if search:
+            return JsonResponse({"detail": "Method not allowed"}, status=405)
+        if bulk:
+            return await self._run("bulk_create", request)
+        return await self._run("create", request)
+
+    async def put(self, request, pk=None, bulk=False, search=False):
+        if search:
+            return JsonResponse({"detail": "Method not allowed"}, status=405)
+        if bulk:
+            return await self._run("bulk_update", request)
+        return await self._run("update", request, pk=pk)
+
+    async def patch(self, request, pk=None, bulk=False, search=False):
+        if search:
+            return JsonResponse({"detail": "Method not allowed"}, status=405)
+        if bulk:
+            return await self._run("bulk_update", request)
+        return await self._run("update", request, pk=pk)
+
+    async def delete(self, request, pk=None, bulk=False, search=False):
+        if search:
+            return JsonResponse({"detail": "Method not allowed"}, status=405)
+        if bulk:
+            return await self._run("bulk_destroy", request)
+        return await self._run("destroy", request, pk=pk)
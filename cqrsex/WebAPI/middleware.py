@@ -1,12 +1,32 @@
 # cqrsex/WebAPI/middleware.py
 import contextvars
 
+from asgiref.sync import iscoroutinefunction
+from django.utils.decorators import sync_and_async_middleware
+
+from cqrsex.Application.Mediator.contracts import CommandMeta
+
+from cqrsex.Infrstraction.Loaders.AuthorLoader import request_scope
+
 _current_request = contextvars.ContextVar("current_request", default=None)
 
 def get_current_user():
     req = _current_request.get()
     return getattr(req, "user", None) if req else None
 
+def command_meta(request):
+    """
+    CommandMeta from the Idempotency-Key header, scoped to the authenticated caller
+    (request.user from DRF's authenticators, or AsyncViewSet's). None without a header or
+    without a user: anonymous clients share no scope of their own, so one's key could
+    replay another's result. Endpoints with authentication_classes = [] never get one.
+    """
+    key = (request.headers.get("Idempotency-Key") or "").strip()
+    user = getattr(request, "user", None)
+    if not key or not getattr(user, "is_authenticated", False):
+        return None
+    return CommandMeta(idempotency_key=f"{user.pk}:{key[:255]}")
+
 class CurrentRequestMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -17,3 +37,17 @@ class CurrentRequestMiddleware:
             return self.get_response(request)
         finally:
             _current_request.reset(token)
+
+
+@sync_and_async_middleware
+def loader_scope_middleware(get_response):
+    """One DataLoader memo per request: repeated author lookups hit auth_db once."""
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            with request_scope():
+                return await get_response(request)
+    else:
+        def middleware(request):
+            with request_scope():
+                return get_response(request)
+    return middleware
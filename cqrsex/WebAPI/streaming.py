@@ -0,0 +1,232 @@
+# cqrsex/WebAPI/streaming.py
+from __future__ import annotations
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, QueryDict, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views import View
+from pydantic import ValidationError
+
+from cqrsex.Application.Common.errors import pydantic_error_to_result
+from cqrsex.Application.Common.exceptions import AppException, ForbiddenException, ValidationException
+from cqrsex.Application.Wrapper.RowStream import RowStream
+from cqrsex.Bootstrap.container import get_mediator
+
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+FLUSH_ROWS = 500   # rows per written chunk: few syscalls, still constant memory
+
+_encoder = DjangoJSONEncoder(separators=(",", ":"))
+
+
+# ---------- query param helpers ----------
+def split_fields(value: Optional[str]) -> Optional[tuple]:
+    return tuple(f.strip() for f in value.split(",") if f.strip()) if value else None
+
+
+def parse_when(params: QueryDict, key: str) -> Optional[datetime]:
+    raw = params.get(key)
+    if not raw:
+        return None
+    value = parse_datetime(raw)
+    if value is None:
+        d = parse_date(raw)
+        value = datetime(d.year, d.month, d.day) if d else None
+    if value is None:
+        raise ValidationException(f"Invalid datetime for '{key}'", {key: raw}, code="invalid_datetime")
+    if settings.USE_TZ and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def parse_bool(params: QueryDict, key: str) -> Optional[bool]:
+    raw = params.get(key)
+    return None if raw in (None, "") else raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+# ---------- encoders ----------
+# a cell starting with one of these is run as a formula by spreadsheet apps
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_cell(v: Any) -> Any:
+    if isinstance(v, (datetime, date)):
+        return v.isoformat()
+    if isinstance(v, str) and v.startswith(_FORMULA_PREFIXES):
+        return "'" + v
+    return v
+
+
+class _CsvChunk:
+    def __init__(self, fields: Sequence[str]) -> None:
+        self.fields = fields
+        self.buf = io.StringIO()
+        self.writer = csv.writer(self.buf)
+
+    def header(self) -> str:
+        self.writer.writerow(self.fields)
+        return self.take()
+
+    def add(self, row: Dict[str, Any]) -> None:
+        self.writer.writerow([_csv_cell(row.get(f)) for f in self.fields])
+
+    def take(self) -> str:
+        out = self.buf.getvalue()
+        self.buf.seek(0)
+        self.buf.truncate()
+        return out
+
+
+def ndjson_chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    batch: List[str] = []
+    for row in rows:
+        batch.append(_encoder.encode(row))
+        if len(batch) >= FLUSH_ROWS:
+            yield "\n".join(batch) + "\n"
+            batch.clear()
+    if batch:
+        yield "\n".join(batch) + "\n"
+
+
+async def andjson_chunks(rows: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[str]:
+    batch: List[str] = []
+    async for row in rows:
+        batch.append(_encoder.encode(row))
+        if len(batch) >= FLUSH_ROWS:
+            yield "\n".join(batch) + "\n"
+            batch.clear()
+    if batch:
+        yield "\n".join(batch) + "\n"
+
+
+def csv_chunks(fields: Sequence[str], rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    out = _CsvChunk(fields)
+    yield out.header()
+    n = 0
+    for row in rows:
+        out.add(row)
+        n += 1
+        if n % FLUSH_ROWS == 0:
+            yield out.take()
+    tail = out.take()
+    if tail:
+        yield tail
+
+
+async def acsv_chunks(fields: Sequence[str], rows: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[str]:
+    out = _CsvChunk(fields)
+    yield out.header()
+    n = 0
+    async for row in rows:
+        out.add(row)
+        n += 1
+        if n % FLUSH_ROWS == 0:
+            yield out.take()
+    tail = out.take()
+    if tail:
+        yield tail
+
+
+# ---------- views ----------
+def request_user(request) -> Any:
+    """
+    The caller as the DRF views see it: plain Django views get no request.user here (no
+    AuthenticationMiddleware), so run DRF's DEFAULT_AUTHENTICATION_CLASSES. AnonymousUser
+    when no credentials are sent or they are rejected.
+    """
+    user = getattr(request, "user", None)
+    if user is not None:
+        return user
+    from django.contrib.auth.models import AnonymousUser
+    from rest_framework.exceptions import APIException
+    from rest_framework.request import Request
+    from rest_framework.settings import api_settings
+    try:
+        return Request(request, authenticators=[a() for a in api_settings.DEFAULT_AUTHENTICATION_CLASSES]).user
+    except APIException:
+        return AnonymousUser()
+
+
+class ExportView(View):
+    """
+    GET ?format=ndjson|csv&fields=a,b,...&<filters> -> rows streamed as the DB cursor
+    yields them (StreamingHttpResponse; memory does not grow with the export size).
+    Configure per endpoint: ExportView.as_view(build_query=fn(QueryDict) -> query, filename=...,
+    permission=fn(user) -> bool); without a permission the export is public.
+    """
+    http_method_names = ["get"]
+    build_query: Callable[[QueryDict], Any] = None
+    filename: str = "export"
+    permission: Optional[Callable[[Any], bool]] = None
+
+    def _denied(self, user) -> Optional[JsonResponse]:
+        if self.permission is None or self.permission(user):
+            return None
+        return self._error(ForbiddenException("Not allowed to export this data").log().to_result())
+
+    def _prepare(self, request):
+        fmt = (request.GET.get("format") or "ndjson").lower()
+        if fmt not in CONTENT_TYPES:
+            raise ValidationException("format must be ndjson or csv", {"format": fmt}, code="invalid_format")
+        return fmt, self.build_query(request.GET)
+
+    @staticmethod
+    def _error(res) -> JsonResponse:
+        return JsonResponse(res.to_dict(), status=res.status.status_code, encoder=DjangoJSONEncoder)
+
+    def _stream(self, fmt: str, content) -> StreamingHttpResponse:
+        resp = StreamingHttpResponse(content, content_type=CONTENT_TYPES[fmt])
+        resp["Content-Disposition"] = f'attachment; filename="{self.filename}.{fmt}"'
+        resp["X-Accel-Buffering"] = "no"   # let nginx pass chunks through
+        return resp
+
+    def get(self, request, *args, **kwargs):
+        if self.permission is not None:
+            denied = self._denied(request_user(request))
+            if denied is not None:
+                return denied
+        try:
+            fmt, query = self._prepare(request)
+        except AppException as ex:
+            return self._error(ex.to_result())
+        except ValidationError as err:
+            return self._error(pydantic_error_to_result(err))
+        except (TypeError, ValueError) as ex:
+            return self._error(ValidationException(str(ex)).to_result())
+        res = get_mediator().send(query)
+        if not res.status.succeeded:
+            return self._error(res)
+        stream: RowStream = res.data
+        content = csv_chunks(stream.fields, stream.rows) if fmt == "csv" else ndjson_chunks(stream.rows)
+        return self._stream(fmt, content)
+
+
+class AsyncExportView(ExportView):
+    """ASGI variant: async iterators all the way, so Django never buffers the body."""
+
+    async def get(self, request, *args, **kwargs):
+        if self.permission is not None:
+            denied = self._denied(await sync_to_async(request_user, thread_sensitive=True)(request))
+            if denied is not None:
+                return denied
+        try:
+            fmt, query = self._prepare(request)
+        except AppException as ex:
+            return self._error(ex.to_result())
+        except ValidationError as err:
+            return self._error(pydantic_error_to_result(err))
+        except (TypeError, ValueError) as ex:
+            return self._error(ValidationException(str(ex)).to_result())
+        res = await get_mediator().send_async(query)
+        if not res.status.succeeded:
+            return self._error(res)
+        stream: RowStream = res.data
+        content = acsv_chunks(stream.fields, stream.rows) if fmt == "csv" else andjson_chunks(stream.rows)
+        return self._stream(fmt, content)
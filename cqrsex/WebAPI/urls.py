@@ -1,9 +1,24 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from cqrsex.WebAPI.Controller.BlogPostController import BlogPostViewSet
+from cqrsex.WebAPI.Controller.BlogPostController import BlogPostViewSet, AsyncBlogPostViewSet, blog_export_query
+from cqrsex.WebAPI.Controller.UserController import is_admin, user_export_query
+from cqrsex.WebAPI.streaming import AsyncExportView, ExportView
 router = DefaultRouter()
 router.register(r'blog', BlogPostViewSet, basename='blog')
 urlpatterns = [
+    # streaming exports (NDJSON/CSV); before the router so "export" is not taken as a pk
+    path('blog/export/', ExportView.as_view(build_query=blog_export_query, filename='blog_posts'), name='blog-export'),
+    # usernames + emails: admins only
+    path('users/export/', ExportView.as_view(build_query=user_export_query, filename='users', permission=is_admin),
+         name='users-export'),
+    path('async/blog/export/', AsyncExportView.as_view(build_query=blog_export_query, filename='blog_posts'),
+         name='async-blog-export'),
+    path('async/users/export/', AsyncExportView.as_view(build_query=user_export_query, filename='users',
+                                                        permission=is_admin),
+         name='async-users-export'),
     path('', include(router.urls)),  # Include router URLs (don't add 'api/' here)
+    # native async endpoints (serve under ASGI: cqrsapp/asgi.py)
+    *AsyncBlogPostViewSet.urls('async/blog', basename='async-blog'),
+    # UserViewSet/AsyncUserViewSet are not routed: their list/retrieve are unauthenticated
 ]
@@ -0,0 +1,31 @@
+# cqrsex/management/commands/handler_manifest.py
+from django.core.management.base import BaseCommand, CommandError
+
+from cqrsex.Application.DI.MediatorModule import manifest_config
+from cqrsex.Application.Mediator import manifest
+
+
+class Command(BaseCommand):
+    help = "Write the handler manifest workers boot from (run at build/deploy time)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", help="Output file (default: CQRS_HANDLER_MANIFEST PATH).")
+        parser.add_argument("--check", action="store_true", help="Exit non-zero if the manifest is missing or stale.")
+
+    def handle(self, *args, **opts):
+        path = opts["path"] or manifest_config()["PATH"]
+        if not path:
+            raise CommandError("No manifest path: pass --path or set CQRS_HANDLER_MANIFEST['PATH'].")
+        roots = manifest.CQRS_ROOTS
+
+        if opts["check"]:
+            if manifest.load(path, roots) is None:
+                raise CommandError(f"{path} is missing or stale.")
+            self.stdout.write(f"{path} is up to date")
+            return
+
+        m = manifest.scan(roots)
+        if not manifest.save(path, m):
+            raise CommandError(f"Cannot write {path}")
+        self.stdout.write(f"wrote {path}: {len(m.handlers)} handlers, {len(m.commands)} commands, "
+                          f"{len(m.sources)} source files")
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from cqrsex.Application.Interfaces.Common.IIdempotencyStore import IIdempotencyStore
+from cqrsex.Bootstrap.container import get_injector
+
+
+class Command(BaseCommand):
+    help = "Delete expired idempotency results and abandoned claims (run from cron)."
+
+    def handle(self, *args, **opts):
+        store = get_injector().get(IIdempotencyStore)
+        n = store.purge_expired()
+        self.stdout.write(f"purged {n} idempotency key(s) from {type(store).__name__}")
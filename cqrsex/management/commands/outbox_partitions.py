@@ -0,0 +1,26 @@
+# cqrsex/management/commands/outbox_partitions.py
+from django.core.management.base import BaseCommand, CommandError
+
+from cqrsex.Infrstraction.Outbox import OutboxPartitions
+
+
+class Command(BaseCommand):
+    help = "PostgreSQL only: convert outbox_events to monthly partitions and/or create upcoming partitions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--convert", action="store_true", help="One-off: copy into a partitioned table (stop relays first).")
+        parser.add_argument("--keep-legacy", action="store_true", help="With --convert: keep outbox_events_legacy.")
+        parser.add_argument("--ahead", type=int, default=2, help="Months of partitions to keep ready (default 2).")
+
+    def handle(self, *args, **opts):
+        alias = opts["database"]
+        if not OutboxPartitions.supported(alias):
+            raise CommandError("outbox partitioning requires PostgreSQL")
+        if opts["convert"]:
+            n = OutboxPartitions.convert(alias, ahead=opts["ahead"], keep_legacy=opts["keep_legacy"])
+            self.stdout.write(f"converted outbox_events to partitions ({n} rows copied)")
+        elif not OutboxPartitions.is_partitioned(alias):
+            raise CommandError("outbox_events is not partitioned; run with --convert first")
+        created = OutboxPartitions.ensure(alias, ahead=opts["ahead"])
+        self.stdout.write(f"partitions created: {', '.join(created) or 'none'}")
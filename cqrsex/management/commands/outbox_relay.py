@@ -0,0 +1,49 @@
+# cqrsex/management/commands/outbox_relay.py
+import signal
+
+from django.core.management.base import BaseCommand
+
+from cqrsex.Application.Interfaces.Repositories.IOutboxRepository import IOutboxRepository
+from cqrsex.Bootstrap.container import get_injector
+from cqrsex.Infrstraction.DI.OutboxRelayModule import build_relay, relay_config
+
+
+class Command(BaseCommand):
+    help = "Relay unprocessed outbox_events to the configured publishers (safe to run several in parallel)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", help="DB alias holding outbox_events (default: CQRS_OUTBOX_RELAY['DB_ALIAS'])")
+        parser.add_argument("--batch-size", type=int)
+        parser.add_argument("--publisher", action="append", dest="publishers", metavar="DOTTED_PATH",
+                            help="Publisher class; repeat for several. Overrides settings.")
+        parser.add_argument("--no-fair", action="store_true", help="Claim oldest-first across tenants.")
+        parser.add_argument("--once", action="store_true", help="Drain what is pending now and exit.")
+        parser.add_argument("--max-polls", type=int)
+        parser.add_argument("--metrics-every", type=float, default=30.0, help="Seconds between metrics log lines.")
+
+    def handle(self, *args, **opts):
+        cfg = relay_config()
+        if opts["database"]:
+            cfg["DB_ALIAS"] = opts["database"]
+        if opts["batch_size"]:
+            cfg["BATCH_SIZE"] = opts["batch_size"]
+        if opts["publishers"]:
+            cfg["PUBLISHERS"] = opts["publishers"]
+        if opts["no_fair"]:
+            cfg["FAIR"] = False
+
+        relay = build_relay(get_injector().get(IOutboxRepository), cfg)
+
+        if opts["once"]:
+            try:
+                n = relay.run_until_empty()
+            finally:
+                relay.close()
+            self.stdout.write(f"relayed {n} event(s): {relay.metrics.snapshot()}")
+            return
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: relay.stop())
+        self.stdout.write(f"outbox relay started db={relay.db_alias} batch={relay.batch_size}")
+        relay.run(max_polls=opts["max_polls"], metrics_every=opts["metrics_every"])
+        self.stdout.write(f"outbox relay stopped: {relay.metrics.snapshot()}")
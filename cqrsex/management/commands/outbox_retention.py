@@ -0,0 +1,44 @@
+# cqrsex/management/commands/outbox_retention.py
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from cqrsex.Infrstraction.Outbox.OutboxRetention import JsonlArchive, OutboxRetention
+
+
+class Command(BaseCommand):
+    help = "Delete (or archive then delete) delivered outbox events older than N days, in small batches."
+
+    def add_arguments(self, parser):
+        cfg = getattr(settings, "CQRS_OUTBOX_RETENTION", {}) or {}
+        parser.add_argument("--days", type=float, default=cfg.get("DAYS", 7))
+        parser.add_argument("--batch-size", type=int, default=cfg.get("BATCH_SIZE", 5_000))
+        parser.add_argument("--pause", type=float, default=cfg.get("PAUSE", 0.0), help="Seconds to sleep between batches.")
+        parser.add_argument("--archive-dir", default=cfg.get("ARCHIVE_DIR"), help="Write deleted rows to gzipped JSONL here first.")
+        parser.add_argument("--max-batches", type=int)
+        parser.add_argument("--database", default=cfg.get("DB_ALIAS", "default"))
+        parser.add_argument("--keep-partitions", action="store_true", help="Never drop whole partitions (PostgreSQL).")
+        parser.add_argument("--ignore-projections", action="store_true",
+                            help="Also delete events read-model projections have not applied yet.")
+
+    def handle(self, *args, **opts):
+        cutoff = timezone.now() - timedelta(days=opts["days"])
+        job = OutboxRetention(
+            opts["database"],
+            batch_size=opts["batch_size"],
+            pause=opts["pause"],
+            archive=JsonlArchive(opts["archive_dir"]) if opts["archive_dir"] else None,
+            drop_partitions=not opts["keep_partitions"],
+            respect_projections=not opts["ignore_projections"],
+        )
+        report = job.run(cutoff, max_batches=opts["max_batches"])
+        r = report.as_dict()
+        self.stdout.write(
+            f"deleted={r['deleted']} archived={r['archived']} batches={r['batches']} "
+            f"partitions_dropped={len(r['partitions_dropped'])} in {r['seconds']}s ({r['rows_per_sec']} rows/s)\n"
+            f"size before={r['size_before']} after={r['size_after']}"
+        )
+        if job.archive is not None:
+            self.stdout.write(f"archive: {job.archive.path}")
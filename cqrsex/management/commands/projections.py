@@ -0,0 +1,44 @@
+# cqrsex/management/commands/projections.py
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cqrsex.Bootstrap.container import get_injector
+from cqrsex.Infrstraction.DI.ProjectionModule import projection_config
+from cqrsex.Infrstraction.Projections.ProjectionEngine import ProjectionEngine
+
+
+class Command(BaseCommand):
+    help = "Apply outbox events to the read-model projections (follows by default)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help="Projection names (default: all).")
+        parser.add_argument("--once", action="store_true", help="Catch up to the outbox head and exit.")
+        parser.add_argument("--rebuild", action="store_true",
+                            help="Recreate the read models from the source tables, then continue from the outbox head.")
+        parser.add_argument("--status", action="store_true", help="Print checkpoints and exit.")
+        parser.add_argument("--poll-interval", type=float, default=projection_config().get("POLL_INTERVAL", 1.0))
+
+    def handle(self, *args, **opts):
+        engine = get_injector().get(ProjectionEngine)
+        names = opts["names"] or None
+        unknown = set(names or ()) - set(engine.names)
+        if unknown:
+            raise CommandError(f"Unknown projection(s): {', '.join(sorted(unknown))}. Known: {', '.join(engine.names)}")
+
+        if opts["status"]:
+            for name, pos in engine.positions().items():
+                self.stdout.write(f"{name}: {pos}")
+            return
+        if opts["rebuild"]:
+            for name, head in engine.rebuild(names).items():
+                self.stdout.write(f"rebuilt {name} at outbox position {head}")
+        if opts["once"] or opts["rebuild"]:
+            self.stdout.write(f"applied {engine.catch_up(names)} event(s)")
+            return
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: engine.stop())
+        self.stdout.write(f"projections started: {', '.join(engine.names)}")
+        engine.run(poll_interval=opts["poll_interval"])
+        self.stdout.write("projections stopped")
@@ -0,0 +1,45 @@
+import json
+import signal
+
+from django.core.management.base import BaseCommand
+
+from cqrsex.Bootstrap.container import get_injector
+from cqrsex.Infrstraction.Saga.SagaRetrier import SagaRetrier
+
+
+class Command(BaseCommand):
+    help = "Retry failed saga invocations from saga_retries with exponential backoff (safe to run several in parallel)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int)
+        parser.add_argument("--once", action="store_true", help="Attempt what is due now and exit.")
+        parser.add_argument("--max-polls", type=int)
+        parser.add_argument("--metrics-every", type=float, default=30.0, help="Seconds between metrics log lines.")
+        parser.add_argument("--stats", action="store_true", help="Print the queue depth and exit.")
+        parser.add_argument("--requeue-dead", action="store_true",
+                            help="Move dead letters back to the queue (due now) and exit.")
+        parser.add_argument("--saga", help="With --requeue-dead: only this saga's dead letters.")
+
+    def handle(self, *args, **opts):
+        retrier = get_injector().get(SagaRetrier)
+        if opts["batch_size"]:
+            retrier.batch_size = opts["batch_size"]
+
+        if opts["stats"]:
+            self.stdout.write(json.dumps(retrier.queue.depth()))
+            return
+        if opts["requeue_dead"]:
+            n = retrier.queue.repo.requeue_dead(saga=opts["saga"])
+            self.stdout.write(f"requeued {n} dead letter(s)")
+            return
+
+        if opts["once"]:
+            n = retrier.run_until_empty()
+            self.stdout.write(f"attempted {n} invocation(s): {retrier.metrics()}")
+            return
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: retrier.stop())
+        self.stdout.write(f"saga retrier started db={retrier.db_alias} batch={retrier.batch_size}")
+        retrier.run(max_polls=opts["max_polls"], metrics_every=opts["metrics_every"])
+        self.stdout.write(f"saga retrier stopped: {retrier.metrics()}")
@@ -0,0 +1,62 @@
+from django.db import migrations, models, router
+import uuid
+
+
+def create_outbox_table(apps, schema_editor):
+    # outbox_events predates the migrations on existing installs; only create it where missing
+    OutboxEvent = apps.get_model("cqrsex", "OutboxEvent")
+    conn = schema_editor.connection
+    if not router.allow_migrate_model(conn.alias, OutboxEvent):
+        return
+    if OutboxEvent._meta.db_table not in conn.introspection.table_names():
+        schema_editor.create_model(OutboxEvent)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cqrsex", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="OutboxEvent",
+                    fields=[
+                        ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                        ("aggregate_type", models.CharField(max_length=50)),
+                        ("aggregate_id", models.UUIDField(default=uuid.uuid4)),
+                        ("event_type", models.CharField(max_length=50)),
+                        ("payload", models.JSONField()),
+                        ("tenant_id", models.CharField(default="main", max_length=20)),
+                        ("created_at", models.DateTimeField(auto_now_add=True)),
+                        ("processed", models.BooleanField(default=False)),
+                    ],
+                    options={"db_table": "outbox_events", "managed": True},
+                ),
+            ],
+        ),
+        migrations.RunPython(create_outbox_table, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name="outboxevent",
+            name="processed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="outboxevent",
+            index=models.Index(
+                condition=models.Q(processed=False),
+                fields=["tenant_id", "created_at", "id"],
+                name="outbox_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="outboxevent",
+            index=models.Index(
+                condition=models.Q(processed=True),
+                fields=["processed_at"],
+                name="outbox_done_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,49 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cqrsex", "0002_outbox_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogPostView",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=255)),
+                ("body", models.TextField(blank=True)),
+                ("author_id", models.IntegerField()),
+                ("author_username", models.CharField(blank=True, default="", max_length=150)),
+                ("tenant_id", models.CharField(default="main", max_length=20)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("version", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "rm_blog_posts",
+                "managed": True,
+                "indexes": [models.Index(fields=["author_id", "id"], name="rm_blog_posts_author_idx")],
+            },
+        ),
+        migrations.CreateModel(
+            name="AuthorPostCount",
+            fields=[
+                ("author_id", models.IntegerField(primary_key=True, serialize=False)),
+                ("author_username", models.CharField(blank=True, default="", max_length=150)),
+                ("post_count", models.IntegerField(default=0)),
+                ("last_post_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={"db_table": "rm_author_post_counts", "managed": True},
+        ),
+        migrations.CreateModel(
+            name="ProjectionCheckpoint",
+            fields=[
+                ("name", models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ("position", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={"db_table": "projection_checkpoints", "managed": True},
+        ),
+    ]
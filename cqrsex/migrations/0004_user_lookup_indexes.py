@@ -0,0 +1,46 @@
+from django.db import migrations
+
+INDEX_NAMES = ("users_username_lower_idx", "users_email_lower_idx")
+
+
+def _user_indexes():
+    # `users` (auth_db) is not part of this app's migration state, so the index
+    # definitions come from the live model (User.Meta.indexes).
+    from cqrsex.Domain.models.User import User
+    return User, [i for i in User._meta.indexes if i.name in INDEX_NAMES]
+
+
+def add_lower_indexes(apps, schema_editor):
+    User, indexes = _user_indexes()
+    conn = schema_editor.connection
+    with conn.cursor() as cursor:
+        if User._meta.db_table not in conn.introspection.table_names(cursor):
+            return
+        existing = conn.introspection.get_constraints(cursor, User._meta.db_table)
+    for index in indexes:
+        if index.name not in existing:
+            schema_editor.add_index(User, index)
+
+
+def drop_lower_indexes(apps, schema_editor):
+    User, indexes = _user_indexes()
+    conn = schema_editor.connection
+    with conn.cursor() as cursor:
+        if User._meta.db_table not in conn.introspection.table_names(cursor):
+            return
+        existing = conn.introspection.get_constraints(cursor, User._meta.db_table)
+    for index in indexes:
+        if index.name in existing:
+            schema_editor.remove_index(User, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cqrsex", "0003_read_models"),
+    ]
+
+    operations = [
+        # hints route this to auth_db only (cqrsapp.routers.DatabaseRouter.allow_migrate)
+        migrations.RunPython(add_lower_indexes, drop_lower_indexes, hints={"model_name": "user"}),
+    ]
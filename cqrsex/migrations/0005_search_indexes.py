@@ -0,0 +1,31 @@
+from django.db import migrations
+
+# table -> searchable columns (UserReadRepository / BlogPostReadRepository.search_fields)
+USERS = ("users", ("username", "email"))
+BLOG_POSTS = ("blog_posts", ("title", "body"))
+
+
+def _run(action, table, fields):
+    def run(apps, schema_editor):
+        from cqrsex.Infrstraction.Search.TextSearch import install, uninstall
+        conn = schema_editor.connection
+        with conn.cursor() as cursor:
+            if table not in conn.introspection.table_names(cursor):
+                return
+        (install if action == "install" else uninstall)(schema_editor, table, fields)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cqrsex", "0004_user_lookup_indexes"),
+    ]
+
+    operations = [
+        # pg_trgm GIN indexes on PostgreSQL, FTS5 tables + triggers on SQLite, nothing elsewhere.
+        # hints route each operation to the database that holds the table.
+        migrations.RunPython(_run("install", *USERS), _run("uninstall", *USERS), hints={"model_name": "user"}),
+        migrations.RunPython(_run("install", *BLOG_POSTS), _run("uninstall", *BLOG_POSTS),
+                             hints={"model_name": "blogpost"}),
+    ]
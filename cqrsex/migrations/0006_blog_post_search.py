@@ -0,0 +1,36 @@
+from django.db import migrations, models
+
+
+def install_index(apps, schema_editor):
+    from cqrsex.Infrstraction.Search.indexes import BLOG_POST_SEARCH
+    BLOG_POST_SEARCH.install(schema_editor)
+
+
+def uninstall_index(apps, schema_editor):
+    from cqrsex.Infrstraction.Search.indexes import BLOG_POST_SEARCH
+    BLOG_POST_SEARCH.uninstall(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cqrsex", "0005_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogPostSearchDoc",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=255)),
+                ("body", models.TextField(blank=True)),
+                ("author_id", models.IntegerField()),
+                ("tenant_id", models.CharField(default="main", max_length=20)),
+                ("created_at", models.DateTimeField()),
+                ("version", models.BigIntegerField(default=0)),
+            ],
+            options={"db_table": "rm_blog_post_search", "managed": True},
+        ),
+        # tsvector column + GIN index on PostgreSQL, FTS5 table + triggers on SQLite
+        migrations.RunPython(install_index, uninstall_index, hints={"model_name": "blogpostsearchdoc"}),
+    ]
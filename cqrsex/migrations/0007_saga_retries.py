@@ -0,0 +1,53 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cqrsex", "0006_blog_post_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SagaRetry",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("saga", models.CharField(max_length=100)),
+                ("idempotency_key", models.CharField(max_length=64)),
+                ("event", models.JSONField()),
+                ("attempts", models.IntegerField(default=1)),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("next_attempt_at", models.DateTimeField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "saga_retries",
+                "managed": True,
+                "constraints": [
+                    models.UniqueConstraint(fields=["saga", "idempotency_key"], name="saga_retry_key_uniq"),
+                ],
+                "indexes": [models.Index(fields=["next_attempt_at", "id"], name="saga_retry_due_idx")],
+            },
+        ),
+        migrations.CreateModel(
+            name="SagaDeadLetter",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("saga", models.CharField(max_length=100)),
+                ("idempotency_key", models.CharField(max_length=64)),
+                ("event", models.JSONField()),
+                ("attempts", models.IntegerField()),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("first_failed_at", models.DateTimeField()),
+                ("dead_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "saga_dead_letters",
+                "managed": True,
+                "constraints": [
+                    models.UniqueConstraint(fields=["saga", "idempotency_key"], name="saga_dead_key_uniq"),
+                ],
+            },
+        ),
+    ]